@@ -0,0 +1,332 @@
+# This file is part of scrilla: https://github.com/chinchalinchin/scrilla.
+
+# scrilla is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3
+# as published by the Free Software Foundation.
+
+# scrilla is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with scrilla.  If not, see <https://www.gnu.org/licenses/>
+# or <https://github.com/chinchalinchin/scrilla/blob/develop/main/LICENSE>.
+
+r"""
+Online accumulators for sample statistics.
+
+An accumulator holds the sufficient statistics of a sample, i.e. the number of observations, their mean and the sum of squared deviations from the mean (the *co-moment*), instead of the sample itself. Observations can be added with `update`, taken back out with `remove`, so a window can slide over a sample, and the statistics of two samples can be combined with `merge`, so a sample can be split into chunks that are accumulated separately, possibly in parallel. Each operation costs a constant amount of time and memory, no matter how many observations the accumulator has seen.
+
+Updates follow [Welford's algorithm](https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm),
+
+$$ \bar{x}_{n} = \bar{x}_{n-1} + \frac{x_{n} - \bar{x}_{n-1}}{n} $$
+
+$$ M_{n} = M_{n-1} + (x_{n} - \bar{x}_{n-1}) \cdot (x_{n} - \bar{x}_{n}) $$
+
+and merges follow the [parallel algorithm](https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm) of Chan et al.,
+
+$$ M_{AB} = M_{A} + M_{B} + (\bar{x}_{B} - \bar{x}_{A})^2 \cdot \frac{n_{A} \cdot n_{B}}{n_{A} + n_{B}} $$
+
+Since the observations are always centered around the running mean, the accumulators do not lose precision to cancellation the way sums of squares do.
+"""
+from typing import Iterable, List, Union
+
+import numpy
+
+from scrilla.util import errors
+
+
+class MomentAccumulator():
+    """
+    Accumulates the mean and variance of a univariate sample.
+
+    Attributes
+    ----------
+    1. **n**: ``int``
+        Number of observations accumulated.
+    2. **mean**: ``float``
+        Sample mean of the observations.
+    3. **m2**: ``float``
+        Sum of the squared deviations of the observations from their mean.
+    """
+    __slots__ = ('n', 'mean', 'm2')
+
+    def __init__(self):
+        self.n, self.mean, self.m2 = 0, 0.0, 0.0
+
+    def update(self, x: float) -> 'MomentAccumulator':
+        """
+        Adds the observation `x` to the sample.
+        """
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta*(x - self.mean)
+        return self
+
+    def update_many(self, x: Iterable[float]) -> 'MomentAccumulator':
+        """
+        Adds a chunk of observations to the sample. The statistics of the chunk are computed with vectorized two-pass sums and then merged into the accumulator.
+        """
+        x = numpy.asarray(x, dtype=float)
+        if len(x) == 0:
+            return self
+        chunk = MomentAccumulator()
+        chunk.n, chunk.mean = len(x), float(numpy.mean(x))
+        chunk.m2 = float(numpy.sum((x - chunk.mean)**2))
+        return self.merge(chunk)
+
+    def remove(self, x: float) -> 'MomentAccumulator':
+        """
+        Removes the observation `x`, which must have been added previously, from the sample.
+        """
+        if self.n == 0:
+            raise errors.SampleSizeError(
+                'Cannot remove an observation from an empty sample.')
+        if self.n == 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return self
+        previous_mean = (self.n*self.mean - x)/(self.n - 1)
+        self.m2 -= (x - previous_mean)*(x - self.mean)
+        self.n, self.mean = self.n - 1, previous_mean
+        return self
+
+    def merge(self, other: 'MomentAccumulator') -> 'MomentAccumulator':
+        """
+        Adds the observations accumulated by `other` to the sample.
+        """
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta**2*self.n*other.n/n
+        self.mean += delta*other.n/n
+        self.n = n
+        return self
+
+    def variance(self, ddof: int = 1) -> float:
+        """
+        Returns the variance of the sample, dividing the sum of squared deviations by `n - ddof`. Defaults to the unbiased sample variance. A sample with a single observation has no variance.
+
+        Raises
+        ------
+        1. **scrilla.errors.SampleSizeError**
+            If the sample is empty.
+        """
+        if self.n == 0:
+            raise errors.SampleSizeError(
+                'Sample variance cannot be computed for a sample size of 0.')
+        if self.n <= ddof:
+            return 0
+        return max(self.m2, 0)/(self.n - ddof)
+
+
+class CovarianceAccumulator():
+    """
+    Accumulates the means, variances and covariance of a bivariate sample of paired observations *(x, y)*.
+
+    Attributes
+    ----------
+    1. **x**: ``scrilla.analysis.accumulators.MomentAccumulator``
+        Accumulator for the *x* observations.
+    2. **y**: ``scrilla.analysis.accumulators.MomentAccumulator``
+        Accumulator for the *y* observations.
+    3. **c**: ``float``
+        Co-moment of the sample, i.e. the sum of the products of the deviations of *x* and *y* from their means.
+    """
+    __slots__ = ('x', 'y', 'c')
+
+    def __init__(self):
+        self.x, self.y, self.c = MomentAccumulator(), MomentAccumulator(), 0.0
+
+    @property
+    def n(self) -> int:
+        return self.x.n
+
+    def update(self, x: float, y: float) -> 'CovarianceAccumulator':
+        """
+        Adds the pair of observations `(x, y)` to the sample.
+        """
+        delta_x = x - self.x.mean
+        self.x.update(x)
+        self.y.update(y)
+        self.c += delta_x*(y - self.y.mean)
+        return self
+
+    def update_many(self, x: Iterable[float], y: Iterable[float]) -> 'CovarianceAccumulator':
+        """
+        Adds a chunk of paired observations to the sample. The statistics of the chunk are computed with vectorized two-pass sums and then merged into the accumulator.
+        """
+        x, y = numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float)
+        if len(x) != len(y):
+            raise errors.SampleSizeError('Samples are not of comparable length')
+        if len(x) == 0:
+            return self
+        chunk = CovarianceAccumulator()
+        chunk.x.update_many(x)
+        chunk.y.update_many(y)
+        chunk.c = float(numpy.sum((x - chunk.x.mean)*(y - chunk.y.mean)))
+        return self.merge(chunk)
+
+    def remove(self, x: float, y: float) -> 'CovarianceAccumulator':
+        """
+        Removes the pair of observations `(x, y)`, which must have been added previously, from the sample.
+        """
+        y_mean = self.y.mean
+        self.x.remove(x)
+        self.y.remove(y)
+        if self.n == 0:
+            self.c = 0.0
+        else:
+            self.c -= (x - self.x.mean)*(y - y_mean)
+        return self
+
+    def merge(self, other: 'CovarianceAccumulator') -> 'CovarianceAccumulator':
+        """
+        Adds the observations accumulated by `other` to the sample.
+        """
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        self.c += other.c + (other.x.mean - self.x.mean) * \
+            (other.y.mean - self.y.mean)*self.n*other.n/n
+        self.x.merge(other.x)
+        self.y.merge(other.y)
+        return self
+
+    def covariance(self, ddof: int = 1) -> float:
+        """
+        Returns the covariance of the sample, dividing the co-moment by `n - ddof`. Defaults to the unbiased sample covariance.
+
+        Raises
+        ------
+        1. **scrilla.errors.SampleSizeError**
+            If the sample has `ddof` or fewer observations.
+        """
+        if self.n <= ddof:
+            raise errors.SampleSizeError(
+                'Sample covariance cannot be computed for a sample size less than or equal to 1.')
+        return self.c/(self.n - ddof)
+
+    def correlation(self) -> float:
+        """
+        Returns the Pearson correlation coefficient of the sample.
+
+        Raises
+        ------
+        1. **scrilla.errors.SampleSizeError**
+            If the sample has one or fewer observations.
+        2. **ValueError**
+            If either sample has no variance, in which case the correlation is undefined.
+        """
+        if self.n <= 1:
+            raise errors.SampleSizeError(
+                'Sample correlation cannot be computed for a sample size less than or equal to 1.')
+        denominator = numpy.sqrt(max(self.x.m2, 0)*max(self.y.m2, 0))
+        if denominator == 0:
+            raise ValueError(
+                'Denominator for correlation formula to small for division')
+        return float(self.c/denominator)
+
+
+class CorrelationMatrixAccumulator():
+    """
+    Accumulates the mean vector and the covariance and correlation matrices of a multivariate sample, i.e. a sample of observations of `dimension` variables made at the same time.
+
+    Parameters
+    ----------
+    1. **dimension**: ``int``
+        Number of variables in each observation.
+
+    Attributes
+    ----------
+    1. **n**: ``int``
+        Number of observations accumulated.
+    2. **mean**: ``numpy.ndarray``
+        Sample mean of each variable.
+    3. **comoment**: ``numpy.ndarray``
+        ``(dimension, dimension)`` matrix of the sums of the products of the deviations of each pair of variables from their means.
+    """
+    __slots__ = ('n', 'mean', 'comoment')
+
+    def __init__(self, dimension: int):
+        self.n = 0
+        self.mean = numpy.zeros(dimension)
+        self.comoment = numpy.zeros((dimension, dimension))
+
+    def update(self, observation: Union[List[float], numpy.ndarray]) -> 'CorrelationMatrixAccumulator':
+        """
+        Adds a single observation of every variable to the sample.
+        """
+        observation = numpy.asarray(observation, dtype=float)
+        self.n += 1
+        delta = observation - self.mean
+        self.mean = self.mean + delta/self.n
+        self.comoment += numpy.outer(delta, observation - self.mean)
+        return self
+
+    def update_many(self, observations: Union[List[List[float]], numpy.ndarray]) -> 'CorrelationMatrixAccumulator':
+        """
+        Adds a chunk of observations to the sample. `observations` is a ``(observations, dimension)`` array. The statistics of the chunk are computed with a single matrix product and then merged into the accumulator, so a long history can be processed chunk by chunk without holding all of it in memory.
+        """
+        observations = numpy.asarray(observations, dtype=float)
+        if len(observations) == 0:
+            return self
+        chunk = CorrelationMatrixAccumulator(len(self.mean))
+        chunk.n, chunk.mean = len(observations), numpy.mean(observations, axis=0)
+        centered = observations - chunk.mean
+        chunk.comoment = centered.T @ centered
+        return self.merge(chunk)
+
+    def remove(self, observation: Union[List[float], numpy.ndarray]) -> 'CorrelationMatrixAccumulator':
+        """
+        Removes a single observation, which must have been added previously, from the sample.
+        """
+        if self.n == 0:
+            raise errors.SampleSizeError(
+                'Cannot remove an observation from an empty sample.')
+        observation = numpy.asarray(observation, dtype=float)
+        if self.n == 1:
+            self.__init__(len(self.mean))
+            return self
+        previous_mean = (self.n*self.mean - observation)/(self.n - 1)
+        self.comoment -= numpy.outer(observation -
+                                     previous_mean, observation - self.mean)
+        self.n, self.mean = self.n - 1, previous_mean
+        return self
+
+    def merge(self, other: 'CorrelationMatrixAccumulator') -> 'CorrelationMatrixAccumulator':
+        """
+        Adds the observations accumulated by `other` to the sample.
+        """
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + \
+            numpy.outer(delta, delta)*self.n*other.n/n
+        self.mean = self.mean + delta*other.n/n
+        self.n = n
+        return self
+
+    def covariance(self, ddof: int = 1) -> numpy.ndarray:
+        """
+        Returns the covariance matrix of the sample, dividing the co-moments by `n - ddof`. Defaults to the unbiased sample covariance.
+        """
+        if self.n <= ddof:
+            raise errors.SampleSizeError(
+                'Sample covariance cannot be computed for a sample size less than or equal to 1.')
+        return self.comoment/(self.n - ddof)
+
+    def correlation(self) -> numpy.ndarray:
+        """
+        Returns the correlation matrix of the sample.
+        """
+        if self.n <= 1:
+            raise errors.SampleSizeError(
+                'Sample correlation cannot be computed for a sample size less than or equal to 1.')
+        volatilities = numpy.sqrt(numpy.maximum(numpy.diag(self.comoment), 0))
+        correlation = self.comoment/numpy.outer(volatilities, volatilities)
+        numpy.fill_diagonal(correlation, 1)
+        return correlation
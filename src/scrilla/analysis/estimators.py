@@ -17,14 +17,17 @@
 A module of statistical point estimators and likelihood functions.
 """
 
+import bisect
 from os import path
 from sys import path as sys_path
-from typing import List, Union
+from typing import Dict, List, Union
+import numpy
 from numpy import inf
-from math import log, sqrt, exp
+from math import sqrt
 from scipy.stats import norm, multivariate_normal
 
 from scrilla.util import errors
+from scrilla.analysis.accumulators import MomentAccumulator, CovarianceAccumulator
 
 if __name__ == "__main__":
     APP_DIR = path.dirname(path.dirname(path.abspath(__file__)))
@@ -38,6 +41,10 @@ logger = outputter.Logger('scrilla.analysis.estimators', settings.LOG_LEVEL)
 profile_cache = cache.ProfileCache()
 correlation_cache = cache.CorrelationCache()
 
+# NOTE: Gauss-Legendre quadrature nodes and weights on [-1, 1] used to integrate the bivariate
+#       normal distribution. 40 nodes keep the error below 1e-6 for correlations up to 0.99999.
+_QUADRATURE_NODES, _QUADRATURE_WEIGHTS = numpy.polynomial.legendre.leggauss(40)
+
 
 def univariate_normal_likelihood_function(params: list, data: list) -> float:
     """
@@ -50,10 +57,7 @@ def univariate_normal_likelihood_function(params: list, data: list) -> float:
     2. **data** : ``list``
         A list of data that has been drawn from a univariate normal population.
     """
-    likelihood = 0
-    for point in data:
-        likelihood += norm.logpdf(x=point, loc=params[0], scale=params[1])
-    return likelihood
+    return float(numpy.sum(norm.logpdf(x=numpy.asarray(data, dtype=float), loc=params[0], scale=params[1])))
 
 
 def bivariate_normal_likelihood_function(params: list, data: list) -> float:
@@ -78,38 +82,104 @@ def bivariate_normal_likelihood_function(params: list, data: list) -> float:
     if determinant == 0 or determinant < 0 or determinant < (10**(-constants['ACCURACY'])):
         return inf
 
-    likelihood = 0
-    for point in data:
-        likelihood += multivariate_normal.logpdf(x=point, mean=mean, cov=cov)
-    return likelihood
+    if len(data) == 0:
+        return 0
+    return float(numpy.sum(multivariate_normal.logpdf(x=numpy.asarray(data, dtype=float), mean=mean, cov=cov)))
 
 
-def sample_percentile(data: List[float], percentile: float):
+class OrderStatistics:
+    r"""
+    The order statistics of a sample, i.e. the sample sorted in ascending order. The sample is sorted once when the object is created, after which any number of percentiles can be read off the order statistics in constant time per percentile.
+
+    The percentile *p* of a sample of *n* observations is the \((n+1) \cdot p\)-th order statistic. If this falls between two order statistics, the percentile is interpolated linearly between them; percentiles that fall before the first or after the last order statistic are given by the first or last order statistic, respectively.
+
+    Parameters
+    ----------
+    1. **data** : ``Union[List[float], numpy.ndarray]``
+        Sample of data. If the sample is two dimensional, each column is treated as a separate sample and percentiles are returned for every column.
+    2. **presorted** : ``bool``
+        *Optional*. Flag to signal `data` is already sorted in ascending order, so it does not need to be sorted again. Defaults to `False`.
+
+    Attributes
+    ----------
+    1. **ordered** : ``numpy.ndarray``
+        The sample sorted in ascending order along its first axis.
+
+    .. notes::
+        * the sample passed in is never modified; unless `presorted` is set, a sorted copy is made.
     """
-    Returns the observation in a sample data corresponding to the given percentile, i.e. the observation from a sorted sample where the percentage of the observations below that point is specified by the percentile. If the percentile falls between data points, the observation is smoothed based on the distance from the adjoining observations in the following manner,
+    __slots__ = ('ordered',)
+
+    def __init__(self, data: Union[List[float], numpy.ndarray], presorted: bool = False):
+        self.ordered = numpy.asarray(data, dtype=float)
+        if not presorted:
+            self.ordered = numpy.sort(self.ordered, axis=0)
+
+    def __len__(self) -> int:
+        return len(self.ordered)
+
+    def percentile(self, percentile: Union[float, List[float]]) -> Union[float, numpy.ndarray]:
+        """
+        Returns the observations corresponding to the given percentiles.
+
+        Parameters
+        ----------
+        1. **percentile** : ``Union[float, List[float]]``
+            A single percentile or a list of percentiles.
+
+        Returns
+        -------
+        ``Union[float, numpy.ndarray]``
+            A ``float`` if a single percentile of a one dimensional sample is requested. Otherwise, an array whose first axis runs over the requested percentiles and whose second axis, if the sample is two dimensional, runs over its columns.
+        """
+        n = len(self.ordered)
+        if n == 0:
+            raise errors.SampleSizeError(
+                'Percentiles of an empty sample are undefined.')
 
-    .. todo:: add latex here
+        obs_number = (n + 1)*numpy.asarray(percentile, dtype=float)
+        whole = numpy.floor(obs_number)
+        weight = obs_number - whole
+        lower = numpy.clip(whole.astype(int) - 1, 0, n - 1)
+        upper = numpy.clip(whole.astype(int), 0, n - 1)
+        if self.ordered.ndim > 1:
+            weight = weight[..., None]
+
+        result = (1 - weight)*self.ordered[lower] + weight*self.ordered[upper]
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+
+def sample_percentile(data: List[float], percentile: float):
+    """
+    Returns the observation in a sample data corresponding to the given percentile, i.e. the observation from a sorted sample where the percentage of the observations below that point is specified by the percentile. If the percentile falls between data points, the observation is smoothed based on the distance from the adjoining observations, as described in `scrilla.analysis.estimators.OrderStatistics`.
 
     Parameters
     ----------
     1. **data** : ``list``
-        Array representing the set of data whose percentile is to be calculated.
+        Array representing the set of data whose percentile is to be calculated. The sample is not modified.
     2. **percentile**: ``float``
         The percentile corresponding to the desired observation.
+
+    .. notes::
+        * the sample is sorted on every call. If several percentiles of the same sample are needed, sort it once with `scrilla.analysis.estimators.OrderStatistics` instead.
     """
-    data.sort()
+    return OrderStatistics(data).percentile(percentile)
 
-    obs_number = (len(data) + 1)*percentile
-    extrapolate = obs_number - int(obs_number)
 
-    if extrapolate == 0:
-        return data[int(obs_number)-1]
-    if obs_number > len(data):
-        return data[-1]
-    first_index = int(obs_number) - 1
-    second_index = first_index + 1
-    weight = obs_number - int(obs_number)
-    return (1-weight)*data[first_index] + weight*data[second_index]
+def percentile_of_sorted(data: List[float], percentile: Union[float, List[float]]) -> Union[float, numpy.ndarray]:
+    """
+    Returns the percentile of a sample that is already sorted in ascending order, smoothed in the same manner as `scrilla.analysis.estimators.sample_percentile`. The sample is not modified.
+
+    Parameters
+    ----------
+    1. **data** : ``list``
+        Array representing the set of data whose percentile is to be calculated, sorted in ascending order.
+    2. **percentile**: ``Union[float, List[float]]``
+        The percentile corresponding to the desired observation, or a list of percentiles.
+    """
+    return OrderStatistics(data, presorted=True).percentile(percentile)
 
 
 def empirical_copula(sample: List[List[float]], x_order: float, y_order: float):
@@ -125,23 +195,127 @@ def empirical_copula(sample: List[List[float]], x_order: float, y_order: float):
     where \\(x_p\\) and \\(y_p\\) are the *p*-th percentiles of their respective univariate samples.
     """
     n = len(sample)
+    sample = numpy.asarray(sample, dtype=float).reshape(n, 2)
+    return int(numpy.count_nonzero((sample[:, 0] <= x_order) & (sample[:, 1] <= y_order))) / n
 
-    def x_order_bounds(test_point):
-        return test_point < x_order or test_point == x_order
 
-    def y_order_bounds(test_point):
-        return test_point < y_order or test_point == y_order
+def empirical_copulas(x: List[float], y: List[float], x_orders: List[float], y_orders: List[float]) -> numpy.ndarray:
+    """
+    Computes the empirical copula of the paired sample *(x, y)*, as defined in `scrilla.analysis.estimators.empirical_copula`, at every pair of orders `(x_orders[i], y_orders[j])` in a single pass over the sample. Each observation is ranked against the orders with a binary search, the observations are counted into a two-dimensional histogram of their ranks and the histogram is summed cumulatively along both axes.
+
+    Parameters
+    ----------
+    1. **x**: ``List[float]``
+        The *x* sample of paired data (*x*, *y*). Must preserve order with **y**.
+    2. **y**: ``List[float]``
+        The *y* sample of paired data (*x*, *y*). Must preserve order with **x**.
+    3. **x_orders**: ``List[float]``
+        Orders of *x*, sorted in ascending order.
+    4. **y_orders**: ``List[float]``
+        Orders of *y*, sorted in ascending order.
+
+    Returns
+    -------
+    ``numpy.ndarray``
+        ``(len(x_orders), len(y_orders))`` array whose *(i, j)*-th element is the proportion of the sample for which `x <= x_orders[i]` and `y <= y_orders[j]`.
+    """
+    # NOTE: x <= x_orders[k] if and only if the left insertion point of x is at most k.
+    x_ranks = numpy.searchsorted(x_orders, x, side='left')
+    y_ranks = numpy.searchsorted(y_orders, y, side='left')
+    counts = numpy.zeros((len(x_orders) + 1, len(y_orders) + 1))
+    numpy.add.at(counts, (x_ranks, y_ranks), 1)
+    return counts.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] / len(x)
+
+
+def bivariate_normal_cdf(x: Union[float, numpy.ndarray], y: Union[float, numpy.ndarray], correlation: Union[float, numpy.ndarray]) -> numpy.ndarray:
+    r"""
+    Returns the cumulative probability of the standard bivariate normal distribution with correlation \\(\rho\\), evaluated elementwise over arrays of arguments. The probability is calculated with Gauss-Legendre quadrature over the integral,
+
+    $$ \Phi_2(x, y; \rho) = \Phi(x) \cdot \Phi(y) + \frac{1}{2 \pi} \int_{0}^{\arcsin \rho} e^{-\frac{x^2 - 2xy \sin \theta + y^2}{2 \cos^2 \theta}} d\theta $$
+
+    Parameters
+    ----------
+    1. **x**: ``Union[float, numpy.ndarray]``
+    2. **y**: ``Union[float, numpy.ndarray]``
+    3. **correlation**: ``Union[float, numpy.ndarray]``
+        Correlations strictly between -1 and 1. The arguments are broadcast against one another.
+    """
+    x, y, correlation = numpy.broadcast_arrays(numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float),
+                                               numpy.asarray(correlation, dtype=float))
+    upper = numpy.arcsin(correlation)
+    theta = 0.5*upper[..., None]*(_QUADRATURE_NODES + 1)
+    x_nodes, y_nodes = x[..., None], y[..., None]
+    integrand = numpy.exp(-(x_nodes**2 - 2*x_nodes*y_nodes*numpy.sin(theta) + y_nodes**2)
+                          / (2*numpy.cos(theta)**2))
+    integral = 0.5*upper*numpy.sum(_QUADRATURE_WEIGHTS*integrand, axis=-1)
+    return norm.cdf(x)*norm.cdf(y) + integral/(2*numpy.pi)
+
+
+def bivariate_normal_density(x: Union[float, numpy.ndarray], y: Union[float, numpy.ndarray], correlation: Union[float, numpy.ndarray]) -> numpy.ndarray:
+    """
+    Returns the probability density of the standard bivariate normal distribution with correlation `correlation`, evaluated elementwise over arrays of arguments. The density is also the derivative of `scrilla.analysis.estimators.bivariate_normal_cdf` with respect to the correlation.
+    """
+    determinant = 1 - numpy.asarray(correlation, dtype=float)**2
+    return numpy.exp(-(x**2 - 2*correlation*x*y + y**2)/(2*determinant))/(2*numpy.pi*numpy.sqrt(determinant))
 
-    copula = [1 for point in sample if x_order_bounds(
-        point[0]) and y_order_bounds(point[1])]
-    return len(copula) / n
+
+def copula_correlation(x_orders: numpy.ndarray, y_orders: numpy.ndarray, empirical: numpy.ndarray, bound: float = 0.99999) -> numpy.ndarray:
+    """
+    Solves for the correlations that best match a standard bivariate normal copula to empirical copula estimates in the least squares sense. Several problems are solved at once, one per column of the inputs, with damped Gauss-Newton iterations; the derivative of each residual is given exactly by `scrilla.analysis.estimators.bivariate_normal_density`.
+
+    Parameters
+    ----------
+    1. **x_orders**: ``numpy.ndarray``
+        ``(orders, problems)`` array of standardized *x* orders.
+    2. **y_orders**: ``numpy.ndarray``
+        ``(orders, problems)`` array of standardized *y* orders.
+    3. **empirical**: ``numpy.ndarray``
+        ``(orders, problems)`` array of empirical copula estimates at the `(x_orders, y_orders)` pairs.
+    4. **bound**: ``float``
+        Bound on the absolute value of the correlations.
+
+    Returns
+    -------
+    ``numpy.ndarray``
+        Array of correlations, one per problem.
+    """
+    correlation = numpy.zeros(empirical.shape[1])
+    residuals = bivariate_normal_cdf(x_orders, y_orders, correlation) - empirical
+    objective = numpy.sum(residuals**2, axis=0)
+
+    for _ in range(100):
+        jacobian = bivariate_normal_density(x_orders, y_orders, correlation)
+        step = numpy.sum(residuals*jacobian, axis=0) / \
+            numpy.maximum(numpy.sum(jacobian**2, axis=0), 10**(-2*constants['ACCURACY']))
+
+        # NOTE: halve the step of every problem whose objective does not decrease.
+        for _ in range(20):
+            candidate = numpy.clip(correlation - step, -bound, bound)
+            candidate_residuals = bivariate_normal_cdf(
+                x_orders, y_orders, candidate) - empirical
+            candidate_objective = numpy.sum(candidate_residuals**2, axis=0)
+            worse = candidate_objective > objective
+            if not worse.any():
+                break
+            step = numpy.where(worse, step/2, step)
+        candidate = numpy.where(worse, correlation, candidate)
+
+        converged = numpy.max(numpy.abs(candidate - correlation)) < 10**(-constants['ACCURACY'])
+        correlation = candidate
+        residuals = bivariate_normal_cdf(
+            x_orders, y_orders, correlation) - empirical
+        objective = numpy.sum(residuals**2, axis=0)
+        if converged:
+            break
+
+    return correlation
 
 
 def sample_correlation(x: List[float], y: List[float]):
     """
     Returns the sample correlation calculated using the Pearson correlation coefficient estimator,
 
-    .. todo:: Pearson coefficient formula here
+    $$ r = \\frac{\\sum_{i=1}^{n} (x_i - \\bar{x}) \\cdot (y_i - \\bar{y})}{\\sqrt{\\sum_{i=1}^{n} (x_i - \\bar{x})^2 \\cdot \\sum_{i=1}^{n} (y_i - \\bar{y})^2}} $$
 
     Parameters
     ----------
@@ -157,8 +331,8 @@ def sample_correlation(x: List[float], y: List[float]):
     2. **ValueError** :
         If the denominator of the correlation coefficient becomes too small for floating point arithmetic, this error is thrown.
 
-    .. todos ::
-        * Possibly wrap the correlation coefficient numerator and denominator in `Decimal` class before calculation to bypass the **ValueError** that occurs in some samples where the denominator is too small for the arithmetic to detect.
+    .. notes::
+        * The co-moments are accumulated around the running means with `scrilla.analysis.accumulators.CovarianceAccumulator`, so the estimate does not suffer from the cancellation that afflicts the sum-of-squares formula.
     """
     if len(x) != len(y):
         raise errors.SampleSizeError('Samples are not of comparable lengths')
@@ -167,41 +341,52 @@ def sample_correlation(x: List[float], y: List[float]):
         raise errors.SampleSizeError(
             'Sample correlation cannot be computed for a sample size less than or equal to 1.')
 
-    sumproduct, sum_x_squared, sum_x, sum_y, sum_y_squared = 0, 0, 0, 0, 0
-    n = len(x)
-    for i, item in enumerate(x):
-        sumproduct += item*y[i]
-        sum_x += item
-        sum_x_squared += item**2
-        sum_y += y[i]
-        sum_y_squared += y[i]**2
-    correl_num = ((n*sumproduct) - sum_x*sum_y)
-    correl_den = sqrt((n*sum_x_squared-sum_x**2)*(n*sum_y_squared-sum_y**2))
-
-    # LET'S DO SOME MATHEMATICS! (to get around division by zero!)
-    #   Unfortunately, this only works when A and B > 0 because log
-    #       of a negative number only exists in complex plane.
-    #   1. correl = A/B
-    #   2. log(correl) = log(A/B) = log(A) - log(B)
-    #   3. exp(log(correl)) = exp(log(A/B))
-    #   4. correl = exp(log(A/B))
-    if correl_num > 0 and correl_den > 0:
-        log_correl = log(correl_num) - log(correl_den)
-        correlation = exp(log_correl)
-    else:
-        if correl_den != 0:
-            correlation = correl_num / correl_den
-        else:
-            raise ValueError(
-                'Denominator for correlation formula to small for division')
+    return CovarianceAccumulator().update_many(x, y).correlation()
 
-    return correlation
 
+def recursive_rolling_correlation(previous: Dict[str, float], new_x_obs: float, lost_x_obs: float,
+                                  new_y_obs: float, lost_y_obs: float, n: int = settings.DEFAULT_ANALYSIS_PERIOD) -> Dict[str, float]:
+    """
+    Slides a window of `n` bivariate observations forward by one observation, updating its sample statistics in constant time.
 
-def recursive_rolling_correlation(correl_previous, new_x_observation, lost_x_obs,
-                                  new_y_obs, lost_y_obs, n=settings.DEFAULT_ANALYSIS_PERIOD):
-    # TODO: after other rolling functions work...
-    pass
+    Parameters
+    ----------
+    1. **previous**: ``Dict[str, float]``
+        Sample statistics of the window before it slides, formatted as `{ 'x_bar': float, 'y_bar': float, 'x_variance': float, 'y_variance': float, 'covariance': float }`. The statistics of the first window can be calculated with `scrilla.analysis.estimators.sample_mean`, `scrilla.analysis.estimators.sample_variance` and `scrilla.analysis.estimators.sample_covariance`.
+    2. **new_x_obs**: ``float``
+        Observation of *x* entering the window.
+    3. **lost_x_obs**: ``float``
+        Observation of *x* leaving the window.
+    4. **new_y_obs**: ``float``
+        Observation of *y* entering the window.
+    5. **lost_y_obs**: ``float``
+        Observation of *y* leaving the window.
+    6. **n**: ``int``
+        Number of observations in the window.
+
+    Returns
+    -------
+    ``Dict[str, float]``
+        The sample statistics of the window after it slides, in the same format as `previous`, along with the sample `correlation`.
+    """
+    x_bar = recursive_rolling_mean(
+        previous['x_bar'], new_x_obs, lost_x_obs, n)
+    y_bar = recursive_rolling_mean(
+        previous['y_bar'], new_y_obs, lost_y_obs, n)
+    x_variance = recursive_rolling_variance(
+        previous['x_variance'], previous['x_bar'], new_x_obs, lost_x_obs, n)
+    y_variance = recursive_rolling_variance(
+        previous['y_variance'], previous['y_bar'], new_y_obs, lost_y_obs, n)
+    covariance = recursive_rolling_covariance(previous['covariance'], new_x_obs, lost_x_obs, previous['x_bar'],
+                                              new_y_obs, lost_y_obs, previous['y_bar'], n)
+    return {
+        'x_bar': x_bar,
+        'y_bar': y_bar,
+        'x_variance': x_variance,
+        'y_variance': y_variance,
+        'covariance': covariance,
+        'correlation': covariance / sqrt(x_variance*y_variance)
+    }
 
 
 def sample_mean(x: List[float]) -> float:
@@ -222,23 +407,21 @@ def sample_mean(x: List[float]) -> float:
     2. **ValueError**
         If the sample contains null or non-numerical data, this error will be thrown.
     """
-    xbar, n = 0, len(x)
-
     if not all(this_x is not None and isinstance(this_x, (float, int)) for this_x in x):
         raise ValueError(
             'Sample contains null values')
 
-    if n == 0:
+    if len(x) == 0:
         raise errors.SampleSizeError(
             'Sample mean cannot be computed for a sample size of 0.')
 
-    for i in x:
-        xbar += i/n
-    return xbar
+    return MomentAccumulator().update_many(x).mean
 
 
 def recursive_rolling_mean(xbar_previous, new_obs, lost_obs, n=settings.DEFAULT_ANALYSIS_PERIOD):
-    # this should be done in terms of the sample arrays, not the observations themselves, i think.
+    """
+    Returns the sample mean of a window of `n` observations after `new_obs` enters the window and `lost_obs` leaves it, given the sample mean of the window before it slides.
+    """
     xbar_next = xbar_previous + (new_obs - lost_obs)/n
     return xbar_next
 
@@ -259,39 +442,35 @@ def sample_variance(x: List[float]):
     1. `scrilla.errors.SampleSizeError`
 
     .. notes::
-        * This a naive two-pass implementation of sample variance. The function does not shift data around the mean, resulting in skewed calculations if the variance is numerically small and the sample is large; if you are concerned about the accuracy of your variance calculation in these instances, a better method is to use `scrilla.analysis.estimators.recursive_sum_of_squares` and then compute the variance by dividing by _(n-1)_, where _n_ is the number of samples.
+        * The squared deviations are accumulated around the running mean with `scrilla.analysis.accumulators.MomentAccumulator`, so the estimate stays accurate when the variance is numerically small and the sample is large.
     """
-    # TODO: this is a 'naive' estimation of variance: https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
-
-    mu, sigma, n = sample_mean(x=x), 0, len(x)
-
     if not all(this_x is not None and isinstance(this_x, (float, int)) for this_x in x):
         raise ValueError(
             'Sample contains null values')
 
-    if n == 0:
-        raise errors.SampleSizeError(
-            'Sample variance cannot be computed for a sample size of 0.')
+    return MomentAccumulator().update_many(x).variance()
 
-    if n == 1:
-        # no variance for a sample of 1.
-        return 0
 
-    for i in x:
-        sigma += ((i-mu)**2)/(n-1)
-    return sigma
+def recursive_rolling_variance(var_previous, xbar_previous, new_obs, lost_obs, n=settings.DEFAULT_ANALYSIS_PERIOD):
+    r"""
+    Returns the sample variance of a window of `n` observations after `new_obs` enters the window and `lost_obs` leaves it, given the sample mean and variance of the window before it slides,
 
+    $$ s_{new}^2 = s_{previous}^2 + \frac{(x_{new} - x_{lost}) \cdot (x_{new} - \bar{x}_{new} + x_{lost} - \bar{x}_{previous})}{n-1} $$
 
-def recursive_rolling_variance(var_previous, xbar_previous, new_obs, lost_obs, n=settings.DEFAULT_ANALYSIS_PERIOD):
-    # TODO: slightly off for some reason...Formula not correct? Rework it out.
+    .. notes::
+        * The update is written in terms of deviations from the means rather than differences of squares, so it does not lose precision to cancellation when the observations are large relative to their spread.
+    """
     xbar_new = recursive_rolling_mean(xbar_previous=xbar_previous, new_obs=new_obs,
                                       lost_obs=lost_obs, n=n)
     var_new = var_previous + \
-        (n/(n-1))*((new_obs**2 - lost_obs**2)/n + (xbar_previous**2-xbar_new**2))
+        (new_obs - lost_obs)*(new_obs - xbar_new + lost_obs - xbar_previous)/(n-1)
     return var_new
 
 
 def recursive_sum_of_squares(x: List[float], checked: bool = False):
+    """
+    Returns the sum of the squared deviations of a sample from its mean. Dividing the result by _(n-1)_, where _n_ is the number of samples, gives the sample variance.
+    """
     n = len(x)
 
     if not checked:
@@ -303,11 +482,7 @@ def recursive_sum_of_squares(x: List[float], checked: bool = False):
             raise errors.SampleSizeError(
                 'Sample variance cannot be computed for a sample size of 0.')
 
-    if n == 1:
-        return 0
-
-    term_variance = (n*x[-1] - sum(x))**2/(n*(n-1))
-    return recursive_sum_of_squares(x[:-1], True) + term_variance
+    return MomentAccumulator().update_many(x).m2
 
 
 def sample_covariance(x: list, y: list):
@@ -332,18 +507,13 @@ def sample_covariance(x: list, y: list):
         raise errors.SampleSizeError(
             'Sample correlation cannot be computed for a sample size less than or equal to 1.')
 
-    n, covariance = len(x), 0
-
-    x_mean, y_mean = sample_mean(x=x), sample_mean(x=y)
-
-    for i, item in enumerate(x):
-        covariance += (item - x_mean)*(y[i] - y_mean) / (n - 1)
-
-    return covariance
+    return CovarianceAccumulator().update_many(x, y).covariance()
 
 
 def recursive_rolling_covariance(covar_previous: float, new_x_obs: float, lost_x_obs: float, previous_x_bar: float, new_y_obs: float, lost_y_obs: float, previous_y_bar: float, n: int = settings.DEFAULT_ANALYSIS_PERIOD):
-    # TODO: no work.
+    """
+    Returns the sample covariance of a window of `n` bivariate observations after `(new_x_obs, new_y_obs)` enters the window and `(lost_x_obs, lost_y_obs)` leaves it, given the sample means and covariance of the window before it slides.
+    """
     new_sum_term = new_x_obs*new_y_obs - lost_x_obs*lost_y_obs
     xy_cross_term = previous_x_bar*(new_y_obs-lost_y_obs)
     yx_cross_term = previous_y_bar*(new_x_obs-lost_x_obs)
@@ -353,6 +523,80 @@ def recursive_rolling_covariance(covar_previous: float, new_x_obs: float, lost_x
     return covar_new
 
 
+def rolling_sums(x: List[float], period: int) -> numpy.ndarray:
+    """
+    Returns the sums of the trailing windows of a sample, i.e. the *i*-th element of the result is the sum of the observations from *i-period+1* to *i*. Windows at the start of the sample that do not have `period` observations are summed over the observations available. The sums are differences of a single prefix sum, so the whole series is computed in *O(n)*, regardless of `period`.
+
+    Parameters
+    ----------
+    1. **x**: ``List[float]``
+        Sample of data, ordered from earliest to latest.
+    2. **period**: ``int``
+        Number of observations in each window.
+    """
+    prefix = numpy.concatenate(([0.], numpy.cumsum(x, dtype=float)))
+    ends = numpy.arange(1, len(prefix))
+    return prefix[ends] - prefix[numpy.maximum(ends - period, 0)]
+
+
+def rolling_percentiles(x: List[float], period: int, percentiles: List[float]) -> numpy.ndarray:
+    """
+    Returns the percentiles of the trailing windows of a sample, i.e. row *i* of the result holds the `percentiles` of the observations from *i-period+1* to *i*, calculated in the manner of `scrilla.analysis.estimators.sample_percentile`. Windows at the start of the sample that do not have `period` observations are taken over the observations available.
+
+    Parameters
+    ----------
+    1. **x**: ``List[float]``
+        Sample of data, ordered from earliest to latest.
+    2. **period**: ``int``
+        Number of observations in each window.
+    3. **percentiles**: ``List[float]``
+        Percentiles to calculate for each window.
+
+    .. notes::
+        * The window is kept sorted as it slides over the sample: each step inserts the new observation and removes the lost observation with a binary search, instead of sorting the window from scratch. The percentiles are then interpolated between the two order statistics that bracket them, which are read off the sorted window by index.
+    """
+    window, result = [], numpy.empty((len(x), len(percentiles)))
+    for i, observation in enumerate(x):
+        bisect.insort(window, observation)
+        if i >= period:
+            del window[bisect.bisect_left(window, x[i - period])]
+
+        n, row = len(window), result[i]
+        for j, percentile in enumerate(percentiles):
+            obs_number = (n + 1)*percentile
+            whole = int(obs_number // 1)
+            weight = obs_number - whole
+            lower = min(max(whole - 1, 0), n - 1)
+            upper = min(max(whole, 0), n - 1)
+            row[j] = (1 - weight)*window[lower] + weight*window[upper]
+    return result
+
+
+def exponential_moving_average(x: List[float], period: int) -> numpy.ndarray:
+    r"""
+    Returns the exponential moving average of a sample,
+
+    $$ EMA_{i} = EMA_{i-1} + \alpha \cdot (x_{i} - EMA_{i-1}) $$
+
+    with smoothing factor \\(\alpha = \frac{2}{period+1}\\). The average is seeded with the simple mean of the first `period` observations; before that, the simple mean of the observations available is returned.
+
+    Parameters
+    ----------
+    1. **x**: ``List[float]``
+        Sample of data, ordered from earliest to latest.
+    2. **period**: ``int``
+        Number of observations that determines the smoothing factor.
+    """
+    x = numpy.asarray(x, dtype=float)
+    result = numpy.empty(len(x))
+    seed = min(period, len(x))
+    result[:seed] = numpy.cumsum(x[:seed]) / numpy.arange(1, seed + 1)
+    alpha = 2 / (period + 1)
+    for i in range(seed, len(x)):
+        result[i] = result[i-1] + alpha*(x[i] - result[i-1])
+    return result
+
+
 def simple_regression_beta(x: List[float], y: List[float]):
     """
     Parameters
@@ -418,18 +662,16 @@ def qq_series_for_sample(sample: List[float]) -> List[list]:
     Parameters
     ----------
     1. **sample**: ``list``
-        A sample of numerical data.
+        A sample of numerical data. The sample is not modified.
+
+    .. notes::
+        * the sample is sorted once and every percentile is read off its order statistics, so the series is calculated in *O(n log n)* time.
     """
-    qq_series = []
     n = len(sample)
-    for i in range(len(sample)):
-        percentile = (i + 0.5)/n
-        percentile_sample = sample_percentile(
-            data=sample, percentile=percentile)
-        percentile_norm = norm.ppf(q=percentile)
-        qq_series += [[percentile_norm, percentile_sample]]
-
-    return qq_series
+    percentiles = (numpy.arange(n) + 0.5)/n
+    percentiles_sample = OrderStatistics(sample).percentile(percentiles)
+    percentiles_norm = norm.ppf(q=percentiles)
+    return numpy.column_stack([percentiles_norm, percentiles_sample]).tolist()
 
 
 def standardize(x: List[float]):
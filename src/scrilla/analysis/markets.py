@@ -248,8 +248,10 @@ def screen_for_discount(model: str = keys.keys['MODELS']['DDM'], discount_rate:
     discounts = {}
     user_discount_rate = discount_rate
 
+    spot_prices = services.get_daily_prices_latest(tickers=equities)
+
     for equity in equities:
-        spot_price = services.get_daily_price_latest(ticker=equity)
+        spot_price = spot_prices[equity]
 
         if user_discount_rate is None:
             discount_rate = cost_of_equity(ticker=equity)
@@ -13,19 +13,19 @@
 # along with scrilla.  If not, see <https://www.gnu.org/licenses/>
 # or <https://github.com/chinchalinchin/scrilla/blob/develop/main/LICENSE>.
 
-from scrilla.util import errors, outputter, helper, dater
+from scrilla.util import errors, outputter, helper, dater, prices as price_util
 from scrilla.analysis import estimators
 from scrilla.static import keys, functions, constants
 from scrilla import services, files, settings, cache
-from numpy import inf
+import numpy
 from datetime import date
 from itertools import groupby
 import datetime
 import itertools
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 from math import log, sqrt
-from scipy.stats import norm, multivariate_normal
-from scipy.optimize import fsolve, least_squares
+from scipy.stats import norm
+from scipy.optimize import fsolve
 
 
 logger = outputter.Logger(
@@ -34,7 +34,7 @@ profile_cache = cache.ProfileCache()
 correlation_cache = cache.CorrelationCache()
 
 
-def get_sample_of_returns(ticker: str, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, start_date: Union[date, None] = None, end_date: Union[date, None] = None, asset_type: Union[str, None] = None, daily: bool = False) -> List[float]:
+def get_sample_of_returns(ticker: str, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceSeries, None] = None, start_date: Union[date, None] = None, end_date: Union[date, None] = None, asset_type: Union[str, None] = None, daily: bool = False) -> List[float]:
     """
     Generates a list of logarithmic returns on the sample `prices`. Sample return is annualized.
 
@@ -46,8 +46,8 @@ def get_sample_of_returns(ticker: str, sample_prices: Union[Dict[str, Dict[str,
         *Optional*. Start date of the time period over which the risk-return profile is to be calculated. Defaults to `None`, in which case the calculation proceeds as if `start_date` were set to 100 trading days prior to `end_date`. If `get_asset_type(ticker)=scrilla.keys.keys['ASSETS']['CRYPTO']`, this means 100 days regardless. If `get_asset_type(ticker)=scrilla.keys.keys['ASSETS']['EQUITY']`, this excludes weekends and holidays and decrements the `end_date` by 100 trading days.
     3. **end_date** : ``Union[date, None]``
         *Optional*. End date of the time period over which the risk-return profile is to be calculated. Defaults to `None`, in which the calculation proceeds as if `end_date` were set to today. If the `get_asset_type(ticker)==keys.keys['ASSETS']['CRYPTO']` this means today regardless. If `get_asset_type(ticker)=keys.keys['ASSETS']['EQUITY']` this excludes holidays and weekends and sets the end date to the last valid trading date.
-    4. **sample_prices** : ``Union[Dict[str, Dict[str, float]], None]``
-        *Optional*. A list of the asset prices for which the risk profile will be calculated. Overrides calls to service and forces calculation of risk price for sample of prices supplied. Function will disregard `start_date` and `end_date` and use the first and last key as the latest and earliest date, respectively. In other words, the `sample_prices` dictionary must be ordered from latest to earliest. Format: `{ 'date_1' : { 'open' : number, 'close' : number}, 'date_2': { 'open': number, 'close': number} ... }`
+    4. **sample_prices** : ``Union[Dict[str, Dict[str, float]], scrilla.util.prices.PriceSeries, None]``
+        *Optional*. A list of the asset prices for which the risk profile will be calculated. Overrides calls to service and forces calculation of risk price for sample of prices supplied. Function will disregard `start_date` and `end_date` and use the first and last key as the latest and earliest date, respectively. In other words, the `sample_prices` dictionary must be ordered from latest to earliest. Format: `{ 'date_1' : { 'open' : number, 'close' : number}, 'date_2': { 'open': number, 'close': number} ... }`. A `scrilla.util.prices.PriceSeries` may be passed in instead of the dictionary.
     5. **asset_type** : ``Union[str, None]``
          *Optional*. Specify asset type to prevent overusing redundant calculations. Allowable values: `scrilla.keys.keys['ASSETS']['EQUITY']`, `scrilla.keys.keys['ASSETS']['CRYPTO']`
     6. **daily**: ``bool``
@@ -84,43 +84,49 @@ def get_sample_of_returns(ticker: str, sample_prices: Union[Dict[str, Dict[str,
             f'{ticker} sample prices provided, skipping service call.', 'get_sample_of_returns')
         prices = sample_prices
 
-    today = False
-    sample_of_returns = []
-    trading_period = functions.get_trading_period(asset_type=asset_type)
+    series = price_util.as_series(prices, ticker)
+    closes, dates = series.closes, series.dates
 
-    for this_date in prices:
-        todays_price = prices[this_date][keys.keys['PRICES']['CLOSE']]
+    if len(closes) < 2:
+        return []
 
-        if today:
-            logger.verbose(
-                f'{this_date}: (todays_price, tomorrows_price) = ({todays_price}, {tomorrows_price})', 'get_sample_of_returns')
-            # NOTE: crypto prices may have weekends and holidays removed during correlation algorithm
-            # so samples can be compared to equities, need to account for these dates by increasing
-            # the time_delta by the number of missed days.
-            if asset_type == keys.keys['ASSETS']['CRYPTO'] or \
-                    (asset_type == keys.keys['ASSETS']['EQUITY'] and not dater.consecutive_trading_days(tomorrows_date, this_date)):
-                time_delta = (dater.parse(
-                    tomorrows_date) - dater.parse(this_date)).days
-            else:
-                time_delta = 1
+    time_deltas = _time_deltas(dates, asset_type)
 
-            todays_return = log(float(tomorrows_price) /
-                                float(todays_price))/(time_delta)
+    # NOTE: logarithms are taken with `math.log` rather than `numpy.log`, whose SIMD
+    #       implementation can differ in the last unit of precision.
+    sample_of_returns = numpy.fromiter(map(log, (closes[1:]/closes[:-1]).tolist()),
+                                       dtype=float, count=len(closes)-1)/time_deltas
 
-            if not daily:
-                todays_return = todays_return/trading_period
+    if not daily:
+        sample_of_returns = sample_of_returns/trading_period
 
-            sample_of_returns.append(todays_return)
-        else:
-            today = True
+    # NOTE: returns are ordered from latest to earliest, like the price history.
+    return sample_of_returns[::-1].tolist()
 
-        tomorrows_price = prices[this_date][keys.keys['PRICES']['CLOSE']]
-        tomorrows_date = this_date
 
-    return sample_of_returns
+def calculate_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, method: str = settings.ESTIMATION_METHOD, exponential: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the moving averages of the logarithmic returns of `ticker` on every date from `start_date` to `end_date`. See `scrilla.analysis.models.geometric.statistics._calculate_moment_moving_averages` for the format of the result.
 
+    Parameters
+    ----------
+    1. **ticker**: ``str``
+    2. **start_date** : ``Union[date, None]``
+        *Optional*. Defaults to `None`. Start date of the time period over which the moving averages will be calculated.
+    3. **end_date**: ``Union[date, None]``
+        *Optional*. Defaults to `None`. End date of the time period over which the moving averages will be calculated.
+    4. **method**: ``str``
+        *Optional*. Estimation method used to calculate the averages. Defaults to `scrilla.settings.ESTIMATION_METHOD`.
+    5. **exponential**: ``bool``
+        *Optional*. Defaults to `False`. If `True`, exponential moving averages of the logarithmic returns are calculated instead and `method` is ignored.
 
-def calculate_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, Dict[str, float]]:
+    .. notes::
+        * Each series is calculated over the whole date range in a single pass over the sample of prices, so the cost of the calculation grows linearly with the length of the date range, not with the product of the date range and the moving average periods.
+    """
+    if exponential:
+        return _calculate_exponential_moving_averages(ticker=ticker,
+                                                      start_date=start_date,
+                                                      end_date=end_date)
     if method == keys.keys['ESTIMATION']['MOMENT']:
         return _calculate_moment_moving_averages(ticker=ticker,
                                                  start_date=start_date,
@@ -136,7 +142,78 @@ def calculate_moving_averages(ticker: str, start_date: Union[date, None] = None,
     raise errors.ConfigurationError('Statistical estimation method not found')
 
 
-def calculate_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, weekends: Union[int, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, float]:
+def _moving_average_periods() -> List[int]:
+    return [settings.MA_1_PERIOD, settings.MA_2_PERIOD, settings.MA_3_PERIOD]
+
+
+def _moving_average_sample(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None):
+    """
+    Retrieves the sample of prices needed to calculate the moving averages of `ticker` from `start_date` to `end_date`, i.e. the prices from `max(MA_1_PERIOD, MA_2_PERIOD, MA_3_PERIOD)` periods before `start_date` up to `end_date`.
+
+    Returns
+    -------
+    ``tuple``
+        The trading period of the asset, the `scrilla.util.prices.PriceSeries` of the sample, the sample of returns ordered from earliest to latest, the dates on which the moving averages are calculated and the positions in the sample of returns of the last return in the window ending on each of those dates.
+    """
+    asset_type = files.get_asset_type(ticker)
+    trading_period = functions.get_trading_period(asset_type)
+
+    if start_date is None:
+        if asset_type == keys.keys['ASSETS']['EQUITY']:
+            start_date = dater.this_date_or_last_trading_date()
+        elif asset_type == keys.keys['ASSETS']['CRYPTO']:
+            start_date = dater.today()
+    if end_date is None:
+        end_date = start_date
+
+    if asset_type == keys.keys['ASSETS']['EQUITY']:
+        ma_date_range = dater.business_dates_between(start_date, end_date)
+        sample_start = dater.decrement_date_by_business_days(
+            start_date, settings.MA_3_PERIOD)
+    elif asset_type == keys.keys['ASSETS']['CRYPTO']:
+        ma_date_range = dater.dates_between(start_date, end_date)
+        sample_start = dater.decrement_date_by_days(
+            start_date, settings.MA_3_PERIOD)
+
+    sample_prices = services.get_daily_price_history(ticker=ticker, start_date=sample_start,
+                                                     end_date=end_date, asset_type=asset_type)
+    series = price_util.as_series(sample_prices, ticker)
+    returns = numpy.array(get_sample_of_returns(
+        ticker=ticker, sample_prices=series, asset_type=asset_type)[::-1])
+
+    # NOTE: the return on the i-th price of the sample is the (i-1)-th return.
+    ends = numpy.array([series.index_of(this_date)
+                       for this_date in ma_date_range], dtype=int) - 1
+    return trading_period, series, returns, ma_date_range, ends
+
+
+def _format_moving_averages(ma_dates: List[date], averages: List[numpy.ndarray]) -> Dict[str, Dict[str, float]]:
+    periods = _moving_average_periods()
+    return {
+        dater.to_string(this_date): {
+            f'MA_{period}': float(average[i]) for period, average in zip(periods, averages)
+        } for i, this_date in enumerate(ma_dates)
+    }
+
+
+def _calculate_exponential_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the exponential moving averages of the logarithmic returns of `ticker`, calculated over the periods `scrilla.settings.MA_1_PERIOD`, `scrilla.settings.MA_2_PERIOD` and `scrilla.settings.MA_3_PERIOD`. The result has the same format as `scrilla.analysis.models.geometric.statistics._calculate_moment_moving_averages`.
+
+    .. notes::
+        * Each average is seeded with the simple moving average of the first returns in the sample, which starts `max(MA_1_PERIOD, MA_2_PERIOD, MA_3_PERIOD)` periods before `start_date`. See `scrilla.analysis.estimators.exponential_moving_average`.
+    """
+    _, _, returns, ma_dates, ends = _moving_average_sample(
+        ticker, start_date, end_date)
+    logger.debug('Calculating %s exponential moving averages from %s to %s', '_calculate_exponential_moving_averages',
+                 ticker, ma_dates[0], ma_dates[-1])
+
+    averages = [estimators.exponential_moving_average(returns, ma_period)[ends]
+                for ma_period in _moving_average_periods()]
+    return _format_moving_averages(ma_dates, averages)
+
+
+def calculate_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceFrame, None] = None, weekends: Union[int, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, float]:
     """
     Returns the correlation between *ticker_1* and *ticker_2* from *start_date* to *end_date* using the estimation method *method*.
 
@@ -155,7 +232,7 @@ def calculate_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str,
     6. **end_date** : ``datetime.date``
         *Optional*. End date of the time period over which correlation will be calculated. If `None`, defaults to last trading day.
     7. **sample_prices** : ``dict``
-        *Optional*. A list of the asset prices for which correlation will be calculated. Overrides calls to service and calculates correlation for sample of prices supplied. Will disregard start_date and end_date. Must be of the format: `{'ticker_1': { 'date_1' : 'price_1', 'date_2': 'price_2' ...}, 'ticker_2': { 'date_1' : 'price_1:, ... } }` and ordered from latest date to earliest date.
+        *Optional*. A list of the asset prices for which correlation will be calculated. Overrides calls to service and calculates correlation for sample of prices supplied. Will disregard start_date and end_date. Must be of the format: `{'ticker_1': { 'date_1' : 'price_1', 'date_2': 'price_2' ...}, 'ticker_2': { 'date_1' : 'price_1:, ... } }` and ordered from latest date to earliest date, or a `scrilla.util.prices.PriceFrame`.
     8. **method** : ``str``
         *Optional*. Defaults to the value set by `scrilla.settings.ESTIMATION_METHOD`, which in turn is configured by the **DEFAULT_ESTIMATION_METHOD** environment variable. Determines the estimation method used during the calculation of sample statistics. Allowable values can be accessed through `scrilla.keys.keys['ESTIMATION']`.
 
@@ -178,7 +255,24 @@ def calculate_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str,
     raise KeyError('Estimation method not found')
 
 
-def calculate_risk_return(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, asset_type: Union[str, None] = None, weekends: Union[int, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, float]:
+def _time_deltas(dates: numpy.ndarray, asset_type: str) -> numpy.ndarray:
+    """
+    Returns the number of days between each pair of consecutive dates in the ascending array `dates`, counting consecutive trading days as a single day for equities.
+    """
+    # NOTE: crypto prices may have weekends and holidays removed during correlation algorithm
+    # so samples can be compared to equities, need to account for these dates by increasing
+    # the time_delta by the number of missed days.
+    time_deltas = (dates[1:] - dates[:-1]).astype(int)
+    if asset_type == keys.keys['ASSETS']['EQUITY']:
+        consecutive = dater.consecutive_trading_days_between(
+            dates[:-1], dates[1:])
+        time_deltas[consecutive] = 1
+    elif asset_type != keys.keys['ASSETS']['CRYPTO']:
+        time_deltas[:] = 1
+    return time_deltas
+
+
+def calculate_risk_return(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceSeries, None] = None, asset_type: Union[str, None] = None, weekends: Union[int, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, float]:
     """
     Estimates the mean rate of return and volatility for a sample of asset prices as if the asset price followed a Geometric Brownian Motion process, i.e. the mean rate of return and volatility are constant and not functions of time or the asset price. Uses the method passed in through `method` to estimate the model parameters.
 
@@ -191,7 +285,7 @@ def calculate_risk_return(ticker: str, start_date: Union[date, None] = None, end
     3. **end_date** : ``datetime.date``
         *Optional*. End date of the time period over which the risk-return profile is to be calculated. Defaults to `None`, in which the calculation proceeds as if `end_date` were set to today. If the `get_asset_type(ticker)==keys.keys['ASSETS']['CRYPTO']` this means today regardless. If `get_asset_type(ticker)=keys.keys['ASSETS']['EQUITY']` this excludes holidays and weekends and sets the end date to the last valid trading date.
     4. **sample_prices** : ``list``
-        *Optional*. A list of the asset prices for which the risk profile will be calculated. Overrides calls to service and forces calculation of risk price for sample of prices supplied. Function will disregard `start_date` and `end_date` and use the first and last key as the latest and earliest date, respectively. In other words, the `sample_prices` dictionary must be ordered from latest to earliest. Format: `{ 'date_1' : { 'open' : number, 'close' : number}, 'date_2': { 'open': number, 'close': number} ... }`
+        *Optional*. A list of the asset prices for which the risk profile will be calculated. Overrides calls to service and forces calculation of risk price for sample of prices supplied. Function will disregard `start_date` and `end_date` and use the first and last key as the latest and earliest date, respectively. In other words, the `sample_prices` dictionary must be ordered from latest to earliest. Format: `{ 'date_1' : { 'open' : number, 'close' : number}, 'date_2': { 'open': number, 'close': number} ... }`. A `scrilla.util.prices.PriceSeries` may be passed in instead of the dictionary.
     5. **asset_type** : ``str``
          *Optional*. Specify asset type to prevent overusing redundant calculations. Allowable values: `scrilla.keys.keys['ASSETS']['EQUITY']`, `scrilla.keys.keys['ASSETS']['CRYPTO']`
     6. **method**: ``str``
@@ -243,6 +337,178 @@ def calculate_risk_return(ticker: str, start_date: Union[date, None] = None, end
     raise errors.ConfigurationError('Statistical estimation method not found')
 
 
+def calculate_risk_returns(tickers: List[str], start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[Dict[str, Union[Dict[str, Dict[str, float]], price_util.PriceSeries]], None] = None, asset_types: Union[List[str], None] = None, weekends: Union[int, None] = None, method: str = settings.ESTIMATION_METHOD) -> Dict[str, Dict[str, float]]:
+    """
+    Batch version of `scrilla.analysis.models.geometric.statistics.calculate_risk_return`. Cached profiles are retrieved with `scrilla.cache.ProfileCache.filter_many`, the price histories of the remaining tickers are retrieved with `scrilla.services.get_daily_price_histories` and the tickers whose histories fall on the same dates are estimated together over a single two-dimensional array of returns. The new profiles are saved with `scrilla.cache.ProfileCache.save_many`.
+
+    Parameters
+    ----------
+    1. **tickers** : ``List[str]``
+        Ticker symbols whose risk-return profiles are to be calculated.
+    2. **start_date** : ``Union[datetime.date, None]``
+        *Optional*. Start date of the time period over which the risk-return profiles are to be calculated. See `scrilla.analysis.models.geometric.statistics.calculate_risk_return` for the default.
+    3. **end_date** : ``Union[datetime.date, None]``
+        *Optional*. End date of the time period over which the risk-return profiles are to be calculated. See `scrilla.analysis.models.geometric.statistics.calculate_risk_return` for the default.
+    4. **sample_prices** : ``Union[Dict[str, Dict[str, Dict[str, float]]], None]``
+        *Optional*. Price histories keyed by ticker symbol, ordered from latest to earliest date. Each history may be a `scrilla.util.prices.PriceSeries`. Overrides calls to the cache and the service, the same as the `sample_prices` argument of `scrilla.analysis.models.geometric.statistics.calculate_risk_return`.
+    5. **asset_types** : ``Union[List[str], None]``
+        *Optional*. Asset types that map to the `tickers` list. Will be calculated from the ticker symbols if not provided.
+    6. **weekends** : ``Union[int, None]``
+        *Optional*. Flag applied to every ticker. Defaults to including weekends for cryptocurrencies and excluding them for everything else.
+    7. **method**: ``str``
+        *Optional*. The calculation method to be used in estimating model parameters. Defaults to the method set in `scrilla.settings.ESTIMATION_METHOD`.
+
+    Raises
+    ------
+    1. **scrilla.errors.ConfigurationError**
+        If the inputted `method` does not map to one of the allowable values in the `scrilla.static.keys.keys` dictionary, then this error will be thrown.
+    2. **scrilla.errors.PriceError**
+        If prices cannot be retrieved for one of the tickers, this error will be thrown.
+
+    Returns
+    -------
+    ``Dict[str, Dict[str, float]]``
+        Dictionary of risk-return profiles keyed by ticker symbol, each formatted as `{ 'annual_return': value, 'annual_volatility': value }`.
+
+    .. notes::
+        * The percentile estimates are solved in closed form instead of numerically, so they may differ from `scrilla.analysis.models.geometric.statistics.calculate_risk_return` within the tolerance of its solver.
+    """
+    if method not in (keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'],
+                      keys.keys['ESTIMATION']['LIKE']):
+        raise errors.ConfigurationError(
+            'Statistical estimation method not found')
+
+    if asset_types is None:
+        asset_types = [None for _ in tickers]
+
+    # NOTE: tickers are grouped by the (start_date, end_date, weekends) period their profiles are
+    #       cached under, so each group needs one cache lookup, one price load and one cache write.
+    profiles, types, periods = {}, {}, {}
+    for ticker, asset_type in zip(tickers, asset_types):
+        if ticker in types:
+            continue
+        types[ticker] = errors.validate_asset_type(ticker, asset_type)
+        if weekends is not None:
+            this_weekends = weekends
+        else:
+            this_weekends = 1 if types[ticker] == keys.keys['ASSETS']['CRYPTO'] else 0
+
+        if sample_prices is None:
+            this_start, this_end = errors.validate_dates(start_date, end_date,
+                                                         keys.keys['ASSETS']['CRYPTO'] if this_weekends == 1
+                                                         else keys.keys['ASSETS']['EQUITY'])
+        else:
+            this_start, this_end = None, None
+        periods.setdefault((this_start, this_end, this_weekends), []).append(ticker)
+
+    prices = {}
+    for (this_start, this_end, this_weekends), group in periods.items():
+        if sample_prices is not None:
+            prices.update({ticker: sample_prices[ticker] for ticker in group})
+            continue
+
+        cached = profile_cache.filter_many(tickers=group, start_date=this_start, end_date=this_end,
+                                           weekends=this_weekends, method=method)
+        profiles.update({ticker: profile for ticker, profile in cached.items()
+                         if profile.get(keys.keys['STATISTICS']['RETURN']) is not None
+                         and profile.get(keys.keys['STATISTICS']['VOLATILITY']) is not None})
+
+        missing = [ticker for ticker in group if ticker not in profiles]
+        if not missing:
+            continue
+
+        logger.debug(f'Retrieving prices for {len(missing)} tickers from service',
+                     'calculate_risk_returns')
+        histories = services.get_daily_price_histories(tickers=missing, start_date=this_start,
+                                                       end_date=this_end,
+                                                       asset_types=[types[ticker] for ticker in missing])
+        for ticker in missing:
+            if types[ticker] == keys.keys['ASSETS']['CRYPTO'] and this_weekends == 0:
+                histories[ticker] = dater.intersect_with_trading_dates(
+                    histories[ticker])
+            prices[ticker] = histories[ticker]
+
+    # NOTE: histories that cover the same dates share their time deltas, so they can be
+    #       stacked into a single array and estimated together.
+    samples = {}
+    for ticker, history in prices.items():
+        if not history:
+            raise errors.PriceError(
+                f'No prices could be retrieved for {ticker}')
+        series = price_util.as_series(history, ticker)
+        samples.setdefault((types[ticker], series.dates.tobytes()),
+                           []).append((ticker, series))
+
+    for (asset_type, _), sample in samples.items():
+        estimates = _risk_return_estimates(closes=numpy.vstack([series.closes for _, series in sample]),
+                                           time_deltas=_time_deltas(
+                                               sample[0][1].dates, asset_type),
+                                           trading_period=functions.get_trading_period(
+                                               asset_type),
+                                           method=method)
+        for (ticker, _), mean, vol in zip(sample, *estimates):
+            profiles[ticker] = {
+                keys.keys['STATISTICS']['RETURN']: float(mean),
+                keys.keys['STATISTICS']['VOLATILITY']: float(vol)
+            }
+
+    if sample_prices is None:
+        for (this_start, this_end, this_weekends), group in periods.items():
+            profile_cache.save_many(profiles={ticker: profiles[ticker] for ticker in group if ticker in prices},
+                                    start_date=this_start, end_date=this_end,
+                                    weekends=this_weekends, method=method)
+
+    return {ticker: profiles[ticker] for ticker in tickers}
+
+
+def _risk_return_estimates(closes: numpy.ndarray, time_deltas: numpy.ndarray, trading_period: float, method: str):
+    """
+    Estimates the annual return and volatility of every row in a two-dimensional array of closing prices, ordered from earliest to latest date, with the estimators used by `scrilla.analysis.models.geometric.statistics.calculate_risk_return`.
+
+    Parameters
+    ----------
+    1. **closes**: ``numpy.ndarray``
+        ``(tickers, dates)`` array of closing prices.
+    2. **time_deltas**: ``numpy.ndarray``
+        Number of days between consecutive dates, as returned by `scrilla.analysis.models.geometric.statistics._time_deltas`.
+    3. **trading_period**: ``float``
+    4. **method**: ``str``
+
+    Returns
+    -------
+    ``Tuple[numpy.ndarray, numpy.ndarray]``
+        The annual returns and annual volatilities of the rows.
+    """
+    log_returns = numpy.log(closes[:, 1:]/closes[:, :-1])
+    sample = log_returns.shape[1]
+
+    if method == keys.keys['ESTIMATION']['MOMENT']:
+        # NOTE: see _calculate_moment_risk_return; the mean telescopes and the volatility is
+        #       measured on returns scaled by the square root of their time delta.
+        mean = numpy.log(closes[:, -1]/closes[:, 0])/(trading_period*sample)
+        mod_returns = log_returns/numpy.sqrt(time_deltas*trading_period)
+        vol = numpy.sqrt(numpy.sum((mod_returns - mean[:, None]*sqrt(trading_period))**2,
+                                   axis=1)/(sample - 1))
+    else:
+        returns = log_returns/time_deltas/trading_period
+        if method == keys.keys['ESTIMATION']['PERCENT']:
+            # NOTE: the quartiles of a normal distribution are symmetric around its mean and
+            #       norm.ppf(0.75) standard deviations away from it, so percentile matching
+            #       has a closed form solution.
+            first_quartile, third_quartile = estimators.OrderStatistics(
+                returns.T).percentile([0.25, 0.75])
+            mean = (first_quartile + third_quartile)/2
+            vol = (third_quartile - first_quartile)/(2*norm.ppf(0.75))
+        else:
+            # NOTE: the maximum likelihood estimates of a normal distribution are the sample
+            #       mean and the biased sample standard deviation.
+            mean = numpy.mean(returns, axis=1)
+            vol = numpy.std(returns, axis=1)
+        vol = vol*sqrt(trading_period)
+    # ito's lemma
+    return mean + 0.5*vol**2, vol
+
+
 def _calculate_moment_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> Dict[str, Dict[str, float]]:
     """
     Returns the moving averages for the specified `ticker`. Each function call returns a group of three moving averages, calculated over different periods. The length of the periods is defined by the variables: `scrilla.settings.MA_1_PERIOD`, `scrilla.settings.MA_2_PERIOD` and `scrilla.settings.MA_3_PERIOD`. These variables are in turn configured by the values of the environment variables *MA_1*, *MA_2* and *MA_3*. If these environment variables are not found, they will default to 20, 60, 100 days, respectively.
@@ -279,51 +545,18 @@ def _calculate_moment_moving_averages(ticker: str, start_date: Union[date, None]
         * If no start_date and end_date passed in, static snapshot of moving averages, i.e. the moving averages as of today (or last close), are calculated and returned.
         * there are two different sets of dates. `(start_date, end_date)` refer to the endpoints of the date range for which the moving averages will be calculated. `(sample_start, sample_end)` refer to the endpoints of the sample necessary to calculate the previously define calculation. Note, `sample_end == end_date`, but `sample_start == start_date - max(MA_1_PERIOD, MA_2_PERIOD, MA_3_PERIOD)`, in order for the sample to contain enough data points to estimate the moving average.
     """
-    asset_type = files.get_asset_type(ticker)
-    trading_period = functions.get_trading_period(asset_type)
-
-    if start_date is None:
-        if asset_type == keys.keys['ASSETS']['EQUITY']:
-            start_date = dater.this_date_or_last_trading_date()
-        elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-            start_date = dater.today()
-    if end_date is None:
-        end_date = start_date
-
-    if asset_type == keys.keys['ASSETS']['EQUITY']:
-        ma_date_range = dater.business_dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_business_days(
-            start_date, settings.MA_3_PERIOD)
-    elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-        ma_date_range = dater.dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_days(
-            start_date, settings.MA_3_PERIOD)
+    trading_period, series, returns, ma_dates, ends = _moving_average_sample(
+        ticker, start_date, end_date)
+    logger.debug('Calculating %s moving averages from %s to %s', '_calculate_moment_moving_averages',
+                 ticker, ma_dates[0], ma_dates[-1])
 
-    sample_prices = services.get_daily_price_history(ticker=ticker, start_date=sample_start,
-                                                     end_date=end_date, asset_type=asset_type)
-
-    moving_averages = {}
-    for this_date in ma_date_range:
-        logger.debug(
-            f'Calculating {ticker} moving averages on {dater.to_string(this_date)}', 'get_sample_of_returns')
-        this_date_index = list(sample_prices).index(dater.to_string(this_date))
-        mas = []
-        for ma_period in [settings.MA_1_PERIOD, settings.MA_2_PERIOD, settings.MA_3_PERIOD]:
-            ma_range = dict(itertools.islice(
-                sample_prices.items(), this_date_index, this_date_index+ma_period+1))
-            last_date, first_date = list(ma_range)[0], list(ma_range)[-1]
-            last_price = ma_range[last_date][keys.keys['PRICES']['CLOSE']]
-            first_price = ma_range[first_date][keys.keys['PRICES']['CLOSE']]
-            mas.append(log(float(last_price)/float(first_price)) /
-                       (trading_period*ma_period))
-
-        moving_averages[dater.to_string(this_date)] = {
-            f'MA_{settings.MA_1_PERIOD}': mas[0],
-            f'MA_{settings.MA_2_PERIOD}': mas[1],
-            f'MA_{settings.MA_3_PERIOD}': mas[2]
-        }
+    # NOTE: the sum of the log differences over a window telescopes into log(last_price/first_price)
+    log_differences = numpy.fromiter(map(log, (series.closes[1:]/series.closes[:-1]).tolist()),
+                                     dtype=float, count=len(series)-1)
+    averages = [estimators.rolling_sums(log_differences, ma_period)[ends]/(trading_period*ma_period)
+                for ma_period in _moving_average_periods()]
 
-    return moving_averages
+    return _format_moving_averages(ma_dates, averages)
 
 
 def _calculate_percentile_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> Dict[str, Dict[str, float]]:
@@ -362,67 +595,28 @@ def _calculate_percentile_moving_averages(ticker: str, start_date: Union[date, N
         * If no start_date and end_date passed in, static snapshot of moving averages, i.e. the moving averages as of today (or last close), are calculated and returned.
         * there are two different sets of dates. `(start_date, end_date)` refer to the endpoints of the date range for which the moving averages will be calculated. `(sample_start, sample_end)` refer to the endpoints of the sample necessary to calculate the previously define calculation. Note, `sample_end == end_date`, but `sample_start == start_date - max(MA_1_PERIOD, MA_2_PERIOD, MA_3_PERIOD)`, in order for the sample to contain enough data points to estimate the moving average.
     """
-    asset_type = files.get_asset_type(ticker)
-    trading_period = functions.get_trading_period(asset_type)
-
-    if start_date is None:
-        if asset_type == keys.keys['ASSETS']['EQUITY']:
-            start_date = dater.this_date_or_last_trading_date()
-        elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-            start_date = dater.today()
-    if end_date is None:
-        end_date = start_date
-
-    if asset_type == keys.keys['ASSETS']['EQUITY']:
-        ma_date_range = dater.business_dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_business_days(
-            start_date, settings.MA_3_PERIOD)
-    elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-        ma_date_range = dater.dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_days(
-            start_date, settings.MA_3_PERIOD)
-
-    sample_prices = services.get_daily_price_history(ticker=ticker, start_date=sample_start,
-                                                     end_date=end_date, asset_type=asset_type)
-
-    moving_averages = {}
-    for this_date in ma_date_range:
-        logger.debug(
-            f'Calculating {ticker} moving averages on {dater.to_string(this_date)}', '_calculate_percentile_moving_averages')
-        this_date_index = list(sample_prices).index(dater.to_string(this_date))
-        mas = []
-        for ma_period in [settings.MA_1_PERIOD, settings.MA_2_PERIOD, settings.MA_3_PERIOD]:
-            ma_range = dict(itertools.islice(
-                sample_prices.items(), this_date_index, this_date_index+ma_period+1))
-            sample_of_returns = get_sample_of_returns(
-                ticker=ticker, sample_prices=ma_range)
-
-            first_quartile = estimators.sample_percentile(
-                data=sample_of_returns, percentile=0.25)
-            median = estimators.sample_percentile(
-                data=sample_of_returns, percentile=0.50)
-            third_quartile = estimators.sample_percentile(
-                data=sample_of_returns, percentile=0.75)
-            guess = (median, (third_quartile-first_quartile)/2)
-
-            mean, vol = fsolve(lambda params, first=first_quartile, third=third_quartile:
-                               [norm.cdf(x=first, loc=params[0], scale=params[1]) - 0.25,
-                                norm.cdf(x=third, loc=params[0], scale=params[1]) - 0.75],
-                               guess)
-
-            # NOTE: Var(dln(S)/delta_t) = (1/delta_t^2)*Var(dlnS) = sigma^2*delta_t / delta_t^2 = sigma^2 / delta_t
-            #       so need to multiply volatiliy by sqrt(delta_t) to get correct scale.
-            vol = vol * sqrt(trading_period)
-            # ito's lemma
-            mean = mean + 0.5 * (vol ** 2)
-            mas.append(mean)
-        moving_averages[dater.to_string(this_date)] = {
-            f'MA_{settings.MA_1_PERIOD}': mas[0],
-            f'MA_{settings.MA_2_PERIOD}': mas[1],
-            f'MA_{settings.MA_3_PERIOD}': mas[2]
-        }
-
-    return moving_averages
+    trading_period, _, returns, ma_dates, ends = _moving_average_sample(
+        ticker, start_date, end_date)
+    logger.debug('Calculating %s moving averages from %s to %s', '_calculate_percentile_moving_averages',
+                 ticker, ma_dates[0], ma_dates[-1])
+
+    averages = []
+    for ma_period in _moving_average_periods():
+        quartiles = estimators.rolling_percentiles(
+            returns, ma_period, [0.25, 0.75])[ends]
+        first_quartile, third_quartile = quartiles[:, 0], quartiles[:, 1]
+        # NOTE: solves norm.cdf(first, mean, vol) = 0.25 and norm.cdf(third, mean, vol) = 0.75
+        #       in closed form, since the normal quartiles are symmetric about the mean.
+        mean = (first_quartile + third_quartile)/2
+        vol = (third_quartile - first_quartile)/(2*norm.ppf(0.75))
+
+        # NOTE: Var(dln(S)/delta_t) = (1/delta_t^2)*Var(dlnS) = sigma^2*delta_t / delta_t^2 = sigma^2 / delta_t
+        #       so need to multiply volatiliy by sqrt(delta_t) to get correct scale.
+        vol = vol * sqrt(trading_period)
+        # ito's lemma
+        averages.append(mean + 0.5 * (vol ** 2))
+
+    return _format_moving_averages(ma_dates, averages)
 
 
 def _calculate_likelihood_moving_averages(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> Dict[str, Dict[str, float]]:
@@ -461,61 +655,35 @@ def _calculate_likelihood_moving_averages(ticker: str, start_date: Union[date, N
         * If no start_date and end_date passed in, static snapshot of moving averages, i.e. the moving averages as of today (or last close), are calculated and returned.
         * there are two different sets of dates. `(start_date, end_date)` refer to the endpoints of the date range for which the moving averages will be calculated. `(sample_start, sample_end)` refer to the endpoints of the sample necessary to calculate the previously define calculation. Note, `sample_end == end_date`, but `sample_start == start_date - max(MA_1_PERIOD, MA_2_PERIOD, MA_3_PERIOD)`, in order for the sample to contain enough data points to estimate the moving average. 
     """
-    from scrilla.analysis.optimizer import maximize_univariate_normal_likelihood
-
-    asset_type = files.get_asset_type(ticker)
-    trading_period = functions.get_trading_period(asset_type)
-
-    if start_date is None:
-        if asset_type == keys.keys['ASSETS']['EQUITY']:
-            start_date = dater.this_date_or_last_trading_date()
-        elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-            start_date = dater.today()
-    if end_date is None:
-        end_date = start_date
-
-    if asset_type == keys.keys['ASSETS']['EQUITY']:
-        ma_date_range = dater.business_dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_business_days(
-            start_date, settings.MA_3_PERIOD)
-    elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-        ma_date_range = dater.dates_between(start_date, end_date)
-        sample_start = dater.decrement_date_by_days(
-            start_date, settings.MA_3_PERIOD)
-
-    sample_prices = services.get_daily_price_history(ticker=ticker, start_date=sample_start,
-                                                     end_date=end_date, asset_type=asset_type)
-
-    moving_averages = {}
-    for this_date in ma_date_range:
-        logger.debug(
-            f'Calculating {ticker} moving averages on {dater.to_string(this_date)}', '_calculate_likelihood_moving_averages')
-        this_date_index = list(sample_prices).index(dater.to_string(this_date))
-        mas = []
-        for ma_period in [settings.MA_1_PERIOD, settings.MA_2_PERIOD, settings.MA_3_PERIOD]:
-            ma_range = dict(itertools.islice(
-                sample_prices.items(), this_date_index, this_date_index+ma_period+1))
-            sample_of_returns = get_sample_of_returns(
-                ticker=ticker, sample_prices=ma_range)
-
-            likelihood_estimates = maximize_univariate_normal_likelihood(
-                data=sample_of_returns)
-            # See NOTE in docstring
-            # NOTE: E(dln(S)/delta_t) = (mu - 0.5 * sigma ** 2) * delta_t / delta_t = mu - 0.5 * sigma ** 2
-            # TODO: add :math to docstring with this
-            # NOTE: Var(dln(S)/delta_t) = (1/delta_t**2)*Var(dlnS) = sigma**2*delta_t / delta_t**2 = sigma**2 / delta_t
-            #       so need to multiply volatiliy by sqrt(delta_t) to get correct scale.
-            vol = likelihood_estimates[1]*sqrt(trading_period)
-            # ito's lemma
-            mean = likelihood_estimates[0] + 0.5 * (vol ** 2)
-            mas.append(mean)
-        moving_averages[dater.to_string(this_date)] = {
-            f'MA_{settings.MA_1_PERIOD}': mas[0],
-            f'MA_{settings.MA_2_PERIOD}': mas[1],
-            f'MA_{settings.MA_3_PERIOD}': mas[2]
-        }
-
-    return moving_averages
+    trading_period, _, returns, ma_dates, ends = _moving_average_sample(
+        ticker, start_date, end_date)
+    logger.debug('Calculating %s moving averages from %s to %s', '_calculate_likelihood_moving_averages',
+                 ticker, ma_dates[0], ma_dates[-1])
+
+    # NOTE: shift the sample so the rolling sums of squares don't lose precision to cancellation
+    shift = numpy.mean(returns)
+    centered = returns - shift
+
+    averages = []
+    for ma_period in _moving_average_periods():
+        # NOTE: the normal likelihood is maximized by the sample mean and the (biased) sample
+        #       variance, so only the rolling sufficient statistics are needed.
+        counts = numpy.minimum(numpy.arange(1, len(returns)+1), ma_period)[ends]
+        sums = estimators.rolling_sums(centered, ma_period)[ends]
+        sums_of_squares = estimators.rolling_sums(
+            centered**2, ma_period)[ends]
+        mean = sums/counts
+        variance = numpy.maximum(sums_of_squares/counts - mean**2, 0)
+        # See NOTE in docstring
+        # NOTE: E(dln(S)/delta_t) = (mu - 0.5 * sigma ** 2) * delta_t / delta_t = mu - 0.5 * sigma ** 2
+        # TODO: add :math to docstring with this
+        # NOTE: Var(dln(S)/delta_t) = (1/delta_t**2)*Var(dlnS) = sigma**2*delta_t / delta_t**2 = sigma**2 / delta_t
+        #       so need to multiply volatiliy by sqrt(delta_t) to get correct scale.
+        vol = numpy.sqrt(variance)*sqrt(trading_period)
+        # ito's lemma
+        averages.append(mean + shift + 0.5 * (vol ** 2))
+
+    return _format_moving_averages(ma_dates, averages)
 
 
 def _calculate_likelihood_risk_return(ticker, start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[dict, None] = None, asset_type: Union[str, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
@@ -693,12 +861,8 @@ def _calculate_percentile_risk_return(ticker: str, start_date: Union[date, None]
     sample_of_returns = get_sample_of_returns(
         ticker=ticker, sample_prices=prices, asset_type=asset_type)
 
-    first_quartile = estimators.sample_percentile(
-        data=sample_of_returns, percentile=0.25)
-    median = estimators.sample_percentile(
-        data=sample_of_returns, percentile=0.50)
-    third_quartile = estimators.sample_percentile(
-        data=sample_of_returns, percentile=0.75)
+    first_quartile, median, third_quartile = estimators.OrderStatistics(
+        sample_of_returns).percentile([0.25, 0.50, 0.75])
     guess = (median, (third_quartile-first_quartile)/2)
 
     def objective(params):
@@ -724,7 +888,7 @@ def _calculate_percentile_risk_return(ticker: str, start_date: Union[date, None]
     return results
 
 
-def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, asset_type: Union[str, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
+def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceSeries, None] = None, asset_type: Union[str, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
     """
     Estimates the mean rate of return and volatility for a sample of asset prices as if the asset price followed a Geometric Brownian Motion process, i.e. the mean rate of return and volatility are constant and not functions of time or the asset price. Moreover, the return and volatility are estimated using the method of moment matching, where the return is estimated by equating it to the first moment of the sample and the volatility is estimated by equating it to the square root of the second moment of the sample.
 
@@ -809,9 +973,8 @@ def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = N
     # NOTE: mean return is a telescoping series, i.e. sum of log(x1/x0) only depends on the first and
     # last terms' contributions (because log(x1/x0) + log(x2/x1)= log(x2) - log(x1) + log(x1) - log(x0)) = log(x2/x0))
     # which raises the question how accurate a measure the sample mean return is of the population mean return.
-    last_date, first_date = list(prices)[0], list(prices)[-1]
-    last_price = prices[last_date][keys.keys['PRICES']['CLOSE']]
-    first_price = prices[first_date][keys.keys['PRICES']['CLOSE']]
+    series = price_util.as_series(prices, ticker)
+    last_price, first_price = series.closes[-1], series.closes[0]
     mean_return = log(float(last_price)/float(first_price)) / \
         (trading_period*sample)
 
@@ -825,12 +988,12 @@ def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = N
     logger.debug(
         f'Calculating mean annual volatility over last {sample} days for {ticker}', '_calculate_moment_risk_return')
 
-    for this_date in prices:
-        todays_price = prices[this_date][keys.keys['PRICES']['CLOSE']]
-
+    verbose = logger.is_enabled(constants.constants['LOG_LEVEL']['VERBOSE'])
+    for this_date, todays_price in zip(series.date_strings(), series.closes[::-1].tolist()):
         if today:
-            logger.verbose(
-                f'{this_date}: (todays_price, tomorrows_price) = ({todays_price}, {tomorrows_price})', '_calculate_moment_risk_return')
+            if verbose:
+                logger.verbose(
+                    f'{this_date}: (todays_price, tomorrows_price) = ({todays_price}, {tomorrows_price})', '_calculate_moment_risk_return')
 
             # crypto prices may have weekends and holidays removed during correlation algorithm
             # so samples can be compared to equities, need to account for these dates by increasing
@@ -847,13 +1010,14 @@ def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = N
             daily = (current_mod_return - mean_mod_return)**2/(sample - 1)
             variance = variance + daily
 
-            logger.verbose(
-                f'{this_date}: (daily_variance, sample_variance) = ({round(daily, 4)}, {round(variance, 4)})', '_calculate_moment_risk_return')
+            if verbose:
+                logger.verbose(
+                    f'{this_date}: (daily_variance, sample_variance) = ({round(daily, 4)}, {round(variance, 4)})', '_calculate_moment_risk_return')
 
         else:
             today = True
 
-        tomorrows_price = prices[this_date][keys.keys['PRICES']['CLOSE']]
+        tomorrows_price = todays_price
         tomorrows_date = this_date
 
     # adjust for output
@@ -875,7 +1039,7 @@ def _calculate_moment_risk_return(ticker: str, start_date: Union[date, None] = N
     return results
 
 
-def _calculate_percentile_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
+def _calculate_percentile_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceFrame, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
     """
     Returns the sample correlation calculated using the method of Percentile Matching, assuming underlying price process follows Geometric Brownian Motion, i.e. the price distribution is lognormal. 
 
@@ -962,6 +1126,11 @@ def _calculate_percentile_correlation(ticker_1: str, ticker_2: str, asset_type_1
                                                                    end_date=end_date, asset_type=asset_type_1)
         sample_prices[ticker_2] = services.get_daily_price_history(ticker=ticker_2, start_date=start_date,
                                                                    end_date=end_date, asset_type=asset_type_2)
+    else:
+        # NOTE: the pair is copied into a new container so the intersections below do not
+        #       modify the caller's `sample_prices`.
+        sample_prices = {ticker_1: sample_prices[ticker_1],
+                         ticker_2: sample_prices[ticker_2]}
 
     if asset_type_1 == asset_type_2 and asset_type_2 == keys.keys['ASSETS']['CRYPTO'] and weekends == 0:
         sample_prices[ticker_1] = dater.intersect_with_trading_dates(
@@ -977,65 +1146,63 @@ def _calculate_percentile_correlation(ticker_1: str, ticker_2: str, asset_type_1
         raise errors.PriceError(
             "Prices cannot be retrieved for correlation calculation", '_calculate_percentile_correlation')
 
-    sample_of_returns_1 = estimators.standardize(get_sample_of_returns(
-        ticker=ticker_1, sample_prices=sample_prices[ticker_1], asset_type=asset_type_1))
-    sample_of_returns_2 = estimators.standardize(get_sample_of_returns(
-        ticker=ticker_2, sample_prices=sample_prices[ticker_2], asset_type=asset_type_2))
-
-    combined_sample = [[el, sample_of_returns_2[i]]
-                       for i, el in enumerate(sample_of_returns_1)]
-
-    percentiles = [0.1, 0.16, 0.5, 0.84, 0.9]
-    sample_percentiles_1, sample_percentiles_2 = [], []
-
-    for percentile in percentiles:
-        sample_percentiles_1.append(estimators.sample_percentile(
-            data=sample_of_returns_1, percentile=percentile))
-        sample_percentiles_2.append(estimators.sample_percentile(
-            data=sample_of_returns_2, percentile=percentile))
+    sample_of_returns_1 = get_sample_of_returns(
+        ticker=ticker_1, sample_prices=sample_prices[ticker_1], asset_type=asset_type_1)
+    sample_of_returns_2 = get_sample_of_returns(
+        ticker=ticker_2, sample_prices=sample_prices[ticker_2], asset_type=asset_type_2)
 
-    logger.debug(
-        f'Standardized sample percentiles for {ticker_1}: \n{sample_percentiles_1}', '_calculate_percentile_correlation')
-    logger.debug(
-        f'Standardized sample percentiles for {ticker_2}: \n{sample_percentiles_2}', '_calculate_percentile_correlation')
-
-    def copula_matrix(params):
-        determinant = 1 - params[0]**2
-        if determinant == 0 or determinant < 0 or determinant < (10**(-constants.constants['ACCURACY'])):
-            logger.verbose('Solution is non-positive semi-definite',
-                           '_calculate_percentile_correlation')
-            return inf
-        logger.verbose(
-            f'Instantiating Copula Matrix: \n{[[1, params[0]], [params[0], 1]]}', '_calculate_percentile_correlation')
-        return [[1, params[0]], [params[0], 1]]
-
-    # Calculate copula distribution of order statistics and constrain it against the empirical estimate
-    def residuals(params):
-        res = [
-
-            (multivariate_normal.cdf(x=[sample_percentiles_1[i], sample_percentiles_2[i]],
-                                     mean=[0, 0], cov=copula_matrix(params))
-             - estimators.empirical_copula(sample=combined_sample, x_order=sample_percentiles_1[i],
-                                           y_order=sample_percentiles_2[i]))
-            for i in enumerate(percentiles)
-        ]
-        logger.verbose(f'Residuals for {params}: \n{res}',
-                       '_calculate_percentile_correlation.residuals')
-        return res
-
-    parameters = least_squares(residuals, (0), bounds=((-0.99999), (0.99999)))
-
-    correl = parameters.x[0]
-    result = {keys.keys['STATISTICS']['CORRELATION']:  correl}
+    correl = float(_percentile_correlations(returns=numpy.column_stack([sample_of_returns_1, sample_of_returns_2]),
+                                            pairs=[(0, 1)])[0])
+    result = {keys.keys['STATISTICS']['CORRELATION']: correl}
 
     correlation_cache.save_row(ticker_1=ticker_1, ticker_2=ticker_2,
                                start_date=start_date, end_date=end_date,
-                               correlation=correlation, method=keys.keys['ESTIMATION']['PERCENT'],
+                               correlation=correl, method=keys.keys['ESTIMATION']['PERCENT'],
                                weekends=weekends)
     return result
 
 
-def _calculate_likelihood_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
+def _percentile_correlations(returns: numpy.ndarray, pairs: List[Tuple[int, int]]) -> numpy.ndarray:
+    """
+    Estimates the correlations between pairs of columns of a sample of returns with the method of Percentile Matching, i.e. by matching a bivariate normal copula to the empirical copula of the standardized returns at the 10th, 16th, 50th, 84th and 90th percentiles.
+
+    Parameters
+    ----------
+    1. **returns**: ``numpy.ndarray``
+        ``(observations, tickers)`` array of returns.
+    2. **pairs**: ``List[Tuple[int, int]]``
+        Column indices of the pairs whose correlations are to be estimated.
+
+    Returns
+    -------
+    ``numpy.ndarray``
+        The correlations of `pairs`, in order.
+
+    .. notes::
+        * The empirical copula of a pair at matching percentiles is the proportion of observations where both returns fall at or below their percentiles, i.e. the diagonal of `scrilla.analysis.estimators.empirical_copulas`. Each column is ranked against its percentiles once, so the empirical copulas of every pair are counted from the ranks without revisiting the sample, and the normal copulas of every pair are fit together by `scrilla.analysis.estimators.copula_correlation`.
+    """
+    percentiles = [0.1, 0.16, 0.5, 0.84, 0.9]
+
+    standardized = (returns - numpy.mean(returns, axis=0)) / \
+        numpy.std(returns, axis=0, ddof=1)
+    orders = estimators.OrderStatistics(standardized).percentile(percentiles)
+
+    logger.debug(f'Standardized sample percentiles: \n{orders}',
+                 '_percentile_correlations')
+
+    ranks = numpy.column_stack([numpy.searchsorted(orders[:, column], standardized[:, column], side='left')
+                                for column in range(standardized.shape[1])])
+
+    first, second = numpy.array(pairs).T
+    joint_ranks = numpy.maximum(ranks[:, first], ranks[:, second])
+    empirical = numpy.array([numpy.mean(joint_ranks <= k, axis=0)
+                             for k in range(len(percentiles))])
+
+    return estimators.copula_correlation(x_orders=orders[:, first], y_orders=orders[:, second],
+                                         empirical=empirical)
+
+
+def _calculate_likelihood_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceFrame, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
     """
     Calculates the sample correlation using the maximum likelihood estimators, assuming underlying price process follows Geometric Brownian Motion, i.e. the price distribution is lognormal. 
 
@@ -1118,6 +1285,11 @@ def _calculate_likelihood_correlation(ticker_1: str, ticker_2: str, asset_type_1
                                                                    start_date=start_date,
                                                                    end_date=end_date,
                                                                    asset_type=asset_type_2)
+    else:
+        # NOTE: the pair is copied into a new container so the intersections below do not
+        #       modify the caller's `sample_prices`.
+        sample_prices = {ticker_1: sample_prices[ticker_1],
+                         ticker_2: sample_prices[ticker_2]}
 
     if asset_type_1 == asset_type_2 and asset_type_2 == keys.keys['ASSETS']['CRYPTO'] and weekends == 0:
         sample_prices[ticker_1] = dater.intersect_with_trading_dates(
@@ -1164,7 +1336,7 @@ def _calculate_likelihood_correlation(ticker_1: str, ticker_2: str, asset_type_1
     return result
 
 
-def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
+def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Union[str, None] = None, asset_type_2: Union[str, None] = None, start_date: Union[datetime.date, None] = None, end_date: Union[datetime.date, None] = None, sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceFrame, None] = None, weekends: Union[int, None] = None) -> Dict[str, float]:
     """
     Returns the sample correlation using the method of Moment Matching, assuming underlying price process follows Geometric Brownian Motion, i.e. the price distribution is lognormal. 
 
@@ -1244,6 +1416,11 @@ def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Un
                                                                    end_date=end_date, asset_type=asset_type_1)
         sample_prices[ticker_2] = services.get_daily_price_history(ticker=ticker_2, start_date=start_date,
                                                                    end_date=end_date, asset_type=asset_type_2)
+    else:
+        # NOTE: the pair is copied into a new container so the intersections below do not
+        #       modify the caller's `sample_prices`.
+        sample_prices = {ticker_1: sample_prices[ticker_1],
+                         ticker_2: sample_prices[ticker_2]}
 
     # TODO: pretty sure something about this is causing the issue.
     if asset_type_1 == asset_type_2 and asset_type_2 == keys.keys['ASSETS']['CRYPTO'] and weekends == 0:
@@ -1305,6 +1482,7 @@ def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Un
     covariance, time_delta = 0, 1
     today, tomorrows_date = False, None
     sample = len(sample_prices[ticker_1])
+    verbose = logger.is_enabled(constants.constants['LOG_LEVEL']['VERBOSE'])
 
     #### START CORRELATION LOOP ####
     for this_date in sample_prices[ticker_1]:
@@ -1312,12 +1490,13 @@ def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Un
         todays_price_2 = sample_prices[ticker_2][this_date][keys.keys['PRICES']['CLOSE']]
 
         if today:
-            logger.verbose(f'today = {this_date}',
-                           '_calculate_moment_correlation')
-            logger.verbose(
-                f'(todays_price, tomorrows_price)_{ticker_1} = ({todays_price_1}, {tomorrows_price_1})', '_calculate_moment_correlation')
-            logger.verbose(
-                f'(todays_price, tomorrows_price)_{ticker_2} = ({todays_price_2}, {tomorrows_price_2})', '_calculate_moment_correlation')
+            if verbose:
+                logger.verbose(f'today = {this_date}',
+                               '_calculate_moment_correlation')
+                logger.verbose(
+                    f'(todays_price, tomorrows_price)_{ticker_1} = ({todays_price_1}, {tomorrows_price_1})', '_calculate_moment_correlation')
+                logger.verbose(
+                    f'(todays_price, tomorrows_price)_{ticker_2} = ({todays_price_2}, {tomorrows_price_2})', '_calculate_moment_correlation')
 
             # NOTE: crypto prices may have weekends and holidays removed during correlation algorithm
             # so samples can be compared to equities, need to account for these dates by increasing
@@ -1346,10 +1525,11 @@ def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Un
                 current_mod_return_1 - mod_mean_1)*(current_mod_return_2 - mod_mean_2)/(sample - 1)
             covariance = covariance + current_sample_covariance
 
-            logger.verbose(
-                f'(return_{ticker_1}, return_{ticker_2}) = ({round(current_mod_return_1, 2)}, {round(current_mod_return_2, 2)})', '_calculate_moment_correlation')
-            logger.verbose(
-                f'(current_sample_covariance, covariance) = ({round(current_sample_covariance, 2)}, {round(covariance, 2)})', '_calculate_moment_correlation')
+            if verbose:
+                logger.verbose(
+                    f'(return_{ticker_1}, return_{ticker_2}) = ({round(current_mod_return_1, 2)}, {round(current_mod_return_2, 2)})', '_calculate_moment_correlation')
+                logger.verbose(
+                    f'(current_sample_covariance, covariance) = ({round(current_sample_covariance, 2)}, {round(covariance, 2)})', '_calculate_moment_correlation')
 
         else:
             today = True
@@ -1373,6 +1553,217 @@ def _calculate_moment_correlation(ticker_1: str, ticker_2: str, asset_type_1: Un
     return result
 
 
+def _calculate_moment_correlation_matrix(tickers: List[str], asset_types: List[str], start_date: Union[date, None] = None, end_date: Union[date, None] = None, weekends: int = 0) -> List[List[float]]:
+    """
+    Returns the correlation matrix for `tickers` using the method of Moment Matching. Produces the same correlations as calling `scrilla.analysis.models.geometric.statistics._calculate_moment_correlation` for every pair of `tickers`, but aligns the returns of every ticker into a single array and computes every covariance with one matrix product, rather than re-fetching prices and looping over the sample once per pair.
+
+    Parameters
+    ----------
+    1. **tickers** : ``List[str]``
+        List of ticker symbols whose correlation matrix is to be calculated.
+    2. **asset_types** : ``List[str]``
+        List of asset types that map to the `tickers` list.
+    3. **start_date** : ``Union[date, None]``
+        *Optional*. Start date of the time period over which correlation will be calculated. If `None`, defaults to 100 trading days ago.
+    4. **end_date** : ``Union[date, None]``
+        *Optional*. End date of the time period over which correlation will be calculated. If `None`, defaults to last trading day.
+    5. **weekends** : ``int``
+        *Optional*. Flag signalling whether the crypto samples include weekends, as determined by `scrilla.analysis.models.geometric.statistics.correlation_matrix`.
+
+    .. notes::
+        * correlations already in the cache are not recalculated; only missing pairs are written back to the cache, in a single batch.
+        * the batched sample is the set of dates on which *every* ticker has a price, whereas the pairwise calculation uses the dates on which both tickers in the pair have a price. The two only coincide if the pair has no dates the other tickers are missing, so the pairs for which they do not coincide, e.g. when one of the tickers has a shorter price history, are calculated and cached one at a time with `scrilla.analysis.models.geometric.statistics.calculate_correlation`.
+    """
+    start_date, end_date = _correlation_matrix_dates(
+        asset_types, start_date, end_date, weekends)
+    correl_matrix, missing = _cached_correlation_matrix(tickers, start_date, end_date, weekends,
+                                                        keys.keys['ESTIMATION']['MOMENT'])
+    if not missing:
+        return correl_matrix.tolist()
+
+    logger.debug(
+        f'Calculating {len(missing)} missing correlations for {tickers}', '_calculate_moment_correlation_matrix')
+
+    dates, closes, time_deltas, shared = _correlation_frame(
+        tickers, asset_types, start_date, end_date, weekends)
+    batched = _pairwise_correlation_matrix(tickers, asset_types, correl_matrix, missing, shared,
+                                           start_date, end_date, weekends, keys.keys['ESTIMATION']['MOMENT'])
+    if not batched:
+        return correl_matrix.tolist()
+    sample = len(dates)
+
+    trading_periods, volatilities, mod_means = [], [], []
+    for ticker, asset_type in zip(tickers, asset_types):
+        stats = _calculate_moment_risk_return(ticker=ticker, start_date=start_date, end_date=end_date,
+                                              asset_type=asset_type, weekends=weekends)
+        trading_period = functions.get_trading_period(asset_type)
+        trading_periods.append(trading_period)
+        volatilities.append(stats[keys.keys['STATISTICS']['VOLATILITY']])
+        # ito's lemma
+        mod_means.append((stats[keys.keys['STATISTICS']['RETURN']] - 0.5*stats[keys.keys['STATISTICS']['VOLATILITY']]**2)
+                         * sqrt(trading_period))
+
+    mod_returns = numpy.log(closes[1:]/closes[:-1]) / \
+        numpy.sqrt(time_deltas*numpy.array(trading_periods))
+    centered = mod_returns - numpy.array(mod_means)
+    covariance = centered.T @ centered / (sample - 1)
+    correlations = covariance/numpy.outer(volatilities, volatilities)
+
+    return _save_correlation_matrix(tickers, correl_matrix, batched, [correlations[i][j] for i, j in batched],
+                                    start_date, end_date, weekends, keys.keys['ESTIMATION']['MOMENT'])
+
+
+def _calculate_percentile_correlation_matrix(tickers: List[str], asset_types: List[str], start_date: Union[date, None] = None, end_date: Union[date, None] = None, weekends: int = 0) -> List[List[float]]:
+    """
+    Returns the correlation matrix for `tickers` using the method of Percentile Matching. Aligns the returns of every ticker into a single array and fits the copulas of every missing pair together with `scrilla.analysis.models.geometric.statistics._percentile_correlations`, rather than re-fetching prices and solving once per pair with `scrilla.analysis.models.geometric.statistics._calculate_percentile_correlation`.
+
+    Parameters
+    ----------
+    1. **tickers** : ``List[str]``
+        List of ticker symbols whose correlation matrix is to be calculated.
+    2. **asset_types** : ``List[str]``
+        List of asset types that map to the `tickers` list.
+    3. **start_date** : ``Union[date, None]``
+        *Optional*. Start date of the time period over which correlation will be calculated. If `None`, defaults to 100 trading days ago.
+    4. **end_date** : ``Union[date, None]``
+        *Optional*. End date of the time period over which correlation will be calculated. If `None`, defaults to last trading day.
+    5. **weekends** : ``int``
+        *Optional*. Flag signalling whether the crypto samples include weekends, as determined by `scrilla.analysis.models.geometric.statistics.correlation_matrix`.
+
+    .. notes::
+        * see the notes of `scrilla.analysis.models.geometric.statistics._calculate_moment_correlation_matrix` on caching and the sample of dates.
+    """
+    start_date, end_date = _correlation_matrix_dates(
+        asset_types, start_date, end_date, weekends)
+    correl_matrix, missing = _cached_correlation_matrix(tickers, start_date, end_date, weekends,
+                                                        keys.keys['ESTIMATION']['PERCENT'])
+    if not missing:
+        return correl_matrix.tolist()
+
+    logger.debug(
+        f'Calculating {len(missing)} missing correlations for {tickers}', '_calculate_percentile_correlation_matrix')
+
+    _, closes, time_deltas, shared = _correlation_frame(
+        tickers, asset_types, start_date, end_date, weekends)
+    batched = _pairwise_correlation_matrix(tickers, asset_types, correl_matrix, missing, shared,
+                                           start_date, end_date, weekends, keys.keys['ESTIMATION']['PERCENT'])
+    if not batched:
+        return correl_matrix.tolist()
+    returns = numpy.log(closes[1:]/closes[:-1])/time_deltas
+    correlations = _percentile_correlations(returns=returns, pairs=batched)
+
+    return _save_correlation_matrix(tickers, correl_matrix, batched, correlations,
+                                    start_date, end_date, weekends, keys.keys['ESTIMATION']['PERCENT'])
+
+
+def _correlation_matrix_dates(asset_types: List[str], start_date: Union[date, None], end_date: Union[date, None], weekends: int):
+    """
+    Validates the dates of a correlation matrix over total days if every asset is a crypto and weekends are included, and over trading days otherwise.
+    """
+    all_crypto = all(asset_type == keys.keys['ASSETS']['CRYPTO']
+                     for asset_type in asset_types)
+    if all_crypto and weekends == 1:
+        return errors.validate_dates(start_date=start_date, end_date=end_date,
+                                     asset_type=keys.keys['ASSETS']['CRYPTO'])
+    return errors.validate_dates(start_date=start_date, end_date=end_date,
+                                 asset_type=keys.keys['ASSETS']['EQUITY'])
+
+
+def _cached_correlation_matrix(tickers: List[str], start_date: date, end_date: date, weekends: int, method: str):
+    """
+    Returns the correlation matrix of `tickers` filled in with the correlations found in the cache, along with the `(i, j)` indices of the pairs that were not found.
+    """
+    correl_matrix = numpy.identity(len(tickers))
+    missing = []
+    for i, j in itertools.combinations(range(len(tickers)), 2):
+        cached = correlation_cache.filter(ticker_1=tickers[i], ticker_2=tickers[j],
+                                          start_date=start_date, end_date=end_date,
+                                          weekends=weekends, method=method)
+        if cached is None:
+            missing.append((i, j))
+        else:
+            correl_matrix[i][j] = correl_matrix[j][i] = cached[keys.keys['STATISTICS']['CORRELATION']]
+    return correl_matrix, missing
+
+
+def _pairwise_correlation_matrix(tickers: List[str], asset_types: List[str], correl_matrix: numpy.ndarray, missing: List[Tuple[int, int]], shared: numpy.ndarray, start_date: date, end_date: date, weekends: int, method: str) -> List[Tuple[int, int]]:
+    """
+    Fills the `missing` pairs of `correl_matrix` whose sample is not the `shared` sample of every ticker in with `scrilla.analysis.models.geometric.statistics.calculate_correlation`, which caches them under their own sample, and returns the pairs that remain to be calculated over the shared sample.
+    """
+    batched = []
+    for i, j in missing:
+        if shared[i][j]:
+            batched.append((i, j))
+            continue
+        logger.debug(f'({tickers[i]}, {tickers[j]}) sample differs from the matrix sample, calculating pairwise',
+                     '_pairwise_correlation_matrix')
+        correlation = calculate_correlation(ticker_1=tickers[i], ticker_2=tickers[j],
+                                            asset_type_1=asset_types[i], asset_type_2=asset_types[j],
+                                            start_date=start_date, end_date=end_date,
+                                            weekends=weekends, method=method)
+        correl_matrix[i][j] = correl_matrix[j][i] = correlation[keys.keys['STATISTICS']['CORRELATION']]
+    return batched
+
+
+def _save_correlation_matrix(tickers: List[str], correl_matrix: numpy.ndarray, missing: List[Tuple[int, int]], correlations: List[float], start_date: date, end_date: date, weekends: int, method: str) -> List[List[float]]:
+    """
+    Fills the `missing` pairs of `correl_matrix` in with `correlations`, saves them to the cache in a single batch and returns the matrix.
+    """
+    calculated = {}
+    for (i, j), correlation in zip(missing, correlations):
+        correl_matrix[i][j] = correl_matrix[j][i] = correlation
+        calculated[(tickers[i], tickers[j])] = float(correlation)
+
+    correlation_cache.save_rows(correlations=calculated, start_date=start_date, end_date=end_date,
+                                weekends=weekends, method=method)
+    return correl_matrix.tolist()
+
+
+def _correlation_frame(tickers: List[str], asset_types: List[str], start_date: date, end_date: date, weekends: int):
+    """
+    Returns the dates on which every ticker has a price, the ``(dates, tickers)`` array of closing prices on those dates, the ``(dates - 1, tickers)`` array of the number of days between consecutive dates for each ticker and the ``(tickers, tickers)`` boolean array that is `True` for the pairs of tickers whose shared dates are exactly the dates on which every ticker has a price, i.e. the pairs whose correlation over the returned sample is the same as their pairwise correlation.
+
+    .. notes::
+        * if fewer than two dates are shared by every ticker, no pair is marked as shared.
+    """
+    frame = {}
+    for ticker, asset_type in zip(tickers, asset_types):
+        series = price_util.as_series(services.get_daily_price_history(ticker=ticker, start_date=start_date,
+                                                                       end_date=end_date, asset_type=asset_type), ticker)
+        if asset_type == keys.keys['ASSETS']['CRYPTO'] and weekends == 0:
+            # remove weekends and holidays from sample
+            if len(series) > 0:
+                trading = dater.trading_calendar(False, series.start_date, series.end_date)\
+                    .is_trading_dates(series.dates)
+                series = price_util.PriceSeries(
+                    series.dates[trading], series.opens[trading], series.closes[trading], ticker)
+        frame[ticker] = series
+
+    # NOTE: the number of dates each pair shares is compared against the number of dates every
+    #       ticker shares, since the pair's correlation is only the same over both samples if
+    #       they are the same set of dates.
+    all_dates = numpy.unique(numpy.concatenate([frame[ticker].dates for ticker in tickers]))
+    membership = numpy.column_stack([numpy.isin(all_dates, frame[ticker].dates, assume_unique=True)
+                                     for ticker in tickers]).astype(int)
+    common = int(membership.all(axis=1).sum())
+    shared = (membership.T @ membership == common) & (common >= 2)
+
+    frame = price_util.PriceFrame(frame).intersect()
+    dates, closes = frame[tickers[0]].dates, frame.closes()
+    if len(dates) < 2:
+        return dates, closes, None, shared
+
+    # NOTE: crypto prices may have weekends and holidays removed during correlation algorithm
+    # so samples can be compared to equities, need to account for these dates by increasing
+    # the time_delta by the number of missed days, to offset the weekend and holiday return.
+    gaps = (dates[1:] - dates[:-1]).astype(int)
+    equity_gaps = numpy.where(
+        dater.consecutive_trading_days_between(dates[:-1], dates[1:]), 1, gaps)
+    time_deltas = numpy.column_stack([equity_gaps if asset_type == keys.keys['ASSETS']['EQUITY'] else gaps
+                                      for asset_type in asset_types])
+    return dates, closes, time_deltas, shared
+
+
 def correlation_matrix(tickers, asset_types=None, start_date=None, end_date=None, sample_prices=None, method=settings.ESTIMATION_METHOD, weekends: Union[int, None] = None) -> List[List[float]]:
     """
     Returns the correlation matrix for *tickers* from *start_date* to *end_date* using the estimation method *method*.
@@ -1388,7 +1779,7 @@ def correlation_matrix(tickers, asset_types=None, start_date=None, end_date=None
     4. **end_date** : ``datetime.date`` 
         *Optional*. End date of the time period over which correlation will be calculated. If `None`, defaults to last trading day.
     5. **sample_prices** : ``dict``
-        *Optional*. A list of the asset prices for which correlation will be calculated. Overrides calls to service and calculates correlation for sample of prices supplied. Will disregard start_date and end_date. Must be of the format: `{'ticker_1': { 'date_1' : 'price_1', 'date_2': 'price_2' ...}, 'ticker_2': { 'date_1' : 'price_1:, ... } }` and ordered from latest date to earliest date. 
+        *Optional*. A list of the asset prices for which correlation will be calculated. Overrides calls to service and calculates correlation for sample of prices supplied. Will disregard start_date and end_date. Must be of the format: `{'ticker_1': { 'date_1' : 'price_1', 'date_2': 'price_2' ...}, 'ticker_2': { 'date_1' : 'price_1:, ... } }` and ordered from latest date to earliest date, or a `scrilla.util.prices.PriceFrame`.
     6. **method** : ``str``
         *Optional*. Defaults to the value set by `scrilla.settings.ESTIMATION_METHOD`, which in turn is configured by the **DEFAULT_ESTIMATION_METHOD** environment variable. Determines the estimation method used during the calculation of sample statistics. Allowable values can be accessed through `scrilla.keys.keys['ESTIMATION']`.
 
@@ -1438,6 +1829,20 @@ def correlation_matrix(tickers, asset_types=None, start_date=None, end_date=None
             logger.debug(
                 'Assets of same type, which is equity, excluding weekends', 'correlation_matrix')
 
+    if len(tickers) > 1 and sample_prices is None and method == keys.keys['ESTIMATION']['MOMENT']:
+        return _calculate_moment_correlation_matrix(tickers=tickers,
+                                                    asset_types=asset_types,
+                                                    start_date=start_date,
+                                                    end_date=end_date,
+                                                    weekends=weekends)
+
+    if len(tickers) > 1 and sample_prices is None and method == keys.keys['ESTIMATION']['PERCENT']:
+        return _calculate_percentile_correlation_matrix(tickers=tickers,
+                                                        asset_types=asset_types,
+                                                        start_date=start_date,
+                                                        end_date=end_date,
+                                                        weekends=weekends)
+
     if(len(tickers) > 1):
         for i, item in enumerate(tickers):
             correl_matrix[i][i] = 1
@@ -1464,41 +1869,143 @@ def correlation_matrix(tickers, asset_types=None, start_date=None, end_date=None
 
 
 def calculate_moment_correlation_series(ticker_1: str, ticker_2: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> Dict[str, float]:
+    """
+    Returns the series of moment matching correlations between `ticker_1` and `ticker_2` on every date from `start_date` to `end_date`, where the correlation on each date is calculated over the sample of the `scrilla.settings.DEFAULT_ANALYSIS_PERIOD` periods ending on that date. Produces the same correlations as calling `scrilla.analysis.models.geometric.statistics._calculate_moment_correlation` on each date.
+
+    Parameters
+    ----------
+    1. **ticker_1** : ``str``
+        Ticker symbol for first asset.
+    2. **ticker_2** : ``str``
+        Ticker symbol for second asset.
+    3. **start_date** : ``Union[date, None]``
+        *Optional*. First date of the series.
+    4. **end_date** : ``Union[date, None]``
+        *Optional*. Last date of the series.
+
+    Returns
+    -------
+    ``Dict[str, float]``
+        Dictionary with date strings formatted `YYYY-MM-DD` as keys and the correlation on that date as the corresponding value, ordered from earliest to latest.
+
+    .. notes::
+        * Prices are retrieved once, for the union of every window, and aligned into a pair of return arrays. The window then slides across the arrays: the sample means, variances and covariance of the returns are updated in constant time per date with `scrilla.analysis.estimators.recursive_rolling_correlation` and adjusted to the telescoping means used by the method of moment matching. If consecutive windows do not differ by exactly one observation on each end, e.g. because of a gap in the price history, the statistics of the window are recalculated from scratch.
+        * Correlations found in the cache are not recalculated. They are read with a single `scrilla.cache.CorrelationCache.filter_series` query before the window slides; the others are written to the cache in a single batch.
+        * The risk profiles are calculated over the sample of dates on which both assets have a price, whereas `_calculate_moment_correlation` calculates each profile over the sample of its own asset. The two coincide unless one price history has gaps the other does not.
+    """
     asset_type_1 = errors.validate_asset_type(ticker=ticker_1)
     asset_type_2 = errors.validate_asset_type(ticker=ticker_2)
-    if asset_type_1 == keys.keys['ASSETS']['CRYPTO'] and asset_type_2 == keys.keys['ASSETS']['CRYPTO']:
+    crypto_pair = asset_type_1 == asset_type_2 == keys.keys['ASSETS']['CRYPTO']
+    if crypto_pair:
         # validate over all days
-        start_date, end_date = errors.validate_dates(start_date=start_date, end_date=end_date,
-                                                     asset_type=keys.keys['ASSETS']['CRYPTO'])
+        window_type, weekends = keys.keys['ASSETS']['CRYPTO'], 1
     else:
         #   validate over trading days. since (date - 100 days) > (date - 100 trading days), always
         #   take the largest sample so intersect_dict_keys will return a sample of the correct size
         #   for mixed asset types.
-        start_date, end_date = errors.validate_dates(start_date=start_date, end_date=end_date,
-                                                     asset_type=keys.keys['ASSETS']['EQUITY'])
-
-    same_type = False
-    correlation_series = {}
+        window_type, weekends = keys.keys['ASSETS']['EQUITY'], 0
+    start_date, end_date = errors.validate_dates(start_date=start_date, end_date=end_date,
+                                                 asset_type=window_type)
 
-    if asset_type_1 == asset_type_2:
-        same_type = True
-
-    # TODO: what if start_date or end_date is None?
-    if same_type and asset_type_1 == keys.keys['ASSETS']['CRYPTO']:
+    if crypto_pair:
         date_range = [start_date] + dater.dates_between(start_date, end_date)
     else:  # default to business days
         date_range = [dater.get_previous_business_date(
             start_date)] + dater.business_dates_between(start_date, end_date)
 
-    for this_date in date_range:
-        calc_date_end = this_date
-        todays_cor = _calculate_moment_correlation(ticker_1=ticker_1,
-                                                   ticker_2=ticker_2,
-                                                   end_date=calc_date_end)
-        correlation_series[dater.to_string(
-            this_date)] = todays_cor['correlation']
-
-    # result = {f'{ticker_1}_{ticker_2}_correlation_time_series': correlation_series}
+    # NOTE: (start_date, end_date) of the sample each correlation in the series is calculated over
+    windows = [errors.validate_dates(start_date=None, end_date=this_date, asset_type=window_type)
+               for this_date in date_range]
+
+    frame = {}
+    for ticker, asset_type in [(ticker_1, asset_type_1), (ticker_2, asset_type_2)]:
+        frame[ticker] = price_util.as_series(services.get_daily_price_history(ticker=ticker,
+                                                                              start_date=windows[0][0],
+                                                                              end_date=windows[-1][1],
+                                                                              asset_type=asset_type), ticker)
+    frame = price_util.PriceFrame(frame).intersect()
+    dates, closes = frame[ticker_1].dates, frame.closes()
+
+    # NOTE: see _calculate_moment_correlation for the time deltas
+    gaps = (dates[1:] - dates[:-1]).astype(int)
+    equity_gaps = numpy.where(
+        dater.consecutive_trading_days_between(dates[:-1], dates[1:]), 1, gaps)
+    trading_periods = [functions.get_trading_period(asset_type)
+                       for asset_type in (asset_type_1, asset_type_2)]
+    log_prices, mod_returns = [], []
+    for i, asset_type in enumerate((asset_type_1, asset_type_2)):
+        time_deltas = equity_gaps if asset_type == keys.keys['ASSETS']['EQUITY'] else gaps
+        log_prices.append(numpy.fromiter(map(log, closes[:, i].tolist()),
+                                         dtype=float, count=len(closes)))
+        mod_returns.append((log_prices[i][1:] - log_prices[i][:-1]) /
+                           numpy.sqrt(time_deltas*trading_periods[i]))
+    x, y = mod_returns
+
+    # NOTE: cached correlations are read in a single query. The cache falls back to a lookup
+    #       per date if it cannot query a range.
+    cached_series = correlation_cache.filter_series(ticker_1=ticker_1, ticker_2=ticker_2,
+                                                    start_date=windows[0][0], end_date=windows[-1][1],
+                                                    weekends=weekends,
+                                                    method=keys.keys['ESTIMATION']['MOMENT'])
+
+    correlation_series, calculated = {}, {}
+    stats, previous = None, None
+    for this_date, (window_start, window_end) in zip(date_range, windows):
+        first = int(numpy.searchsorted(
+            dates, numpy.datetime64(window_start, 'D'), side='left'))
+        last = int(numpy.searchsorted(
+            dates, numpy.datetime64(window_end, 'D'), side='right')) - 1
+        # NOTE: returns first, ..., last-1 fall inside of the window
+        n = last - first
+        if n < 2:
+            raise errors.PriceError(
+                "Prices cannot be retrieved for correlation calculation")
+
+        if previous == (first - 1, last - 1):
+            stats = estimators.recursive_rolling_correlation(stats, x[last-1], x[first-1],
+                                                             y[last-1], y[first-1], n)
+        else:
+            covariance = numpy.cov(x[first:last], y[first:last])
+            stats = {
+                'x_bar': float(numpy.mean(x[first:last])),
+                'y_bar': float(numpy.mean(y[first:last])),
+                'x_variance': float(covariance[0][0]),
+                'y_variance': float(covariance[1][1]),
+                'covariance': float(covariance[0][1])
+            }
+        previous = (first, last)
+
+        if cached_series is not None:
+            cached = cached_series.get((window_start, window_end))
+        else:
+            cached = correlation_cache.filter(ticker_1=ticker_1, ticker_2=ticker_2,
+                                              start_date=window_start, end_date=window_end,
+                                              weekends=weekends,
+                                              method=keys.keys['ESTIMATION']['MOMENT'])
+            if cached is not None:
+                cached = cached[keys.keys['STATISTICS']['CORRELATION']]
+        if cached is not None:
+            correlation_series[dater.to_string(this_date)] = cached
+            continue
+
+        # NOTE: the method of moment matching centers the returns around the telescoping mean,
+        #       log(last_price/first_price)/(n*delta_t), instead of the sample mean, and scales the
+        #       covariance by 1/n instead of 1/(n-1).
+        mod_mean_1 = (log_prices[0][last] - log_prices[0][first]) / \
+            (n*sqrt(trading_periods[0]))
+        mod_mean_2 = (log_prices[1][last] - log_prices[1][first]) / \
+            (n*sqrt(trading_periods[1]))
+        shift_1, shift_2 = stats['x_bar'] - mod_mean_1, stats['y_bar'] - mod_mean_2
+        variance_1 = stats['x_variance'] + n*shift_1**2/(n-1)
+        variance_2 = stats['y_variance'] + n*shift_2**2/(n-1)
+        covariance = (n-1)*stats['covariance']/n + shift_1*shift_2
+        correlation = covariance/sqrt(variance_1*variance_2)
+
+        correlation_series[dater.to_string(this_date)] = correlation
+        calculated[(window_start, window_end)] = correlation
+
+    correlation_cache.save_series(ticker_1=ticker_1, ticker_2=ticker_2, correlations=calculated,
+                                  weekends=weekends, method=keys.keys['ESTIMATION']['MOMENT'])
     return correlation_series
 
 
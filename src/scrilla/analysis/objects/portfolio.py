@@ -14,21 +14,19 @@
 # or <https://github.com/chinchalinchin/scrilla/blob/develop/main/LICENSE>.
 
 from datetime import date
-from math import trunc, sqrt
+from math import trunc, sqrt, exp
 from decimal import Decimal
 from itertools import groupby
 from typing import Callable, Dict, List, Union
 
-# TODO: get rid of numpy functions.
-#       dot, multiply and transpose should be easy to replicate
-#       and it removes a big dependency from the package...
-from numpy import dot, multiply, transpose
+import numpy
+from scipy.stats import norm
 
 from scrilla import settings
 from scrilla.static import keys
-from scrilla.util import errors, outputter
+from scrilla.util import errors, outputter, prices as price_util
 # TODO: conditional import module based on analysis_mode, i.e. geometric versus mean reverting.
-from scrilla.analysis.models.geometric.statistics import calculate_risk_return, correlation_matrix
+from scrilla.analysis.models.geometric.statistics import calculate_risk_returns, correlation_matrix
 from scrilla.analysis.models.geometric.probability import percentile, conditional_expected_value
 
 logger = outputter.Logger(
@@ -43,7 +41,9 @@ class Portfolio:
 
     The portfolio can be initialized with historical prices using the `start_date` and `end_date` parameters or the `sample_prices` parameter. If `start_date` and `end_date` are provided, the class will pass the dates to the PriceManager to query an external service for the required prices. If `sample_prices` is provided, the `start_date` and `end_date` are ignored and the `sample_prices` are used in lieu of an external query.
 
-    The `return_function` and `volatility_function` methods accept an allocation of percentage weights corresponding to each ticker in the `tickers` array and return the overall portfolio return and volatility. The return is the dot product of the weight and the individual asset returns. The `volatility_function` is the result of applying matrix multiplication to the transposed weight allocations, the correlation matrix and the untransposed weight allocations. These formulations are consistent with Modern Portfolio Theory.
+    The `return_function` and `volatility_function` methods accept an allocation of percentage weights corresponding to each ticker in the `tickers` array and return the overall portfolio return and volatility. The return is the dot product of the weight and the individual asset returns. The `volatility_function` is the result of applying matrix multiplication to the transposed weight allocations, the covariance matrix and the untransposed weight allocations. These formulations are consistent with Modern Portfolio Theory.
+
+    The `batch_return_function`, `batch_volatility_function`, `batch_sharpe_ratio_function` and `batch_conditional_value_at_risk_function` methods evaluate the same objectives for many allocations at once, where each row of the input is a separate allocation.
 
     Parameters
     ----------
@@ -54,7 +54,7 @@ class Portfolio:
     3. **end_date**: ``Union[date, None]``
         *Optional*. The end date for the range of historical prices over which the portfolio will be optimized.
     4. **sample_prices**: ``Union[Dict[str, Dict[str, float]], None]``
-        *Optional*. A list representing a sample of historical data over a time range. The list must be ordered in descending order, i.e. from latest to earliest. Must be formatted as: `{ 'ticker_1': { 'date' : { 'open': value, 'close': value},... }}
+        *Optional*. A list representing a sample of historical data over a time range. The list must be ordered in descending order, i.e. from latest to earliest. Must be formatted as: `{ 'ticker_1': { 'date' : { 'open': value, 'close': value},... }}. A `scrilla.util.prices.PriceFrame` may be passed in instead; dictionaries are converted into one.
     5. **risk_profile** : ``Union[Dict[str, Dict[str, float]], None]``
         Optional: Rather than use sample statistics calculated from historical data, this argument can override the calculated values. Must be formatted as: `{ ticker: { 'annual_return': float, 'annual_volatility': float }}`
     6. **correlation_matrix**: ``Union[List[List[float]], None]``
@@ -66,7 +66,18 @@ class Portfolio:
 
     Attributes
     ----------
-    All parameters are exposed as properties on the class. With the exception of `asset_return_functions` and `asset_volatility_functions`, if optional parameters are not provided in the class constructor, they will be calculated based on available information. See *notes* for more details on how this class is constructed.
+    All parameters are exposed as properties on the class. With the exception of `asset_return_functions` and `asset_volatility_functions`, if optional parameters are not provided in the class constructor, they will be calculated based on available information. See *notes* for more details on how this class is constructed. In addition,
+
+    1. **mean_return**: ``numpy.ndarray``
+        The annual return of each asset.
+    2. **sample_vol**: ``numpy.ndarray``
+        The annual volatility of each asset.
+    3. **correl_matrix**: ``numpy.ndarray``
+        The correlation matrix of the assets.
+    4. **covariance**: ``numpy.ndarray``
+        The covariance matrix of the assets, built once from `sample_vol` and `correl_matrix` when the portfolio is initialized.
+    5. **cholesky**: ``Union[numpy.ndarray, None]``
+        The lower triangular Cholesky factor of `covariance`, i.e. the matrix *L* such that \\(L \cdot L^T = \Sigma\\), or `None` if the covariance matrix is not positive definite.
 
     .. notes::
     * While `start_date`, `end_date`, `sample_prices` are all by themselves optional, the `scrilla.analysis.objects.Portfolio` class must be initialized in one of three ways: 
@@ -79,9 +90,14 @@ class Portfolio:
     $$ \frac{dX(t)}{X(t)} = \mu(t) \cdot dt + \sigma(t) \cdot dB(t) $$
 
     where B(t) ~ \\(N(0, \Delta \cdot t)\\).
+    * The statistics are converted into contiguous arrays when the portfolio is initialized. If `mean_return`, `sample_vol` or `correl_matrix` are changed afterwards, `init_covariance` must be called to rebuild `covariance` and `cholesky`.
     """
+    __slots__ = ('estimation_method', 'sample_prices', 'tickers', 'correl_matrix', 'asset_volatility_functions',
+                 'asset_return_functions', 'risk_profiles', 'target_return', 'start_date', 'end_date',
+                 'risk_free_rate', 'asset_types', 'asset_groups', 'weekends', 'mean_return', 'sample_vol',
+                 'covariance', 'cholesky')
 
-    def __init__(self, tickers: List[str], start_date=Union[date, None], end_date=Union[date, None], sample_prices: Union[Dict[str, Dict[str, float]], None] = None, correl_matrix: Union[List[List[int]], None] = None, risk_profiles: Union[Dict[str, Dict[str, float]]] = None, risk_free_rate: Union[float, None] = None, asset_return_functions: Union[List[Callable], None] = None, asset_volatility_functions: Union[List[Callable], None] = None, method: str = settings.ESTIMATION_METHOD):
+    def __init__(self, tickers: List[str], start_date=Union[date, None], end_date=Union[date, None], sample_prices: Union[Dict[str, Dict[str, float]], price_util.PriceFrame, None] = None, correl_matrix: Union[List[List[int]], None] = None, risk_profiles: Union[Dict[str, Dict[str, float]]] = None, risk_free_rate: Union[float, None] = None, asset_return_functions: Union[List[Callable], None] = None, asset_volatility_functions: Union[List[Callable], None] = None, method: str = settings.ESTIMATION_METHOD):
         self.estimation_method = method
         self.sample_prices = sample_prices
         self.tickers = tickers
@@ -95,8 +111,9 @@ class Portfolio:
             self.start_date = start_date
             self.end_date = end_date
         else:
-            self.start_date = list(self.sample_prices.keys())[-1]
-            self.end_date = list(self.sample_prices.keys())[0]
+            self.sample_prices = price_util.as_frame(self.sample_prices)
+            self.start_date = self.sample_prices.start_date
+            self.end_date = self.sample_prices.end_date
 
         if risk_free_rate is not None:
             self.risk_free_rate = risk_free_rate
@@ -155,19 +172,22 @@ class Portfolio:
             #       need a flag in the cache to tell the program the statistic includes/exclude weekend prices.
 
             if self.risk_profiles is None:
-                for ticker in self.tickers:
-                    if self.sample_prices is not None:
-                        stats = calculate_risk_return(ticker=ticker,
-                                                      sample_prices=self.sample_prices[ticker],
+                if self.sample_prices is not None:
+                    profiles = calculate_risk_returns(tickers=self.tickers,
+                                                      sample_prices=self.sample_prices,
+                                                      asset_types=self.asset_types,
                                                       method=self.estimation_method,
                                                       weekends=self.weekends)
-                    else:
-                        stats = calculate_risk_return(ticker=ticker,
+                else:
+                    profiles = calculate_risk_returns(tickers=self.tickers,
                                                       start_date=self.start_date,
                                                       end_date=self.end_date,
+                                                      asset_types=self.asset_types,
                                                       method=self.estimation_method,
                                                       weekends=self.weekends)
 
+                for ticker in self.tickers:
+                    stats = profiles[ticker]
                     self.mean_return.append(stats['annual_return'])
                     self.sample_vol.append(stats['annual_volatility'])
             else:
@@ -185,6 +205,25 @@ class Portfolio:
                                                         weekends=self.weekends,
                                                         method=self.estimation_method)
 
+            self.init_covariance()
+
+    def init_covariance(self):
+        """
+        Converts `mean_return`, `sample_vol` and `correl_matrix` into ``numpy.float64`` arrays and builds the covariance matrix of the assets and its Cholesky factor from them. Called when the portfolio is initialized; it only needs to be called again if the statistics are changed afterwards.
+        """
+        self.mean_return = numpy.array(self.mean_return, dtype=numpy.float64)
+        self.sample_vol = numpy.array(self.sample_vol, dtype=numpy.float64)
+        self.correl_matrix = numpy.array(
+            self.correl_matrix, dtype=numpy.float64)
+        self.covariance = self.correl_matrix * \
+            numpy.outer(self.sample_vol, self.sample_vol)
+        try:
+            self.cholesky = numpy.linalg.cholesky(self.covariance)
+        except numpy.linalg.LinAlgError:
+            logger.debug(f'{self.tickers} covariance matrix is not positive definite, no Cholesky factor',
+                         'init_covariance')
+            self.cholesky = None
+
     def return_function(self, x):
         """
         Returns the portfolio return for a vector of allocations. It can be used as objective function input for `scipy.optimize`'s optimization methods. 
@@ -199,7 +238,7 @@ class Portfolio:
         ``float``
             The portfolio return on an annualized basis.
         """
-        return dot(x, self.mean_return)
+        return numpy.dot(x, self.mean_return)
 
     def volatility_function(self, x):
         """
@@ -215,7 +254,52 @@ class Portfolio:
         ``float``
             The portfolio volatility on an annualized basis.
         """
-        return sqrt(multiply(x, self.sample_vol).dot(self.correl_matrix).dot(transpose(multiply(x, self.sample_vol))))
+        return sqrt(max(numpy.dot(x, self._covariance_product(x)), 0))
+
+    def return_gradient(self, x):
+        """
+        Returns the gradient of `scrilla.analysis.objects.portfolio.Portfolio.return_function` with respect to the allocation. This function can be used as the `jac` input of `scipy.optimize`'s optimization methods.
+
+        Parameters
+        ----------
+        1. **x**: ``list``
+            Vector representing the allocation of each asset in the portfolio. Must be preserve the order of `portfolio.tickers`.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The vector of asset returns, since the portfolio return is linear in the allocation.
+        """
+        return self.mean_return.copy()
+
+    def volatility_gradient(self, x):
+        r"""
+        Returns the gradient of `scrilla.analysis.objects.portfolio.Portfolio.volatility_function` with respect to the allocation. This function can be used as the `jac` input of `scipy.optimize`'s optimization methods.
+
+        If \\(\Sigma\\) is the covariance matrix of the assets, the gradient of the portfolio volatility \\(\sigma(x) = \sqrt{x^T \Sigma x}\\) is given by,
+
+        $$ \nabla \sigma (x) = \frac{\Sigma x}{\sigma(x)} $$
+
+        Parameters
+        ----------
+        1. **x**: ``list``
+            Vector representing the allocation of each asset in the portfolio. Must be preserve the order of `portfolio.tickers`.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The gradient of the portfolio volatility. If the portfolio volatility is zero, a vector of zeros is returned.
+        """
+        volatility = self.volatility_function(x)
+        if volatility == 0:
+            return numpy.zeros(len(x))
+        return self._covariance_product(x) / volatility
+
+    def _covariance_product(self, x):
+        """
+        Returns the product of the asset covariance matrix and the allocation **x**.
+        """
+        return numpy.dot(self.covariance, x)
 
     def sharpe_ratio_function(self, x):
         """
@@ -231,7 +315,22 @@ class Portfolio:
         ``float``
             The portfolio sharpe ratio on an annualized basis.
         """
-        return (dot(x, self.mean_return) - self.risk_free_rate) / (self.volatility_function(x))
+        return (numpy.dot(x, self.mean_return) - self.risk_free_rate) / (self.volatility_function(x))
+
+    def sharpe_ratio_gradient(self, x):
+        r"""
+        Returns the gradient of `scrilla.analysis.objects.portfolio.Portfolio.sharpe_ratio_function` with respect to the allocation. This function can be used as the `jac` input of `scipy.optimize`'s optimization methods.
+
+        $$ \nabla \left( \frac{r(x) - r_f}{\sigma(x)} \right) = \frac{\nabla r(x)}{\sigma(x)} - \frac{r(x) - r_f}{\sigma(x)^2} \cdot \nabla \sigma(x) $$
+
+        Parameters
+        ----------
+        1. **x**: ``list``
+            Vector representing the allocation of each asset in the portfolio. Must be preserve the order of `portfolio.tickers`.
+        """
+        volatility = self.volatility_function(x)
+        excess_return = numpy.dot(x, self.mean_return) - self.risk_free_rate
+        return self.return_gradient(x)/volatility - excess_return*self._covariance_product(x)/volatility**3
 
     def percentile_function(self, x, time, prob):
         """
@@ -271,6 +370,111 @@ class Portfolio:
         return (1 - conditional_expected_value(S0=1, vol=portfolio_volatility, ret=portfolio_return,
                                                expiry=time, conditional_value=value_at_risk))
 
+    def conditional_value_at_risk_gradient(self, x, time, prob):
+        r"""
+        Returns the gradient of `scrilla.analysis.objects.portfolio.Portfolio.conditional_value_at_risk_function` with respect to the allocation. This function can be used as the `jac` input of `scipy.optimize`'s optimization methods.
+
+        Parameters
+        ----------
+        1. **x**: ``list``
+            an array of decimals representing percentage allocations of the portfolio. Must preserve order with `self.tickers`.
+        2. **time**: ``float``
+            time horizon (in years) of the value at risk.
+        3. **prob**: ``float``
+            desired probability of loss.
+
+        .. notes::
+            * Conditioned on the value at risk, the *d2* of the lognormal distribution reduces to \\(-z\\), where \\(z\\) is the standard normal percentile of `prob`, and *d1* reduces to \\(\sigma(x) \cdot t - z\\), where \\(r(x)\\) and \\(\sigma(x)\\) are the portfolio return and volatility. Therefore, the conditional value at risk has the closed form,
+
+            $$ CVaR(x) = 1 - \frac{e^{r(x) \cdot t^2} \cdot N(z - \sigma(x) \cdot t)}{prob} $$
+
+            whose gradient is,
+
+            $$ \nabla CVaR(x) = - \frac{e^{r(x) \cdot t^2}}{prob} \cdot \left( t^2 \cdot N(z - \sigma(x) \cdot t) \cdot \nabla r(x) - t \cdot n(z - \sigma(x) \cdot t) \cdot \nabla \sigma(x) \right) $$
+
+            The time horizon appears squared because `conditional_value_at_risk_function` scales the portfolio statistics to the horizon before passing them, along with the horizon, into the lognormal distribution functions.
+        """
+        shifted = norm.ppf(prob) - self.volatility_function(x)*time
+        scale = -exp(self.return_function(x)*time**2)/prob
+        return scale*(time**2*norm.cdf(shifted)*self.return_gradient(x)
+                      - time*norm.pdf(shifted)*self.volatility_gradient(x))
+
+    def batch_return_function(self, allocations):
+        """
+        Returns the portfolio return of many allocations at once.
+
+        Parameters
+        ----------
+        1. **allocations**: ``Union[List[List[float]], numpy.ndarray]``
+            Matrix whose rows are allocations. Each row must preserve the order of `portfolio.tickers`.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The annualized return of each allocation.
+        """
+        return numpy.asarray(allocations, dtype=numpy.float64) @ self.mean_return
+
+    def batch_volatility_function(self, allocations):
+        r"""
+        Returns the portfolio volatility of many allocations at once. If the Cholesky factor *L* of the covariance matrix is available, the volatility of the allocation *x* is calculated as the norm of \\(L^T \cdot x\\); otherwise, it is calculated from the covariance matrix directly.
+
+        Parameters
+        ----------
+        1. **allocations**: ``Union[List[List[float]], numpy.ndarray]``
+            Matrix whose rows are allocations. Each row must preserve the order of `portfolio.tickers`.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The annualized volatility of each allocation.
+        """
+        allocations = numpy.asarray(allocations, dtype=numpy.float64)
+        if self.cholesky is not None:
+            return numpy.linalg.norm(allocations @ self.cholesky, axis=1)
+        variances = numpy.einsum(
+            'ij,ij->i', allocations @ self.covariance, allocations)
+        return numpy.sqrt(numpy.maximum(variances, 0))
+
+    def batch_sharpe_ratio_function(self, allocations):
+        """
+        Returns the portfolio sharpe ratio of many allocations at once.
+
+        Parameters
+        ----------
+        1. **allocations**: ``Union[List[List[float]], numpy.ndarray]``
+            Matrix whose rows are allocations. Each row must preserve the order of `portfolio.tickers`.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The annualized sharpe ratio of each allocation.
+        """
+        return (self.batch_return_function(allocations) - self.risk_free_rate) / \
+            self.batch_volatility_function(allocations)
+
+    def batch_conditional_value_at_risk_function(self, allocations, time, prob):
+        """
+        Returns the conditional value at risk of many allocations at once, using the closed form given in `scrilla.analysis.objects.portfolio.Portfolio.conditional_value_at_risk_gradient`.
+
+        Parameters
+        ----------
+        1. **allocations**: ``Union[List[List[float]], numpy.ndarray]``
+            Matrix whose rows are allocations. Each row must preserve the order of `portfolio.tickers`.
+        2. **time**: ``float``
+            time horizon (in years) of the value at risk.
+        3. **prob**: ``float``
+            desired probability of loss.
+
+        Returns
+        -------
+        ``numpy.ndarray``
+            The conditional value at risk of each allocation.
+        """
+        shifted = norm.ppf(prob) - \
+            self.batch_volatility_function(allocations)*time
+        return 1 - numpy.exp(self.batch_return_function(allocations)*time**2)*norm.cdf(shifted)/prob
+
     def get_init_guess(self):
         length = len(self.tickers)
         uniform_guess = 1/length
@@ -281,6 +485,10 @@ class Portfolio:
     def get_constraint(x):
         return sum(x) - 1
 
+    @staticmethod
+    def get_constraint_jacobian(x):
+        return numpy.ones(len(x))
+
     def get_default_bounds(self):
         return [[0, 1] for y in range(len(self.tickers))]
 
@@ -289,9 +497,12 @@ class Portfolio:
 
     def get_target_return_constraint(self, x):
         if self.target_return is not None:
-            return (dot(x, self.mean_return) - self.target_return)
+            return (numpy.dot(x, self.mean_return) - self.target_return)
         return None
 
+    def get_target_return_constraint_jacobian(self, x):
+        return self.return_gradient(x)
+
     @staticmethod
     def calculate_approximate_shares(x, total, latest_prices: Dict[str, float]):
         """
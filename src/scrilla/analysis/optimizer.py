@@ -18,14 +18,17 @@
 A module of functions that wrap around `scipy.optimize` in order to optimize statistical and financial functions of interest.
 """
 
-from typing import List, Tuple
-from math import sqrt
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Union
+from math import sqrt, inf, isfinite
 
+import numpy
 import scipy.optimize as optimize
 
 from scrilla import settings
 from scrilla.static import constants
 from scrilla.analysis import estimators
+from scrilla.analysis.accumulators import MomentAccumulator, CovarianceAccumulator
 from scrilla.analysis.objects.portfolio import Portfolio
 import scrilla.util.outputter as outputter
 
@@ -34,7 +37,13 @@ logger = outputter.Logger('scrilla.analysis.optimizer', settings.LOG_LEVEL)
 
 def maximize_univariate_normal_likelihood(data: List[float]) -> List[float]:
     r"""
-    Maximizes the normal (log-)likelihood of the sample with respect to the mean and volatility in order to estimate the mean and volatility of the population distribution described by the sample.
+    Maximizes the normal (log-)likelihood of the sample with respect to the mean and volatility in order to estimate the mean and volatility of the population distribution described by the sample. The likelihood of a normal sample is maximized by the sample mean and the biased sample volatility,
+
+    $$ \hat{\mu} = \frac{\sum_{i=1}^{n} x_i}{n} $$
+
+    $$ \hat{\sigma} = \sqrt{\frac{\sum_{i=1}^{n} (x_i - \hat{\mu})^2}{n}} $$
+
+    so the estimates are calculated in closed form rather than solved for numerically.
 
     Parameters
     ----------
@@ -48,29 +57,15 @@ def maximize_univariate_normal_likelihood(data: List[float]) -> List[float]:
 
     .. notes::
         * Some comments about the methodology. This module assumes an underlying asset price process that follows Geometric Brownian motion. This implies the return on the asset over intervals of  \\(\delta t\\) is normally distributed with mean \\(\mu * \delta t\\) and volatility \\(\sigma \cdot \sqrt{\delta t}\\). If the sample is scaled by \\(\delta t\\), then the mean becomes \\(\mu\\) and the volatility \\(\frac{\sigma}{\sqrt t}\\).  Moreover, increments are independent. Therefore, if the observations are made over equally spaced intervals, each observation is drawn from an independent, identially distributed normal random variable. The parameters \\(\mu\\) and :\\(\frac {\sigma}{\delta t}\\) can then be estimated by maximizing the probability of observing a given sample with respect to the parameters. To obtain the estimate for \\(\sigma\\), multiply the result of this function by \\(\delta t\\).
-        * Theoretically, the output of this function should equal the same value obtained from the method of moment matching. However, there is a small discrepancy. It could be due to floating point arthimetic. However, see Section 2.2 of the following for what I think may be, if not the source, at least related to the [issue](https://www.researchgate.net/publication/5071468_Maximum_Likelihood_Estimation_of_Generalized_Ito_Processes_With_Discretely-Sampled_Data)
-        The author, however, is not considering the transformed Ito process, the log of the asset price process. It seems like his conclusion may be an artifact of Ito's Lemma? Not sure. Will need to think.
+        * The output of this function differs slightly from the method of moment matching, because the maximum likelihood estimate of the volatility divides the sum of squared deviations by _n_ instead of _(n-1)_. See Section 2.2 of the following for a discussion of maximum likelihood estimation on discretely-sampled Ito processes: [issue](https://www.researchgate.net/publication/5071468_Maximum_Likelihood_Estimation_of_Generalized_Ito_Processes_With_Discretely-Sampled_Data)
     """
-
-    def likelihood(x): return (-1) * \
-        estimators.univariate_normal_likelihood_function(params=x, data=data)
-
-    # make an educated guess
-    first_quartile = estimators.sample_percentile(data=data, percentile=0.25)
-    median = estimators.sample_percentile(data=data, percentile=0.5)
-    third_quartile = estimators.sample_percentile(data, percentile=0.75)
-    guess = [median, (third_quartile-first_quartile)/2]
-
-    params = optimize.minimize(fun=likelihood, x0=guess, options={'disp': False},
-                               method=constants.constants['OPTIMIZATION_METHOD'])
-    return params.x
+    moments = MomentAccumulator().update_many(data)
+    return [moments.mean, sqrt(moments.variance(ddof=0))]
 
 
 def maximize_bivariate_normal_likelihood(data: List[Tuple[float, float]]) -> List[float]:
     r"""
-
-    .. warning ::
-        This can take an extremely long time to solve...
+    Maximizes the bivariate normal (log-)likelihood of the sample with respect to the means, variances and covariance. The likelihood is maximized by the sample means and the biased sample variances and covariance, so the estimates are calculated in closed form. If the estimated covariance matrix is singular, the likelihood is unbounded, in which case it is maximized numerically within bounds on the variances and covariance instead, starting from the closed form estimates.
 
     Returns
     -------
@@ -81,27 +76,37 @@ def maximize_bivariate_normal_likelihood(data: List[Tuple[float, float]]) -> Lis
     x_data = [datum[0] for datum in data]
     y_data = [datum[1] for datum in data]
 
-    x_25_percentile = estimators.sample_percentile(x_data, 0.25)
-    y_25_percentile = estimators.sample_percentile(y_data, 0.25)
-    x_median = estimators.sample_percentile(x_data, 0.5)
-    y_median = estimators.sample_percentile(y_data, 0.5)
-    x_75_percentile = estimators.sample_percentile(x_data, 0.75)
-    y_75_percentile = estimators.sample_percentile(y_data, 0.75)
-    x_1_percentile = estimators.sample_percentile(x_data, 0.01)
-    y_1_percentile = estimators.sample_percentile(y_data, 0.01)
-    x_99_percentile = estimators.sample_percentile(x_data, 0.99)
-    y_99_percentile = estimators.sample_percentile(y_data, 0.99)
-
-    def likelihood(x): return (-1)*estimators.bivariate_normal_likelihood_function(params=x,
-                                                                                   data=data)
-
-    var_x_guess = (x_75_percentile - x_25_percentile)/2
-    var_y_guess = (y_75_percentile - y_25_percentile)/2
-    guess = [x_median, y_median, var_x_guess, var_y_guess, 0]
+    def likelihood(x):
+        # NOTE: bivariate_normal_likelihood_function flags singular covariance matrices with an
+        #       infinite likelihood, which must not be mistaken for a maximum.
+        value = estimators.bivariate_normal_likelihood_function(params=x,
+                                                                data=data)
+        return (-1)*value if isfinite(value) else inf
+
+    moments = CovarianceAccumulator().update_many(x_data, y_data)
+    estimates = [moments.x.mean, moments.y.mean, moments.x.variance(ddof=0),
+                 moments.y.variance(ddof=0), moments.covariance(ddof=0)]
+    determinant = estimates[2]*estimates[3] - estimates[4]**2
+
+    # NOTE: the determinant is compared relative to the variances, so the check does not depend
+    #       on the scale of the sample.
+    if determinant > 10**(-constants.constants['ACCURACY'])*estimates[2]*estimates[3]:
+        return estimates
+
+    logger.debug('Sample covariance matrix is singular, maximizing likelihood numerically.',
+                 'maximize_bivariate_normal_likelihood')
+
+    x_1_percentile, x_99_percentile = estimators.OrderStatistics(
+        x_data).percentile([0.01, 0.99])
+    y_1_percentile, y_99_percentile = estimators.OrderStatistics(
+        y_data).percentile([0.01, 0.99])
     var_x_bounds = x_99_percentile - x_1_percentile
     var_y_bounds = y_99_percentile - y_1_percentile
     cov_bounds = sqrt(var_x_bounds*var_y_bounds)
 
+    guess = [estimates[0], estimates[1], min(estimates[2], var_x_bounds),
+             min(estimates[3], var_y_bounds), max(min(estimates[4], cov_bounds), -cov_bounds)]
+
     params = optimize.minimize(fun=likelihood,
                                x0=guess,
                                bounds=[
@@ -116,7 +121,7 @@ def maximize_bivariate_normal_likelihood(data: List[Tuple[float, float]]) -> Lis
     return params.x
 
 
-def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = None) -> List[float]:
+def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = None, init_guess: Union[List[float], None] = None) -> List[float]:
     """
     Parameters
     ----------
@@ -124,6 +129,8 @@ def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = Non
         An instance of the `Portfolio` class. Must be initialized with an array of ticker symbols. Optionally, it can be initialized with a start_date and end_date datetime. If start_date and end_date are specified, the portfolio will be optimized over the stated time period. Otherwise, date range will default to range defined by `scrilla.settings.DEFAULT_ANALYSIS_PERIOD`.
     2. **target_return**: ``float``
         *Optional*. Defaults to `None`. The target return, as a decimal, subject to which the portfolio's volatility will be minimized.
+    3. **init_guess**: ``Union[List[float], None]``
+        *Optional*. Defaults to `None`. The allocation from which the optimization starts. If not provided, the optimization starts from `scrilla.analysis.objects.portfolio.Portfolio.get_init_guess`.
 
     Returns
     -------
@@ -133,11 +140,13 @@ def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = Non
     tickers = portfolio.tickers
     portfolio.set_target_return(target_return)
 
-    init_guess = portfolio.get_init_guess()
+    if init_guess is None:
+        init_guess = portfolio.get_init_guess()
     equity_bounds = portfolio.get_default_bounds()
     equity_constraint = {
         'type': 'eq',
-        'fun': portfolio.get_constraint
+        'fun': portfolio.get_constraint,
+        'jac': portfolio.get_constraint_jacobian
     }
 
     if target_return is not None:
@@ -146,7 +155,8 @@ def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = Non
 
         return_constraint = {
             'type': 'eq',
-            'fun': portfolio.get_target_return_constraint
+            'fun': portfolio.get_target_return_constraint,
+            'jac': portfolio.get_target_return_constraint_jacobian
         }
         portfolio_constraints = [equity_constraint, return_constraint]
     else:
@@ -155,6 +165,7 @@ def optimize_portfolio_variance(portfolio: Portfolio, target_return: float = Non
         portfolio_constraints = equity_constraint
 
     allocation = optimize.minimize(fun=portfolio.volatility_function, x0=init_guess,
+                                   jac=portfolio.volatility_gradient,
                                    method=constants.constants['OPTIMIZATION_METHOD'], bounds=equity_bounds,
                                    constraints=portfolio_constraints, options={'disp': False})
 
@@ -186,7 +197,8 @@ def optimize_conditional_value_at_risk(portfolio: Portfolio, prob: float, expiry
 
     equity_constraint = {
         'type': 'eq',
-        'fun': portfolio.get_constraint
+        'fun': portfolio.get_constraint,
+        'jac': portfolio.get_constraint_jacobian
     }
 
     if target_return is not None:
@@ -195,7 +207,8 @@ def optimize_conditional_value_at_risk(portfolio: Portfolio, prob: float, expiry
 
         return_constraint = {
             'type': 'eq',
-            'fun': portfolio.get_target_return_constraint
+            'fun': portfolio.get_target_return_constraint,
+            'jac': portfolio.get_target_return_constraint_jacobian
         }
         portfolio_constraints = [equity_constraint, return_constraint]
     else:
@@ -205,6 +218,8 @@ def optimize_conditional_value_at_risk(portfolio: Portfolio, prob: float, expiry
 
     allocation = optimize.minimize(fun=lambda x: portfolio.conditional_value_at_risk_function(x, expiry, prob),
                                    x0=init_guess,
+                                   jac=lambda x: portfolio.conditional_value_at_risk_gradient(
+                                       x, expiry, prob),
                                    method=constants.constants['OPTIMIZATION_METHOD'], bounds=equity_bounds,
                                    constraints=portfolio_constraints, options={'disp': False})
 
@@ -232,7 +247,8 @@ def maximize_sharpe_ratio(portfolio: Portfolio, target_return: float = None) ->
     equity_bounds = portfolio.get_default_bounds()
     equity_constraint = {
         'type': 'eq',
-        'fun': portfolio.get_constraint
+        'fun': portfolio.get_constraint,
+        'jac': portfolio.get_constraint_jacobian
     }
 
     if target_return is not None:
@@ -241,7 +257,8 @@ def maximize_sharpe_ratio(portfolio: Portfolio, target_return: float = None) ->
 
         return_constraint = {
             'type': 'eq',
-            'fun': portfolio.get_target_return_constraint
+            'fun': portfolio.get_target_return_constraint,
+            'jac': portfolio.get_target_return_constraint_jacobian
         }
         portfolio_constraints = [equity_constraint, return_constraint]
     else:
@@ -251,6 +268,8 @@ def maximize_sharpe_ratio(portfolio: Portfolio, target_return: float = None) ->
 
     allocation = optimize.minimize(fun=lambda x: (-1)*portfolio.sharpe_ratio_function(x),
                                    x0=init_guess,
+                                   jac=lambda x: (-1) *
+                                   portfolio.sharpe_ratio_gradient(x),
                                    method=constants.constants['OPTIMIZATION_METHOD'], bounds=equity_bounds,
                                    constraints=portfolio_constraints, options={'disp': False})
 
@@ -278,20 +297,22 @@ def maximize_portfolio_return(portfolio: Portfolio) -> List[float]:
     equity_bounds = portfolio.get_default_bounds()
     equity_constraint = {
         'type': 'eq',
-        'fun': portfolio.get_constraint
+        'fun': portfolio.get_constraint,
+        'jac': portfolio.get_constraint_jacobian
     }
 
     logger.debug(f'Maximizing {tickers} Portfolio Return',
                  'maximize_portfolio_retrun')
     allocation = optimize.minimize(fun=lambda x: (-1)*portfolio.return_function(x),
-                                   x0=init_guess, method=constants.constants['OPTIMIZATION_METHOD'],
+                                   x0=init_guess, jac=lambda x: (-1)*portfolio.return_gradient(x),
+                                   method=constants.constants['OPTIMIZATION_METHOD'],
                                    bounds=equity_bounds, constraints=equity_constraint,
                                    options={'disp': False})
 
     return allocation.x
 
 
-def calculate_efficient_frontier(portfolio: Portfolio, steps=None) -> List[List[float]]:
+def calculate_efficient_frontier(portfolio: Portfolio, steps=None, critical_line: bool = False, processes: Union[int, None] = None) -> List[List[float]]:
     """
     Parameters
     ----------
@@ -300,27 +321,262 @@ def calculate_efficient_frontier(portfolio: Portfolio, steps=None) -> List[List[
 
     2. **steps**: ``int``
         *Optional*. Defaults to `None`. The number of points calculated in the efficient frontier. If none is provided, it defaults to the environment variable **FRONTIER_STEPS**.
+    3. **critical_line**: ``bool``
+        *Optional*. Defaults to `False`. If `True`, the frontier is traced exactly with the critical line method in `scrilla.analysis.optimizer.calculate_critical_line_turning_points`, instead of solving a separate optimization for each point. Falls back to the optimizations if the covariance matrix of the portfolio is not positive definite.
+    4. **processes**: ``Union[int, None]``
+        *Optional*. Defaults to `None`. If greater than one, the points of the frontier are split into this many contiguous segments that are optimized in parallel by a pool of processes. If none is provided, it defaults to the environment variable **FRONTIER_PROCESSES**. Ignored by the critical line method.
 
     Returns
     -------
     ``List[List[float]]``
         A nested list of floats. Each float list corresponds to a point on a portfolio's efficient frontier, i.e. each list represents the percentage of a portfolio that should be allocated to the equity with the corresponding ticker symbol supplied as an attribute to the ``scrilla.analysis.objects.Portfolio`` object parameter.
+
+    .. notes::
+        * The points of the frontier are spaced evenly in return, from the return of the minimum volatility portfolio up to, but not including, the maximum return. Without short sales, the maximum return is attained by allocating the entire portfolio to the asset with the highest return, so it does not need to be optimized.
+        * Each optimization starts from the solution of the preceding point on the frontier, which is close to its own solution, rather than from a uniform allocation.
     """
     if steps is None:
         steps = settings.FRONTIER_STEPS
+    if processes is None:
+        processes = settings.FRONTIER_PROCESSES
+
+    if critical_line:
+        if portfolio.cholesky is not None:
+            return _interpolate_turning_points(portfolio=portfolio,
+                                               turning_points=calculate_critical_line_turning_points(
+                                                   portfolio),
+                                               steps=steps)
+        logger.debug(f'{portfolio.tickers} covariance matrix is not positive definite, optimizing frontier points instead',
+                     'calculate_efficient_frontier')
 
     minimum_allocation = optimize_portfolio_variance(portfolio=portfolio)
-    maximum_allocation = maximize_portfolio_return(portfolio=portfolio)
 
     minimum_return = portfolio.return_function(minimum_allocation)
-    maximum_return = portfolio.return_function(maximum_allocation)
+    maximum_return = max(portfolio.mean_return)
+    return_width = (maximum_return - minimum_return)/steps
+    target_returns = [minimum_return + return_width *
+                      i for i in range(steps)]
+
+    if processes is not None and processes > 1 and steps > 1:
+        segments = [segment.tolist() for segment in numpy.array_split(target_returns, min(processes, steps))]
+        logger.debug(f'Optimizing {steps} frontier points over {len(segments)} processes',
+                     'calculate_efficient_frontier')
+        with ProcessPoolExecutor(max_workers=len(segments)) as executor:
+            results = executor.map(_optimize_frontier_segment, [portfolio]*len(segments),
+                                   segments, [minimum_allocation]*len(segments))
+            return [allocation for result in results for allocation in result]
+
+    return _optimize_frontier_segment(portfolio, target_returns, minimum_allocation)
+
+
+def _optimize_frontier_segment(portfolio: Portfolio, target_returns: List[float], init_guess: List[float]) -> List[List[float]]:
+    """
+    Minimizes the volatility of `portfolio` subject to each of the `target_returns` in turn, starting each optimization from the solution of the previous one. Defined at the module level so it can be sent to the processes of `scrilla.analysis.optimizer.calculate_efficient_frontier`.
+    """
+    frontier = []
+    for target_return in target_returns:
+        init_guess = optimize_portfolio_variance(portfolio=portfolio, target_return=target_return,
+                                                 init_guess=init_guess)
+        frontier.append(init_guess)
+    return frontier
+
+
+def calculate_critical_line_turning_points(portfolio: Portfolio) -> List[numpy.ndarray]:
+    r"""
+    Traces the efficient frontier of a portfolio without short sales with Markowitz's [Critical Line Algorithm](https://en.wikipedia.org/wiki/Markowitz_model#Choosing_the_best_portfolio). Along the frontier, the optimal allocation solves,
+
+    $$ \min_{x} \frac{1}{2} x^T \Sigma x - \lambda \mu^T x \quad \text{subject to} \quad \sum_i x_i = 1, \, 0 \leq x_i \leq 1 $$
+
+    for some \\(\lambda \geq 0\\). While the same assets are *free*, i.e. strictly between their bounds, the solution is linear in \\(\lambda\\). The algorithm starts from the maximum return portfolio as \\(\lambda \to \infty\\) and decreases \\(\lambda\\) to the next value at which an asset enters or leaves its bounds, called a *turning point*, until it reaches the minimum volatility portfolio at \\(\lambda = 0\\).
+
+    Parameters
+    ----------
+    1. **portfolio**: `scrilla.analysis.objects.Portfolio`
+        An instance of the Portfolio class. Its covariance matrix must be positive definite.
+
+    Returns
+    -------
+    ``List[numpy.ndarray]``
+        The allocations at the turning points of the frontier, ordered from the maximum return portfolio to the minimum volatility portfolio. Every point of the frontier is a convex combination of two consecutive turning points.
+
+    .. notes::
+        * Follows the implementation in Bailey, D. and Lopez de Prado, M., *An Open-Source Implementation of the Critical-Line Algorithm for Portfolio Optimization*, Algorithms 6(1), 2013.
+    """
+    mean, covariance = portfolio.mean_return, portfolio.covariance
+    n = len(mean)
+    lower, upper = numpy.zeros(n), numpy.ones(n)
+
+    # NOTE: the maximum return portfolio fills the highest return assets up to their upper bound
+    #       until the portfolio is fully invested; the last asset filled is the only free asset.
+    order, weights = numpy.argsort(mean), lower.copy()
+    i = n
+    while weights.sum() < 1:
+        i -= 1
+        weights[order[i]] = upper[order[i]]
+    weights[order[i]] += 1 - weights.sum()
+    free = [order[i]]
+
+    # NOTE: an asset that enters or leaves its bounds at a turning point is not allowed to reverse
+    #       at the next one. Otherwise, rounding error can put the reversal at the same lambda
+    #       and the asset crosses its bound unnoticed.
+    turning_points, critical_lambda, last_in, last_out = [
+        weights.copy()], None, None, None
+    while True:
+        # an asset that is free moves to one of its bounds
+        lambda_in, asset_in, bound_in = None, None, None
+        if len(free) > 1:
+            system = _critical_line_system(mean, covariance, weights, free)
+            for j, asset in enumerate(free):
+                if asset == last_out:
+                    continue
+                this_lambda, bound = _critical_line_lambda(
+                    system, j, [lower[asset], upper[asset]])
+                if this_lambda is not None and (critical_lambda is None or this_lambda < critical_lambda) \
+                        and (lambda_in is None or this_lambda > lambda_in):
+                    lambda_in, asset_in, bound_in = this_lambda, asset, bound
+
+        # an asset that is on one of its bounds becomes free
+        lambda_out, asset_out = None, None
+        bounded = [asset for asset in range(n)
+                   if asset not in free and asset != last_in]
+        if bounded:
+            lambdas = _critical_line_freeing_lambdas(
+                mean, covariance, weights, free, bounded)
+            for asset, this_lambda in zip(bounded, lambdas):
+                if numpy.isfinite(this_lambda) and (critical_lambda is None or this_lambda < critical_lambda) \
+                        and (lambda_out is None or this_lambda > lambda_out):
+                    lambda_out, asset_out = this_lambda, asset
+
+        last_in, last_out = None, None
+        if (lambda_in is None or lambda_in < 0) and (lambda_out is None or lambda_out < 0):
+            critical_lambda = 0
+        elif lambda_out is None or (lambda_in is not None and lambda_in > lambda_out):
+            critical_lambda, last_in = lambda_in, asset_in
+            free.remove(asset_in)
+            weights[asset_in] = bound_in
+        else:
+            critical_lambda, last_out = lambda_out, asset_out
+            free.append(asset_out)
+
+        weights[free] = _critical_line_weights(_critical_line_system(mean, covariance, weights, free),
+                                               critical_lambda)
+        turning_points.append(weights.copy())
+        if critical_lambda == 0:
+            break
+
+    return _purge_turning_points(turning_points, mean, lower, upper)
+
+
+def _critical_line_system(mean: numpy.ndarray, covariance: numpy.ndarray, weights: numpy.ndarray, free: List[int]) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float]:
+    """
+    Returns the inverse covariance matrix of the `free` assets, their returns, the part of the allocation they must offset to balance the bounded assets, i.e. the product of the inverse covariance of the free assets, the covariance between the free and bounded assets and the bounded weights, and the total weight of the bounded assets.
+    """
+    bounded = [asset for asset in range(len(mean)) if asset not in free]
+    inverse = numpy.linalg.inv(covariance[numpy.ix_(free, free)])
+    offset = inverse @ covariance[numpy.ix_(free, bounded)] @ weights[bounded]
+    return inverse, mean[free], offset, weights[bounded].sum()
+
+
+def _critical_line_freeing_lambdas(mean: numpy.ndarray, covariance: numpy.ndarray, weights: numpy.ndarray, free: List[int], candidates: List[int]) -> numpy.ndarray:
+    """
+    Returns the value of lambda at which each of the `candidates` would become free, i.e. `scrilla.analysis.optimizer._critical_line_lambda` for the last asset of the system formed by adding the candidate to the `free` assets, for every candidate at once. Instead of inverting the covariance matrix of each enlarged set of free assets, the inverse of the covariance matrix of the `free` assets is extended by one row and column per candidate through its Schur complement.
+    """
+    bounded = [asset for asset in range(len(mean)) if asset not in free]
+    inverse = numpy.linalg.inv(covariance[numpy.ix_(free, free)])
+    cross = covariance[numpy.ix_(free, candidates)]
+    # NOTE: each column is the inverse of the free covariance applied to a candidate's covariances.
+    projection = inverse @ cross
+    schur = covariance[candidates, candidates] - \
+        numpy.einsum('ij,ij->j', cross, projection)
+    projection_sum = projection.sum(axis=0)
+
+    def extend(free_part, candidate_part):
+        # the last element and the sum of the inverse of the enlarged covariance applied to a vector
+        solved = inverse @ free_part
+        last = (candidate_part - cross.T @ solved)/schur
+        return last, solved.sum() + last*(1 - projection_sum)
+
+    ones_last, ones_sum = extend(numpy.ones(len(free)), 1)
+    mean_last, mean_sum = extend(mean[free], mean[candidates])
+
+    candidate_weights = weights[candidates]
+    bounded_offset = covariance[numpy.ix_(free, bounded)] @ weights[bounded]
+    candidate_offset = covariance[numpy.ix_(candidates, bounded)] @ weights[bounded] - \
+        covariance[candidates, candidates]*candidate_weights
+    solved = inverse @ bounded_offset
+    offset_last = (candidate_offset - cross.T @ solved +
+                   numpy.einsum('ij,ij->j', cross, projection)*candidate_weights)/schur
+    offset_sum = solved.sum() - projection_sum*candidate_weights + \
+        offset_last*(1 - projection_sum)
+    bounded_sum = weights[bounded].sum() - candidate_weights
+
+    c = -ones_sum*mean_last + mean_sum*ones_last
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        lambdas = ((1 - bounded_sum + offset_sum)*ones_last -
+                   ones_sum*(candidate_weights + offset_last))/c
+    return numpy.where(c == 0, numpy.nan, lambdas)
+
+
+def _critical_line_weights(system, critical_lambda: float) -> numpy.ndarray:
+    """
+    Returns the weights of the free assets on the critical line at `critical_lambda`.
+    """
+    inverse, mean, offset, bounded_sum = system
+    ones_inverse = inverse.sum(axis=0)
+    gamma = (-critical_lambda*ones_inverse @ mean + 1 - bounded_sum +
+             offset.sum())/ones_inverse.sum()
+    return -offset + gamma*ones_inverse + critical_lambda*inverse @ mean
+
+
+def _critical_line_lambda(system, i: int, bound: Union[float, List[float]]) -> Tuple[Union[float, None], float]:
+    """
+    Returns the value of lambda at which the *i*-th free asset of the `system` reaches `bound`, along with the bound. If `bound` is a pair of lower and upper bounds, the bound the asset moves towards is used.
+    """
+    inverse, mean, offset, bounded_sum = system
+    ones_inverse = inverse.sum(axis=0)
+    inverse_mean = inverse @ mean
+    c = -ones_inverse.sum()*inverse_mean[i] + \
+        (ones_inverse @ mean)*ones_inverse[i]
+    if c == 0:
+        return None, None
+    if isinstance(bound, list):
+        bound = bound[1] if c > 0 else bound[0]
+    return ((1 - bounded_sum + offset.sum())*ones_inverse[i] - ones_inverse.sum()*(bound + offset[i]))/c, bound
+
+
+def _purge_turning_points(turning_points: List[numpy.ndarray], mean: numpy.ndarray, lower: numpy.ndarray, upper: numpy.ndarray) -> List[numpy.ndarray]:
+    """
+    Removes turning points that violate the constraints through numerical error, or whose return does not decrease along the frontier.
+    """
+    tolerance = 10**(-constants.constants['ACCURACY'])
+    feasible = [weights for weights in turning_points
+                if abs(weights.sum() - 1) <= tolerance
+                and numpy.all(weights >= lower - tolerance) and numpy.all(weights <= upper + tolerance)]
+
+    purged = feasible[:1]
+    for weights in feasible[1:]:
+        if weights @ mean <= purged[-1] @ mean + tolerance:
+            purged.append(weights)
+    return [numpy.clip(weights, lower, upper) for weights in purged]
+
+
+def _interpolate_turning_points(portfolio: Portfolio, turning_points: List[numpy.ndarray], steps: int) -> List[List[float]]:
+    """
+    Returns `steps` allocations on the frontier traced by `turning_points`, spaced evenly in return from the minimum volatility portfolio to the maximum return portfolio. Between consecutive turning points, the allocation is linear in its return, so each allocation is interpolated from the turning points on either side of its return.
+    """
+    returns = numpy.array([weights @ portfolio.mean_return for weights in turning_points])
+    minimum_return, maximum_return = returns[-1], returns[0]
     return_width = (maximum_return - minimum_return)/steps
 
     frontier = []
     for i in range(steps):
         target_return = minimum_return + return_width*i
-        allocation = optimize_portfolio_variance(
-            portfolio=portfolio, target_return=target_return)
-        frontier.append(allocation)
-
+        # NOTE: returns decrease along the turning points; find the segment containing the target.
+        k = min(max(int(numpy.searchsorted(-returns, -target_return, side='right')) - 1, 0),
+                len(turning_points) - 2) if len(turning_points) > 1 else 0
+        if len(turning_points) == 1 or returns[k] == returns[k+1]:
+            frontier.append(turning_points[k].copy())
+            continue
+        alpha = (target_return - returns[k+1])/(returns[k] - returns[k+1])
+        frontier.append(alpha*turning_points[k] + (1 - alpha)*turning_points[k+1])
     return frontier
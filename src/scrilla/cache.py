@@ -18,10 +18,19 @@ This module provides a data access layer for a SQLite database maintained on the
 
 In addition to preventing excessive API calls, the cache prevents redundant calculations. For example, calculating the market beta for a series of assets requires the variance of the market proxy for each calculation. Rather than recalculate this quantity each time, the program will defer to the values stored in the cache.
 """
-import itertools
+import atexit
+import bisect
 import datetime
+import os
 import sqlite3
-from typing import Union
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from queue import Empty, Queue
+from typing import Any, Dict, List, Tuple, Union
 import uuid
 
 from scrilla import files, settings
@@ -45,6 +54,633 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+class Connection():
+    """
+    `scrilla.cache.Connection` manages the *SQLite* connections used by `scrilla.cache.Cache`. Instead of opening, committing and closing a connection for every statement, a connection is opened once per thread (and per process, since *SQLite* connections cannot be carried across a `fork`) and reused by every cache table. When a connection is opened, it is configured with the pragmas in `scrilla.static.config.sqlite_connection_conf`, i.e. write-ahead journaling and a larger page cache, and it keeps a cache of prepared statements so the handful of statements the cache tables use are only compiled once.
+
+    Statements executed outside of a `scrilla.cache.Connection.transaction` scope are committed immediately, exactly as they were when every statement opened its own connection. Statements executed inside of a scope are committed together when the outermost scope exits, or rolled back if an exception is raised.
+
+    Attributes
+    ----------
+    1. **pool**: ``threading.local``
+        Thread local storage holding the connections opened by the current thread, keyed by the location of the database file.
+    2. **counters**: ``dict``
+        Running totals of the connections opened, the connections reused, the statements executed, the commits and the rollbacks performed. Accessible through `scrilla.cache.Connection.statistics`.
+
+    .. notes::
+        * Pooled connections remember the identity of the file they opened. If the file is removed or replaced, e.g. when `scrilla.files.clear_cache` is called, the stale connection is discarded and a new one is opened the next time the cache is accessed.
+    """
+    pool = threading.local()
+    lock = threading.Lock()
+    connections = []
+    counters = {
+        'connections': 0,
+        'reuses': 0,
+        'statements': 0,
+        'commits': 0,
+        'rollbacks': 0
+    }
+
+    @staticmethod
+    def _identity(path):
+        try:
+            stats = os.stat(path)
+        except OSError:
+            return None
+        return (stats.st_dev, stats.st_ino)
+
+    @classmethod
+    def _count(cls, counter, increment=1):
+        with cls.lock:
+            cls.counters[counter] += increment
+
+    @classmethod
+    def _pooled(cls):
+        if not hasattr(cls.pool, 'connections'):
+            cls.pool.connections = {}
+            cls.pool.depth = 0
+        return cls.pool.connections
+
+    @classmethod
+    def _open(cls, path):
+        conf = config.sqlite_connection_conf
+        con = sqlite3.connect(path, timeout=conf['timeout'],
+                              cached_statements=conf['cached_statements'],
+                              check_same_thread=False)
+        for pragma, value in conf['pragmas'].items():
+            con.execute(f'PRAGMA {pragma}={value}')
+        Migrations.migrate(con)
+
+        with cls.lock:
+            cls.connections.append(con)
+            cls.counters['connections'] += 1
+
+        logger.debug(f'Opened connection to {path}', 'Connection._open')
+        return con
+
+    @classmethod
+    def _discard(cls, con):
+        with cls.lock:
+            if con in cls.connections:
+                cls.connections.remove(con)
+        try:
+            con.close()
+        except sqlite3.Error as e:
+            logger.error(e, 'Connection._discard')
+
+    @classmethod
+    def get(cls, path: Union[str, None] = None) -> sqlite3.Connection:
+        """
+        Returns the current thread's connection to the database located at `path`, opening a new connection if one has not been opened yet or if the pooled connection has gone stale.
+
+        Parameters
+        ----------
+        1. **path**: ``Union[str, None]``
+            *Optional*. Location of the database file. Defaults to `scrilla.settings.CACHE_SQLITE_FILE`.
+        """
+        if path is None:
+            path = settings.CACHE_SQLITE_FILE
+
+        pooled = cls._pooled()
+
+        if path in pooled:
+            con, pid, identity = pooled[path]
+            if pid == os.getpid() and identity == cls._identity(path):
+                cls._count('reuses')
+                return con
+            del pooled[path]
+            # NOTE: a connection inherited through a fork belongs to the parent process,
+            #       so it is dropped rather than closed.
+            if pid == os.getpid():
+                logger.debug(f'{path} has been replaced, reopening connection',
+                             'Connection.get')
+                cls._discard(con)
+
+        con = cls._open(path)
+        pooled[path] = (con, os.getpid(), cls._identity(path))
+        return con
+
+    @classmethod
+    def commit(cls, con: sqlite3.Connection):
+        """
+        Commits the pending changes on `con`, unless the current thread is inside of a `scrilla.cache.Connection.transaction` scope, in which case the commit is deferred until the scope exits.
+        """
+        cls._pooled()
+        if cls.pool.depth == 0 and con.in_transaction:
+            con.commit()
+            cls._count('commits')
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, path: Union[str, None] = None):
+        """
+        Context manager that groups every statement executed through `scrilla.cache.Cache.execute` within its scope into a single transaction. Scopes can be nested; only the outermost scope commits.
+
+        ```python
+        from scrilla.cache import Connection
+
+        with Connection.transaction():
+            price_cache.save_rows('AAPL', aapl_prices)
+            price_cache.save_rows('MSFT', msft_prices)
+        ```
+        """
+        con = cls.get(path)
+        cls.pool.depth += 1
+        try:
+            yield con
+        except BaseException:
+            cls.pool.depth -= 1
+            if cls.pool.depth == 0 and con.in_transaction:
+                con.rollback()
+                cls._count('rollbacks')
+            raise
+        cls.pool.depth -= 1
+        cls.commit(con)
+
+    @classmethod
+    def in_scope(cls) -> bool:
+        """
+        Returns `True` if the current thread is inside of a `scrilla.cache.Connection.transaction` scope.
+        """
+        cls._pooled()
+        return cls.pool.depth > 0
+
+    @classmethod
+    def close_all(cls):
+        """
+        Closes every connection opened by this process. Subsequent calls to `scrilla.cache.Connection.get` will open fresh connections.
+        """
+        with cls.lock:
+            connections, cls.connections = cls.connections, []
+        for con in connections:
+            try:
+                con.close()
+            except sqlite3.Error as e:
+                logger.error(e, 'Connection.close_all')
+        cls.pool = threading.local()
+
+    @classmethod
+    def statistics(cls) -> dict:
+        """
+        Returns a snapshot of `scrilla.cache.Connection.counters`, along with the number of connections currently open.
+        """
+        with cls.lock:
+            return {**cls.counters, 'open': len(cls.connections)}
+
+
+class Migrations():
+    """
+    `scrilla.cache.Migrations` versions the schema of the *SQLite* cache. The version of a database file is recorded in its `schema_version` table. Every migration newer than the recorded version is applied, in order, when `scrilla.cache.Connection` opens a connection to the file. Each migration is applied in a single transaction along with the row that records its version, so an interrupted upgrade leaves the database at the last version that was applied in full.
+
+    Attributes
+    ----------
+    1. **sqlite_create_version_table**: ``str``
+        *SQLite* transaction used to create the table recording the migrations applied to the database.
+    2. **sqlite_version_query**: ``str``
+        *SQLite* query to retrieve the current version of the database.
+    3. **sqlite_insert_version_transaction**: ``str``
+        *SQLite* transaction used to record a migration.
+    4. **migrations**: ``List[Tuple[int, List[str]]]``
+        The version of each migration, along with the statements that upgrade the previous version to it.
+
+    .. notes::
+        * Version 1 is the original schema, which stores dates as ISO-8601 strings and has no indexes on the `correlations` and `profile` tables. Its statements only create the tables that do not exist, so a database created before the schema was versioned is recognized as version 1.
+        * Version 2 keys every table by the columns its queries filter on, so every lookup is a search of the primary key instead of a scan of the table. Dates are stored as the integers returned by `datetime.date.toordinal`. Duplicate rows are collapsed while the tables are copied: the latest correlation saved is kept, and for profiles the latest value of each statistic that is not null is kept.
+        * The statements of a migration must never be changed once released. Changes to the schema are made by appending a new migration.
+    """
+    sqlite_create_version_table = "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY, applied TEXT)"
+    sqlite_version_query = "SELECT ifnull(max(version), 0) FROM schema_version"
+    sqlite_insert_version_transaction = "INSERT INTO schema_version (version, applied) VALUES (:version, datetime('now'))"
+
+    _ordinal = "CAST(julianday({column}) - 1721424.5 AS INTEGER)"
+    migrations = [
+        (1, [
+            "CREATE TABLE IF NOT EXISTS prices (ticker text, date text, open real, close real, UNIQUE(ticker, date))",
+            "CREATE TABLE IF NOT EXISTS interest(maturity text, date text, value real, UNIQUE(maturity, date))",
+            "CREATE TABLE IF NOT EXISTS correlations (ticker_1 TEXT, ticker_2 TEXT, start_date TEXT, end_date TEXT, correlation REAL, method TEXT, weekends INT)",
+            "CREATE TABLE IF NOT EXISTS profile (id INTEGER PRIMARY KEY, ticker TEXT, start_date TEXT, end_date TEXT, annual_return REAL, annual_volatility REAL, sharpe_ratio REAL, asset_beta REAL, equity_cost REAL, method TEXT, weekends INT)"
+        ]),
+        (2, [
+            "ALTER TABLE prices RENAME TO prices_v1",
+            "CREATE TABLE prices (ticker TEXT, date INTEGER, open REAL, close REAL, PRIMARY KEY (ticker, date)) WITHOUT ROWID",
+            f"INSERT OR REPLACE INTO prices (ticker, date, open, close) SELECT ticker, {_ordinal.format(column='date')}, open, close FROM prices_v1 WHERE ticker IS NOT NULL AND julianday(date) IS NOT NULL ORDER BY rowid",
+            "DROP TABLE prices_v1",
+            "ALTER TABLE interest RENAME TO interest_v1",
+            "CREATE TABLE interest (maturity TEXT, date INTEGER, value REAL, PRIMARY KEY (maturity, date)) WITHOUT ROWID",
+            f"INSERT OR REPLACE INTO interest (maturity, date, value) SELECT maturity, {_ordinal.format(column='date')}, value FROM interest_v1 WHERE maturity IS NOT NULL AND julianday(date) IS NOT NULL ORDER BY rowid",
+            "DROP TABLE interest_v1",
+            "ALTER TABLE correlations RENAME TO correlations_v1",
+            "CREATE TABLE correlations (ticker_1 TEXT, ticker_2 TEXT, start_date INTEGER, end_date INTEGER, method TEXT, weekends INT, correlation REAL, PRIMARY KEY (ticker_1, ticker_2, start_date, end_date, method, weekends)) WITHOUT ROWID",
+            f"INSERT OR REPLACE INTO correlations (ticker_1, ticker_2, start_date, end_date, method, weekends, correlation) SELECT ticker_1, ticker_2, {_ordinal.format(column='start_date')}, {_ordinal.format(column='end_date')}, method, weekends, correlation FROM correlations_v1 WHERE ticker_1 IS NOT NULL AND ticker_2 IS NOT NULL AND julianday(start_date) IS NOT NULL AND julianday(end_date) IS NOT NULL AND method IS NOT NULL AND weekends IS NOT NULL ORDER BY rowid",
+            "DROP TABLE correlations_v1",
+            "ALTER TABLE profile RENAME TO profile_v1",
+            "CREATE TABLE profile (ticker TEXT, start_date INTEGER, end_date INTEGER, method TEXT, weekends INT, annual_return REAL, annual_volatility REAL, sharpe_ratio REAL, asset_beta REAL, equity_cost REAL, PRIMARY KEY (ticker, start_date, end_date, method, weekends)) WITHOUT ROWID",
+            f"INSERT INTO profile (ticker, start_date, end_date, method, weekends, annual_return, annual_volatility, sharpe_ratio, asset_beta, equity_cost) SELECT ticker, {_ordinal.format(column='start_date')}, {_ordinal.format(column='end_date')}, method, weekends, annual_return, annual_volatility, sharpe_ratio, asset_beta, equity_cost FROM profile_v1 WHERE ticker IS NOT NULL AND julianday(start_date) IS NOT NULL AND julianday(end_date) IS NOT NULL AND method IS NOT NULL AND weekends IS NOT NULL ORDER BY id ON CONFLICT (ticker, start_date, end_date, method, weekends) DO UPDATE SET annual_return=ifnull(excluded.annual_return, annual_return), annual_volatility=ifnull(excluded.annual_volatility, annual_volatility), sharpe_ratio=ifnull(excluded.sharpe_ratio, sharpe_ratio), asset_beta=ifnull(excluded.asset_beta, asset_beta), equity_cost=ifnull(excluded.equity_cost, equity_cost)",
+            "DROP TABLE profile_v1"
+        ])
+    ]
+
+    @classmethod
+    def version(cls, con: sqlite3.Connection) -> int:
+        """
+        Returns the version of the database `con` is connected to, or 0 if no migrations have been applied to it.
+        """
+        con.execute(cls.sqlite_create_version_table)
+        return con.execute(cls.sqlite_version_query).fetchone()[0]
+
+    @classmethod
+    def migrate(cls, con: sqlite3.Connection) -> int:
+        """
+        Applies the migrations newer than the version of the database `con` is connected to and returns the version of the database after they have been applied.
+
+        Parameters
+        ----------
+        1. **con**: ``sqlite3.Connection``
+
+        .. notes::
+            * The version is read again once the write lock is held, so when several processes open the same database at once, each migration is only applied by the first of them.
+        """
+        current = cls.version(con)
+        for version, statements in cls.migrations:
+            if version <= current:
+                continue
+            con.execute('BEGIN IMMEDIATE')
+            try:
+                current = con.execute(cls.sqlite_version_query).fetchone()[0]
+                if version <= current:
+                    con.rollback()
+                    continue
+                for statement in statements:
+                    con.execute(statement)
+                con.execute(cls.sqlite_insert_version_transaction,
+                            {'version': version})
+                con.commit()
+            except BaseException:
+                con.rollback()
+                raise
+            current = version
+            logger.debug(f'Migrated cache to schema version {version}',
+                         'Migrations.migrate')
+        return current
+
+
+class CoverageIndex():
+    """
+    In-memory index of a single series of observations, e.g. the prices of a ticker or the yields of a maturity, along with the date intervals the index covers. An interval is covered when the observations inside of it have been read from or written to the cache, meaning the index holds every observation the cache has for that interval, even if some of its dates have none.
+
+    Dates are kept sorted, so a date range is sliced with a binary search, and `scrilla.cache.CoverageIndex.uncovered` determines which parts of a date range still need to be read from the cache.
+
+    Attributes
+    ----------
+    1. **dates**: ``List[str]``
+        Dates of the observations, formatted *YYYY-MM-DD* and sorted from earliest to latest.
+    2. **values**: ``List[Any]``
+        Observations, aligned with `dates`.
+    3. **intervals**: ``List[Tuple[datetime.date, datetime.date]]``
+        Disjoint `(start_date, end_date)` intervals covered by the index, sorted from earliest to latest.
+    """
+    __slots__ = ('dates', 'values', 'intervals')
+
+    ONE_DAY = datetime.timedelta(days=1)
+
+    def __init__(self):
+        self.dates, self.values, self.intervals = [], [], []
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def update(self, observations: Dict[str, Any], start_date: Union[datetime.date, str, None] = None, end_date: Union[datetime.date, str, None] = None):
+        """
+        Adds `observations` to the index and marks the interval from `start_date` to `end_date` as covered.
+
+        Parameters
+        ----------
+        1. **observations**: ``Dict[str, Any]``
+            Observations keyed by date string. May be ordered either way.
+        2. **start_date**: ``Union[datetime.date, str, None]``
+            *Optional*. Start of the covered interval. Defaults to the earliest date in `observations`.
+        3. **end_date**: ``Union[datetime.date, str, None]``
+            *Optional*. End of the covered interval. Defaults to the latest date in `observations`.
+        """
+        if observations:
+            new_dates = sorted(observations)
+            if not self.dates or new_dates[0] > self.dates[-1]:
+                # NOTE: observations are usually appended as time moves forward, so avoid the merge
+                self.dates += new_dates
+                self.values += [observations[this_date]
+                                for this_date in new_dates]
+            else:
+                merged = dict(zip(self.dates, self.values))
+                merged.update(observations)
+                self.dates = sorted(merged)
+                self.values = [merged[this_date] for this_date in self.dates]
+            start_date = new_dates[0] if start_date is None else start_date
+            end_date = new_dates[-1] if end_date is None else end_date
+
+        if start_date is not None and end_date is not None:
+            self.cover(start_date, end_date)
+
+    def cover(self, start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]):
+        """
+        Marks the interval from `start_date` to `end_date` as covered, merging it with any interval it overlaps or borders.
+        """
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        intervals = []
+        for this_start, this_end in self.intervals:
+            if this_end + self.ONE_DAY < start_date or end_date + self.ONE_DAY < this_start:
+                intervals.append((this_start, this_end))
+            else:
+                start_date, end_date = min(this_start, start_date), max(
+                    this_end, end_date)
+        bisect.insort(intervals, (start_date, end_date))
+        self.intervals = intervals
+
+    def uncovered(self, start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]) -> List[Tuple[datetime.date, datetime.date]]:
+        """
+        Returns the `(start_date, end_date)` sub-ranges of the given date range that are not covered by the index, ordered from earliest to latest.
+        """
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        missing, cursor = [], start_date
+        for this_start, this_end in self.intervals:
+            if this_end < cursor:
+                continue
+            if this_start > end_date:
+                break
+            if this_start > cursor:
+                missing.append((cursor, this_start - self.ONE_DAY))
+            cursor = this_end + self.ONE_DAY
+            if cursor > end_date:
+                break
+        if cursor <= end_date:
+            missing.append((cursor, end_date))
+        return missing
+
+    def covers(self, start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]) -> bool:
+        return not self.uncovered(start_date, end_date)
+
+    def slice(self, start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]) -> Dict[str, Any]:
+        """
+        Returns the observations dated from `start_date` to `end_date`, inclusive, ordered from latest to earliest.
+        """
+        start = bisect.bisect_left(self.dates, _as_string(start_date))
+        end = bisect.bisect_right(self.dates, _as_string(end_date))
+        return {self.dates[i]: self.values[i] for i in range(end - 1, start - 1, -1)}
+
+
+def _sizeof(obj: Any) -> int:
+    """
+    Returns an estimate of the bytes held by `obj`, including the objects it contains.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_sizeof(key) + _sizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_sizeof(item) for item in obj)
+    return size
+
+
+class MemoryTier():
+    """
+    Base class of the in-memory tier each cache keeps in front of its tables. Entries are held in least recently used order. The least recently used entries are evicted once the estimated size of the tier exceeds `max_bytes`, and entries are expired once they have been held for longer than `ttl` seconds. Every tier counts its hits, misses, evictions and expirations; see `scrilla.cache.MemoryTier.statistics`.
+
+    Parameters
+    ----------
+    1. **max_bytes**: ``Union[int, None]``
+        *Optional*. Estimated size, in bytes, the tier is allowed to grow to. If `None`, the tier is not bounded by size.
+    2. **ttl**: ``Union[float, None]``
+        *Optional*. Seconds an entry is held before it expires. If `None`, entries do not expire.
+
+    .. notes::
+        * Sizes are estimated with `sys.getsizeof`, applied recursively to the contents of an entry. Objects shared between entries, such as the keys of the dictionaries they hold, are counted once for every entry, so the estimate errs on the high side.
+        * The most recently used entry is never evicted, even if it is larger than `max_bytes` on its own.
+    """
+
+    def __init__(self, max_bytes: Union[int, None] = None, ttl: Union[float, None] = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.sizes, self.stored = {}, {}
+        self.bytes, self.peak_bytes = 0, 0
+        self.counters = {'hits': 0, 'misses': 0,
+                         'evictions': 0, 'expirations': 0}
+        self.lock = threading.RLock()
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.entries and not self._expire(key)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _expire(self, key):
+        if self.ttl is None or time.monotonic() - self.stored[key] <= self.ttl:
+            return False
+        self._discard(key)
+        self.counters['expirations'] += 1
+        return True
+
+    def _discard(self, key):
+        del self.entries[key]
+        self.bytes -= self.sizes.pop(key)
+        del self.stored[key]
+
+    def _over_budget(self) -> bool:
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+    def _resize(self, key, size):
+        self.bytes += size - self.sizes.get(key, 0)
+        self.sizes[key] = size
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        while self._over_budget() and len(self.entries) > 1:
+            evicted_key = next(iter(self.entries))
+            self._discard(evicted_key)
+            self.counters['evictions'] += 1
+            logger.debug(f'Evicted {evicted_key} from memory',
+                         f'{type(self).__name__}._resize')
+
+    def _store(self, key, value, size):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.stored[key] = time.monotonic()
+        self._resize(key, size)
+
+    def peek(self, key: str) -> Any:
+        """
+        Returns the entry for `key`, or `None` if there isn't one, and marks it as the most recently used, without counting a hit or a miss.
+        """
+        with self.lock:
+            if key not in self.entries or self._expire(key):
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def record(self, hit: bool):
+        """
+        Counts a lookup as a hit if `hit` is `True`, or as a miss otherwise.
+        """
+        with self.lock:
+            self.counters['hits' if hit else 'misses'] += 1
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns the number of entries held, their estimated size in bytes, the largest size the tier has reached, the limits of the tier and its counters.
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.bytes, 'peak_bytes': self.peak_bytes,
+                    'max_bytes': self.max_bytes, 'ttl': self.ttl, **self.counters}
+
+    def clear(self):
+        """
+        Removes every entry. The counters are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.stored.clear()
+            self.bytes = 0
+
+
+class InternalCache(MemoryTier):
+    """
+    `scrilla.cache.MemoryTier` of `scrilla.cache.CoverageIndex`, keyed by ticker symbol or maturity. Besides the size of the tier, the number of observations held across all indices is bounded by `max_rows`.
+
+    Parameters
+    ----------
+    1. **max_rows**: ``int``
+        *Optional*. Maximum number of observations held in memory. Defaults to `scrilla.static.config.internal_cache_conf['max_rows']`.
+    2. **max_bytes**: ``Union[int, None]``
+        *Optional*. Defaults to `None`.
+    3. **ttl**: ``Union[float, None]``
+        *Optional*. Defaults to `None`.
+
+    .. notes::
+        * The size of an index is estimated from the size of a single observation, since the observations of a series all have the same structure.
+    """
+
+    def __init__(self, max_rows: int = config.internal_cache_conf['max_rows'], max_bytes: Union[int, None] = None, ttl: Union[float, None] = None):
+        super().__init__(max_bytes, ttl)
+        self.max_rows = max_rows
+        self.rows = 0
+
+    def _discard(self, key):
+        self.rows -= len(self.entries[key])
+        super()._discard(key)
+
+    def _over_budget(self) -> bool:
+        return self.rows > self.max_rows or super()._over_budget()
+
+    def get(self, key: str) -> CoverageIndex:
+        """
+        Returns the index for `key`, creating an empty index if there isn't one, and marks it as the most recently used.
+        """
+        with self.lock:
+            index = self.peek(key)
+            if index is None:
+                index = CoverageIndex()
+                self._store(key, index, sys.getsizeof(index))
+            return index
+
+    def uncovered(self, key: str, start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]) -> List[Tuple[datetime.date, datetime.date]]:
+        """
+        Applies `scrilla.cache.CoverageIndex.uncovered` to the index for `key`. The lookup is counted as a hit if the index covers the whole date range.
+        """
+        with self.lock:
+            missing = self.get(key).uncovered(start_date, end_date)
+            self.record(not missing)
+            return missing
+
+    def update(self, key: str, observations: Dict[str, Any], start_date: Union[datetime.date, str, None] = None, end_date: Union[datetime.date, str, None] = None):
+        """
+        Applies `scrilla.cache.CoverageIndex.update` to the index for `key`, then evicts the least recently used indices until the cache fits in `max_rows` and `max_bytes`. The index for `key` itself is never evicted.
+        """
+        with self.lock:
+            index = self.get(key)
+            before = len(index)
+            index.update(observations, start_date, end_date)
+            added = len(index) - before
+            self.rows += added
+            if added:
+                this_date = next(iter(observations))
+                # NOTE: every observation costs a date string, its value and a slot in each list.
+                row_size = _sizeof(this_date) + \
+                    _sizeof(observations[this_date]) + 16
+                self._resize(key, self.sizes[key] + added*row_size)
+            else:
+                self._resize(key, self.sizes[key])
+
+    def clear(self):
+        with self.lock:
+            super().clear()
+            self.rows = 0
+
+
+class MemoryCache(MemoryTier):
+    """
+    `scrilla.cache.MemoryTier` of single values, e.g. correlations or risk profiles, keyed by a string that identifies the value.
+    """
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the value for `key`, or `None` if there isn't one, and counts the lookup as a hit or a miss.
+        """
+        with self.lock:
+            value = self.peek(key)
+            self.record(value is not None)
+            return value
+
+    def put(self, key: str, value: Any):
+        """
+        Stores `value` under `key`, then evicts the least recently used values until the tier fits in `max_bytes`.
+        """
+        with self.lock:
+            self._store(key, value, _sizeof(key) + _sizeof(value))
+
+
+def _as_date(this_date: Union[datetime.date, str]) -> datetime.date:
+    if isinstance(this_date, str):
+        return dater.parse(this_date)
+    if isinstance(this_date, datetime.datetime):
+        return this_date.date()
+    return this_date
+
+
+@lru_cache(maxsize=config.sqlite_date_conf['cache_size'])
+def _as_ordinal(this_date: Union[datetime.date, str]) -> int:
+    """
+    Returns the ordinal of `this_date`, which is how dates are stored in the `sqlite` cache. See `scrilla.cache.Migrations`.
+    """
+    return _as_date(this_date).toordinal()
+
+
+@lru_cache(maxsize=config.sqlite_date_conf['cache_size'])
+def _from_ordinal(ordinal: int) -> str:
+    return dater.to_string(datetime.date.fromordinal(ordinal))
+
+
+def _date_params(formatter: Union[Dict[str, Any], List[Dict[str, Any]]], mode: str, fields: Tuple[str, ...] = ('start_date', 'end_date')) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Returns a copy of `formatter` with the dates in `fields` converted into ordinals, if `mode` is `sqlite`. Otherwise, `formatter` is returned unchanged. Dates that are `None` are left as `None`.
+    """
+    if mode != 'sqlite':
+        return formatter
+    if isinstance(formatter, list):
+        return [_date_params(this_formatter, mode, fields) for this_formatter in formatter]
+    return {**formatter, **{field: _as_ordinal(formatter[field]) for field in fields
+                            if formatter[field] is not None}}
+
+
+def _in_clause(values: List[str], name: str = 'ticker') -> Tuple[str, Dict[str, str]]:
+    """
+    Returns the named placeholders and parameters of an SQLite `IN` clause over `values`.
+    """
+    params = {f'{name}_{i}': value for i, value in enumerate(values)}
+    return ','.join(f':{param}' for param in params), params
+
+
+def _as_string(this_date: Union[datetime.date, str]) -> str:
+    return this_date if isinstance(this_date, str) else dater.to_string(this_date)
+
+
 class Cache():
     """
     Class with static methods all other Caches employ. This class tries to hide as much implementation detail as possible behind its methods, i.e. this class is concerned with executing commits and transactions, whereas the other cache classes are concerned with the data structure that is created with these methods.
@@ -60,7 +696,7 @@ class Cache():
     @staticmethod
     def execute(query, formatter=None, mode=settings.CACHE_MODE):
         """
-        Executes and commits a transaction against the cache.
+        Executes and commits a transaction against the cache. In `sqlite` mode, the statement is executed on the current thread's pooled connection, see `scrilla.cache.Connection`.
 
         Parameters
         ----------
@@ -70,22 +706,28 @@ class Cache():
             Dictionary of parameters used to format statement. Statements are formatted with DB-API's name substitution. See [sqlite3 documentation](https://docs.python.org/3/library/sqlite3.html) for more information. A list of dictionaries can be passed in to perform a batch execute transaction. If nothing is passed in, method will assume the query is unparameterized.
         """
         if mode == 'sqlite':
-            con = sqlite3.connect(settings.CACHE_SQLITE_FILE)
+            con = Connection.get()
             executor = con.cursor()
-            if formatter is not None:
-                if isinstance(formatter, list):
-                    response = executor.executemany(
-                        query, formatter).fetchall()
-                    con.commit(), con.close()
-                    return response
-
-                response = executor.execute(query, formatter)
-                response = response.fetchall()
-                con.commit(), con.close()
-                return response
-
-            response = executor.execute(query).fetchall()
-            con.commit(), con.close()
+            try:
+                if formatter is not None:
+                    if isinstance(formatter, list):
+                        response = executor.executemany(
+                            query, formatter).fetchall()
+                    else:
+                        response = executor.execute(
+                            query, formatter).fetchall()
+                else:
+                    response = executor.execute(query).fetchall()
+            except BaseException:
+                # NOTE: outside of a transaction scope, the implicit transaction a failed statement
+                #       opened would otherwise stay pending on the pooled connection and be
+                #       committed along with the next successful statement.
+                if Connection.pool.depth == 0 and con.in_transaction:
+                    con.rollback()
+                    Connection._count('rollbacks')
+                raise
+            Connection._count('statements')
+            Connection.commit(con)
             return response
 
         elif mode == 'dynamodb':
@@ -95,6 +737,166 @@ class Cache():
         raise errors.ConfigurationError(
             'CACHE_MODE has not been set in "settings.py"')
 
+    @staticmethod
+    def write(query, formatter=None, mode=settings.CACHE_MODE):
+        """
+        Executes a statement that writes to the cache. See `scrilla.cache.Cache.write_many`.
+
+        Parameters
+        ----------
+        1. **query**: ``str``
+        2. **formatter**: ``Union[dict, List[dict]]``
+        3. **mode**: ``str``
+        """
+        Cache.write_many([(query, formatter)], mode)
+
+    @staticmethod
+    def write_many(statements, mode=settings.CACHE_MODE):
+        """
+        Executes several statements that write to the cache and commits them together. If the environment variable **CACHE_WRITE_BEHIND** is enabled, the statements are queued on `scrilla.cache.WriteBehind` and committed by its writer thread instead, unless the current thread is inside of a `scrilla.cache.Connection.transaction` scope.
+
+        Parameters
+        ----------
+        1. **statements**: ``List[Tuple[str, Union[dict, List[dict]]]]``
+            The statements to execute, along with the parameters used to format each of them.
+        2. **mode**: ``str``
+        """
+        if settings.CACHE_WRITE_BEHIND and not Connection.in_scope():
+            for query, formatter in statements:
+                WriteBehind.put(query, formatter, mode)
+            return
+
+        if mode == 'sqlite':
+            with Connection.transaction():
+                for query, formatter in statements:
+                    Cache.execute(query, formatter, mode)
+            return
+
+        for query, formatter in statements:
+            Cache.execute(query, formatter, mode)
+
+
+class WriteBehind():
+    """
+    `scrilla.cache.WriteBehind` queues the statements that write to the cache, so they are committed by a background thread instead of the thread that calculated the values being saved. The writer thread takes statements off of the queue in batches of up to `scrilla.static.config.write_behind_conf['batch_size']`, merges consecutive statements with the same query into a single batch execute and commits each batch in one transaction. Statements are queued by `scrilla.cache.Cache.write` when the environment variable **CACHE_WRITE_BEHIND** is enabled.
+
+    Attributes
+    ----------
+    1. **queue**: ``queue.Queue``
+        Statements waiting to be written, as `(query, formatter, mode)`-tuples. The queue holds at most `scrilla.static.config.write_behind_conf['max_pending']` statements; once it is full, the threads saving values block until the writer thread catches up.
+    2. **writer**: ``Union[threading.Thread, None]``
+        The writer thread, started when the first statement is queued.
+
+    .. notes::
+        * The in-memory caches are updated as soon as a value is saved, so values that are still queued are read from memory. Queries against the cache do not wait for the queue; `scrilla.cache.WriteBehind.flush` blocks until every queued statement has been committed.
+        * The queue is flushed when the interpreter exits. Statements queued by a process that is killed are lost, which only means the values they held will be calculated again.
+    """
+    queue = Queue(maxsize=config.write_behind_conf['max_pending'])
+    writer = None
+    lock = threading.Lock()
+    marker = object()
+
+    @classmethod
+    def _start(cls):
+        with cls.lock:
+            if cls.writer is None or not cls.writer.is_alive():
+                cls.writer = threading.Thread(target=cls._drain, name='scrilla-cache-writer',
+                                              daemon=True)
+                cls.writer.start()
+
+    @classmethod
+    def _reset(cls):
+        # NOTE: a forked process does not inherit the writer thread, so it starts with an empty queue
+        #       of its own. The parent remains responsible for the statements it queued.
+        cls.queue = Queue(maxsize=config.write_behind_conf['max_pending'])
+        cls.writer = None
+        cls.lock = threading.Lock()
+
+    @classmethod
+    def put(cls, query: str, formatter: Union[dict, List[dict], None], mode: str):
+        """
+        Queues a statement to be committed by the writer thread.
+        """
+        cls._start()
+        cls.queue.put((query, formatter, mode))
+
+    @classmethod
+    def flush(cls):
+        """
+        Blocks until every statement queued before the call has been committed.
+        """
+        if cls.writer is None:
+            return
+        cls._start()
+        cls.queue.put(cls.marker)
+        cls.queue.join()
+
+    @classmethod
+    def _drain(cls):
+        while True:
+            batch = [cls.queue.get()]
+            conf = config.write_behind_conf
+            deadline = time.monotonic() + conf['linger']
+            while batch[-1] is not cls.marker and len(batch) < conf['batch_size']:
+                try:
+                    batch.append(cls.queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)))
+                except Empty:
+                    break
+            try:
+                cls._write([statement for statement in batch
+                            if statement is not cls.marker])
+            finally:
+                for _ in batch:
+                    cls.queue.task_done()
+
+    @staticmethod
+    def _group(statements):
+        """
+        Merges consecutive statements with the same query into a single batch statement.
+        """
+        groups = []
+        for query, formatter, mode in statements:
+            if formatter is None:
+                groups.append((query, None, mode))
+                continue
+            formatter = formatter if isinstance(
+                formatter, list) else [formatter]
+            if groups and groups[-1][1] is not None and groups[-1][0] == query and groups[-1][2] == mode:
+                groups[-1][1].extend(formatter)
+            else:
+                groups.append((query, list(formatter), mode))
+        return groups
+
+    @classmethod
+    def _write(cls, statements):
+        if not statements:
+            return
+        groups = cls._group(statements)
+        logger.debug(f'Writing {len(statements)} queued statements to the cache',
+                     'WriteBehind._write')
+        try:
+            cls._commit(groups)
+        except Exception as e:
+            # NOTE: one bad statement should not discard the rest of the batch, so each
+            #       group is retried in a transaction of its own.
+            logger.error(e, 'WriteBehind._write')
+            for group in groups:
+                try:
+                    cls._commit([group])
+                except Exception as e:
+                    logger.error(e, 'WriteBehind._write')
+
+    @staticmethod
+    def _commit(groups):
+        if any(mode == 'sqlite' for _, _, mode in groups):
+            with Connection.transaction():
+                for query, formatter, mode in groups:
+                    Cache.execute(query, formatter, mode)
+            return
+        for query, formatter, mode in groups:
+            Cache.execute(query, formatter, mode)
+
 
 class PriceCache(metaclass=Singleton):
     """
@@ -102,8 +904,8 @@ class PriceCache(metaclass=Singleton):
 
     Attributes
     ----------
-    1. **internal_cache**: ``dict``
-        Dictionary used by `PriceCache` to store API responses in memory. Used to quickly access data that is requested frequently.
+    1. **internal_cache**: ``scrilla.cache.InternalCache``
+        Bounded in-memory index of the prices read from or written to the cache, keyed by ticker. Used to quickly access data that is requested frequently and to limit queries to the date ranges that are not already held in memory.
     2. **inited**: ``bool``
         Flag used to determine if `InterestCache` has been instantiated prior to current instantiation. 
     3. **sqlite_create_table_transaction**: ``str``
@@ -112,12 +914,18 @@ class PriceCache(metaclass=Singleton):
         *SQLite* transaction used to insert row into price cache table.
     5. **sqlite_price_query**: ``str```
         *SQLite* query to retrieve prices from cache.
+    6. **sqlite_prices_query**: ``str``
+        *SQLite* query to retrieve the prices of several tickers from cache. The `{tickers}` placeholder is formatted with the named parameters of an `IN` clause.
+
+    .. notes::
+        * dates are stored as ordinals, see `scrilla.cache.Migrations`, so the queries compare and order by the `date` column directly. Wrapping the column in a function would force *SQLite* to evaluate the function on every row instead of searching the `(ticker, date)` primary key.
     """
-    internal_cache = {}
+    internal_cache = InternalCache(**config.memory_tier_conf['prices'])
     inited = False
-    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS prices (ticker text, date text, open real, close real, UNIQUE(ticker, date))"
+    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS prices (ticker TEXT, date INTEGER, open REAL, close REAL, PRIMARY KEY (ticker, date)) WITHOUT ROWID"
     sqlite_insert_row_transaction = "INSERT OR IGNORE INTO prices (ticker, date, open, close) VALUES (:ticker, :date, :open, :close)"
-    sqlite_price_query = "SELECT date, open, close FROM prices WHERE ticker = :ticker AND date <= date(:end_date) AND date >= date(:start_date) ORDER BY date(date) DESC"
+    sqlite_price_query = "SELECT date, open, close FROM prices WHERE ticker = :ticker AND date >= :start_date AND date <= :end_date ORDER BY date DESC"
+    sqlite_prices_query = "SELECT ticker, date, open, close FROM prices WHERE ticker IN ({tickers}) AND date >= :start_date AND date <= :end_date ORDER BY ticker, date DESC"
 
     dynamodb_table_configuration = config.dynamo_price_table_conf
 
@@ -138,7 +946,7 @@ class PriceCache(metaclass=Singleton):
         """
         if mode == 'sqlite':
             return {
-                result[0]: {
+                _from_ordinal(result[0]): {
                     keys.keys['PRICES']['OPEN']: result[1],
                     keys.keys['PRICES']['CLOSE']: result[2]
                 } for result in query_results
@@ -205,76 +1013,168 @@ class PriceCache(metaclass=Singleton):
         elif self.mode == 'dynamodb':
             return self.dynamodb_price_query
 
-    def _update_internal_cache(self, ticker, prices):
-        if ticker not in list(self.internal_cache):
-            self.internal_cache[ticker] = prices
-        else:
-            self.internal_cache[ticker].update(prices)
+    def _update_internal_cache(self, ticker, prices, start_date=None, end_date=None):
+        self.internal_cache.update(ticker, prices, start_date, end_date)
 
     def _retrieve_from_internal_cache(self, ticker, start_date, end_date):
-        dates = list(self.internal_cache[ticker].keys())
-        start_string = dater.to_string(start_date)
-        end_string = dater.to_string(end_date)
-
-        if start_string in dates and end_string in dates:
-            end_index = dates.index(start_string)
-            start_index = dates.index(end_string)
-            if start_index > end_index:
-                # NOTE: DynamoDB respones are not necessarily ordered
-                # `to_dict` will take care of ordering
-                start_index, end_index = end_index, start_index
-            prices = dict(itertools.islice(
-                self.internal_cache[ticker].items(), start_index, end_index+1))
-            return prices
+        if ticker in self.internal_cache:
+            index = self.internal_cache.get(ticker)
+            if index.covers(start_date, end_date):
+                return index.slice(start_date, end_date)
         return None
 
     def save_rows(self, ticker, prices):
         self._update_internal_cache(ticker, prices)
         logger.verbose(
             F'Attempting to insert {ticker} prices to cache', 'ProfileCache.save_rows')
-        Cache.execute(
+        Cache.write(
             query=self._insert(),
-            formatter=self._to_params(ticker, prices),
+            formatter=_date_params(self._to_params(
+                ticker, prices), self.mode, ('date',)),
             mode=self.mode
         )
 
-    def filter(self, ticker, start_date, end_date):
-        if ticker in list(self.internal_cache):
-            prices = self._retrieve_from_internal_cache(
-                ticker, start_date, end_date)
-            if prices is not None:
-                logger.debug(f'{ticker} prices found in memory',
-                             'ProfileCachce.filter')
-                return prices
-
-        logger.debug(
-            f'Querying {self.mode} cache \n\t{self._query()}\n\t\t with :ticker={ticker}, :start_date={start_date}, :end_date={end_date}', 'ProfileCache.filter')
-
-        if isinstance(start_date, datetime.date):
-            start_date = dater.to_string(start_date)
+    def save_many(self, prices: Dict[str, Dict[str, Dict[str, float]]]):
+        """
+        Saves the price histories of several tickers to the cache with a single statement.
 
-        if isinstance(end_date, datetime.date):
-            end_date = dater.to_string(end_date)
+        Parameters
+        ----------
+        1. **prices**: ``Dict[str, Dict[str, Dict[str, float]]]``
+            Price histories keyed by ticker symbol, formatted as `{ 'ticker': { 'date': { 'open': value, 'close': value }, ... }, ... }`
+        """
+        formatter = []
+        for ticker, history in prices.items():
+            self._update_internal_cache(ticker, history)
+            formatter += self._to_params(ticker, history)
+        if not formatter:
+            return
+        logger.verbose(
+            f'Attempting to insert {list(prices)} prices to cache', 'PriceCache.save_many')
+        Cache.write(
+            query=self._insert(),
+            formatter=_date_params(formatter, self.mode, ('date',)),
+            mode=self.mode
+        )
 
-        formatter = {'ticker': ticker,
-                     'end_date': end_date, 'start_date': start_date}
+    def filter(self, ticker, start_date, end_date):
+        """
+        Returns the cached prices of `ticker` from `start_date` to `end_date`, ordered from latest to earliest, or `None` if there are none. Only the parts of the date range that are not already held in memory are queried.
+        """
+        missing = self.internal_cache.uncovered(ticker, start_date, end_date)
 
-        results = Cache.execute(
-            query=self._query(),
-            formatter=formatter,
-            mode=self.mode)
+        if not missing:
+            logger.debug(f'{ticker} prices found in memory',
+                         'PriceCache.filter')
 
-        if len(results) > 0:
+        for missing_start, missing_end in missing:
+            formatter = {'ticker': ticker,
+                         'start_date': _as_string(missing_start),
+                         'end_date': _as_string(missing_end)}
+            logger.debug(
+                f'Querying {self.mode} cache \n\t{self._query()}\n\t\t with :ticker={ticker}, :start_date={formatter["start_date"]}, :end_date={formatter["end_date"]}', 'PriceCache.filter')
+            results = Cache.execute(
+                query=self._query(),
+                formatter=_date_params(formatter, self.mode),
+                mode=self.mode)
+            # NOTE: the sub-range is covered even if it has no rows, so it isn't queried again
+            self._update_internal_cache(ticker, self.to_dict(results, self.mode) if len(results) > 0 else {},
+                                        missing_start, missing_end)
+
+        prices = self.internal_cache.get(ticker).slice(start_date, end_date)
+        if prices:
             logger.debug(
-                f'Found {ticker} prices in the cache', 'ProfileCache.filter')
-            prices = self.to_dict(results)
-            self._update_internal_cache(ticker, prices)
+                f'Found {ticker} prices in the cache', 'PriceCache.filter')
             return prices
 
         logger.debug(
-            f'No results found for {ticker} prices in the cache', 'ProfileCache.filter')
+            f'No results found for {ticker} prices in the cache', 'PriceCache.filter')
         return None
 
+    def filter_many(self, tickers: List[str], start_date: Union[datetime.date, str], end_date: Union[datetime.date, str]) -> Dict[str, Union[Dict[str, Dict[str, float]], None]]:
+        """
+        Batch version of `scrilla.cache.PriceCache.filter`. Only the tickers whose date range is not already held in memory are queried. In `sqlite` mode, they are retrieved with a single query over the smallest date range that contains every missing range. In `dynamodb` mode, the missing range of each ticker is queried from its partition concurrently.
+
+        Parameters
+        ----------
+        1. **tickers**: ``List[str]``
+            Ticker symbols whose prices are to be retrieved.
+        2. **start_date**: ``Union[datetime.date, str]``
+        3. **end_date**: ``Union[datetime.date, str]``
+
+        Returns
+        -------
+        ``Dict[str, Union[Dict[str, Dict[str, float]], None]]``
+            The cached prices of each ticker, ordered from latest to earliest, keyed by ticker symbol. Tickers without cached prices map to `None`. The prices can be aligned into arrays with `scrilla.util.prices.as_frame`.
+        """
+        # NOTE: the prices held in memory are read before the query, since the memory can evict
+        #       earlier tickers while the results of later ones are added to it.
+        prices, missing = {}, {}
+        for ticker in dict.fromkeys(tickers):
+            index = self.internal_cache.get(ticker)
+            prices[ticker] = index.slice(start_date, end_date)
+            uncovered = self.internal_cache.uncovered(
+                ticker, start_date, end_date)
+            if uncovered:
+                missing[ticker] = uncovered
+
+        if missing and self.mode == 'sqlite':
+            span_start = _as_string(
+                min(_as_date(gaps[0][0]) for gaps in missing.values()))
+            span_end = _as_string(
+                max(_as_date(gaps[-1][1]) for gaps in missing.values()))
+            in_clause, ticker_params = _in_clause(list(missing))
+            logger.debug(
+                f'Querying {self.mode} cache for {len(missing)} tickers with :start_date={span_start}, :end_date={span_end}', 'PriceCache.filter_many')
+            results = Cache.execute(query=self.sqlite_prices_query.format(tickers=in_clause),
+                                    formatter=_date_params({**ticker_params,
+                                                            'start_date': span_start, 'end_date': span_end},
+                                                           self.mode),
+                                    mode=self.mode)
+            rows = {ticker: [] for ticker in missing}
+            for row in results:
+                rows[row[0]].append(row[1:])
+            for ticker, ticker_rows in rows.items():
+                fetched = self.to_dict(ticker_rows, self.mode)
+                self._update_internal_cache(
+                    ticker, fetched, span_start, span_end)
+                prices[ticker] = self._merge(prices[ticker], fetched)
+
+        elif missing:
+            requests = [(ticker, missing_start, missing_end)
+                        for ticker, gaps in missing.items() for missing_start, missing_end in gaps]
+            logger.debug(
+                f'Querying {self.mode} cache for {len(requests)} date ranges of {len(missing)} tickers', 'PriceCache.filter_many')
+            results = aws.dynamo_statements(query=self._query(),
+                                            formatters=[{'ticker': ticker,
+                                                         'start_date': _as_string(missing_start),
+                                                         'end_date': _as_string(missing_end)}
+                                                        for ticker, missing_start, missing_end in requests],
+                                            max_workers=config.dynamo_query_conf['max_workers'])
+            for (ticker, missing_start, missing_end), result in zip(requests, results):
+                if isinstance(result, Exception):
+                    # NOTE: the range is left uncovered, so it is queried again or retrieved from the service.
+                    logger.error(
+                        f'Failed to query {ticker} prices from {_as_string(missing_start)} to {_as_string(missing_end)}: {result}', 'PriceCache.filter_many')
+                    continue
+                fetched = self.to_dict(
+                    result, self.mode) if len(result) > 0 else {}
+                self._update_internal_cache(
+                    ticker, fetched, missing_start, missing_end)
+                prices[ticker] = self._merge(prices[ticker], fetched)
+
+        return {ticker: prices[ticker] or None for ticker in tickers}
+
+    @staticmethod
+    def _merge(prices: Dict[str, Dict[str, float]], fetched: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        """
+        Merges the `fetched` prices into `prices`, ordered from latest to earliest.
+        """
+        if not fetched:
+            return prices
+        merged = {**prices, **fetched}
+        return {this_date: merged[this_date] for this_date in sorted(merged, reverse=True)}
+
 
 class InterestCache(metaclass=Singleton):
     """
@@ -283,8 +1183,8 @@ class InterestCache(metaclass=Singleton):
 
     Attributes
     ----------
-    1. **internal_cache**: ``dict``
-        Dictionary used by `InterestCache` to store API responses in memory. Used to quickly access data that is requested frequently.
+    1. **internal_cache**: ``scrilla.cache.InternalCache``
+        Bounded in-memory index of the interest rates read from or written to the cache, keyed by maturity. Used to quickly access data that is requested frequently and to limit queries to the date ranges that are not already held in memory.
     2. **inited**: ``bool``
         Flag used to determine if `InterestCache` has been instantiated prior to current instantiation. 
     2. **sqlite_create_table_transaction**: ``str``
@@ -298,11 +1198,11 @@ class InterestCache(metaclass=Singleton):
     7. **dynamo_query**: ``str``
     8. **dynamo_identity_query**: ``str``
     """
-    internal_cache = {}
+    internal_cache = InternalCache(**config.memory_tier_conf['interest'])
     inited = False
-    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS interest(maturity text, date text, value real, UNIQUE(maturity, date))"
+    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS interest (maturity TEXT, date INTEGER, value REAL, PRIMARY KEY (maturity, date)) WITHOUT ROWID"
     sqlite_insert_row_transaction = "INSERT OR IGNORE INTO interest (maturity, date, value) VALUES (:maturity, :date, :value)"
-    sqlite_interest_query = "SELECT date, value FROM interest WHERE maturity=:maturity AND date <=date(:end_date) AND date>=date(:start_date) ORDER BY date(date) DESC"
+    sqlite_interest_query = "SELECT date, value FROM interest WHERE maturity=:maturity AND date >= :start_date AND date <= :end_date ORDER BY date DESC"
 
     dynamodb_table_configuration = config.dynamo_interest_table_conf
     dynamodb_insert_transaction = "INSERT INTO \"interest\" VALUE {'maturity': ?, 'date': ?, 'value': ? }"
@@ -321,7 +1221,7 @@ class InterestCache(metaclass=Singleton):
             Raw SQLite query results.
         """
         if mode == 'sqlite':
-            return {result[0]: result[1] for result in query_results}
+            return {_from_ordinal(result[0]): result[1] for result in query_results}
         elif mode == 'dynamodb':
             # TODO: need to order by date!
             dates = [result['date'] for result in query_results]
@@ -355,7 +1255,6 @@ class InterestCache(metaclass=Singleton):
         """
         if not self.inited:
             self.uuid = uuid.uuid4()
-            self._init_internal_cache()
             self.inited = True
 
         self.mode = mode
@@ -372,10 +1271,6 @@ class InterestCache(metaclass=Singleton):
                 self.dynamodb_table_configuration)
             Cache.provision(self.dynamodb_table_configuration, self.mode)
 
-    def _init_internal_cache(self):
-        for maturity in keys.keys['YIELD_CURVE']:
-            self.internal_cache[maturity] = {}
-
     def _insert(self):
         if self.mode == 'sqlite':
             return self.sqlite_insert_row_transaction
@@ -401,42 +1296,25 @@ class InterestCache(metaclass=Singleton):
             - The internal cache data structure is as follows,
                 ```json
                 {
-                    "maturity": {
-                        "date": "value"
-                        "date": "value"
-                    },
-
+                    "maturity": `scrilla.cache.CoverageIndex` of { "date": "value", ... },
+                    ...
                 }
                 ```
         """
-        for date in rates:
-            for index, maturity in enumerate(keys.keys['YIELD_CURVE']):
-                self.internal_cache[maturity][date] = rates[date][index]
+        for index, maturity in enumerate(keys.keys['YIELD_CURVE']):
+            self._update_internal_cache(
+                {date: rates[date][index] for date in rates}, maturity)
 
-    def _update_internal_cache(self, values, maturity):
-        self.internal_cache[maturity].update(values)
+    def _update_internal_cache(self, values, maturity, start_date=None, end_date=None):
+        self.internal_cache.update(maturity, values, start_date, end_date)
 
     def _retrieve_from_internal_cache(self, maturity, start_date, end_date):
-        dates = list(self.internal_cache[maturity].keys())
-        start_string, end_string = dater.to_string(
-            start_date), dater.to_string(end_date)
-
-        if start_string in dates and end_string in dates:
-            start_index = dates.index(start_string)
-            end_index = dates.index(end_string)
-
-            if start_index > end_index:
-                # NOTE: DynamoDB respones are not necessarily ordered
-                # `to_dict` will take care of ordering
-                start_index, end_index = end_index, start_index
-
-            rates = dict(itertools.islice(
-                self.internal_cache[maturity].items(), start_index, end_index+1))
-
-            if dater.business_days_between(start_date, end_date) == len(rates):
+        if maturity in self.internal_cache:
+            index = self.internal_cache.get(maturity)
+            if index.covers(start_date, end_date):
                 logger.debug('Found interest in memory',
                              'InterestCache._retrieve_from_internal_cache')
-                return rates
+                return index.slice(start_date, end_date)
         return None
 
     def save_rows(self, rates):
@@ -455,9 +1333,11 @@ class InterestCache(metaclass=Singleton):
         self._save_internal_cache(rates)
         logger.verbose(
             'Attempting to insert interest rates into cache', 'InterestCache.save_rows')
-        Cache.execute(
+        Cache.write(
             query=self._insert(),
-            formatter=self._to_params(rates)
+            formatter=_date_params(self._to_params(
+                rates), self.mode, ('date',)),
+            mode=self.mode
         )
 
     def filter(self, maturity, start_date, end_date):
@@ -465,37 +1345,33 @@ class InterestCache(metaclass=Singleton):
 
         .. notes::
             - `scrilla.cache.InterestCache.filter()` is called in `scrilla.services.get_daily_interest_history()` _before_ the API response from the Treasury is saved, i.e. before `scrilla.cache.InterestCache.save_rows()` and thus `scrilla.cache.InterestCache._save_internal_cache()` are called. If the application has just been installed and the cache is empty, then nothing unusual happens. If the application has just been installed and the cache is not empty (perhaps the application was re-installed or data has been inserted manually into the cache), then calling `filter` will return results and those results will populate the internal_cache with a `scrilla.InterestCache._update_internal_cache()` call, meaning in this case the internal cache is hydrated by the `update` method instead of the `save` method. In other words, the internal cache has two different entrypoints and care must be taken so both are taken into account when initializing the internal cache.
+            - Only the parts of the date range that the internal cache does not cover are queried. A queried range is marked as covered even if it has no rows, so a range with no yields, e.g. a holiday, is not queried again.
 
         """
-        rates = self._retrieve_from_internal_cache(
+        missing = self.internal_cache.uncovered(
             maturity, start_date, end_date)
-        if rates is not None:
-            logger.debug(f'{maturity} interet found in memory',
-                         'InterestCache.filter')
-            return rates
-
-        logger.debug(
-            f'Querying {self.mode} cache \n\t{self._query()}\n\t\t with :maturity={maturity}, :start_date={start_date}, :end_date={end_date}',
-            'InterestCache.filter')
-
-        if isinstance(start_date, datetime.date):
-            start_date = dater.to_string(start_date)
-
-        if isinstance(end_date, datetime.date):
-            end_date = dater.to_string(end_date)
 
-        formatter = {'maturity': maturity,
-                     'start_date': start_date, 'end_date': end_date}
-        results = Cache.execute(
-            query=self._query(), formatter=formatter, mode=self.mode)
-        # NOTE: [ [ 'date', 'value ] ] at this point
+        if not missing:
+            logger.debug(f'{maturity} interest found in memory',
+                         'InterestCache.filter')
 
-        if len(results) > 0:
+        for missing_start, missing_end in missing:
+            formatter = {'maturity': maturity,
+                         'start_date': _as_string(missing_start),
+                         'end_date': _as_string(missing_end)}
+            logger.debug(
+                f'Querying {self.mode} cache \n\t{self._query()}\n\t\t with :maturity={maturity}, :start_date={formatter["start_date"]}, :end_date={formatter["end_date"]}',
+                'InterestCache.filter')
+            results = Cache.execute(
+                query=self._query(), formatter=_date_params(formatter, self.mode), mode=self.mode)
+            # NOTE: [ [ 'date', 'value ] ] at this point
+            self._update_internal_cache(self.to_dict(results, self.mode) if len(results) > 0 else {},
+                                        maturity, missing_start, missing_end)
+
+        rates = self.internal_cache.get(maturity).slice(start_date, end_date)
+        if rates:
             logger.debug(
                 f'Found {maturity} yield on in the cache', 'InterestCache.filter')
-            rates = self.to_dict(results)
-            # NOTE: { 'date': 'value' } at this point
-            self._update_internal_cache(rates, maturity)
             return rates
 
         logger.debug(
@@ -509,8 +1385,8 @@ class CorrelationCache(metaclass=Singleton):
 
     Attributes
     ----------
-    1. **internal_cache**: ``dict``
-        Dictionary used by `CorrelationCache` to store API responses in memory. Used to quickly access data that is requested frequently.
+    1. **internal_cache**: ``scrilla.cache.MemoryCache``
+        Bounded in-memory tier used by `CorrelationCache` to store correlations. Used to quickly access data that is requested frequently.
     2. **inited**: ``bool``
         Flag used to determine if `CorrelationCache` has been instantiated prior to current instantiation.
     3. **sqlite_create_table_transaction**: ``str``
@@ -519,17 +1395,21 @@ class CorrelationCache(metaclass=Singleton):
         *SQLite* transaction used to insert row into correlation cache table.
     5. **sqlite_correlation_query**: ``str```
         *SQLite* query to retrieve correlation from cache.
+    6. **sqlite_correlation_series_query**: ``str``
+        *SQLite* query to retrieve every correlation between a pair of tickers calculated over a period inside of a date range.
 
     .. notes::
         * do not need to order `correlation_query` and `profile_query` because profiles and correlations are uniquely determined by the (`start_date`, `end_date`, 'ticker_1', 'ticker_2')-tuple. More or less. There is a bit of fuzziness, since the permutation of the previous tuple, ('start_date', 'end_date', 'ticker_2', 'ticker_1'), will also be associated with the same correlation value. No other mappings between a date's correlation value and the correlation's tickers are possible though. In other words, the query, for a given (ticker_1, ticker_2)-permutation will only ever return one result.
         * `method` corresponds to the estimation method used by the application to calculate a given statistic. 
         * `weekends` corresponds to a flag representing whether or not the calculation used weekends. This will always be 0 in the case of equities, but for cryptocurrencies, this flag is important and will affect the calculation.
+        * the table is keyed by every column the query filters on, so saving a correlation that is already cached replaces it rather than adding a duplicate row.
     """
-    internal_cache = {}
+    internal_cache = MemoryCache(**config.memory_tier_conf['correlations'])
     inited = False
-    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS correlations (ticker_1 TEXT, ticker_2 TEXT, start_date TEXT, end_date TEXT, correlation REAL, method TEXT, weekends INT)"
-    sqlite_insert_row_transaction = "INSERT INTO correlations (ticker_1, ticker_2, start_date, end_date, correlation, method, weekends) VALUES (:ticker_1, :ticker_2, :start_date, :end_date, :correlation, :method, :weekends)"
-    sqlite_correlation_query = "SELECT correlation FROM correlations WHERE ticker_1=:ticker_1 AND ticker_2=:ticker_2 AND start_date=date(:start_date) AND end_date=date(:end_date) AND method=:method AND weekends=:weekends"
+    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS correlations (ticker_1 TEXT, ticker_2 TEXT, start_date INTEGER, end_date INTEGER, method TEXT, weekends INT, correlation REAL, PRIMARY KEY (ticker_1, ticker_2, start_date, end_date, method, weekends)) WITHOUT ROWID"
+    sqlite_insert_row_transaction = "INSERT OR REPLACE INTO correlations (ticker_1, ticker_2, start_date, end_date, correlation, method, weekends) VALUES (:ticker_1, :ticker_2, :start_date, :end_date, :correlation, :method, :weekends)"
+    sqlite_correlation_query = "SELECT correlation FROM correlations WHERE ticker_1=:ticker_1 AND ticker_2=:ticker_2 AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
+    sqlite_correlation_series_query = "SELECT start_date, end_date, correlation FROM correlations WHERE ((ticker_1=:ticker_1 AND ticker_2=:ticker_2) OR (ticker_1=:ticker_2 AND ticker_2=:ticker_1)) AND start_date >= :start_date AND end_date <= :end_date AND method=:method AND weekends=:weekends"
 
     dynamodb_table_configuration = config.dynamo_correlation_table_conf
     dynamodb_insert_transaction = "INSERT INTO \"correlations\" VALUE { 'ticker_1': ?, 'ticker_2': ?, 'end_date': ?, 'start_date': ?, 'method': ?, 'weekends': ?, 'id': ?, 'correlation': ? }"
@@ -600,18 +1480,16 @@ class CorrelationCache(metaclass=Singleton):
     def _update_internal_cache(self, params, permuted_params, correlation):
         correl_id = self.generate_id(params)
         permuted_id = self.generate_id(permuted_params)
-        self.internal_cache[correl_id] = {'correlation': correlation}
-        self.internal_cache[permuted_id] = {'correlation': correlation}
-        pass
+        self.internal_cache.put(correl_id, {'correlation': correlation})
+        self.internal_cache.put(permuted_id, {'correlation': correlation})
 
     def _retrieve_from_internal_cache(self, params, permuted_params):
-        first_id = self.generate_id(params)
-        second_id = self.generate_id(permuted_params)
-        if first_id in list(self.internal_cache):
-            return self.internal_cache[first_id]
-        if second_id in list(self.internal_cache):
-            return self.internal_cache[second_id]
-        return None
+        correlation = self.internal_cache.peek(self.generate_id(params))
+        if correlation is None:
+            correlation = self.internal_cache.peek(
+                self.generate_id(permuted_params))
+        self.internal_cache.record(correlation is not None)
+        return correlation
 
     def save_row(self, ticker_1: str, ticker_2: str, start_date: datetime.date, end_date: datetime.date, correlation: float, weekends: bool, method: str = settings.ESTIMATION_METHOD):
         """
@@ -650,10 +1528,80 @@ class CorrelationCache(metaclass=Singleton):
         formatter_1.update({'id': key_1, 'correlation': correlation})
         formatter_2.update({'id': key_2, 'correlation': correlation})
 
-        Cache.execute(
-            query=self._insert(), formatter=[formatter_1, formatter_2], mode=self.mode)
-        Cache.execute(
-            query=self._insert(), formatter=formatter_2, mode=self.mode)
+        Cache.write(
+            query=self._insert(), formatter=_date_params([formatter_1, formatter_2], self.mode), mode=self.mode)
+
+    def save_rows(self, correlations: Dict[Tuple[str, str], float], start_date: datetime.date, end_date: datetime.date, weekends: bool, method: str = settings.ESTIMATION_METHOD):
+        """
+        Saves a batch of correlations calculated over the same period to the cache in a single statement. Each correlation is saved under both permutations of its tickers, the same as `scrilla.cache.CorrelationCache.save_row`.
+
+        Parameters
+        ----------
+        1. **correlations**: ``Dict[Tuple[str, str], float]``
+            Dictionary of correlations keyed by their `(ticker_1, ticker_2)` pair.
+        2. **start_date**: ``datetime.date``
+        3. **end_date**: ``datetime.date``
+        4. **weekends**: ``bool``
+        5. **method**: ``str``
+            *Optional*. Method used to calculate the correlations. Defaults to `scrilla.settings.ESTIMATION_METHOD`, which in turn is configured by the environment variable, *DEFAULT_ESTIMATION_METHOD*.
+        """
+        if not correlations:
+            return
+
+        logger.verbose(
+            f'Saving {len(correlations)} correlations from {start_date} to {end_date} to the cache',
+            'CorrelationCache.save_rows')
+
+        formatters = []
+        for (ticker_1, ticker_2), correlation in correlations.items():
+            formatters += self._permuted_formatters(ticker_1, ticker_2, start_date, end_date,
+                                                    correlation, weekends, method)
+
+        Cache.write(query=self._insert(), formatter=_date_params(
+            formatters, self.mode), mode=self.mode)
+
+    def save_series(self, ticker_1: str, ticker_2: str, correlations: Dict[Tuple[datetime.date, datetime.date], float], weekends: bool, method: str = settings.ESTIMATION_METHOD):
+        """
+        Saves a series of correlations between the same pair of tickers, each calculated over a different period, to the cache in a single statement. Each correlation is saved under both permutations of its tickers, the same as `scrilla.cache.CorrelationCache.save_row`.
+
+        Parameters
+        ----------
+        1. **ticker_1**: ``str``
+        2. **ticker_2**: ``str``
+        3. **correlations**: ``Dict[Tuple[datetime.date, datetime.date], float]``
+            Dictionary of correlations keyed by the `(start_date, end_date)` of the period they were calculated over.
+        4. **weekends**: ``bool``
+        5. **method**: ``str``
+            *Optional*. Method used to calculate the correlations. Defaults to `scrilla.settings.ESTIMATION_METHOD`, which in turn is configured by the environment variable, *DEFAULT_ESTIMATION_METHOD*.
+        """
+        if not correlations:
+            return
+
+        logger.verbose(
+            f'Saving {len(correlations)} ({ticker_1}, {ticker_2}) correlations to the cache',
+            'CorrelationCache.save_series')
+
+        formatters = []
+        for (start_date, end_date), correlation in correlations.items():
+            formatters += self._permuted_formatters(ticker_1, ticker_2, start_date, end_date,
+                                                    correlation, weekends, method)
+
+        Cache.write(query=self._insert(), formatter=_date_params(
+            formatters, self.mode), mode=self.mode)
+
+    def _permuted_formatters(self, ticker_1, ticker_2, start_date, end_date, correlation, weekends, method):
+        formatter_1 = {'ticker_1': ticker_1, 'ticker_2': ticker_2,
+                       'end_date': end_date, 'start_date': start_date,
+                       'method': method, 'weekends': weekends}
+        formatter_2 = {'ticker_1': ticker_2, 'ticker_2': ticker_1,
+                       'end_date': end_date, 'start_date': start_date,
+                       'method': method, 'weekends': weekends}
+        self._update_internal_cache(formatter_1, formatter_2, correlation)
+        formatter_1.update(
+            {'id': self.generate_id(formatter_1), 'correlation': correlation})
+        formatter_2.update(
+            {'id': self.generate_id(formatter_2), 'correlation': correlation})
+        return [formatter_1, formatter_2]
 
     def filter(self, ticker_1, ticker_2, start_date, end_date, weekends, method=settings.ESTIMATION_METHOD):
         formatter_1 = {'ticker_1': ticker_1, 'ticker_2': ticker_2,
@@ -670,7 +1618,7 @@ class CorrelationCache(metaclass=Singleton):
         logger.debug(
             f'Querying {self.mode} cache \n\t{self._query()}\n\t\t with :ticker_1={ticker_1}, :ticker_2={ticker_2},:start_date={start_date}, :end_date={end_date}', 'CorrelationCache.filter')
         results = Cache.execute(
-            query=self._query(), formatter=formatter_1, mode=self.mode)
+            query=self._query(), formatter=_date_params(formatter_1, self.mode), mode=self.mode)
 
         if len(results) > 0:
             logger.debug(
@@ -679,11 +1627,12 @@ class CorrelationCache(metaclass=Singleton):
                 correl = self.to_dict(results)
             elif self.mode == 'dynamodb':
                 correl = results[0]
-            self._update_internal_cache(formatter_1, formatter_2, correl)
+            self._update_internal_cache(
+                formatter_1, formatter_2, correl[keys.keys['STATISTICS']['CORRELATION']])
             return correl
 
         results = Cache.execute(
-            query=self._query(), formatter=formatter_2, mode=self.mode)
+            query=self._query(), formatter=_date_params(formatter_2, self.mode), mode=self.mode)
 
         if len(results) > 0:
             logger.debug(
@@ -692,12 +1641,61 @@ class CorrelationCache(metaclass=Singleton):
                 correl = self.to_dict(results)
             elif self.mode == 'dynamodb':
                 correl = results[0]
-            self._update_internal_cache(formatter_1, formatter_2, correl)
+            self._update_internal_cache(
+                formatter_1, formatter_2, correl[keys.keys['STATISTICS']['CORRELATION']])
             return correl
         logger.debug(
             f'No results found for ({ticker_1}, {ticker_2}) correlation in the cache', 'CorrelationCache.filter')
         return None
 
+    def filter_series(self, ticker_1: str, ticker_2: str, start_date: datetime.date, end_date: datetime.date, weekends: int, method: str = settings.ESTIMATION_METHOD) -> Union[Dict[Tuple[datetime.date, datetime.date], float], None]:
+        """
+        Returns every cached correlation between `ticker_1` and `ticker_2` calculated over a period that falls inside of `start_date` and `end_date`, retrieved with a single query. This is the read counterpart of `scrilla.cache.CorrelationCache.save_series`.
+
+        Parameters
+        ----------
+        1. **ticker_1**: ``str``
+        2. **ticker_2**: ``str``
+        3. **start_date**: ``datetime.date``
+            Earliest start date of the periods to retrieve.
+        4. **end_date**: ``datetime.date``
+            Latest end date of the periods to retrieve.
+        5. **weekends**: ``int``
+        6. **method**: ``str``
+            *Optional*. Method used to calculate the correlations. Defaults to `scrilla.settings.ESTIMATION_METHOD`, which in turn is configured by the environment variable, *DEFAULT_ESTIMATION_METHOD*.
+
+        Returns
+        -------
+        ``Union[Dict[Tuple[datetime.date, datetime.date], float], None]``
+            Dictionary of correlations keyed by the `(start_date, end_date)` of the period they were calculated over. `None` is returned if the cache does not support a range query, i.e. in `dynamodb` mode, in which case each correlation has to be retrieved with `scrilla.cache.CorrelationCache.filter`.
+        """
+        if self.mode != 'sqlite':
+            return None
+
+        formatter = {'ticker_1': ticker_1, 'ticker_2': ticker_2,
+                     'start_date': start_date, 'end_date': end_date,
+                     'method': method, 'weekends': weekends}
+        logger.debug(
+            f'Querying {self.mode} cache \n\t{self.sqlite_correlation_series_query}\n\t\t with :ticker_1={ticker_1}, :ticker_2={ticker_2}, :start_date={start_date}, :end_date={end_date}', 'CorrelationCache.filter_series')
+        results = Cache.execute(query=self.sqlite_correlation_series_query,
+                                formatter=_date_params(formatter, self.mode), mode=self.mode)
+
+        series = {}
+        for row_start, row_end, correlation in results:
+            period = (datetime.date.fromordinal(row_start),
+                      datetime.date.fromordinal(row_end))
+            series[period] = correlation
+            # NOTE: the keys are ordered the same as in filter, since the order determines the id.
+            self._update_internal_cache(
+                {'ticker_1': ticker_1, 'ticker_2': ticker_2, 'end_date': period[1],
+                 'start_date': period[0], 'method': method, 'weekends': weekends},
+                {'ticker_1': ticker_2, 'ticker_2': ticker_1, 'end_date': period[1],
+                 'start_date': period[0], 'method': method, 'weekends': weekends},
+                correlation)
+        logger.debug(
+            f'Found {len(series)} ({ticker_1}, {ticker_2}) correlations in the cache', 'CorrelationCache.filter_series')
+        return series
+
 
 class ProfileCache(metaclass=Singleton):
     """
@@ -705,8 +1703,8 @@ class ProfileCache(metaclass=Singleton):
 
     Attributes
     ----------
-    1. **internal_cache**: ``dict``
-        Dictionary used by `PriceCache` to store API responses in memory. Used to quickly access data that is requested frequently.
+    1. **internal_cache**: ``scrilla.cache.MemoryCache``
+        Bounded in-memory tier used by `ProfileCache` to store risk profiles. Used to quickly access data that is requested frequently.
     2. **inited**: ``bool``
         Flag used to determine if `InterestCache` has been instantiated prior to current instantiation.
     3. **sqlite_create_table_transaction**: ``str``
@@ -720,26 +1718,29 @@ class ProfileCache(metaclass=Singleton):
     7. **dynamo_insert_transaction**: ``str``
         **PartiQL** statement used to insert new value into the **DynamoDB** tables
     8. **dynamo_query**: ``str``
-    9. **dynamo_identity_query**: ``str``
+    9. **buffer**: ``dict``
+        Statistics saved with `scrilla.cache.ProfileCache.save_or_update_row` that have not been written to the cache yet, keyed by profile. See `scrilla.cache.ProfileCache.flush`.
 
     .. notes::
         * do not need to order `correlation_query` and `profile_query` because profiles and correlations are uniquely determined by the (`start_date`, `end_date`, 'ticker_1', 'ticker_2')-tuple. More or less. There is a bit of fuzziness, since the permutation of the previous tuple, ('start_date', 'end_date', 'ticker_2', 'ticker_1'), will also be associated with the same correlation value. No other mappings between a date's correlation value and the correlation's tickers are possible though. In other words, the query, for a given (ticker_1, ticker_2)-permutation will only ever return one result.
         * `method` corresponds to the estimation method used by the application to calculate a given statistic. 
         * `weekends` corresponds to a flag representing whether or not the calculation used weekends. This will always be 0 in the case of equities, but for cryptocurrencies, this flag is important and will affect the calculation.
     """
-    internal_cache = {}
+    internal_cache = MemoryCache(**config.memory_tier_conf['profile'])
     inited = False
-    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS profile (id INTEGER PRIMARY KEY, ticker TEXT, start_date TEXT, end_date TEXT, annual_return REAL, annual_volatility REAL, sharpe_ratio REAL, asset_beta REAL, equity_cost REAL, method TEXT, weekends INT)"
-    sqlite_filter = "ticker=:ticker AND start_date=date(:start_date) AND end_date=date(:end_date) AND :method=method AND weekends=:weekends"
-    sqlite_identity_query = "SELECT id FROM profile WHERE ticker=:ticker AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
+    sqlite_create_table_transaction = "CREATE TABLE IF NOT EXISTS profile (ticker TEXT, start_date INTEGER, end_date INTEGER, method TEXT, weekends INT, annual_return REAL, annual_volatility REAL, sharpe_ratio REAL, asset_beta REAL, equity_cost REAL, PRIMARY KEY (ticker, start_date, end_date, method, weekends)) WITHOUT ROWID"
+    sqlite_filter = "ticker=:ticker AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
     sqlite_profile_query = "SELECT ifnull(annual_return, 'empty'), ifnull(annual_volatility, 'empty'), ifnull(sharpe_ratio, 'empty'), ifnull(asset_beta, 'empty'), ifnull(equity_cost, 'empty') FROM profile WHERE {sqlite_filter}".format(
         sqlite_filter=sqlite_filter)
+    sqlite_profiles_query = "SELECT ticker, ifnull(annual_return, 'empty'), ifnull(annual_volatility, 'empty'), ifnull(sharpe_ratio, 'empty'), ifnull(asset_beta, 'empty'), ifnull(equity_cost, 'empty') FROM profile WHERE ticker IN ({tickers}) AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
+    profile_columns = ('annual_return', 'annual_volatility',
+                       'sharpe_ratio', 'asset_beta', 'equity_cost')
+    profile_keys = ('ticker', 'start_date', 'end_date', 'method', 'weekends')
+    buffer = {}
+    buffer_lock = threading.Lock()
 
     dynamodb_table_configuration = config.dynamo_profile_table_conf
     dynamodb_profile_query = "SELECT annual_return,annual_volatility,sharpe_ratio,asset_beta,equity_cost FROM \"profile\" WHERE ticker=? AND start_date=? AND end_date=? AND method=? AND weekends=?"
-    # dynamodb_identity_query = "EXISTS(SELECT * FROM \"profile\" WHERE ticker=? AND start_date=? AND end_date=? AND method=? AND weekends=?)"
-    # See NOTE in save_or_update_row
-    dynamodb_identity_query = "SELECT * FROM \"profile\" WHERE ticker=? AND start_date=? AND end_date=? AND method=? AND weekends=?"
 
     @staticmethod
     def to_dict(query_result, mode=settings.CACHE_MODE):
@@ -762,49 +1763,15 @@ class ProfileCache(metaclass=Singleton):
         elif mode == 'dynamodb':
             return query_result[0]
 
-    @staticmethod
-    def _construct_update(params, mode=settings.CACHE_MODE):
-        if mode == 'sqlite':
-            update_query = 'UPDATE profile SET '
-            for param in params.keys():
-                update_query += f'{param}=:{param}'
-                if list(params.keys()).index(param) != len(params)-1:
-                    update_query += ','
-            update_query += " WHERE ticker=:ticker AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
-            return update_query
-        elif mode == 'dynamodb':
-            update_query = 'UPDATE profile '
-            for param in params.keys():
-                update_query += f'SET {param}=? '
-            update_query += "WHERE ticker=? AND start_date=? AND end_date=? AND method=? AND weekends=?"
-            return update_query
-
-    @staticmethod
-    def _construct_insert(params_and_filter, mode=settings.CACHE_MODE):
-        if mode == 'sqlite':
-            insert_query = 'INSERT INTO profile ('
-            for param in params_and_filter.keys():
-                insert_query += f'{param}'
-                if list(params_and_filter.keys()).index(param) != len(params_and_filter) - 1:
-                    insert_query += ","
-                else:
-                    insert_query += ") VALUES ("
-            for param in params_and_filter.keys():
-                insert_query += f':{param}'
-                if list(params_and_filter.keys()).index(param) != len(params_and_filter) - 1:
-                    insert_query += ","
-                else:
-                    insert_query += ")"
-            return insert_query
-        elif mode == 'dynamodb':
-            insert_query = "INSERT INTO 'profile' VALUE {"
-            for param in params_and_filter.keys():
-                insert_query += f"'{param}': ?"
-                if list(params_and_filter.keys()).index(param) != len(params_and_filter)-1:
-                    insert_query += ", "
-                else:
-                    insert_query += "}"
-            return insert_query
+    @classmethod
+    def _construct_upsert(cls, params):
+        """
+        Returns the *SQLite* statement that inserts a profile with the statistics in `params`, or sets them on the profile if it already exists, in a single statement.
+        """
+        columns = cls.profile_keys + tuple(params)
+        return "INSERT INTO profile ({columns}) VALUES ({values}) ON CONFLICT ({keys}) DO UPDATE SET {updates}".format(
+            columns=', '.join(columns), values=', '.join(f':{column}' for column in columns),
+            keys=', '.join(cls.profile_keys), updates=', '.join(f'{param}=excluded.{param}' for param in params))
 
     @staticmethod
     def _create_cache_key(filters):
@@ -851,55 +1818,198 @@ class ProfileCache(metaclass=Singleton):
         elif settings.CACHE_MODE == 'dynamodb':
             return self.dynamodb_profile_query
 
-    def _identity(self):
-        if self.mode == 'sqlite':
-            return self.sqlite_identity_query
-        elif self.mode == 'dynamodb':
-            return self.dynamodb_identity_query
-
     def _update_internal_cache(self, profile, profile_keys):
-        key = self._create_cache_key(profile_keys)
-        self.internal_cache[key] = profile
+        self.internal_cache.put(self._create_cache_key(profile_keys), profile)
 
     def _retrieve_from_internal_cache(self, profile_keys):
-        key = self._create_cache_key(profile_keys)
-        if key in list(self.internal_cache):
-            return self.internal_cache[key]
-        return None
+        return self.internal_cache.get(self._create_cache_key(profile_keys))
 
     def save_or_update_row(self, ticker: str, start_date: datetime.date, end_date: datetime.date, annual_return: Union[float, None] = None, annual_volatility: Union[float, None] = None, sharpe_ratio: Union[float, None] = None, asset_beta: Union[float, None] = None, equity_cost: Union[float, None] = None, weekends: int = 0, method: str = settings.ESTIMATION_METHOD):
+        """
+        Saves the statistics that are not `None` to the risk profile of `ticker`, leaving its other statistics untouched. The statistics are held in `scrilla.cache.ProfileCache.buffer`, and the statistics saved for the same profile are written together by a single upsert when the buffer is flushed, see `scrilla.cache.ProfileCache.flush`. They are available from memory immediately.
+
+        Parameters
+        ----------
+        1. **ticker**: ``str``
+        2. **start_date**: ``datetime.date``
+        3. **end_date**: ``datetime.date``
+        4. **annual_return**: ``Union[float, None]``
+        5. **annual_volatility**: ``Union[float, None]``
+        6. **sharpe_ratio**: ``Union[float, None]``
+        7. **asset_beta**: ``Union[float, None]``
+        8. **equity_cost**: ``Union[float, None]``
+        9. **weekends**: ``int``
+        10. **method**: ``str``
+            *Optional*. Method used to calculate the statistics. Defaults to `scrilla.settings.ESTIMATION_METHOD`.
+
+        .. notes::
+            * Profiles calculated over a sample without a `start_date` or `end_date`, i.e. from `sample_prices`, are not saved, since they cannot be retrieved by date.
+        """
+        if start_date is None or end_date is None:
+            logger.verbose(
+                f'{ticker} profile has no sample period, not saving to the cache', 'ProfileCache.save_or_update_row')
+            return
+
         filters = {'ticker': ticker, 'start_date': start_date,
                    'end_date': end_date, 'method': method, 'weekends': weekends}
-        params = {}
-
-        if annual_return is not None:
-            params['annual_return'] = annual_return
-        if annual_volatility is not None:
-            params['annual_volatility'] = annual_volatility
-        if sharpe_ratio is not None:
-            params['sharpe_ratio'] = sharpe_ratio
-        if asset_beta is not None:
-            params['asset_beta'] = asset_beta
-        if equity_cost is not None:
-            params['equity_cost'] = equity_cost
-
-        self._update_internal_cache(params, filters)
-
-        identity = Cache.execute(self._identity(), filters, self.mode)
-        # NOTE: in order to uses EXISTS function, need to execute identity query as transaction.
-        # will need to differentiate between sqlite and dynamodb mode here since all executes
-        # are passed through statement, not transaction...
-        # could add a flag to execute method to explicitly perform a transaction.
-        # not wild about that idea, though.
+        params = {column: value for column, value in zip(self.profile_columns,
+                                                         (annual_return, annual_volatility, sharpe_ratio, asset_beta, equity_cost))
+                  if value is not None}
+
+        logger.verbose(
+            'Buffering risk profile for the cache', 'ProfileCache.save_or_update_row')
+        if self._buffer(filters, params) >= config.profile_buffer_conf['max_rows']:
+            self.flush()
+
+    def save_many(self, profiles: Dict[str, Dict[str, float]], start_date: datetime.date, end_date: datetime.date, weekends: int = 0, method: str = settings.ESTIMATION_METHOD):
+        """
+        Batch version of `scrilla.cache.ProfileCache.save_or_update_row`. Saves the risk profiles of several tickers calculated over the same period and flushes them to the cache immediately, along with any other buffered statistics.
+
+        Parameters
+        ----------
+        1. **profiles**: ``Dict[str, Dict[str, float]]``
+            Risk profiles keyed by ticker symbol, formatted as `{ 'ticker': { 'annual_return': value, 'annual_volatility': value, ... }, ... }`. Statistics that are missing or `None` are left untouched.
+        2. **start_date**: ``datetime.date``
+        3. **end_date**: ``datetime.date``
+        4. **weekends**: ``int``
+        5. **method**: ``str``
+            *Optional*. Method used to calculate the profiles. Defaults to `scrilla.settings.ESTIMATION_METHOD`.
+        """
+        if not profiles or start_date is None or end_date is None:
+            return
 
         logger.verbose(
-            'Attempting to insert/update risk profile into cache', 'ProfileCache.save_or_update_rows')
+            f'Saving {len(profiles)} risk profiles from {start_date} to {end_date} to the cache', 'ProfileCache.save_many')
+
+        for ticker, profile in profiles.items():
+            self._buffer({'ticker': ticker, 'start_date': start_date, 'end_date': end_date,
+                          'method': method, 'weekends': weekends},
+                         {column: profile[column] for column in self.profile_columns
+                          if profile.get(column) is not None})
+        self.flush()
+
+    def _buffer(self, filters, params):
+        """
+        Adds `params` to the buffered statistics of the profile identified by `filters` and returns the number of profiles buffered.
+        """
+        key = self._create_cache_key(filters)
+        self.internal_cache.put(
+            key, {**(self.internal_cache.peek(key) or {}), **params})
+        if not params:
+            return len(self.buffer)
+        with self.buffer_lock:
+            _, _, buffered = self.buffer.setdefault((self.mode, key), (self.mode, filters, {}))
+            buffered.update(params)
+            return len(self.buffer)
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes the buffered statistics to the cache. The statistics of each profile are written with a single upsert, i.e. an `INSERT ... ON CONFLICT DO UPDATE` statement in `sqlite` mode and an `UpdateItem` request in `dynamodb` mode. In `sqlite` mode, the profiles whose statistics are the same columns are written with one batch statement and every statement is committed in one transaction.
+
+        .. notes::
+            * The buffer is flushed when it holds `scrilla.static.config.profile_buffer_conf['max_rows']` profiles, before the cache is queried, and when the interpreter exits.
+            * Profiles are only removed from the buffer once they have been written. If a write fails, the profiles it held stay buffered and are written by the next flush. A profile that cannot be formatted into a statement is logged and discarded, so it does not block the rest of the buffer.
+            * The `dynamodb` profile table is keyed by `(ticker, start_date)`, so an item is only updated if it holds the same `end_date`, `method` and `weekends` as the buffered profile. Otherwise, the profile is not written, rather than overwriting a different profile.
+        """
+        with cls.buffer_lock:
+            buffered = {key: (mode, filters, dict(params))
+                        for key, (mode, filters, params) in cls.buffer.items()}
+
+        statements, written = {}, []
+        for key, (mode, filters, params) in buffered.items():
+            if mode == 'sqlite':
+                try:
+                    formatter = _date_params({**filters, **params}, mode)
+                except Exception as e:
+                    logger.error(f'Discarding {filters} profile: {e}', 'ProfileCache.flush')
+                    written.append(key)
+                    continue
+                profiles, formatters = statements.setdefault(tuple(params), ([], []))
+                profiles.append(key)
+                formatters.append(formatter)
+            elif mode == 'dynamodb':
+                response = aws.dynamo_update_item(cls.dynamodb_table_configuration['TableName'],
+                                                  {'ticker': filters['ticker'],
+                                                   'start_date': filters['start_date']},
+                                                  {**{column: filters[column] for column in cls.profile_keys[2:]}, **params},
+                                                  {column: filters[column] for column in cls.profile_keys[2:]})
+                if not isinstance(response, Exception):
+                    written.append(key)
+
+        if statements:
+            logger.debug(f'Writing {sum(len(profiles) for profiles, _ in statements.values())} risk profiles to the cache',
+                         'ProfileCache.flush')
+            try:
+                Cache.write_many([(cls._construct_upsert(params), formatters)
+                                  for params, (_, formatters) in statements.items()], 'sqlite')
+                written.extend(key for profiles, _ in statements.values() for key in profiles)
+            except Exception as e:
+                logger.error(e, 'ProfileCache.flush')
+
+        with cls.buffer_lock:
+            for key in written:
+                # NOTE: statistics buffered for a profile while it was being written are kept for the next flush.
+                if key in cls.buffer and cls.buffer[key][2] == buffered[key][2]:
+                    del cls.buffer[key]
+
+    def filter_many(self, tickers: List[str], start_date: datetime.date, end_date: datetime.date, weekends: int = 0, method=settings.ESTIMATION_METHOD) -> Dict[str, Dict[str, float]]:
+        """
+        Batch version of `scrilla.cache.ProfileCache.filter`. Profiles that are not held in memory are retrieved from the `sqlite` cache with a single query.
+
+        Parameters
+        ----------
+        1. **tickers**: ``List[str]``
+        2. **start_date**: ``datetime.date``
+        3. **end_date**: ``datetime.date``
+        4. **weekends**: ``int``
+        5. **method**: ``str``
+
+        Returns
+        -------
+        ``Dict[str, Dict[str, float]]``
+            Risk profiles keyed by ticker symbol. Tickers without a cached profile are omitted.
+        """
+        profiles, missing = {}, []
+        for ticker in tickers:
+            in_memory = self._retrieve_from_internal_cache({'ticker': ticker, 'start_date': start_date,
+                                                            'end_date': end_date, 'method': method,
+                                                            'weekends': weekends})
+            if in_memory:
+                profiles[ticker] = in_memory
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return profiles
+
+        if self.buffer:
+            self.flush()
+
+        if self.mode != 'sqlite':
+            for ticker in missing:
+                result = self.filter(ticker=ticker, start_date=start_date, end_date=end_date,
+                                     weekends=weekends, method=method)
+                if result is not None:
+                    profiles[ticker] = result
+            return profiles
 
-        if len(identity) == 0:
-            return Cache.execute(self._construct_insert({**params, **filters}),
-                                 {**params, **filters}, self.mode)
-        return Cache.execute(self._construct_update(params),
-                             {**params, **filters}, self.mode)
+        logger.debug(
+            f'Querying {self.mode} cache for {len(missing)} profiles', 'ProfileCache.filter_many')
+
+        in_clause, ticker_params = _in_clause(missing)
+        result = Cache.execute(query=self.sqlite_profiles_query.format(tickers=in_clause),
+                               formatter=_date_params({**ticker_params, 'start_date': start_date, 'end_date': end_date,
+                                                       'method': method, 'weekends': weekends}, self.mode),
+                               mode=self.mode)
+
+        for row in result:
+            profile = self.to_dict([row[1:]], self.mode)
+            self._update_internal_cache(profile, {'ticker': row[0], 'start_date': start_date,
+                                                  'end_date': end_date, 'method': method,
+                                                  'weekends': weekends})
+            profiles[row[0]] = profile
+        return profiles
 
     def filter(self, ticker: str, start_date: datetime.date, end_date: datetime.date, weekends: int = 0, method=settings.ESTIMATION_METHOD):
         filters = {'ticker': ticker, 'start_date': start_date,
@@ -911,11 +2021,14 @@ class ProfileCache(metaclass=Singleton):
                          'ProfileCachce.filter')
             return in_memory
 
+        if self.buffer:
+            self.flush()
+
         logger.debug(
             f'Querying {self.mode} cache: \n\t{self._query()}\n\t\t with :ticker={ticker}, :start_date={start_date}, :end_date={end_date}', 'ProfileCache.filter')
 
         result = Cache.execute(
-            query=self._query(), formatter=filters, mode=self.mode)
+            query=self._query(), formatter=_date_params(filters, self.mode), mode=self.mode)
 
         if len(result) > 0:
             logger.debug(f'{ticker} profile found in cache',
@@ -927,6 +2040,51 @@ class ProfileCache(metaclass=Singleton):
         return None
 
 
+def statistics() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns `scrilla.cache.MemoryTier.statistics` for the memory tier of every cache, keyed by the name of its table.
+    """
+    return {
+        'prices': PriceCache.internal_cache.statistics(),
+        'interest': InterestCache.internal_cache.statistics(),
+        'correlations': CorrelationCache.internal_cache.statistics(),
+        'profile': ProfileCache.internal_cache.statistics()
+    }
+
+
+def save_statistics():
+    """
+    Adds the counters of the memory tiers of this process to the running totals kept in the memory file, see `scrilla.files.get_memory_json`, so the memory tiers can be sized against the workloads of several runs. Called when the interpreter exits.
+    """
+    this_process = statistics()
+    if not any(tier['hits'] or tier['misses'] for tier in this_process.values()):
+        return
+    memory = files.get_memory_json()
+    totals = memory.setdefault('statistics', {})
+    for name, tier in this_process.items():
+        total = totals.setdefault(name, {counter: 0 for counter in (
+            'runs', 'hits', 'misses', 'evictions', 'expirations', 'peak_bytes')})
+        total['runs'] += 1
+        for counter in ('hits', 'misses', 'evictions', 'expirations'):
+            total[counter] += tier[counter]
+        total['peak_bytes'] = max(total['peak_bytes'], tier['peak_bytes'])
+    files.save_memory_json(memory)
+
+
+def saved_statistics() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the running totals saved by `scrilla.cache.save_statistics`, along with the limits each memory tier is configured with, keyed by the name of the table the tier belongs to.
+    """
+    totals = files.get_memory_json().get('statistics', {})
+    saved = {}
+    for name, tier in statistics().items():
+        total = totals.get(name, {})
+        lookups = total.get('hits', 0) + total.get('misses', 0)
+        saved[name] = {'max_bytes': tier['max_bytes'], 'ttl': tier['ttl'], **total,
+                       'hit_rate': total.get('hits', 0)/lookups if lookups else None}
+    return saved
+
+
 def init_cache():
     memory = files.get_memory_json()
     if not memory['cache'][settings.CACHE_MODE]['prices']:
@@ -942,3 +2100,11 @@ def init_cache():
         CorrelationCache()
         memory['cache'][settings.CACHE_MODE]['correlations'] = True
     files.save_memory_json(memory)
+
+
+# NOTE: handlers run in the reverse order they are registered, so the profiles buffered
+#       in memory are queued before the queue is flushed.
+atexit.register(WriteBehind.flush)
+atexit.register(ProfileCache.flush)
+atexit.register(save_statistics)
+os.register_at_fork(after_in_child=WriteBehind._reset)
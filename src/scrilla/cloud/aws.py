@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 import boto3
 from botocore.exceptions import ClientError, ParamValidationError
@@ -165,6 +166,82 @@ def dynamo_statement(query, formatter=None):
         return e
 
 
+def dynamo_statements(query: str, formatters: List[dict], max_workers: int) -> list:
+    """
+    Executes `query` once for each set of parameters in `formatters` concurrently, on a pool of at most `max_workers` threads sharing a single client, and returns the results in the same order as `formatters`. Unlike a batch statement, each statement can return any number of items, so this can be used to query several partitions at once.
+    """
+    client = dynamo_client()
+
+    def execute(formatter):
+        try:
+            return dynamo_params_to_json(client.execute_statement(**dynamo_statement_args(query, formatter)))
+        except (ClientError, ParamValidationError) as e:
+            logger.error(e, 'dynamo_statements')
+            logger.debug(f'\n\t\t{query}', 'dynamo_statements')
+            return e
+
+    if not formatters:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(formatters))) as executor:
+        return list(executor.map(execute, formatters))
+
+
+def dynamo_update_item(table: str, key: dict, attributes: dict, conditions: Union[dict, None] = None):
+    """
+    Sets `attributes` on the item of `table` identified by `key` with a single `UpdateItem` request. Unlike a **PartiQL** `UPDATE`, the item is created if it does not exist, so an item can be inserted or updated without first querying for it.
+
+    Parameters
+    ----------
+    1. **table**: ``str``
+    2. **key**: ``dict``
+        The primary key of the item.
+    3. **attributes**: ``dict``
+        The attributes to set on the item.
+    4. **conditions**: ``Union[dict, None]``
+        *Optional*. Attributes an existing item must already hold for the update to be applied. The item is still created if it does not exist. Defaults to `None`, in which case the item is always updated.
+
+    Returns
+    -------
+    ``Union[dict, None, Exception]``
+        The response of the request, `None` if there is nothing to update or `conditions` were not met and the exception raised if the request failed.
+    """
+    if not attributes:
+        return None
+    names = {f'#a{i}': attribute for i, attribute in enumerate(attributes)}
+    values = {f':a{i}': value for i, value
+              in enumerate(dynamo_json_to_params(attributes))}
+    request = {}
+    if conditions:
+        condition_names = {f'#c{i}': attribute for i,
+                           attribute in enumerate(conditions)}
+        names.update(condition_names)
+        names['#k0'] = next(iter(key))
+        values.update({f':c{i}': value for i, value
+                       in enumerate(dynamo_json_to_params(conditions))})
+        request['ConditionExpression'] = 'attribute_not_exists(#k0) OR (' + ' AND '.join(
+            f'{name}=:c{i}' for i, name in enumerate(condition_names)) + ')'
+    try:
+        return dynamo_client().update_item(
+            TableName=table,
+            Key=dict(zip(key, dynamo_json_to_params(key))),
+            UpdateExpression='SET ' + ', '.join(f'#a{i}=:a{i}' for i in range(len(attributes))),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            **request)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            logger.debug(f'{table}: {key} does not hold {conditions}, not updating',
+                         'dynamo_update_item')
+            return None
+        logger.error(e, 'dynamo_update_item')
+        logger.debug(f'\n\t\t{table}: {key}', 'dynamo_update_item')
+        return e
+    except ParamValidationError as e:
+        logger.error(e, 'dynamo_update_item')
+        logger.debug(f'\n\t\t{table}: {key}', 'dynamo_update_item')
+        return e
+
+
 def dynamo_drop_table(tables: Union[str, List[str]]) -> bool:
     try:
         if isinstance(tables, list):
@@ -457,8 +457,15 @@ def clear_cache(mode: str = settings.CACHE_MODE) -> bool:
     save_memory_json(memory)
 
     if mode == 'sqlite':
+        # NOTE: pooled connections must be released before the database file is removed.
+        from scrilla.cache import Connection, WriteBehind
+        WriteBehind.flush()
+        Connection.close_all()
         try:
             os.remove(settings.CACHE_SQLITE_FILE)
+            for sidecar in ['-wal', '-shm']:
+                if os.path.isfile(f'{settings.CACHE_SQLITE_FILE}{sidecar}'):
+                    os.remove(f'{settings.CACHE_SQLITE_FILE}{sidecar}')
             return True
         except OSError as e:
             logger.error(e, 'clear_cache')
@@ -269,14 +269,13 @@ class RiskProfileWidget(components.SkeletonWidget):
         self.composite_widget.table_widget.init_table(rows=symbols,
                                                       columns=['Return', 'Volatility', 'Sharpe', 'Beta', 'Equity Cost'])
 
-        profiles = {}
         start_date = start_date = self.arg_widget.get_control_input(
             'start_date')
         end_date = self.arg_widget.get_control_input('end_date')
+        profiles = statistics.calculate_risk_returns(tickers=symbols,
+                                                     start_date=start_date,
+                                                     end_date=end_date)
         for i, symbol in enumerate(symbols):
-            profiles[symbol] = statistics.calculate_risk_return(ticker=symbol,
-                                                                start_date=start_date,
-                                                                end_date=end_date)
             profiles[symbol][keys.keys['APP']['PROFILE']
                              ['SHARPE']] = markets.sharpe_ratio(ticker=symbol,
                                                                 start_date=start_date,
@@ -502,7 +501,11 @@ class EfficientFrontierWidget(components.SkeletonWidget):
                                        'start_date'),
                                    end_date=self.arg_widget.get_control_input('end_date'))
         frontier = optimizer.calculate_efficient_frontier(portfolio=this_portfolio,
-                                                          steps=self.arg_widget.get_control_input('steps'))
+                                                          steps=self.arg_widget.get_control_input(
+                                                              'steps'),
+                                                          critical_line=self.arg_widget.get_control_input(
+                                                              'critical_line'),
+                                                          processes=self.arg_widget.get_control_input('processes'))
         plotter.plot_frontier(portfolio=this_portfolio,
                               frontier=frontier,
                               show=False,
@@ -118,6 +118,13 @@ def do_program(cli_args: List[str]) -> None:
             help_msg(function_filter=args['tickers'])
         selected_function, required_length = cli_help, 0
 
+    # FUNCTION: Cache Statistics
+    elif args['function_arg'] in definitions.FUNC_DICT["cache_stats"]['values']:
+        def cli_cache_stats():
+            from scrilla.util.outputter import cache_statistics
+            cache_statistics(cache.saved_statistics())
+        selected_function, required_length = cli_cache_stats, 0
+
     # FUNCTION: Clear Cache
     elif args['function_arg'] in definitions.FUNC_DICT["clear_cache"]['values']:
         def cli_clear_cache():
@@ -216,22 +223,24 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Black-Scholes Value At Risk
     elif args['function_arg'] in definitions.FUNC_DICT['var']['values']:
         def cli_var():
-            from scrilla.analysis.models.geometric.statistics import calculate_risk_return
+            from scrilla.analysis.models.geometric.statistics import calculate_risk_returns
             from scrilla.analysis.models.geometric.probability import percentile
-            from scrilla.services import get_daily_price_history
+            from scrilla.services import get_daily_price_histories
             from scrilla.util.helper import get_first_json_key
             from scrilla.static.keys import keys
 
             all_vars = {}
+            all_prices = get_daily_price_histories(tickers=args['tickers'],
+                                                   start_date=args['start_date'],
+                                                   end_date=args['end_date'])
+            profiles = calculate_risk_returns(tickers=args['tickers'],
+                                              sample_prices=all_prices,
+                                              method=args['estimation_method'])
             for arg in args['tickers']:
-                prices = get_daily_price_history(ticker=arg,
-                                                 start_date=args['start_date'],
-                                                 end_date=args['end_date'])
+                prices = all_prices[arg]
                 latest_price = prices[get_first_json_key(
                     prices)][keys['PRICES']['CLOSE']]
-                profile = calculate_risk_return(ticker=arg,
-                                                sample_prices=prices,
-                                                method=args['estimation_method'])
+                profile = profiles[arg]
                 valueatrisk = percentile(S0=latest_price,
                                          vol=profile['annual_volatility'],
                                          ret=profile['annual_return'],
@@ -257,21 +266,23 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Black-Scholes Conditional Value At Risk
     elif args['function_arg'] in definitions.FUNC_DICT['cvar']['values']:
         def cli_cvar():
-            from scrilla.services import get_daily_price_history
+            from scrilla.services import get_daily_price_histories
             from scrilla.static.keys import keys
-            from scrilla.analysis.models.geometric.statistics import calculate_risk_return
+            from scrilla.analysis.models.geometric.statistics import calculate_risk_returns
             from scrilla.analysis.models.geometric.probability import percentile, conditional_expected_value
             from scrilla.util.helper import get_first_json_key
             all_cvars = {}
+            all_prices = get_daily_price_histories(tickers=args['tickers'],
+                                                   start_date=args['start_date'],
+                                                   end_date=args['end_date'])
+            profiles = calculate_risk_returns(tickers=args['tickers'],
+                                              sample_prices=all_prices,
+                                              method=args['estimation_method'])
             for arg in args['tickers']:
-                prices = get_daily_price_history(ticker=arg,
-                                                 start_date=args['start_date'],
-                                                 end_date=args['end_date'])
+                prices = all_prices[arg]
                 latest_price = prices[get_first_json_key(
                     prices)][keys['PRICES']['CLOSE']]
-                profile = calculate_risk_return(ticker=arg,
-                                                sample_prices=prices,
-                                                method=args['estimation_method'])
+                profile = profiles[arg]
                 valueatrisk = percentile(S0=latest_price,
                                          vol=profile['annual_volatility'],
                                          ret=profile['annual_return'],
@@ -356,12 +367,11 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Last Close Price
     elif args['function_arg'] in definitions.FUNC_DICT["close"]['values']:
         def cli_close():
-            from scrilla.services import get_daily_price_latest
+            from scrilla.services import get_daily_prices_latest
 
-            all_prices = {}
+            all_prices = get_daily_prices_latest(args['tickers'])
             for arg in args['tickers']:
-                price = get_daily_price_latest(arg)
-                all_prices[arg] = price
+                price = all_prices[arg]
 
                 if print_format_to_screen(args):
                     from scrilla.util.outputter import scalar_result
@@ -502,7 +512,9 @@ def do_program(cli_args: List[str]) -> None:
                                   end_date=args['end_date'],
                                   method=args['estimation_method'])
             frontier = calculate_efficient_frontier(portfolio=portfolio,
-                                                    steps=args['steps'])
+                                                    steps=args['steps'],
+                                                    critical_line=args['critical_line'],
+                                                    processes=args['processes'])
 
             if args['investment'] is not None:
                 from scrilla.services import get_daily_prices_latest
@@ -586,7 +598,8 @@ def do_program(cli_args: List[str]) -> None:
             moving_averages = calculate_moving_averages(ticker=args['tickers'][0],
                                                         start_date=args['start_date'],
                                                         end_date=args['end_date'],
-                                                        method=args['estimation_method'])
+                                                        method=args['estimation_method'],
+                                                        exponential=args['exponential'])
 
             if print_format_to_screen(args):
                 from scrilla.util.outputter import moving_average_result
@@ -751,7 +764,9 @@ def do_program(cli_args: List[str]) -> None:
                                   method=args['estimation_method'])
 
             frontier = calculate_efficient_frontier(portfolio=portfolio,
-                                                    steps=args['steps'])
+                                                    steps=args['steps'],
+                                                    critical_line=args['critical_line'],
+                                                    processes=args['processes'])
 
             plot_frontier(portfolio=portfolio,
                           frontier=frontier,
@@ -769,7 +784,8 @@ def do_program(cli_args: List[str]) -> None:
             moving_averages = calculate_moving_averages(ticker=args['tickers'][0],
                                                         start_date=args['start_date'],
                                                         end_date=args['end_date'],
-                                                        method=args['estimation_method'])
+                                                        method=args['estimation_method'],
+                                                        exponential=args['exponential'])
 
             plot_moving_averages(ticker=args['tickers'][0],
                                  averages=moving_averages,
@@ -817,15 +833,13 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Plot Risk-Return Profile
     elif args['function_arg'] in definitions.FUNC_DICT['plot_risk_profile']['values']:
         def cli_plot_risk_profile():
-            from scrilla.analysis.models.geometric.statistics import calculate_risk_return
+            from scrilla.analysis.models.geometric.statistics import calculate_risk_returns
             from scrilla.analysis.plotter import plot_profiles
             from scrilla.util.dater import format_date_range
-            profiles = {}
-            for arg in args['tickers']:
-                profiles[arg] = calculate_risk_return(ticker=arg,
-                                                      start_date=args['start_date'],
-                                                      end_date=args['end_date'],
-                                                      method=args['estimation_method'])
+            profiles = calculate_risk_returns(tickers=args['tickers'],
+                                              start_date=args['start_date'],
+                                              end_date=args['end_date'],
+                                              method=args['estimation_method'])
 
             plot_profiles(symbols=args['tickers'],
                           show=True,
@@ -858,16 +872,17 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Price History
     elif args['function_arg'] in definitions.FUNC_DICT['price_history']['values']:
         def cli_price_history():
-            from scrilla.services import get_daily_price_history
+            from scrilla.services import get_daily_price_histories
             from scrilla.static.keys import keys
             if print_format_to_screen(args):
                 from scrilla.util.outputter import scalar_result
 
             all_prices = {}
+            histories = get_daily_price_histories(tickers=args['tickers'],
+                                                  start_date=args['start_date'],
+                                                  end_date=args['end_date'])
             for arg in args['tickers']:
-                prices = get_daily_price_history(ticker=arg,
-                                                 start_date=args['start_date'],
-                                                 end_date=args['end_date'])
+                prices = histories[arg]
                 all_prices[arg] = {}
                 for this_date in prices:
                     price = prices[this_date][keys['PRICES']['CLOSE']]
@@ -941,14 +956,13 @@ def do_program(cli_args: List[str]) -> None:
     # FUNCTION: Risk-Return Profile
     elif args['function_arg'] in definitions.FUNC_DICT["risk_profile"]['values']:
         def cli_risk_return():
-            from scrilla.analysis.models.geometric.statistics import calculate_risk_return
+            from scrilla.analysis.models.geometric.statistics import calculate_risk_returns
             from scrilla.analysis.markets import sharpe_ratio, market_beta, cost_of_equity
-            profiles = {}
+            profiles = calculate_risk_returns(tickers=args['tickers'],
+                                              method=args['estimation_method'],
+                                              start_date=args['start_date'],
+                                              end_date=args['end_date'])
             for arg in args['tickers']:
-                profiles[arg] = calculate_risk_return(ticker=arg,
-                                                      method=args['estimation_method'],
-                                                      start_date=args['start_date'],
-                                                      end_date=args['end_date'])
                 profiles[arg]['sharpe_ratio'] = sharpe_ratio(ticker=arg,
                                                              start_date=args['start_date'],
                                                              end_date=args['end_date'],
@@ -26,17 +26,16 @@ os.environ.setdefault('ALPHA_VANTAGE_KEY')
 prices = get_daily_price_history('AAPL')
 ```
 """
-import itertools
-import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 import defusedxml.ElementTree as ET
 
 from datetime import date
 
 from scrilla import settings, cache
-from scrilla.static import keys, constants
-from scrilla.util import errors, outputter, helper, dater
+from scrilla.static import config, keys, constants
+from scrilla.util import errors, outputter, helper, dater, limiter
 
 logger = outputter.Logger("scrilla.services", settings.LOG_LEVEL)
 
@@ -51,6 +50,8 @@ class StatManager():
         A string denoting which service will be used for data hydration. Genres can be accessed through the `keys.keys['SERVICES']` dictionary.
     2. **self.service_map**: ``dict``
         A dictionary containing keys unique to the service defined by `genre`, such as endpoints, query parameters, etc. 
+    3. **limiter**: ``scrilla.util.limiter.TokenBucket``
+        Process-wide rate limiter for the service defined by `genre`, configured by the `QUOTA` of `self.service_map`.
 
     Raises
     ------
@@ -75,6 +76,8 @@ class StatManager():
         if self.service_map is None:
             raise errors.ConfigurationError(
                 'No STAT_MANAGER found in the environment settings')
+        self.limiter = limiter.bucket(self.genre, self.service_map['QUOTA']['PER_MINUTE'],
+                                      self.service_map['QUOTA']['BURST'])
 
     def _is_quandl(self):
         """
@@ -197,6 +200,7 @@ class StatManager():
 
     def get_stats(self, symbol, start_date, end_date):
         url = self._construct_stat_url(symbol, start_date, end_date)
+        self.limiter.acquire()
         response = requests.get(url).json()
 
         raw_stat = response[self.service_map["KEYS"]["FIRST_LAYER"]
@@ -224,6 +228,7 @@ class StatManager():
         formatted_interest = {}
 
         if self._is_quandl():
+            self.limiter.acquire()
             response = requests.get(url)
 
             response = response.json()
@@ -240,6 +245,7 @@ class StatManager():
                 page_url = f'{page_url}&{self.service_map["PARAMS"]["PAGE"]}={page_no}'
                 logger.verbose(
                     f'Paginating: {page_url}', 'StatManager.get_interest_rates.__paginate')
+                self.limiter.acquire()
                 page_response = ET.fromstring(requests.get(page_url).text)
                 return page_no - 1, page_response
 
@@ -304,10 +310,13 @@ class DividendManager():
         A string denoting which service will be used for data hydration. Genres can be accessed through the `keys.keys['SERVICES']` dictionary.
     2. **self.service_map**: ``dict``
         A dictionary containing keys unique to the service defined by `genre`, such as endpoints, query parameters, etc. 
+    3. **limiter**: ``scrilla.util.limiter.TokenBucket``
+        Process-wide rate limiter for the service defined by `genre`, configured by the `QUOTA` of `self.service_map`.
     """
 
     def __init__(self, genre):
         self.genre = genre
+        self.service_map = None
         if self.genre == keys.keys['SERVICES']['DIVIDENDS']['IEX']['MANAGER']:
             self.service_map = keys.keys['SERVICES']['DIVIDENDS']['IEX']['MAP']
             self.key = settings.iex_key()
@@ -316,6 +325,8 @@ class DividendManager():
         if self.service_map is None:
             raise errors.ConfigurationError(
                 'No DIV_MANAGER found in the parsed environment settings')
+        self.limiter = limiter.bucket(self.genre, self.service_map['QUOTA']['PER_MINUTE'],
+                                      self.service_map['QUOTA']['BURST'])
 
     def _construct_url(self, ticker):
         query = f'{ticker}/{self.service_map["PATHS"]["DIV"]}/{self.service_map["PARAMS"]["FULL"]}'
@@ -326,6 +337,7 @@ class DividendManager():
 
     def get_dividends(self, ticker):
         url = self._construct_url(ticker)
+        self.limiter.acquire()
         response = requests.get(url).json()
         formatted_response = {}
 
@@ -352,11 +364,16 @@ class PriceManager():
         A string denoting which service will be used for data hydration. Genres can be accessed through the `keys.keys['SERVICES']` dictionary.
     2. **self.service_map**: ``dict``
         A dictionary containing keys unique to the service defined by `genre`, such as endpoints, query parameters, etc. 
+    3. **session**: ``requests.Session``
+        Session shared by every request the manager makes, so connections to the service are kept alive and reused.
+    4. **limiter**: ``scrilla.util.limiter.TokenBucket``
+        Process-wide rate limiter for the service defined by `genre`. Allows the number of requests per minute configured by the `scrilla.settings.PRICE_PER_MINUTE` variable, or the `QUOTA` of `self.service_map` if it is not set. Requests are delayed until they can be made without exceeding the quota, so concurrent requests made by `scrilla.services.PriceManager.get_prices_many` are not throttled by the service.
 
     """
 
     def __init__(self, genre):
         self.genre = genre
+        self.service_map = None
         if self.genre == keys.keys['SERVICES']['PRICES']['ALPHA_VANTAGE']['MANAGER']:
             self.service_map = keys.keys['SERVICES']['PRICES']['ALPHA_VANTAGE']['MAP']
             self.url = settings.AV_URL
@@ -364,8 +381,20 @@ class PriceManager():
         if self.service_map is None:
             raise errors.ConfigurationError(
                 'No PRICE_MANAGER found in the parsed environment settings')
+        self.limiter = limiter.bucket(self.genre, settings.PRICE_PER_MINUTE or self.service_map['QUOTA']['PER_MINUTE'],
+                                      self.service_map['QUOTA']['BURST'])
+        self.session = self._session()
 
-    def _construct_url(self, ticker, asset_type):
+    @staticmethod
+    def _session() -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=config.http_session_conf['pool_connections'],
+                                                pool_maxsize=config.http_session_conf['pool_maxsize'])
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _construct_url(self, ticker, asset_type, compact=False):
         """
         Constructs the service url with the query and parameters appended. 
 
@@ -376,6 +405,8 @@ class PriceManager():
         2. **asset_type**: ``str``
             Asset type of the asset whose prices are being retrieved. Options are statically
             accessible in the `scrillla.static` module dictionary `scrilla.keys.keys['ASSETS']`.
+        3. **compact**: ``bool``
+            *Optional*. If `True`, only the latest prices are requested, if the service supports it. Defaults to `False`.
 
         Returns
         -------
@@ -390,7 +421,8 @@ class PriceManager():
 
         if asset_type == keys.keys['ASSETS']['EQUITY']:
             query += f'&{self.service_map["PARAMS"]["FUNCTION"]}={self.service_map["ARGUMENTS"]["EQUITY_DAILY"]}'
-            query += f'&{self.service_map["PARAMS"]["SIZE"]}={self.service_map["ARGUMENTS"]["FULL"]}'
+            size = self.service_map["ARGUMENTS"]["COMPACT"] if compact else self.service_map["ARGUMENTS"]["FULL"]
+            query += f'&{self.service_map["PARAMS"]["SIZE"]}={size}'
 
         elif asset_type == keys.keys['ASSETS']['CRYPTO']:
             query += f'&{self.service_map["PARAMS"]["FUNCTION"]}={self.service_map["ARGUMENTS"]["CRYPTO_DAILY"]}'
@@ -402,7 +434,7 @@ class PriceManager():
             f'PriceManager query (w/o key) = {self.url}?{query}', 'PriceManager._construct_url')
         return url
 
-    def get_prices(self, ticker: str, start_date: date, end_date: date, asset_type: str):
+    def get_prices(self, ticker: str, start_date: date, end_date: date, asset_type: str, compact: bool = False):
         """
         Retrieve prices from external service.
 
@@ -415,6 +447,8 @@ class PriceManager():
         4. **asset_type** : ``str``
             Asset type of the asset whose prices are being retrieved. Options are statically
             accessible in the `scrillla.static` module dictionary `scrilla.keys.keys['ASSETS']`.
+        5. **compact**: ``bool``
+            *Optional*. If `True`, only the latest prices are requested from the service, see `scrilla.services.PriceManager.covers_compact`. Defaults to `False`.
 
         Returns
         -------
@@ -440,8 +474,9 @@ class PriceManager():
         2. **scrilla.errors.APIResponseError**
             If the service from which data is being retrieved is down, the request has been rate limited or some otherwise anomalous event has taken place, this error will be thrown.
         """
-        url = self._construct_url(ticker, asset_type)
-        response = requests.get(url).json()
+        url = self._construct_url(ticker, asset_type, compact)
+        self.limiter.acquire()
+        response = self.session.get(url).json()
 
         first_element = helper.get_first_json_key(response)
         # end function is daily rate limit is reached
@@ -453,19 +488,15 @@ class PriceManager():
             raise errors.APIResponseError(
                 response[self.service_map['ERRORS']['INVALID']])
 
-        # check and wait for API rate limit refresh
-        first_pass, first_element = True, helper.get_first_json_key(response)
-
+        # NOTE: the limiter should keep requests within the quota, but the service throttles the
+        # API key, not the process, so other clients using the same key can still exhaust it.
+        # empty the bucket so the retry waits for the quota to refresh.
         while first_element == self.service_map['ERRORS']['RATE_THROTTLE']:
-            if first_pass:
-                logger.info(
-                    f'{self.genre} API rate limit per minute exceeded. Waiting...', 'PriceManager.get_prices')
-                first_pass = False
-            else:
-                logger.info('Waiting...', 'PriceManager.get_prices')
-
-            time.sleep(constants.constants['BACKOFF_PERIOD'])
-            response = requests.get(url).json()
+            logger.info(
+                f'{self.genre} API rate limit per minute exceeded. Waiting...', 'PriceManager.get_prices')
+            self.limiter.drain()
+            self.limiter.acquire()
+            response = self.session.get(url).json()
             first_element = helper.get_first_json_key(response)
 
             if first_element == self.service_map['ERRORS']['INVALID']:
@@ -484,6 +515,56 @@ class PriceManager():
                 keys.keys['PRICES']['OPEN']: float(open_price), keys.keys['PRICES']['CLOSE']: float(close_price)}
         return format_prices
 
+    def get_prices_many(self, requests_by_ticker: Dict[str, Tuple[date, date, str, bool]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Retrieves the prices of several tickers from the external service concurrently. Requests are spread over a pool of threads that share `self.session` and are scheduled by `self.limiter`.
+
+        Parameters
+        ----------
+        1. **requests_by_ticker**: ``Dict[str, Tuple[datetime.date, datetime.date, str, bool]]``
+            Dictionary keyed by ticker symbol whose values are the `(start_date, end_date, asset_type, compact)` arguments of `scrilla.services.PriceManager.get_prices`.
+
+        Returns
+        -------
+        ``Dict[str, Dict[str, Dict[str, float]]]``
+            Dictionary of prices keyed by ticker symbol, each in the format returned by `scrilla.services.PriceManager.get_prices`.
+
+        Raises
+        ------
+        1. **scrilla.errors.APIResponseError**
+            If any of the requests fail, the first error raised is re-raised once the remaining requests have finished.
+        """
+        if not requests_by_ticker:
+            return {}
+
+        def fetch(ticker):
+            start_date, end_date, asset_type, compact = requests_by_ticker[ticker]
+            return self.get_prices(ticker=ticker, start_date=start_date, end_date=end_date,
+                                   asset_type=asset_type, compact=compact)
+
+        workers = min(len(requests_by_ticker),
+                      config.http_session_conf['max_workers'])
+        logger.debug(
+            f'Retrieving {len(requests_by_ticker)} price histories with {workers} workers', 'PriceManager.get_prices_many')
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {ticker: executor.submit(fetch, ticker)
+                       for ticker in requests_by_ticker}
+        return {ticker: future.result() for ticker, future in futures.items()}
+
+    def covers_compact(self, start_date: date, asset_type: str) -> bool:
+        """
+        Returns `True` if the compact response of the service, i.e. the latest `COMPACT_LENGTH` prices, includes every price on or after `start_date`.
+
+        .. notes::
+            * *AlphaVantage* only supports compact responses for equities.
+        """
+        if asset_type != keys.keys['ASSETS']['EQUITY']:
+            return False
+        # NOTE: one day of slack in case the latest price has been published before the market close
+        cutoff = dater.decrement_date_by_business_days(dater.get_last_trading_date(),
+                                                        self.service_map['KEYS']['COMPACT_LENGTH'] - 2)
+        return start_date >= cutoff
+
     def _slice_prices(self, start_date: date, end_date: date, asset_type: str, prices: dict) -> dict:
         """
         Parses the raw response from the external price service into a format the program will understand.
@@ -525,11 +606,11 @@ class PriceManager():
             elif asset_type == keys.keys['ASSETS']['CRYPTO']:
                 response_map = self.service_map['KEYS']['CRYPTO']['FIRST_LAYER']
 
-            start_index = list(prices[response_map].keys()).index(start_string)
-            end_index = list(prices[response_map].keys()).index(end_string)
-            prices = dict(itertools.islice(
-                prices[response_map].items(), end_index, start_index+1))
-            return prices
+            # NOTE: dates are formatted YYYY-MM-DD, so they can be compared as strings. The
+            # endpoints do not need to exist in the response, e.g. when filling a gap in the cache
+            # that extends past the latest published price.
+            return {this_date: price for this_date, price in prices[response_map].items()
+                    if start_string <= this_date <= end_string}
 
         raise errors.ConfigurationError(
             'No PRICE_MANAGER found in the parsed environment settings')
@@ -582,7 +663,7 @@ def get_daily_price_history(ticker: str, start_date: Union[None, date] = None, e
     """
     Wrapper around external service request for price data. Relies on an instance of `PriceManager` configured by `settings.PRICE_MANAGER` value, which in turn is configured by the `PRICE_MANAGER` environment variable, to hydrate with data. 
 
-    Before deferring to the `PriceManager` and letting it call the external service, however, this function checks if response is in local cache. If the response is not in the cache, it will pass the request off to `PriceManager` and then save the response in the cache so subsequent calls to the function can bypass the service request. Used to prevent excessive external HTTP requests and improve the performance of the application. Other parts of the program should interface with the external price data services through this function to utilize the cache functionality.
+    Before deferring to the `PriceManager` and letting it call the external service, however, this function checks if response is in local cache. If the response is not in the cache, it will pass the request off to `PriceManager` and then save the response in the cache so subsequent calls to the function can bypass the service request. If the cache only holds part of the requested range, only the missing dates are requested from the service and merged into the cached prices; when every missing date is recent, the service's compact output is requested instead of the full history. Used to prevent excessive external HTTP requests and improve the performance of the application. Other parts of the program should interface with the external price data services through this function to utilize the cache functionality.
 
     Parameters
     ----------
@@ -626,47 +707,164 @@ def get_daily_price_history(ticker: str, start_date: Union[None, date] = None, e
     start_date, end_date = errors.validate_dates(
         start_date, end_date, asset_type)
 
+    cached_prices, gaps = _filter_price_cache(
+        ticker, start_date, end_date, asset_type)
+    if not gaps:
+        return cached_prices
+
+    fetched = price_manager.get_prices(ticker, *_gap_request(gaps, asset_type))
+    new_prices = _new_prices(fetched, cached_prices, gaps)
+    price_cache.save_rows(ticker, new_prices)
+
+    prices = _merge_prices(cached_prices, new_prices)
+    if not prices:
+        raise errors.PriceError(
+            f'Prices could not be retrieved for {ticker}')
+
+    return prices
+
+
+def _filter_price_cache(ticker: str, start_date: date, end_date: date, asset_type: str) -> Tuple[Union[Dict[str, Dict[str, float]], None], List[Tuple[date, date]]]:
+    """
+    Returns the cached prices of `ticker` between `start_date` and `end_date`, along with the date intervals missing from the cache, as returned by `scrilla.services._price_gaps`.
+    """
     cached_prices = price_cache.filter(
         ticker=ticker, start_date=start_date, end_date=end_date)
 
-    if cached_prices is not None:
-        if asset_type == keys.keys['ASSETS']['EQUITY']:
-            logger.debug(
-                f'Comparing cache-size({len(cached_prices)}) = date-length{dater.business_days_between(start_date, end_date)})', 'get_daily_price_history')
-        elif asset_type == keys.keys['ASSETS']['CRYPTO']:
-            logger.debug(
-                f'Comparing cache-size({len(cached_prices)}) = date-length({dater.days_between(start_date, end_date)})', 'get_daily_price_history')
-
-    # make sure the length of cache is equal to the length of the requested sample
-    if cached_prices is not None and dater.to_string(end_date) in cached_prices.keys() and (
-        (asset_type == keys.keys['ASSETS']['EQUITY']
-            and (dater.business_days_between(start_date, end_date)) == len(cached_prices))
-        or
-        (asset_type == keys.keys['ASSETS']['CRYPTO']
-            and (dater.days_between(start_date, end_date)) == len(cached_prices))
-    ):
-        # TODO: debug the crypto out of date check.
-        return cached_prices
+    gaps = _price_gaps(cached_prices, start_date, end_date, asset_type)
 
-    if cached_prices is not None:
+    if cached_prices is not None and gaps:
         logger.debug(
-            f'Cached {ticker} prices are out of date, passing request off to external service', 'get_daily_price_history')
+            f'Cached {ticker} prices are missing {len(gaps)} date ranges, passing request off to external service', 'get_daily_price_history')
+    return cached_prices, gaps
 
-    prices = price_manager.get_prices(
-        ticker=ticker, start_date=start_date, end_date=end_date, asset_type=asset_type)
 
-    if cached_prices is not None:
-        new_prices = helper.complement_dict_keys(prices, cached_prices)[0]
+def _price_gaps(cached_prices: Union[Dict[str, Dict[str, float]], None], start_date: date, end_date: date, asset_type: str) -> List[Tuple[date, date]]:
+    """
+    Returns the `(start_date, end_date)` intervals of dates that should have a price, i.e. trading days for equities and every day for crypto, but are missing from `cached_prices`. Intervals are ordered from earliest to latest.
+    """
+    if asset_type == keys.keys['ASSETS']['CRYPTO']:
+        expected = dater.dates_between(start_date, end_date)
     else:
-        new_prices = prices
+        expected = dater.business_dates_between(start_date, end_date)
+
+    if cached_prices is None:
+        return [(expected[0], expected[-1])] if expected else []
+
+    gaps, gap_start, previous = [], None, None
+    for this_date in expected:
+        if dater.to_string(this_date) in cached_prices:
+            if gap_start is not None:
+                gaps.append((gap_start, previous))
+                gap_start = None
+        elif gap_start is None:
+            gap_start = this_date
+        previous = this_date
+    if gap_start is not None:
+        gaps.append((gap_start, previous))
+    return gaps
+
+
+def _gap_request(gaps: List[Tuple[date, date]], asset_type: str) -> Tuple[date, date, str, bool]:
+    """
+    Returns the arguments of `scrilla.services.PriceManager.get_prices` for a single request that covers every interval in `gaps`. The compact output of the service is requested if it includes the earliest gap.
+    """
+    start_date, end_date = gaps[0][0], gaps[-1][1]
+    return start_date, end_date, asset_type, price_manager.covers_compact(start_date, asset_type)
 
-    price_cache.save_rows(ticker, new_prices)
 
-    if not prices:
-        raise errors.PriceError(
-            f'Prices could not be retrieved for {ticker}')
+def _new_prices(prices: Dict[str, Dict[str, float]], cached_prices: Union[Dict[str, Dict[str, float]], None], gaps: List[Tuple[date, date]]) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the subset of `prices` that falls inside one of the `gaps` in `cached_prices`.
+    """
+    if cached_prices is None:
+        return prices
+    gap_strings = [(dater.to_string(start), dater.to_string(end))
+                   for start, end in gaps]
+    return {this_date: price for this_date, price in prices.items()
+            if this_date not in cached_prices and any(start <= this_date <= end for start, end in gap_strings)}
 
-    return prices
+
+def _merge_prices(cached_prices: Union[Dict[str, Dict[str, float]], None], new_prices: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Merges the newly retrieved prices into the cached prices, ordered from latest to earliest.
+    """
+    if not cached_prices:
+        return new_prices
+    if not new_prices:
+        return cached_prices
+    merged = {**cached_prices, **new_prices}
+    return {this_date: merged[this_date] for this_date in sorted(merged, reverse=True)}
+
+
+def get_daily_price_histories(tickers: List[str], start_date: Union[None, date] = None, end_date: Union[None, date] = None, asset_types: Union[None, List[str]] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Batch version of `scrilla.services.get_daily_price_history`. The cached prices of tickers with the same date range are read with a single `scrilla.cache.PriceCache.filter_many` query; the gaps in the remaining tickers are retrieved from the external service concurrently with `scrilla.services.PriceManager.get_prices_many` and written to the cache with a single statement.
+
+    Parameters
+    ----------
+    1. **tickers** : ``List[str]``
+        Ticker symbols whose price histories are to be retrieved.
+    2. **start_date** : ``datetime.date``
+        *Optional*. Start date of the price histories. See `scrilla.services.get_daily_price_history` for the default.
+    3. **end_date** : ``datetime.date``
+        *Optional*. End date of the price histories. See `scrilla.services.get_daily_price_history` for the default.
+    4. **asset_types** : ``List[str]``
+        *Optional*. Asset types that map to the `tickers` list. Will be calculated from the ticker symbols if not provided.
+
+    Returns
+    -------
+    ``Dict[str, Dict[str, Dict[str, float]]]``
+        Dictionary of price histories keyed by ticker symbol, each in the format returned by `scrilla.services.get_daily_price_history`.
+
+    Raises
+    ------
+    1. **scrilla.errors.PriceError**
+        If no sample prices can be retrieved for one of the tickers, this error is thrown.
+    """
+    if asset_types is None:
+        asset_types = [None for _ in tickers]
+
+    validated = {}
+    for ticker, asset_type in zip(tickers, asset_types):
+        if ticker in validated:
+            continue
+        asset_type = errors.validate_asset_type(ticker, asset_type)
+        validated[ticker] = (asset_type, *errors.validate_dates(
+            start_date, end_date, asset_type))
+
+    # NOTE: the date range only depends on the asset type, so there are at most two groups.
+    groups, cached_prices_by_ticker = {}, {}
+    for ticker, (_, this_start, this_end) in validated.items():
+        groups.setdefault((this_start, this_end), []).append(ticker)
+    for (this_start, this_end), group in groups.items():
+        cached_prices_by_ticker.update(price_cache.filter_many(
+            tickers=group, start_date=this_start, end_date=this_end))
+
+    histories, cached, missing = {}, {}, {}
+    for ticker, (asset_type, this_start, this_end) in validated.items():
+        cached_prices = cached_prices_by_ticker[ticker]
+        gaps = _price_gaps(cached_prices, this_start, this_end, asset_type)
+        if not gaps:
+            histories[ticker] = cached_prices
+        else:
+            cached[ticker] = (cached_prices, gaps)
+            missing[ticker] = _gap_request(gaps, asset_type)
+
+    fetched = price_manager.get_prices_many(missing)
+    new_prices = {ticker: _new_prices(prices, *cached[ticker])
+                  for ticker, prices in fetched.items()}
+
+    price_cache.save_many(new_prices)
+
+    for ticker, prices in new_prices.items():
+        prices = _merge_prices(cached[ticker][0], prices)
+        if not prices:
+            raise errors.PriceError(
+                f'Prices could not be retrieved for {ticker}')
+        histories[ticker] = prices
+
+    return {ticker: histories[ticker] for ticker in tickers}
 
 
 def get_daily_price_latest(ticker: str, asset_type: Union[None, str] = None) -> float:
@@ -687,10 +885,15 @@ def get_daily_price_latest(ticker: str, asset_type: Union[None, str] = None) ->
     return prices[first_element][keys.keys['PRICES']['OPEN']]
 
 
-def get_daily_prices_latest(tickers: List[str], asset_types: Union[None, List[str]] = None):
-    if asset_types is None:
-        asset_types = [None for _ in tickers]
-    return {ticker: get_daily_price_latest(ticker, asset_types[i]) for i, ticker in enumerate(tickers)}
+def get_daily_prices_latest(tickers: List[str], asset_types: Union[None, List[str]] = None) -> Dict[str, float]:
+    """
+    Batch version of `scrilla.services.get_daily_price_latest`. Prices that aren't cached are retrieved concurrently with `scrilla.services.get_daily_price_histories`.
+    """
+    last_date = dater.this_date_or_last_trading_date()
+    histories = get_daily_price_histories(
+        tickers=tickers, asset_types=asset_types, start_date=last_date, end_date=last_date)
+    return {ticker: prices[helper.get_first_json_key(prices)][keys.keys['PRICES']['OPEN']]
+            for ticker, prices in histories.items()}
 
 
 def get_daily_fred_history(symbol: str, start_date: Union[date, None] = None, end_date: Union[date, None] = None) -> list:
@@ -58,6 +58,9 @@ CACHE_SQLITE_FILE = os.environ.setdefault(
     'SQLITE_FILE', os.path.join(CACHE_DIR, 'scrilla.db'))
 """Location of the SQLite database flat file; Configured by environment variable **SQLITE_FILE***"""
 
+CACHE_CALENDAR_FILE = os.path.join(CACHE_DIR, 'calendar.npz')
+"""Location of the precomputed trading calendars"""
+
 TEMP_DIR = os.path.join(APP_DIR, 'data', 'tmp')
 """Buffer directory for graphics generated while using the GUI."""
 
@@ -113,6 +116,8 @@ GUI_HEIGHT = None
 """Height of main Graphical User Interface window; Configured by environment variable of same name, **GUI_HEIGHT**."""
 FRONTIER_STEPS = None
 """Number of data points used to trace out the efficient frontier; Configured by environment variable of same name, **FRONTIER_STEPS** """
+FRONTIER_PROCESSES = None
+"""Number of processes used to optimize the points of the efficient frontier in parallel; Configured by environment variable of same name, **FRONTIER_PROCESSES** """
 MA_1_PERIOD = None
 """Number of data points in first moving average period; Configured by environment variable, **MA_1**"""
 MA_2_PERIOD = None
@@ -157,6 +162,15 @@ except (ValueError, TypeError) as ParseError:
     FRONTIER_STEPS = 5
     os.environ['FRONTIER_STEPS'] = '5'
 
+try:
+    FRONTIER_PROCESSES = int(
+        os.environ.setdefault('FRONTIER_PROCESSES', '1'))
+except (ValueError, TypeError) as ParseError:
+    logger.debug(
+        'Failed to parse FRONTIER_PROCESSES from enviroment. Setting to default value of 1.', 'line_160')
+    FRONTIER_PROCESSES = 1
+    os.environ['FRONTIER_PROCESSES'] = '1'
+
 try:
     MA_1_PERIOD = int(os.environ.setdefault('MA_1', '20'))
 except (ValueError, TypeError) as ParseError:
@@ -215,6 +229,10 @@ CACHE_MODE = os.environ.setdefault(
     'CACHE_MODE', 'sqlite')
 """Determines how caching is handled"""
 
+CACHE_WRITE_BEHIND = os.environ.setdefault(
+    'CACHE_WRITE_BEHIND', 'false').lower() == 'true'
+"""Determines whether writes to the cache are committed by a background thread; Configured by environment variable of the same name, **CACHE_WRITE_BEHIND**"""
+
 DYNAMO_CONF = {
     'BillingMode': 'PAY_PER_REQUEST'  # PAY_PER_REQUEST | PROVISIONED
     # If PROVISIONED, the following lines need uncommented and configured:
@@ -226,6 +244,10 @@ DYNAMO_CONF = {
 }
 
 # SERVICE CONFIGURATION
+RATE_LIMIT_FILE_LOCK = os.environ.setdefault(
+    'RATE_LIMIT_FILE_LOCK', 'false').lower() == 'true'
+"""Flag determining whether the service rate limits are shared with other processes through lock files in `CACHE_DIR`, e.g. when several processes use the same API keys."""
+
 # PRICE_MANAGER CONFIGRUATION
 PRICE_MANAGER = os.environ.setdefault('PRICE_MANAGER', 'alpha_vantage')
 """Determines the service used to retrieve price data"""
@@ -233,6 +255,15 @@ PRICE_MANAGER = os.environ.setdefault('PRICE_MANAGER', 'alpha_vantage')
 AV_KEY = None
 """API Key used to query *AlphaVantage* service."""
 
+try:
+    PRICE_PER_MINUTE = int(os.environ['PRICE_PER_MINUTE']) \
+        if 'PRICE_PER_MINUTE' in os.environ else None
+except (ValueError, TypeError) as ParseError:
+    logger.debug(
+        'Failed to parse PRICE_PER_MINUTE from environment. Defaulting to the service quota.', 'line_236')
+    PRICE_PER_MINUTE = None
+"""Number of requests per minute the price service allows. If not set, defaults to the free tier quota of the service defined by `PRICE_MANAGER`."""
+
 # ALPHAVANTAGE CONFIGURATION
 if PRICE_MANAGER == 'alpha_vantage':
     AV_URL = os.environ.setdefault(
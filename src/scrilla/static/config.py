@@ -206,3 +206,83 @@ dynamo_profile_table_conf = {
         }
     ]
 }
+sqlite_connection_conf = {
+    # NOTE: number of compiled statements each connection keeps in its
+    #       prepared statement cache. The cache tables only use a handful
+    #       of distinct statements, so this comfortably holds all of them.
+    'cached_statements': 128,
+    # NOTE: seconds a connection waits on a locked database before raising.
+    'timeout': 10,
+    'pragmas': {
+        # NOTE: write-ahead logging lets readers proceed while a writer commits.
+        'journal_mode': 'WAL',
+        # NOTE: NORMAL is durable across application crashes in WAL mode;
+        #       only an OS crash or power loss can roll back the last commits.
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        # NOTE: negative values are measured in KiB, i.e. a 16 MiB page cache.
+        'cache_size': -16384
+    }
+}
+sqlite_date_conf = {
+    # NOTE: dates are stored in the cache as ordinals. This is the number of
+    #       conversions between date strings and ordinals that are memoized;
+    #       a decade of daily observations is less than 4000 dates.
+    'cache_size': 8192
+}
+http_session_conf = {
+    # NOTE: number of hosts whose connections are kept alive by the session.
+    'pool_connections': 4,
+    # NOTE: keep-alive connections kept open to a single host.
+    'pool_maxsize': 8,
+    # NOTE: threads used to fetch price histories concurrently.
+    'max_workers': 8
+}
+dynamo_query_conf = {
+    # NOTE: threads used to query the partitions of several tickers concurrently.
+    'max_workers': 8
+}
+internal_cache_conf = {
+    # NOTE: maximum number of observations, i.e. dated prices or yields, the
+    #       in-memory caches hold across all tickers and maturities before the
+    #       least recently used series are evicted.
+    'max_rows': 100000
+}
+write_behind_conf = {
+    # NOTE: statements queued for the writer thread before the threads saving
+    #       values to the cache block, when CACHE_WRITE_BEHIND is enabled.
+    'max_pending': 10000,
+    # NOTE: statements committed by the writer thread in a single transaction.
+    'batch_size': 1000,
+    # NOTE: seconds the writer thread waits for more statements before it
+    #       commits a batch that is not full.
+    'linger': 0.05
+}
+memory_tier_conf = {
+    # NOTE: estimated bytes each cache holds in memory before the least
+    #       recently used entries are evicted, and the seconds an entry is
+    #       held before it expires. A ttl of None never expires entries.
+    #       Run `scrilla cache-stats` to compare these with real workloads.
+    'prices': {
+        'max_bytes': 64*1024*1024,
+        'ttl': None
+    },
+    'interest': {
+        'max_bytes': 8*1024*1024,
+        'ttl': None
+    },
+    'correlations': {
+        'max_bytes': 16*1024*1024,
+        'ttl': None
+    },
+    'profile': {
+        'max_bytes': 16*1024*1024,
+        'ttl': None
+    }
+}
+profile_buffer_conf = {
+    # NOTE: number of risk profiles whose statistics are buffered before they
+    #       are written to the cache. Statistics saved for the same profile
+    #       while it is buffered are written by a single statement.
+    'max_rows': 64
+}
@@ -6,7 +6,10 @@ constants = {
         'CRYPTO': (1/365)
     },
     'ACCURACY': 7,
-    'BACKOFF_PERIOD': 30,
+    'CALENDAR': {
+        'START_YEAR': 1990,
+        'YEARS_AHEAD': 2
+    },
     'KEEP_FILE': '.gitkeep',
     'PRICE_YEAR_CUTOFF': 1950,
     'DENOMINATION': 'USD',
@@ -45,6 +45,13 @@ FUNC_DICT = {
         'description': "Computes the market beta according to CAPM for the supplied list of tickers. If no start or end dates are specified, calculations default to the last 100 days of prices. The environment variable MARKET_PROXY defines which ticker serves as a proxy for the market as whole.",
         'tickers': True,
     },
+    "cache_stats": {
+        'name': 'Cache Statistics',
+        'values': ["cache-stats", "cst"],
+        'args': None,
+        'description': "Prints the hits, misses, evictions and expirations of the in-memory tier of each cache, totaled over every run, along with the size and lifetime limits each tier is configured with.",
+        'tickers': False,
+    },
     "clear_cache": {
         'name': 'Clear Cache',
         'values': ["clear-cache", "cc"],
@@ -104,8 +111,8 @@ FUNC_DICT = {
     "efficient_frontier": {
         'name': 'Portfolio Efficient Frontier',
         'values': ["efficient-frontier", "ef"],
-        'args': ['start_date', 'end_date', 'investment', 'target', 'steps', 'save_file', 'suppress_output', 'json', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
-        'description': "Generate a sample of the portfolio's efficient frontier for the supplied list of tickers. The efficient frontier algorithm will minimize a portfolio's volality for a given rate of return and then maximize its return, and then use these points to generate the rest of the frontier by taking increments along the line connecting the (risk,return) profile of the minimum volatility portfolio to the (risk, return) profile of the maximum return portfolio. The number of points calculated in the efficient frontier can be specifed as an integer with the -steps flag. If no -steps is provided, the value of the environment variable FRONTIER_STEPS will be used.",
+        'args': ['start_date', 'end_date', 'investment', 'target', 'steps', 'critical_line', 'processes', 'save_file', 'suppress_output', 'json', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
+        'description': "Generate a sample of the portfolio's efficient frontier for the supplied list of tickers. The efficient frontier algorithm will minimize a portfolio's volality for a given rate of return and then maximize its return, and then use these points to generate the rest of the frontier by taking increments along the line connecting the (risk,return) profile of the minimum volatility portfolio to the (risk, return) profile of the maximum return portfolio. The number of points calculated in the efficient frontier can be specifed as an integer with the -steps flag. If no -steps is provided, the value of the environment variable FRONTIER_STEPS will be used. The -critical-line flag traces the frontier exactly with the critical line method instead of optimizing each point. Otherwise, the points can be optimized in parallel over the number of processes specified with the -processes flag, or the value of the environment variable FRONTIER_PROCESSES.",
         'tickers': True,
     },
     "help": {
@@ -139,7 +146,7 @@ FUNC_DICT = {
     "moving_averages": {
         'name': 'Moving Averages Series',
         'values': ["mov-averages", "mas"],
-        'args': ['start_date', 'end_date', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
+        'args': ['start_date', 'end_date', 'exponential', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
         'description': "Calculate the current moving averages. If no start or end dates are specified, calculations default to the last 100 days of prices.",
         'tickers': True,
     },
@@ -174,14 +181,14 @@ FUNC_DICT = {
     "plot_frontier": {
         'name': 'Plot Efficient Frontier',
         'values': ["plot-efficient-frontier", "plot-ef"],
-        'args': ['start_date', 'end_date', 'save_file', 'steps', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
-        'description': "Generates a scatter plot graphic of the portfolio\'s efficient frontier for the supplied list of tickers. The number of points calculated in the efficient frontier can be specifed as an integer with the -steps. If no -steps is provided, the value of the environment variable FRONTIER_STEPS will be used. If this value is not set, the function will default to a value of 5.",
+        'args': ['start_date', 'end_date', 'save_file', 'steps', 'critical_line', 'processes', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
+        'description': "Generates a scatter plot graphic of the portfolio\'s efficient frontier for the supplied list of tickers. The number of points calculated in the efficient frontier can be specifed as an integer with the -steps. If no -steps is provided, the value of the environment variable FRONTIER_STEPS will be used. If this value is not set, the function will default to a value of 5. The -critical-line and -processes flags select how the frontier is calculated, as in the efficient-frontier function.",
         'tickers': True,
     },
     "plot_moving_averages": {
         'name': 'Plot Moving Averages Series',
         'values': ["plot-moving-averages", "plot-mas"],
-        'args': ['start_date', 'end_date', 'save_file', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
+        'args': ['start_date', 'end_date', 'save_file', 'exponential', keys.keys['ESTIMATION']['MOMENT'], keys.keys['ESTIMATION']['PERCENT'], keys.keys['ESTIMATION']['LIKE']],
         'description': "Generates a grouped bar chart of the moving averages for each equity in the supplied list of ticker symbols. If no start or end dates are specified, calculations default to the last 100 days of prices.",
         'tickers': True,
     },
@@ -402,6 +409,28 @@ ARG_DICT = {
         'syntax': '<value>',
         'cli_only': False
     },
+    'critical_line': {
+        'name': 'Critical Line Method',
+        'values': ['-critical-line', '--critical-line', '-cla', '--cla'],
+        'description': 'Flag to trace the efficient frontier with the critical line method',
+        'default': None,
+        'widget_type': 'flag',
+        'format': bool,
+        'required': False,
+        'syntax': None,
+        'cli_only': False
+    },
+    'processes': {
+        'name': 'Efficient Frontier Processes',
+        'values': ['-processes', '--processes', '-proc', '--proc'],
+        'description': 'Number of processes used to optimize the points of the efficient frontier in parallel',
+        'default': 'FRONTIER_PROCESSES environment variable',
+        'widget_type': 'integer',
+        'format': int,
+        'required': False,
+        'syntax': '<value>',
+        'cli_only': False
+    },
     'criteria': {
         'name': 'Watchlist Screener Critia',
         'values': ['-criteria', '--criteria', '-crit', '--crit'],
@@ -459,6 +488,17 @@ ARG_DICT = {
         'syntax': None,
         'cli_only': False
     },
+    'exponential': {
+        'name': 'Exponential Moving Averages',
+        'values': ['-exponential', '--exponential', '-ema', '--ema'],
+        'description': 'Flag to calculate exponential moving averages of returns',
+        'default': None,
+        'widget_type': 'flag',
+        'format': bool,
+        'required': False,
+        'syntax': None,
+        'cli_only': True
+    },
     'json': {
         'name': 'JSON Display',
         'values': ['-json', '--json', '-js', '--js'],
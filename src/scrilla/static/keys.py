@@ -68,7 +68,8 @@ keys = {
                         },
                         'ERROR': 'Error Message',
                         'THROTTLE': 'Note',
-                        'LIMIT': 'Information'
+                        'LIMIT': 'Information',
+                        'COMPACT_LENGTH': 100
                     },
                     'PARAMS': {
                         'TICKER': 'symbol',
@@ -81,12 +82,17 @@ keys = {
                         'EQUITY_DAILY': 'TIME_SERIES_DAILY',
                         'EQUITY_LISTING': 'LISTING_STATUS',
                         'CRYPTO_DAILY': 'DIGITAL_CURRENCY_DAILY',
-                        'FULL': 'full'
+                        'FULL': 'full',
+                        'COMPACT': 'compact'
                     },
                     'ERRORS': {
                         'RATE_THROTTLE': 'Note',
                         'RATE_LIMIT': 'Information',
                         'INVALID': 'Error Message'
+                    },
+                    'QUOTA': {
+                        'PER_MINUTE': 5,
+                        'BURST': 5
                     }
                 }
             }
@@ -111,6 +117,10 @@ keys = {
                         'START': 'start_date',
                         'END': 'end_date'
                     },
+                    'QUOTA': {
+                        'PER_MINUTE': 300,
+                        'BURST': 30
+                    },
                     'YIELD_CURVE': {
                         'ONE_MONTH': '1 MO',
                         'TWO_MONTH': '2 MO',
@@ -147,6 +157,10 @@ keys = {
                     'ARGUMENTS': {
                         'DAILY': 'daily_treasury_yield_curve',
                     },
+                    'QUOTA': {
+                        'PER_MINUTE': 60,
+                        'BURST': 10
+                    },
                     'YIELD_CURVE': {
                         'ONE_MONTH': 'BC_1MONTH',
                         'TWO_MONTH': 'BC_2MONTH',
@@ -178,6 +192,10 @@ keys = {
                     'PARAMS': {
                         'FULL': '5y',
                         'KEY': 'token'
+                    },
+                    'QUOTA': {
+                        'PER_MINUTE': 6000,
+                        'BURST': 100
                     }
                 }
             }
@@ -0,0 +1,11 @@
+import pytest
+
+from scrilla import services
+from scrilla.util.limiter import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def unlimited_service_quotas(monkeypatch):
+    # NOTE: the mocked services do not enforce a quota, so tests shouldn't wait on one.
+    for manager in [services.price_manager, services.stat_manager, services.div_manager]:
+        monkeypatch.setattr(manager, 'limiter', TokenBucket(per_minute=10**9))
@@ -0,0 +1,84 @@
+import pytest
+import numpy
+
+from scrilla.analysis.accumulators import MomentAccumulator, CovarianceAccumulator, CorrelationMatrixAccumulator
+from scrilla.util.errors import SampleSizeError
+
+from .. import mock_data
+from .. import settings
+
+
+@pytest.mark.parametrize("x,var", mock_data.variance_cases)
+def test_moment_update_matches_two_pass_variance(x, var):
+    accumulator = MomentAccumulator()
+    for obs in x:
+        accumulator.update(obs)
+    assert(settings.is_within_tolerance(lambda: accumulator.variance() - var))
+    assert(settings.is_within_tolerance(
+        lambda: accumulator.mean - numpy.mean(x)))
+
+
+def test_moment_remove_slides_window():
+    x = [100 + 0.01*i**2 for i in range(50)]
+    accumulator = MomentAccumulator().update_many(x[:20])
+    for i in range(20, len(x)):
+        accumulator.update(x[i]).remove(x[i-20])
+        window = x[i-19:i+1]
+        assert(settings.is_within_tolerance(
+            lambda: accumulator.variance() - numpy.var(window, ddof=1)))
+
+
+def test_moment_merge_matches_whole_sample():
+    x = numpy.random.default_rng(7).normal(5, 2, 1000)
+    merged = MomentAccumulator()
+    for chunk in numpy.array_split(x, 7):
+        merged.merge(MomentAccumulator().update_many(chunk))
+    assert merged.n == len(x)
+    assert(settings.is_within_tolerance(
+        lambda: merged.variance() - numpy.var(x, ddof=1)))
+
+
+def test_empty_moment_variance():
+    with pytest.raises(SampleSizeError):
+        MomentAccumulator().variance()
+
+
+def test_covariance_update_remove_and_merge():
+    rng = numpy.random.default_rng(11)
+    x, y = rng.normal(size=200), rng.normal(size=200)
+    y = y + 0.5*x
+
+    streamed = CovarianceAccumulator()
+    for x_obs, y_obs in zip(x, y):
+        streamed.update(x_obs, y_obs)
+    assert(settings.is_within_tolerance(
+        lambda: streamed.covariance() - numpy.cov(x, y)[0][1]))
+    assert(settings.is_within_tolerance(
+        lambda: streamed.correlation() - numpy.corrcoef(x, y)[0][1]))
+
+    for x_obs, y_obs in zip(x[:50], y[:50]):
+        streamed.remove(x_obs, y_obs)
+    assert(settings.is_within_tolerance(
+        lambda: streamed.correlation() - numpy.corrcoef(x[50:], y[50:])[0][1]))
+
+    merged = CovarianceAccumulator().update_many(x[:50], y[:50])
+    merged.merge(streamed)
+    assert(settings.is_within_tolerance(
+        lambda: merged.correlation() - numpy.corrcoef(x, y)[0][1]))
+
+
+def test_correlation_matrix_chunks_match_numpy():
+    rng = numpy.random.default_rng(3)
+    sample = rng.normal(size=(500, 4)) @ rng.normal(size=(4, 4))
+
+    accumulator = CorrelationMatrixAccumulator(4)
+    for chunk in numpy.array_split(sample, 9):
+        accumulator.update_many(chunk)
+    for row in sample[:3]:
+        accumulator.remove(row)
+    accumulator.update(sample[0])
+
+    expected = numpy.vstack([sample[3:], sample[:1]])
+    assert numpy.allclose(accumulator.covariance(), numpy.cov(expected.T))
+    assert numpy.allclose(accumulator.correlation(),
+                          numpy.corrcoef(expected.T))
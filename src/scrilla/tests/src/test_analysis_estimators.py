@@ -1,6 +1,8 @@
 import pytest
 import math
 import random
+import numpy
+from scipy.stats import multivariate_normal
 
 from scrilla.analysis import estimators
 from scrilla.util.errors import SampleSizeError
@@ -161,6 +163,24 @@ def test_rolling_recursive_variance(first_x, second_x):
         lambda: recursive_variance - actual_next_variance))
 
 
+@pytest.mark.parametrize("x,y", [(mock_data.bivariate_data[datum]) for datum in mock_data.bivariate_data])
+def test_rolling_recursive_correlation(x, y):
+    n = len(x) - 1
+    stats = {
+        'x_bar': estimators.sample_mean(x[:-1]),
+        'y_bar': estimators.sample_mean(y[:-1]),
+        'x_variance': estimators.sample_variance(x[:-1]),
+        'y_variance': estimators.sample_variance(y[:-1]),
+        'covariance': estimators.sample_covariance(x[:-1], y[:-1])
+    }
+    stats = estimators.recursive_rolling_correlation(
+        stats, x[-1], x[0], y[-1], y[0], n)
+    assert(settings.is_within_tolerance(
+        lambda: stats['covariance'] - estimators.sample_covariance(x[1:], y[1:])))
+    assert(settings.is_within_tolerance(
+        lambda: stats['correlation'] - estimators.sample_correlation(x[1:], y[1:])))
+
+
 @pytest.mark.parametrize("x,y,cov", mock_data.covariance_cases)
 def test_covariance(x, y, cov):
     covariance = estimators.sample_covariance(x=x, y=y)
@@ -199,3 +219,110 @@ def test_simple_regression_slope(x, y, beta):
 def test_simple_regression_intercept(x, y, alpha):
     intercept = estimators.simple_regression_alpha(x=x, y=y)
     assert(settings.is_within_tolerance(lambda: intercept - alpha))
+
+
+@pytest.mark.parametrize("x", [(mock_data.univariate_data[datum]) for datum in mock_data.univariate_data])
+@pytest.mark.parametrize("period", [1, 3, 7])
+def test_rolling_windows_match_window_estimates(x, period):
+    sums = estimators.rolling_sums(x, period)
+    quartiles = estimators.rolling_percentiles(x, period, [0.25, 0.75])
+    for i in range(len(x)):
+        window = x[max(i-period+1, 0):i+1]
+        assert sums[i] == pytest.approx(sum(window))
+        assert quartiles[i][0] == pytest.approx(
+            estimators.sample_percentile(list(window), 0.25))
+        assert quartiles[i][1] == pytest.approx(
+            estimators.sample_percentile(list(window), 0.75))
+
+
+@pytest.mark.parametrize("period", [2, 10, 60])
+def test_rolling_percentiles_match_numpy_percentile(period):
+    x = [random.gauss(0, 1) for _ in range(1000)]
+    percentiles = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+    rolled = estimators.rolling_percentiles(x, period, percentiles)
+    for i in range(len(x)):
+        window = x[max(i-period+1, 0):i+1]
+        n = len(window)
+        # the (n+1)p-th order statistic, clamped to the sample, is numpy's
+        # linearly interpolated percentile at the rescaled rank below
+        ranks = [100*min(max(((n+1)*p - 1)/max(n - 1, 1), 0), 1)
+                 for p in percentiles]
+        assert rolled[i] == pytest.approx(numpy.percentile(window, ranks))
+
+
+@pytest.mark.parametrize('x,percentile,expected', [
+    ([3, 1, 2], 0.5, 2),
+    ([4, 1, 3, 2], 0.5, 2.5),
+    ([4, 1, 3, 2], 0.01, 1),
+    ([4, 1, 3, 2], 0.99, 4),
+    ([10, 30, 20, 40], 0.25, 12.5)
+])
+def test_sample_percentile(x, percentile, expected):
+    unsorted = list(x)
+    assert estimators.sample_percentile(x, percentile) == pytest.approx(expected)
+    assert x == unsorted
+
+
+def test_order_statistics_vector_and_column_queries():
+    rng = numpy.random.default_rng(13)
+    sample = rng.normal(size=(101, 3))
+    percentiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+    orders = estimators.OrderStatistics(sample).percentile(percentiles)
+    assert orders.shape == (len(percentiles), 3)
+    for column in range(3):
+        for i, percentile in enumerate(percentiles):
+            assert orders[i][column] == pytest.approx(
+                estimators.sample_percentile(list(sample[:, column]), percentile))
+
+
+def test_qq_series_for_sample():
+    x = list(numpy.random.default_rng(17).normal(size=250))
+    unsorted = list(x)
+    qq_series = estimators.qq_series_for_sample(x)
+    assert x == unsorted
+    assert len(qq_series) == len(x)
+    assert [point[1] for point in qq_series] == pytest.approx(
+        [estimators.sample_percentile(x, (i + 0.5)/len(x)) for i in range(len(x))])
+    assert all(qq_series[i][0] < qq_series[i+1][0]
+               for i in range(len(x) - 1))
+
+
+def test_exponential_moving_average():
+    x = [1, 2, 3, 4, 5]
+    ema = estimators.exponential_moving_average(x, 3)
+    assert list(ema[:3]) == [1, 1.5, 2]
+    assert ema[3] == pytest.approx(2 + 0.5*(4-2))
+    assert ema[4] == pytest.approx(3 + 0.5*(5-3))
+
+
+def test_empirical_copulas_match_pointwise_copula():
+    rng = numpy.random.default_rng(5)
+    x = rng.normal(size=300)
+    y = 0.6*x + rng.normal(size=300)
+    x_orders, y_orders = numpy.quantile(
+        x, [0.1, 0.5, 0.9]), numpy.quantile(y, [0.1, 0.5, 0.9])
+    copulas = estimators.empirical_copulas(list(x), list(y), x_orders, y_orders)
+    for i in range(3):
+        for j in range(3):
+            assert copulas[i][j] == pytest.approx(estimators.empirical_copula(
+                list(zip(x, y)), x_orders[i], y_orders[j]))
+
+
+@pytest.mark.parametrize('correlation', [-0.95, -0.3, 0, 0.5, 0.99])
+def test_bivariate_normal_cdf(correlation):
+    points = [(-1.5, 0.2), (0, 0), (1.2, 1.8), (-0.4, -2.1)]
+    expected = [multivariate_normal.cdf(point, mean=[0, 0], cov=[[1, correlation], [correlation, 1]])
+                for point in points]
+    x, y = numpy.array(points).T
+    assert estimators.bivariate_normal_cdf(
+        x, y, correlation) == pytest.approx(expected, abs=1e-5)
+
+
+def test_copula_correlation_recovers_normal_correlation():
+    orders = numpy.array([-1.28, -0.99, 0, 0.99, 1.28])
+    correlations = numpy.array([-0.4, 0.25, 0.8])
+    empirical = numpy.column_stack([estimators.bivariate_normal_cdf(orders, orders, correlation)
+                                    for correlation in correlations])
+    solved = estimators.copula_correlation(
+        numpy.tile(orders, (3, 1)).T, numpy.tile(orders, (3, 1)).T, empirical)
+    assert solved == pytest.approx(correlations, abs=1e-6)
@@ -1,13 +1,18 @@
 import pytest
+from math import log
 from httmock import HTTMock
 
 from scrilla.util.errors import SampleSizeError
 from scrilla.util import dater
 from scrilla.analysis.models.geometric import statistics
 from scrilla.analysis.estimators import standardize
+from scrilla import cache
 from scrilla.cache import PriceCache, ProfileCache, InterestCache, CorrelationCache
 from scrilla.files import clear_cache, get_asset_type
 from scrilla.static.keys import keys
+from scrilla.static.functions import get_trading_period
+from scrilla.services import get_daily_price_history
+from scrilla import settings
 
 from .. import mock_data
 
@@ -38,6 +43,39 @@ def test_moving_average_return(ticker, start_date, end_date):
                for average_dict in moving_average.values())
 
 
+@pytest.mark.parametrize("ticker,start_date,end_date", mock_data.service_price_cases)
+def test_moment_moving_average_windows(ticker, start_date, end_date):
+    with HTTMock(mock_data.mock_prices):
+        moving_average = statistics.calculate_moving_averages(
+            ticker=ticker, start_date=start_date, end_date=end_date, method=keys['ESTIMATION']['MOMENT'])
+        if get_asset_type(ticker) == keys['ASSETS']['CRYPTO']:
+            sample_start = dater.decrement_date_by_days(start_date, settings.MA_3_PERIOD)
+        else:
+            sample_start = dater.decrement_date_by_business_days(start_date, settings.MA_3_PERIOD)
+        prices = get_daily_price_history(ticker, sample_start, end_date)
+
+    dates = list(prices)
+    trading_period = get_trading_period(get_asset_type(ticker))
+    for this_date, averages in moving_average.items():
+        index = dates.index(this_date)
+        for period, average in zip([settings.MA_1_PERIOD, settings.MA_2_PERIOD, settings.MA_3_PERIOD], averages.values()):
+            first_date = dates[index+period]
+            expected = log(prices[this_date]['close']/prices[first_date]['close'])/(trading_period*period)
+            assert average == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("ticker,start_date,end_date", mock_data.service_price_cases)
+def test_exponential_moving_average_return(ticker, start_date, end_date):
+    with HTTMock(mock_data.mock_prices):
+        moving_average = statistics.calculate_moving_averages(
+            ticker=ticker, start_date=start_date, end_date=end_date, exponential=True)
+    assert list(moving_average) == [dater.to_string(this_date) for this_date in (
+        dater.dates_between(start_date, end_date) if get_asset_type(ticker) == keys['ASSETS']['CRYPTO']
+        else dater.business_dates_between(start_date, end_date))]
+    assert all(isinstance(average, float) for averages in moving_average.values()
+               for average in averages.values())
+
+
 @pytest.mark.parametrize("ticker,start_date,end_date", mock_data.service_price_cases)
 def test_sample_of_returns(ticker, start_date, end_date):
     with HTTMock(mock_data.mock_prices):
@@ -57,6 +95,45 @@ def test_sample_of_returns(ticker, start_date, end_date):
     assert len(these_returns) == no_of_days - 1
 
 
+@pytest.mark.parametrize("ticker,start_date,end_date", mock_data.service_price_cases)
+def test_sample_of_returns_matches_pairwise_calculation(ticker, start_date, end_date):
+    asset_type = get_asset_type(ticker)
+    with HTTMock(mock_data.mock_prices):
+        prices = get_daily_price_history(ticker=ticker, start_date=dater.parse(start_date),
+                                         end_date=dater.parse(end_date), asset_type=asset_type)
+    these_returns = statistics.get_sample_of_returns(
+        ticker=ticker, sample_prices=prices, asset_type=asset_type)
+
+    dates, expected = list(prices), []
+    for later, earlier in zip(dates[:-1], dates[1:]):
+        if asset_type == keys['ASSETS']['CRYPTO'] or not dater.consecutive_trading_days(later, earlier):
+            time_delta = (dater.parse(later) - dater.parse(earlier)).days
+        else:
+            time_delta = 1
+        expected.append(log(float(prices[later]['close'])/float(prices[earlier]['close']))
+                        / time_delta / get_trading_period(asset_type))
+
+    assert these_returns == expected
+
+
+@pytest.mark.parametrize('method', [keys['ESTIMATION']['MOMENT'], keys['ESTIMATION']['PERCENT'],
+                                    keys['ESTIMATION']['LIKE']])
+@pytest.mark.parametrize("ticker,start_date,end_date", mock_data.service_price_cases)
+def test_risk_return_from_sample_prices(ticker, start_date, end_date, method):
+    asset_type = get_asset_type(ticker)
+    with HTTMock(mock_data.mock_prices):
+        prices = get_daily_price_history(ticker=ticker, start_date=dater.parse(start_date),
+                                         end_date=dater.parse(end_date), asset_type=asset_type)
+        from_dates = statistics.calculate_risk_return(
+            ticker=ticker, start_date=dater.parse(start_date), end_date=dater.parse(end_date), method=method)
+    from_sample = statistics.calculate_risk_return(
+        ticker=ticker, sample_prices=prices, asset_type=asset_type, method=method)
+    ProfileCache.flush()
+
+    assert from_sample == pytest.approx(from_dates)
+    assert not ProfileCache.buffer
+
+
 @pytest.mark.parametrize('ticker,start_date,end_date', [
     ('ALLY', '2021-11-12', '2021-11-12'),
     ('BX', '2021-11-06', '2021-11-08')
@@ -85,3 +162,134 @@ def test_standardized_sample_of_returns(ticker, start_date, end_date):
     assert all(isinstance(this_return, float) for this_return in these_returns)
     # subtract one because differencing price history loses one sample
     assert len(these_returns) == no_of_days - 1
+
+
+@pytest.mark.parametrize('tickers,start_date,end_date', [
+    (['SPY', 'DIS'], '2020-01-06', '2020-03-13'),
+    (['SPY', 'DIS', 'ALGO'], '2020-01-06', '2020-03-13'),
+    (['BTC', 'ALGO'], '2021-03-10', '2021-04-12')
+])
+def test_moment_correlation_matrix_matches_pairwise_calculation(tickers, start_date, end_date):
+    start_date, end_date = dater.parse(start_date), dater.parse(end_date)
+    with HTTMock(mock_data.mock_prices):
+        matrix = statistics.correlation_matrix(
+            tickers=tickers, start_date=start_date, end_date=end_date)
+        cached_matrix = statistics.correlation_matrix(
+            tickers=tickers, start_date=start_date, end_date=end_date)
+        clear_cache(mode='sqlite')
+        ProfileCache(mode='sqlite'), CorrelationCache(mode='sqlite')
+        for i, j in [(i, j) for i in range(len(tickers)) for j in range(i+1, len(tickers))]:
+            correlation = statistics.calculate_correlation(ticker_1=tickers[i], ticker_2=tickers[j],
+                                                           start_date=start_date, end_date=end_date)
+            assert matrix[i][j] == matrix[j][i] == pytest.approx(
+                correlation[keys['STATISTICS']['CORRELATION']])
+    assert all(cached_row == pytest.approx(row)
+               for cached_row, row in zip(cached_matrix, matrix))
+    assert all(matrix[i][i] == 1 for i in range(len(tickers)))
+
+
+@pytest.mark.parametrize('method', [keys['ESTIMATION']['MOMENT'], keys['ESTIMATION']['PERCENT']])
+def test_correlation_matrix_with_shorter_history_matches_pairwise_calculation(method, monkeypatch):
+    tickers, start_date, end_date = ['SPY', 'DIS', 'ALGO'], dater.parse('2020-01-06'), dater.parse('2020-03-13')
+    price_history = statistics.services.get_daily_price_history
+
+    def shorter_history(ticker, *args, **kwargs):
+        prices = price_history(ticker, *args, **kwargs)
+        if ticker == 'ALGO':
+            return {this_date: price for this_date, price in prices.items() if this_date >= '2020-02-03'}
+        return prices
+
+    monkeypatch.setattr(statistics.services, 'get_daily_price_history', shorter_history)
+    # NOTE: the in-memory tiers outlive `clear_cache` and would otherwise hold statistics
+    #       calculated over the full histories by other tests.
+    monkeypatch.setattr(ProfileCache, 'internal_cache', cache.MemoryCache())
+    monkeypatch.setattr(CorrelationCache, 'internal_cache', cache.MemoryCache())
+    with HTTMock(mock_data.mock_prices):
+        matrix = statistics.correlation_matrix(
+            tickers=tickers, start_date=start_date, end_date=end_date, method=method)
+        cached = statistics.calculate_correlation(ticker_1='SPY', ticker_2='DIS', start_date=start_date,
+                                                  end_date=end_date, method=method)
+        clear_cache(mode='sqlite')
+        CorrelationCache.internal_cache.clear()
+        ProfileCache(mode='sqlite'), CorrelationCache(mode='sqlite')
+        for i, j in [(0, 1), (0, 2), (1, 2)]:
+            correlation = statistics.calculate_correlation(ticker_1=tickers[i], ticker_2=tickers[j],
+                                                           start_date=start_date, end_date=end_date,
+                                                           method=method)
+            assert matrix[i][j] == matrix[j][i] == pytest.approx(
+                correlation[keys['STATISTICS']['CORRELATION']])
+            if (i, j) == (0, 1):
+                assert cached == pytest.approx(correlation)
+
+
+@pytest.mark.parametrize('ticker_1,ticker_2,start_date,end_date', [
+    ('SPY', 'DIS', '2020-06-01', '2020-06-19'),
+    ('BTC', 'ALGO', '2021-04-01', '2021-04-12'),
+    ('SPY', 'BTC', '2021-03-01', '2021-03-12')
+])
+def test_moment_correlation_series_matches_daily_calculation(ticker_1, ticker_2, start_date, end_date):
+    with HTTMock(mock_data.mock_prices):
+        series = statistics.calculate_moment_correlation_series(ticker_1=ticker_1, ticker_2=ticker_2,
+                                                                start_date=start_date, end_date=end_date)
+        cached_series = statistics.calculate_moment_correlation_series(ticker_1=ticker_1, ticker_2=ticker_2,
+                                                                       start_date=start_date, end_date=end_date)
+        clear_cache(mode='sqlite')
+        ProfileCache(mode='sqlite'), CorrelationCache(mode='sqlite')
+        for this_date, correlation in series.items():
+            daily = statistics._calculate_moment_correlation(ticker_1=ticker_1, ticker_2=ticker_2,
+                                                             end_date=dater.parse(this_date))
+            assert correlation == pytest.approx(
+                daily[keys['STATISTICS']['CORRELATION']])
+    assert cached_series == pytest.approx(series)
+
+
+@pytest.mark.parametrize('tickers,start_date,end_date', [
+    (['SPY', 'DIS', 'ALGO'], '2020-01-06', '2020-03-13'),
+    (['BTC', 'ALGO'], '2021-03-10', '2021-04-12')
+])
+@pytest.mark.parametrize('method,tolerance', [
+    (keys['ESTIMATION']['MOMENT'], 1e-6),
+    (keys['ESTIMATION']['PERCENT'], 1e-6),
+    (keys['ESTIMATION']['LIKE'], 1e-6)
+])
+def test_risk_returns_match_single_ticker_calculation(tickers, start_date, end_date, method, tolerance):
+    start_date, end_date = dater.parse(start_date), dater.parse(end_date)
+    with HTTMock(mock_data.mock_prices):
+        profiles = statistics.calculate_risk_returns(
+            tickers=tickers, start_date=start_date, end_date=end_date, method=method)
+        cached_profiles = statistics.calculate_risk_returns(
+            tickers=tickers, start_date=start_date, end_date=end_date, method=method)
+        clear_cache(mode='sqlite')
+        PriceCache(mode='sqlite'), ProfileCache(mode='sqlite')
+        for ticker in tickers:
+            profile = statistics.calculate_risk_return(ticker=ticker, start_date=start_date,
+                                                       end_date=end_date, method=method)
+            assert profiles[ticker] == pytest.approx(profile, rel=tolerance)
+    assert list(profiles) == tickers
+    assert all(cached_profiles[ticker] == pytest.approx(profiles[ticker])
+               for ticker in tickers)
+
+
+@pytest.mark.parametrize('tickers,start_date,end_date', [
+    (['SPY', 'DIS', 'ALGO'], '2020-01-06', '2020-03-13'),
+    (['BTC', 'ALGO'], '2021-03-10', '2021-04-12')
+])
+def test_percentile_correlation_matrix_matches_pairwise_calculation(tickers, start_date, end_date):
+    start_date, end_date = dater.parse(start_date), dater.parse(end_date)
+    method = keys['ESTIMATION']['PERCENT']
+    with HTTMock(mock_data.mock_prices):
+        matrix = statistics.correlation_matrix(
+            tickers=tickers, start_date=start_date, end_date=end_date, method=method)
+        cached_matrix = statistics.correlation_matrix(
+            tickers=tickers, start_date=start_date, end_date=end_date, method=method)
+        clear_cache(mode='sqlite')
+        ProfileCache(mode='sqlite'), CorrelationCache(mode='sqlite')
+        for i, j in [(i, j) for i in range(len(tickers)) for j in range(i+1, len(tickers))]:
+            correlation = statistics.calculate_correlation(ticker_1=tickers[i], ticker_2=tickers[j],
+                                                           start_date=start_date, end_date=end_date,
+                                                           method=method)
+            assert -1 < matrix[i][j] < 1
+            assert matrix[i][j] == matrix[j][i] == pytest.approx(
+                correlation[keys['STATISTICS']['CORRELATION']])
+    assert all(cached_row == pytest.approx(row)
+               for cached_row, row in zip(cached_matrix, matrix))
@@ -1,4 +1,6 @@
 import pytest
+import numpy
+from scipy.optimize import approx_fprime
 
 from scrilla import settings as scrilla_settings
 from scrilla.cache import PriceCache, ProfileCache, InterestCache, CorrelationCache
@@ -84,3 +86,39 @@ def test_asset_groups(tickers, groups):
             test_portfolio = Portfolio(
                 tickers=tickers, start_date=test_settings.START, end_date=test_settings.END)
     assert(test_portfolio.asset_groups == groups)
+
+
+@pytest.mark.parametrize('gradient_case', [
+    'volatility', 'sharpe_ratio', 'return', 'conditional_value_at_risk'
+])
+def test_analytic_gradients_match_finite_differences(portfolios, gradient_case):
+    for portfolio in portfolios:
+        portfolio.risk_free_rate = 0.02
+        x = numpy.random.default_rng(
+            len(portfolio.tickers)).dirichlet(numpy.ones(len(portfolio.tickers)))
+        if gradient_case == 'conditional_value_at_risk':
+            function = lambda x: portfolio.conditional_value_at_risk_function(
+                x, 0.5, 0.05)
+            gradient = lambda x: portfolio.conditional_value_at_risk_gradient(
+                x, 0.5, 0.05)
+        else:
+            function = getattr(portfolio, f'{gradient_case}_function')
+            gradient = getattr(portfolio, f'{gradient_case}_gradient')
+        assert gradient(x) == pytest.approx(
+            approx_fprime(x, function, 1e-8), abs=1e-5)
+
+
+def test_batch_functions_match_single_allocation(portfolios):
+    for portfolio in portfolios:
+        allocations = numpy.random.default_rng(len(portfolio.tickers)).dirichlet(
+            numpy.ones(len(portfolio.tickers)), size=25)
+        assert portfolio.covariance.shape == (
+            len(portfolio.tickers), len(portfolio.tickers))
+        assert portfolio.batch_return_function(allocations) == pytest.approx(
+            [portfolio.return_function(x) for x in allocations])
+        assert portfolio.batch_volatility_function(allocations) == pytest.approx(
+            [portfolio.volatility_function(x) for x in allocations])
+        assert portfolio.batch_sharpe_ratio_function(allocations) == pytest.approx(
+            [portfolio.sharpe_ratio_function(x) for x in allocations])
+        assert portfolio.batch_conditional_value_at_risk_function(allocations, 0.5, 0.05) == pytest.approx(
+            [portfolio.conditional_value_at_risk_function(x, 0.5, 0.05) for x in allocations])
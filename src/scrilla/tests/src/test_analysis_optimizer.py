@@ -1 +1,81 @@
-# mock portfolios. don't need to calculate statistics with prices, just input returns and vols to verify optimization works.
\ No newline at end of file
+# mock portfolios. don't need to calculate statistics with prices, just input returns and vols to verify optimization works.
+
+import pytest
+import numpy
+
+from httmock import HTTMock
+
+from scrilla.analysis import estimators, optimizer
+from scrilla.analysis.objects.portfolio import Portfolio
+
+from .. import mock_data
+from .. import settings
+
+
+@pytest.mark.parametrize("x", [(mock_data.univariate_data[datum]) for datum in mock_data.univariate_data])
+def test_univariate_likelihood_closed_form_is_maximum(x):
+    estimates = optimizer.maximize_univariate_normal_likelihood(x)
+    maximum = estimators.univariate_normal_likelihood_function(estimates, x)
+    assert estimates == pytest.approx([numpy.mean(x), numpy.std(x)])
+    for perturbation in [[0.1, 0], [-0.1, 0], [0, 0.1], [0, -0.1]]:
+        assert maximum > estimators.univariate_normal_likelihood_function(
+            numpy.add(estimates, perturbation), x)
+
+@pytest.mark.parametrize("x,y", [(mock_data.bivariate_data[datum]) for datum in mock_data.bivariate_data])
+def test_bivariate_likelihood_closed_form_matches_sample_correlation(x, y):
+    estimates = optimizer.maximize_bivariate_normal_likelihood(
+        [[x_obs, y[i]] for i, x_obs in enumerate(x)])
+    assert estimates[:2] == pytest.approx([numpy.mean(x), numpy.mean(y)])
+    assert estimates[4]/numpy.sqrt(estimates[2]*estimates[3]) == pytest.approx(
+        estimators.sample_correlation(x, y))
+
+
+@pytest.fixture()
+def mock_portfolio():
+    tickers = ['ALLY', 'DIS', 'BX', 'SPY', 'GLD', 'AAPL', 'MSFT', 'AMZN']
+    rng = numpy.random.default_rng(23)
+    factors = rng.normal(size=(len(tickers), len(tickers) + 4))
+    covariance = factors @ factors.T
+    scale = numpy.sqrt(numpy.diag(covariance))
+    profiles = {ticker: {'annual_return': rng.normal(0.1, 0.1), 'annual_volatility': rng.uniform(0.1, 0.5)}
+                for ticker in tickers}
+    with HTTMock(mock_data.mock_prices):
+        return Portfolio(tickers=tickers, start_date=settings.START, end_date=settings.END,
+                         risk_profiles=profiles,
+                         correl_matrix=(covariance/numpy.outer(scale, scale)).tolist())
+
+
+def test_critical_line_frontier_is_optimal(mock_portfolio):
+    frontier = optimizer.calculate_efficient_frontier(
+        portfolio=mock_portfolio, steps=8, critical_line=True)
+    assert len(frontier) == 8
+    for allocation in frontier:
+        assert sum(allocation) == pytest.approx(1)
+        assert all(0 <= weight <= 1 for weight in allocation)
+        target_return = mock_portfolio.return_function(allocation)
+        optimized = optimizer.optimize_portfolio_variance(portfolio=mock_portfolio, target_return=target_return,
+                                                          init_guess=allocation)
+        assert mock_portfolio.volatility_function(allocation) <= \
+            mock_portfolio.volatility_function(optimized) + 1e-6
+    assert mock_portfolio.volatility_function(frontier[0]) <= \
+        mock_portfolio.volatility_function(
+            optimizer.optimize_portfolio_variance(mock_portfolio)) + 1e-8
+
+
+def test_warm_started_frontier_matches_critical_line(mock_portfolio):
+    frontier = optimizer.calculate_efficient_frontier(
+        portfolio=mock_portfolio, steps=6)
+    exact = optimizer.calculate_efficient_frontier(
+        portfolio=mock_portfolio, steps=6, critical_line=True)
+    assert [mock_portfolio.volatility_function(allocation) for allocation in frontier] == pytest.approx(
+        [mock_portfolio.volatility_function(allocation) for allocation in exact], abs=1e-4)
+
+
+def test_frontier_over_process_pool_matches_sequential(mock_portfolio):
+    frontier = optimizer.calculate_efficient_frontier(
+        portfolio=mock_portfolio, steps=6)
+    parallel = optimizer.calculate_efficient_frontier(
+        portfolio=mock_portfolio, steps=6, processes=2)
+    assert len(parallel) == len(frontier)
+    assert [mock_portfolio.volatility_function(allocation) for allocation in parallel] == pytest.approx(
+        [mock_portfolio.volatility_function(allocation) for allocation in frontier], abs=1e-6)
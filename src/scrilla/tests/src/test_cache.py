@@ -1,8 +1,11 @@
 import pytest
+import sqlite3
 
+from scrilla import settings
 from scrilla.static import keys, config
-from scrilla.cache import CorrelationCache, PriceCache, InterestCache, ProfileCache
+from scrilla.cache import save_statistics, saved_statistics, Cache, Connection, CorrelationCache, CoverageIndex, InternalCache, MemoryCache, Migrations, PriceCache, WriteBehind, InterestCache, ProfileCache
 from scrilla.files import clear_cache
+from scrilla import services
 from scrilla.services import get_daily_price_history, get_daily_interest_history
 from scrilla.util import dater
 
@@ -29,6 +32,7 @@ def mock_aws():
 
 @pytest.fixture(autouse=True)
 def reset_cache():
+    ProfileCache.buffer.clear()
     clear_cache(mode='sqlite')
     PriceCache(mode='sqlite')._table()
     InterestCache(mode='sqlite')._table()
@@ -108,23 +112,11 @@ def test_sqlite_interest_cache(maturity, date, yield_rate, sqlite_interest_cache
             'a': 1,
             'b': 2
         },
-        "UPDATE profile SET a=:a,b=:b WHERE ticker=:ticker AND start_date=:start_date AND end_date=:end_date AND method=:method AND weekends=:weekends"
+        "INSERT INTO profile (ticker, start_date, end_date, method, weekends, a, b) VALUES (:ticker, :start_date, :end_date, :method, :weekends, :a, :b) ON CONFLICT (ticker, start_date, end_date, method, weekends) DO UPDATE SET a=excluded.a, b=excluded.b"
     )
 ])
-def test_profile_cache_construct_update_query(params, expected):
-    assert ProfileCache._construct_update(params) == expected
-
-@pytest.mark.parametrize('params,expected',[
-    (
-        {
-            'a': 1,
-            'b': 2
-        },
-        "INSERT INTO profile (a,b) VALUES (:a,:b)"
-    )
-])
-def test_profile_cache_construct_insert_query(params, expected):
-    assert ProfileCache._construct_insert(params) == expected
+def test_profile_cache_construct_upsert_query(params, expected):
+    assert ProfileCache._construct_upsert(params) == expected
 
 
 @pytest.mark.parametrize('ticker,prices,expected',
@@ -159,7 +151,7 @@ def test_price_cache_to_dict_dynamodb(results, expected):
 @pytest.mark.parametrize('ticker,prices,expected', 
     [mock_data.price_internal_cache_case])
 def test_price_internal_cache_save_hook(prices, ticker, expected, sqlite_price_cache):
-    with patch('scrilla.cache.sqlite3'):
+    with patch.object(Connection, 'get'):
         sqlite_price_cache.save_rows(ticker, prices)
         for index, date in enumerate(prices.keys()):
             real_date = dater.parse(date)
@@ -168,7 +160,7 @@ def test_price_internal_cache_save_hook(prices, ticker, expected, sqlite_price_c
 @pytest.mark.parametrize('rates,expected', 
     [mock_data.interest_internal_cache_case])
 def test_interest_internal_cache_save_hook(rates, expected, sqlite_interest_cache):
-    with patch('scrilla.cache.sqlite3'):
+    with patch.object(Connection, 'get'):
         sqlite_interest_cache.save_rows(rates)
         for date_index, date in enumerate(rates.keys()):
             real_date = dater.parse(date)
@@ -180,8 +172,8 @@ def test_interest_internal_cache_save_hook(rates, expected, sqlite_interest_cach
 @pytest.mark.parametrize('ticker,prices,expected,query_results', 
     [mock_data.price_internal_cache_case_query_results])
 def test_price_internal_cache_update_hook(ticker, prices, expected, query_results, sqlite_price_cache):
-    with patch('scrilla.cache.sqlite3') as mocksqlite:
-        mocksqlite.connect().cursor().execute().fetchall.return_value = query_results
+    with patch.object(Connection, 'get') as mockconnection:
+        mockconnection.return_value.cursor().execute().fetchall.return_value = query_results
         for index, date in enumerate(prices.keys()):
             start_date = dater.parse(date)
             sqlite_price_cache.filter(ticker, start_date, start_date)
@@ -191,8 +183,8 @@ def test_price_internal_cache_update_hook(ticker, prices, expected, query_result
 @pytest.mark.parametrize('maturity,rates,expected,query_results', 
     [mock_data.interest_internal_cache_case_query_results])
 def test_interest_internal_cache_update_hook(maturity, rates, expected, query_results, sqlite_interest_cache):
-    with patch('scrilla.cache.sqlite3') as mocksqlite:
-        mocksqlite.connect().cursor().execute().fetchall.return_value = query_results
+    with patch.object(Connection, 'get') as mockconnection:
+        mockconnection.return_value.cursor().execute().fetchall.return_value = query_results
         for index, date in enumerate(rates.keys()):
             start_date = dater.parse(date)
             sqlite_interest_cache.filter(maturity, start_date, start_date)
@@ -201,6 +193,292 @@ def test_interest_internal_cache_update_hook(maturity, rates, expected, query_re
 
 # TODO: update and save hook tests for profile and correlation cache
 
+def test_coverage_index_uncovered_ranges():
+    index = CoverageIndex()
+    index.update({'2021-11-10': 1, '2021-11-08': 2})
+    index.update({'2021-11-15': 3}, '2021-11-12', '2021-11-16')
+    assert index.intervals == [(dater.parse('2021-11-08'), dater.parse('2021-11-10')),
+                               (dater.parse('2021-11-12'), dater.parse('2021-11-16'))]
+    assert index.uncovered('2021-11-09', '2021-11-15') == [(dater.parse('2021-11-11'), dater.parse('2021-11-11'))]
+    assert index.uncovered('2021-11-01', '2021-11-20') == [(dater.parse('2021-11-01'), dater.parse('2021-11-07')),
+                                                           (dater.parse('2021-11-11'), dater.parse('2021-11-11')),
+                                                           (dater.parse('2021-11-17'), dater.parse('2021-11-20'))]
+    index.cover('2021-11-11', '2021-11-11')
+    assert index.covers('2021-11-08', '2021-11-16')
+    assert list(index.slice('2021-11-09', '2021-11-16')) == ['2021-11-15', '2021-11-10']
+
+def test_internal_cache_evicts_least_recently_used():
+    internal_cache = InternalCache(max_rows=4)
+    internal_cache.update('ALLY', {'2021-11-10': 1, '2021-11-11': 2})
+    internal_cache.update('BX', {'2021-11-10': 1, '2021-11-11': 2})
+    internal_cache.get('ALLY')
+    internal_cache.update('SPY', {'2021-11-10': 1})
+    assert 'BX' not in internal_cache
+    assert 'ALLY' in internal_cache and 'SPY' in internal_cache
+    assert internal_cache.rows == 3
+
+def test_internal_cache_evicts_by_size_and_counts_lookups():
+    internal_cache = InternalCache(max_bytes=3000)
+    internal_cache.update('ALLY', {f'2021-11-{day:02d}': {'open': 1.0, 'close': 2.0} for day in range(1, 6)})
+    assert internal_cache.uncovered('ALLY', '2021-11-01', '2021-11-05') == []
+    assert internal_cache.uncovered('BX', '2021-11-01', '2021-11-05') != []
+    internal_cache.update('BX', {f'2021-11-{day:02d}': {'open': 1.0, 'close': 2.0} for day in range(1, 6)})
+    assert 'ALLY' not in internal_cache and 'BX' in internal_cache
+    stats = internal_cache.statistics()
+    assert stats['bytes'] <= 3000 and stats['peak_bytes'] > 3000
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1)
+
+
+def test_memory_cache_expires_and_evicts(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr('scrilla.cache.time.monotonic', lambda: clock[0])
+    memory_cache = MemoryCache(max_bytes=1000, ttl=60)
+    memory_cache.put('ALLY', {'correlation': 0.5})
+    assert memory_cache.get('ALLY') == {'correlation': 0.5}
+    clock[0] = 61
+    assert memory_cache.get('ALLY') is None
+    for ticker in ('BX', 'SPY', 'DIS', 'GLD', 'QQQ'):
+        memory_cache.put(ticker, {'correlation': 0.5})
+    stats = memory_cache.statistics()
+    assert stats['bytes'] <= 1000 and 'QQQ' in memory_cache and 'BX' not in memory_cache
+    assert (stats['hits'], stats['misses'], stats['expirations']) == (1, 1, 1)
+    assert stats['evictions'] > 0
+
+
+def test_save_statistics_accumulates_runs(monkeypatch):
+    memory = {}
+    monkeypatch.setattr('scrilla.cache.files.get_memory_json', lambda: memory)
+    monkeypatch.setattr('scrilla.cache.files.save_memory_json', lambda persist: None)
+    monkeypatch.setattr(ProfileCache, 'internal_cache', MemoryCache())
+    ProfileCache.internal_cache.get('SPY')
+    ProfileCache.internal_cache.put('SPY', {'annual_return': 0.1})
+    ProfileCache.internal_cache.get('SPY')
+    save_statistics()
+    save_statistics()
+    saved = saved_statistics()['profile']
+    assert (saved['runs'], saved['hits'], saved['misses']) == (2, 2, 2)
+    assert saved['hit_rate'] == 0.5
+    assert saved['max_bytes'] == ProfileCache.internal_cache.max_bytes
+
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_price_filter_only_queries_uncovered_ranges(ticker, prices, expected, sqlite_price_cache, monkeypatch):
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    dates = sorted(prices)
+    sqlite_price_cache.save_rows(ticker, {date: prices[date] for date in dates[1:]})
+    sqlite_price_cache.internal_cache.clear()
+    sqlite_price_cache.filter(ticker, dates[1], dates[-1])
+    with patch.object(Connection, 'get') as mockconnection:
+        mockconnection.return_value.cursor().execute().fetchall.return_value = []
+        mockconnection.reset_mock()
+        assert list(sqlite_price_cache.filter(ticker, dates[1], dates[-1])) == dates[:0:-1]
+        assert not mockconnection.called
+        sqlite_price_cache.filter(ticker, dates[0], dates[-1])
+        assert mockconnection.called
+    assert sqlite_price_cache.internal_cache.get(ticker).covers(dates[0], dates[-1])
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_price_filter_many_matches_filter(ticker, prices, expected, sqlite_price_cache, monkeypatch):
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    dates = sorted(prices)
+    sqlite_price_cache.save_rows(ticker, prices)
+    sqlite_price_cache.save_rows('BX', {date: prices[date] for date in dates[1:]})
+    sqlite_price_cache.internal_cache.clear()
+    expected_prices = {symbol: sqlite_price_cache.filter(symbol, dates[0], dates[-1]) 
+                        for symbol in (ticker, 'BX')}
+    sqlite_price_cache.internal_cache.clear()
+    with patch.object(Cache, 'execute', wraps=Cache.execute) as mockexecute:
+        results = sqlite_price_cache.filter_many([ticker, 'BX', 'SPY'], dates[0], dates[-1])
+        assert mockexecute.call_count == 1
+    assert results == {**expected_prices, 'SPY': None}
+    assert list(results['BX']) == dates[:0:-1]
+
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_price_filter_many_failed_partition_falls_back_to_service(ticker, prices, expected, sqlite_price_cache, monkeypatch):
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    monkeypatch.setattr(sqlite_price_cache, 'mode', 'dynamodb')
+    monkeypatch.setattr(PriceCache, 'save_many', lambda self, prices: None)
+    dates = sorted(prices)
+    start_date, end_date = dater.parse(dates[0]), dater.parse(dates[-1])
+    with patch('scrilla.cache.aws.dynamo_statements', return_value=[RuntimeError('throttled')]):
+        assert sqlite_price_cache.filter_many([ticker], start_date, end_date) == {ticker: None}
+        assert not sqlite_price_cache.internal_cache.get(ticker).covers(start_date, end_date)
+
+    with patch('scrilla.cache.aws.dynamo_statements', side_effect=lambda query, formatters, max_workers: [RuntimeError('throttled') for _ in formatters]), \
+            patch.object(services.price_manager, 'get_prices_many', return_value={ticker: prices}) as mockservice:
+        histories = services.get_daily_price_histories([ticker], start_date, end_date)
+    assert ticker in mockservice.call_args[0][0]
+    assert histories[ticker]
+
+def test_profile_cache_coalesces_buffered_statistics(sqlite_profile_cache, monkeypatch):
+    monkeypatch.setattr(ProfileCache, 'internal_cache', MemoryCache())
+    start_date, end_date = dater.parse('2021-01-04'), dater.parse('2021-03-31')
+    with patch.object(Cache, 'execute', wraps=Cache.execute) as mockexecute:
+        for statistic in ({'annual_return': 0.1}, {'sharpe_ratio': 0.5}, {'asset_beta': 1.2}):
+            sqlite_profile_cache.save_or_update_row(ticker='SPY', start_date=start_date, end_date=end_date,
+                                                    method='moments', **statistic)
+        assert not mockexecute.called
+        ProfileCache.flush()
+        assert mockexecute.call_count == 1
+
+    sqlite_profile_cache.save_or_update_row(ticker='SPY', start_date=start_date, end_date=end_date,
+                                            annual_return=0.2, method='moments')
+    sqlite_profile_cache.internal_cache.clear()
+    profile = sqlite_profile_cache.filter('SPY', start_date, end_date, method='moments')
+    assert Connection.get().execute('SELECT COUNT(*) FROM profile').fetchone()[0] == 1
+    assert profile['annual_return'] == 0.2
+    assert profile['sharpe_ratio'] == 0.5
+    assert profile['asset_beta'] == 1.2
+
+
+def test_profile_cache_keeps_buffer_when_write_fails(sqlite_profile_cache):
+    start_date, end_date = dater.parse('2021-01-04'), dater.parse('2021-03-31')
+    for ticker in ('SPY', 'ALLY'):
+        sqlite_profile_cache.save_or_update_row(ticker=ticker, start_date=start_date, end_date=end_date,
+                                                annual_return=0.1, method='moments')
+    with patch.object(Cache, 'write_many', side_effect=sqlite3.OperationalError('database is locked')):
+        ProfileCache.flush()
+    assert len(ProfileCache.buffer) == 2
+
+    ProfileCache.flush()
+    assert not ProfileCache.buffer
+    assert Connection.get().execute('SELECT COUNT(*) FROM profile').fetchone()[0] == 2
+
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_write_behind_commits_queued_writes_together(ticker, prices, expected, sqlite_price_cache, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_WRITE_BEHIND', True)
+    monkeypatch.setitem(config.write_behind_conf, 'linger', 5)
+    before = Connection.statistics()['commits']
+    for symbol in (ticker, 'BX', 'SPY'):
+        sqlite_price_cache.save_rows(symbol, prices)
+    WriteBehind.flush()
+    assert Connection.statistics()['commits'] == before + 1
+    assert Connection.get().execute('SELECT COUNT(*) FROM prices').fetchone()[0] == 3*len(prices)
+
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_write_behind_writes_synchronously_in_transaction(ticker, prices, expected, sqlite_price_cache, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_WRITE_BEHIND', True)
+    with pytest.raises(RuntimeError):
+        with Connection.transaction():
+            sqlite_price_cache.save_rows(ticker, prices)
+            raise RuntimeError
+    WriteBehind.flush()
+    assert Connection.get().execute('SELECT COUNT(*) FROM prices').fetchone()[0] == 0
+
+
+def test_connection_reuse():
+    con1 = Connection.get()
+    con2 = Connection.get()
+    assert con1 is con2
+    assert con1.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+def test_connection_reopens_after_clear(sqlite_price_cache):
+    con1 = Connection.get()
+    clear_cache(mode='sqlite')
+    sqlite_price_cache._table()
+    assert Connection.get() is not con1
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_connection_transaction_rollback(ticker, prices, expected, sqlite_price_cache):
+    with pytest.raises(RuntimeError):
+        with Connection.transaction():
+            sqlite_price_cache.save_rows(ticker, prices)
+            raise RuntimeError
+    assert Connection.get().execute('SELECT COUNT(*) FROM prices').fetchone()[0] == 0
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_failed_execute_rolls_back_partial_batch(ticker, prices, expected, sqlite_price_cache):
+    params = PriceCache._to_params(ticker, prices)
+    params.append({'ticker': ticker})
+    with pytest.raises(sqlite3.ProgrammingError):
+        Cache.execute(sqlite_price_cache.sqlite_insert_row_transaction, params, mode='sqlite')
+    Cache.execute('SELECT 1', mode='sqlite')
+    Connection.commit(Connection.get())
+    assert Connection.get().execute('SELECT COUNT(*) FROM prices').fetchone()[0] == 0
+
+@pytest.mark.parametrize('ticker,prices,expected', 
+    [mock_data.price_internal_cache_case])
+def test_connection_transaction_commit(ticker, prices, expected, sqlite_price_cache):
+    before = Connection.statistics()['commits']
+    with Connection.transaction():
+        sqlite_price_cache.save_rows(ticker, prices)
+        sqlite_price_cache.save_rows(ticker, prices)
+    assert Connection.statistics()['commits'] == before + 1
+    assert Connection.get().execute('SELECT COUNT(*) FROM prices').fetchone()[0] == len(prices)
+
+def test_migrations_upgrade_legacy_cache(monkeypatch):
+    clear_cache(mode='sqlite')
+    legacy = sqlite3.connect(settings.CACHE_SQLITE_FILE)
+    for statement in Migrations.migrations[0][1]:
+        legacy.execute(statement)
+    legacy.executemany("INSERT INTO prices (ticker, date, open, close) VALUES (?, ?, ?, ?)",
+                       [('ALLY', '2020-01-10', 51, 53), ('ALLY', '2020-01-09', 50, 11)])
+    legacy.executemany("INSERT INTO correlations (ticker_1, ticker_2, start_date, end_date, correlation, method, weekends) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       [('ALLY', 'BX', '2020-01-01', '2020-06-30', 0.4, 'moments', 0),
+                        ('ALLY', 'BX', '2020-01-01', '2020-06-30', 0.5, 'moments', 0)])
+    legacy.executemany("INSERT INTO profile (ticker, start_date, end_date, annual_return, sharpe_ratio, method, weekends) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       [('ALLY', '2020-01-01', '2020-06-30', 0.1, None, 'moments', 0),
+                        ('ALLY', '2020-01-01', '2020-06-30', None, 0.5, 'moments', 0)])
+    legacy.commit()
+    legacy.close()
+
+    con = Connection.get()
+    assert Migrations.version(con) == Migrations.migrations[-1][0]
+    assert con.execute('SELECT COUNT(*) FROM correlations').fetchone()[0] == 1
+    assert con.execute('SELECT COUNT(*) FROM profile').fetchone()[0] == 1
+
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    monkeypatch.setattr(CorrelationCache, 'internal_cache', MemoryCache())
+    monkeypatch.setattr(ProfileCache, 'internal_cache', MemoryCache())
+    start_date, end_date = dater.parse('2020-01-01'), dater.parse('2020-06-30')
+    assert list(PriceCache(mode='sqlite').filter('ALLY', '2020-01-01', '2020-01-31')) == ['2020-01-10', '2020-01-09']
+    assert CorrelationCache(mode='sqlite').filter('BX', 'ALLY', start_date, end_date, 0, 'moments')['correlation'] == 0.5
+    profile = ProfileCache(mode='sqlite').filter('ALLY', start_date, end_date, method='moments')
+    assert profile['annual_return'] == 0.1 and profile['sharpe_ratio'] == 0.5
+
+
+@pytest.mark.parametrize('query', [
+    PriceCache.sqlite_price_query,
+    InterestCache.sqlite_interest_query,
+    CorrelationCache.sqlite_correlation_query,
+    CorrelationCache.sqlite_correlation_series_query,
+    ProfileCache.sqlite_profile_query
+])
+def test_cache_queries_search_primary_key(query):
+    params = {'ticker': 'ALLY', 'ticker_1': 'ALLY', 'ticker_2': 'BX', 'maturity': 'ONE_YEAR',
+              'start_date': 737425, 'end_date': 737606, 'method': 'moments', 'weekends': 0}
+    plan = ' '.join(row[-1] for row in Connection.get().execute(f'EXPLAIN QUERY PLAN {query}', params))
+    assert 'SEARCH' in plan and 'PRIMARY KEY' in plan
+
+
+def test_correlation_save_row_does_not_duplicate(sqlite_correlation_cache):
+    start_date, end_date = dater.parse('2020-01-01'), dater.parse('2020-06-30')
+    for correlation in (0.4, 0.5):
+        sqlite_correlation_cache.save_row('ALLY', 'BX', start_date, end_date, correlation, 0, 'moments')
+    assert Connection.get().execute('SELECT COUNT(*) FROM correlations').fetchone()[0] == 2
+
+
+def test_correlation_filter_series_reads_series_in_one_query(sqlite_correlation_cache):
+    periods = [(dater.parse('2020-01-01'), dater.parse('2020-06-30')),
+               (dater.parse('2020-01-02'), dater.parse('2020-07-01')),
+               (dater.parse('2019-12-31'), dater.parse('2020-06-29'))]
+    sqlite_correlation_cache.save_series('ALLY', 'BX', {period: 0.1*i for i, period in enumerate(periods)},
+                                         0, 'moments')
+    with patch.object(Cache, 'execute', wraps=Cache.execute) as mockexecute:
+        series = sqlite_correlation_cache.filter_series('BX', 'ALLY', periods[0][0], periods[1][1], 0, 'moments')
+        assert mockexecute.call_count == 1
+    assert series == pytest.approx({periods[0]: 0.0, periods[1]: 0.1})
+
 def test_dynamodb_table_creation(dynamodb_price_cache, dynamodb_profile_cache, dynamodb_correlation_cache, dynamodb_interest_cache):
     dynamo_tables = boto3.client('dynamodb').list_tables()['TableNames']
     table_names = [
@@ -230,4 +508,21 @@ def test_profile_cache_singularity():
 def test_correlation_cache_singularity():
     cache1 = CorrelationCache(mode='sqlite')
     cache2 = CorrelationCache(mode='sqlite')
-    assert cache1.uuid == cache2.uuid
\ No newline at end of file
+    assert cache1.uuid == cache2.uuid
+
+def test_profile_cache_save_many_inserts_then_updates(sqlite_profile_cache):
+    start_date, end_date = dater.parse('2021-01-04'), dater.parse('2021-03-31')
+    sqlite_profile_cache.save_or_update_row(ticker='SPY', start_date=start_date, end_date=end_date,
+                                            sharpe_ratio=0.5, method='moments')
+    sqlite_profile_cache.save_many({'SPY': {'annual_return': 0.1, 'annual_volatility': 0.2},
+                                    'DIS': {'annual_return': 0.3, 'annual_volatility': 0.4}},
+                                   start_date=start_date, end_date=end_date, method='moments')
+    sqlite_profile_cache.internal_cache.clear()
+
+    profiles = sqlite_profile_cache.filter_many(['SPY', 'DIS', 'ALLY'], start_date=start_date,
+                                                end_date=end_date, method='moments')
+    assert Connection.get().execute('SELECT COUNT(*) FROM profile').fetchone()[0] == 2
+    assert set(profiles) == {'SPY', 'DIS'}
+    assert profiles['SPY']['annual_return'] == 0.1
+    assert profiles['SPY']['sharpe_ratio'] == 0.5
+    assert profiles['DIS']['annual_volatility'] == 0.4
@@ -238,3 +238,28 @@ def test_dynamo_table_duplication(table_conf):
     assert isinstance(first, dict)
     assert first['TableDescription']['TableName'] == table_conf['TableName']
     assert isinstance(second, ClientError)
+
+
+@mock_dynamodb
+def test_dynamo_update_item_creates_then_updates(singleton_table_conf):
+    aws.dynamo_table(aws.dynamo_table_conf(singleton_table_conf))
+    key = {'ticker': 'ALLY', 'date': '2020-01-10'}
+    aws.dynamo_update_item('prices', key, {'open': 51})
+    aws.dynamo_update_item('prices', key, {'close': 53})
+    item = aws.dynamo_client().get_item(TableName='prices',
+                                        Key={'ticker': {'S': 'ALLY'}, 'date': {'S': '2020-01-10'}})['Item']
+    assert item['open'] == {'N': '51'}
+    assert item['close'] == {'N': '53'}
+
+
+@mock_dynamodb
+def test_dynamo_update_item_does_not_overwrite_other_conditions(singleton_table_conf):
+    aws.dynamo_table(aws.dynamo_table_conf(singleton_table_conf))
+    key = {'ticker': 'ALLY', 'date': '2020-01-10'}
+    aws.dynamo_update_item('prices', key, {'source': 'iex', 'close': 51}, {'source': 'iex'})
+    assert aws.dynamo_update_item('prices', key, {'source': 'alpha', 'close': 53}, {'source': 'alpha'}) is None
+    aws.dynamo_update_item('prices', key, {'source': 'iex', 'open': 50}, {'source': 'iex'})
+    item = aws.dynamo_client().get_item(TableName='prices',
+                                        Key={'ticker': {'S': 'ALLY'}, 'date': {'S': '2020-01-10'}})['Item']
+    assert item['close'] == {'N': '51'}
+    assert item['open'] == {'N': '50'}
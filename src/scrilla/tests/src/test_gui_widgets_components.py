@@ -9,6 +9,7 @@ from scrilla.gui.widgets import components
         'correlation',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': False,
             'end_date': True,
             'expiry': False,
@@ -18,6 +19,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': True,
             'probability': False,
+            'processes': False,
             'start_date': True,
             'steps': False,
             'target': False
@@ -27,6 +29,7 @@ from scrilla.gui.widgets import components
         'discount_dividend',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': True,
             'end_date': False,
             'expiry': False,
@@ -36,6 +39,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': False,
             'probability': False,
+            'processes': False,
             'start_date': False,
             'steps': False,
             'target': False
@@ -45,6 +49,7 @@ from scrilla.gui.widgets import components
         'efficient_frontier',
         {
             'criteria': False,
+            'critical_line': True,
             'discount': False,
             'end_date': True,
             'expiry': False,
@@ -54,6 +59,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': True,
             'probability': False,
+            'processes': True,
             'start_date': True,
             'steps': True,
             'target': True
@@ -63,6 +69,7 @@ from scrilla.gui.widgets import components
         'moving_averages',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': False,
             'end_date': True,
             'expiry': False,
@@ -72,6 +79,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': True,
             'probability': False,
+            'processes': False,
             'start_date': True,
             'steps': False,
             'target': False
@@ -81,6 +89,7 @@ from scrilla.gui.widgets import components
         'optimize_portfolio',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': False,
             'end_date': True,
             'expiry': False,
@@ -90,6 +99,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': True,
             'percentiles': True,
             'probability': False,
+            'processes': False,
             'start_date': True,
             'steps': False,
             'target': True
@@ -99,6 +109,7 @@ from scrilla.gui.widgets import components
         'risk_profile',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': False,
             'end_date': True,
             'expiry': False,
@@ -108,6 +119,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': True,
             'probability': False,
+            'processes': False,
             'start_date': True,
             'steps': False,
             'target': False
@@ -117,6 +129,7 @@ from scrilla.gui.widgets import components
         'yield_curve',
         {
             'criteria': False,
+            'critical_line': False,
             'discount': False,
             'end_date': False,
             'expiry': False,
@@ -126,6 +139,7 @@ from scrilla.gui.widgets import components
             'optimize_sharpe': False,
             'percentiles': False,
             'probability': False,
+            'processes': False,
             'start_date': True,
             'steps': False,
             'target': False
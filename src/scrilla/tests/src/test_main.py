@@ -6,8 +6,9 @@ from httmock import HTTMock
 
 from scrilla import settings as app_settings
 from scrilla.main import do_program
+from scrilla.analysis import optimizer
 from scrilla.cache import PriceCache, ProfileCache, InterestCache, CorrelationCache
-from scrilla.files import clear_cache, init_static_data
+from scrilla.files import clear_cache, init_static_data, get_memory_json
 from scrilla.static import keys, definitions
 from scrilla.util.errors import InputValidationError, ModelError
 
@@ -42,6 +43,18 @@ def test_cli_specific_help_msg(args, capsys):
             assert definition['name'] in help_message
             assert all(val in help_message for val in definition['values'])
 
+def test_cli_cache_stats(monkeypatch, capsys):
+    memory = get_memory_json()
+    memory['statistics'] = {'prices': {'runs': 3, 'hits': 30, 'misses': 10, 'evictions': 2,
+                                       'expirations': 0, 'peak_bytes': 2*1024*1024}}
+    monkeypatch.setattr('scrilla.files.get_memory_json', lambda: memory)
+    do_program(['cache-stats'])
+    output = capsys.readouterr().out
+    for table in ('prices', 'interest', 'correlations', 'profile'):
+        assert f'{table} Memory Tier' in output
+    assert 'hit_rate' in output and '75.0' in output
+    assert '2.00 MiB' in output
+
 @patch('scrilla.files.os.remove')
 def test_cli_clear_cache_sqlite_mode(delete_function):
     do_program(['clear-cache'])
@@ -473,6 +486,25 @@ def test_cli_efficient_frontier_json_format(args, tickers, capsys):
         assert frontier['portfolio_volatility'] > 0
 
 
+@pytest.mark.parametrize('args,critical_line,processes', [
+    (['efficient-frontier', 'ALLY', 'DIS', 'BX', '-start', settings.START_STR, '-end', settings.END_STR,
+        '-json'], False, None),
+    (['efficient-frontier', 'ALLY', 'DIS', 'BX', '-start', settings.START_STR, '-end', settings.END_STR,
+        '-json', '-cla'], True, None),
+    (['efficient-frontier', 'ALLY', 'DIS', 'BX', '-start', settings.START_STR, '-end', settings.END_STR,
+        '-json', '-proc', '2'], False, 2)
+])
+def test_cli_frontier_method_flags(args, critical_line, processes, capsys):
+    with HTTMock(mock_data.mock_prices), \
+         HTTMock(mock_data.mock_treasury), \
+         patch('scrilla.analysis.optimizer.calculate_efficient_frontier',
+               wraps=optimizer.calculate_efficient_frontier) as frontier_function:
+        do_program(args)
+    frontier_function.assert_called_once_with(portfolio=ANY, steps=None, critical_line=critical_line,
+                                              processes=processes)
+    assert len(json.loads(capsys.readouterr().out)) == app_settings.FRONTIER_STEPS
+
+
 @pytest.mark.parametrize('args',[
     (['max-return', 'ALLY', 'BX', 'DIS', '-start', settings.START_STR, '-end', settings.END_STR, '-json']),
 ])
@@ -1,4 +1,7 @@
 import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
 from scrilla import services
 from scrilla.util.errors import validate_dates
@@ -6,7 +9,7 @@ from scrilla.util import dater
 from scrilla.static.keys import keys
 
 from scrilla import settings as scrilla_settings
-from scrilla.cache import PriceCache, InterestCache, ProfileCache
+from scrilla.cache import PriceCache, InterestCache, InternalCache, ProfileCache
 from scrilla.files import clear_cache, init_static_data
 
 from .. import mock_data, settings
@@ -71,4 +74,109 @@ def test_past_interest(maturity, date, yield_rate):
 def test_past_dividend(ticker, date, amount):
     with HTTMock(mock_data.mock_dividends):
         response = services.get_dividend_history(ticker)
-    assert response[date] == amount
\ No newline at end of file
+    assert response[date] == amount
+
+
+@pytest.fixture
+def stub_price_server(monkeypatch):
+    requested = []
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            ticker = parse_qs(urlparse(self.path).query)['symbol'][0]
+            body = mock_data.load_test_file(
+                f'{ticker.lower()}_response.json').encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(services.price_manager, 'url',
+                        f'http://127.0.0.1:{server.server_port}/query')
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    yield requested
+    server.shutdown()
+    server.server_close()
+
+
+def test_price_histories_from_stub_server(stub_price_server):
+    tickers = ['ALLY', 'BX', 'DIS', 'SPY', 'BTC']
+    histories = services.get_daily_price_histories(
+        tickers=tickers, start_date=settings.START, end_date=settings.END)
+    assert list(histories) == tickers
+    assert len(stub_price_server) == len(tickers)
+
+    with HTTMock(mock_data.mock_prices):
+        for ticker in tickers:
+            assert histories[ticker] == services.get_daily_price_history(
+                ticker=ticker, start_date=settings.START, end_date=settings.END)
+
+    # NOTE: second call is served from the cache
+    services.get_daily_price_histories(
+        tickers=tickers, start_date=settings.START, end_date=settings.END)
+    assert len(stub_price_server) == len(tickers)
+
+
+
+@pytest.mark.parametrize('cached_dates,expected', [
+    (None, [('2021-11-08', '2021-11-12')]),
+    (['2021-11-08', '2021-11-09', '2021-11-10', '2021-11-11', '2021-11-12'], []),
+    (['2021-11-08', '2021-11-09', '2021-11-10', '2021-11-11'],
+     [('2021-11-12', '2021-11-12')]),
+    (['2021-11-09', '2021-11-11'], [('2021-11-08', '2021-11-08'),
+                                    ('2021-11-10', '2021-11-10'),
+                                    ('2021-11-12', '2021-11-12')])
+])
+def test_price_gaps(cached_dates, expected):
+    cached_prices = None if cached_dates is None else {
+        this_date: {'open': 1, 'close': 1} for this_date in cached_dates}
+    gaps = services._price_gaps(cached_prices, dater.parse('2021-11-08'), dater.parse('2021-11-12'),
+                                keys['ASSETS']['EQUITY'])
+    assert gaps == [(dater.parse(start), dater.parse(end))
+                    for start, end in expected]
+
+
+def test_price_history_fills_gaps_incrementally(monkeypatch):
+    monkeypatch.setattr(PriceCache, 'internal_cache', InternalCache())
+    partial_end = dater.parse('2021-10-01')
+    with HTTMock(mock_data.mock_prices):
+        services.get_daily_price_history(
+            ticker='ALLY', start_date=settings.START, end_date=partial_end)
+
+    requests = []
+    get_prices = services.price_manager.get_prices
+
+    def record(*args, **kwargs):
+        requests.append(args)
+        return get_prices(*args, **kwargs)
+
+    monkeypatch.setattr(services.price_manager, 'get_prices', record)
+    with HTTMock(mock_data.mock_prices):
+        prices = services.get_daily_price_history(
+            ticker='ALLY', start_date=settings.START, end_date=settings.END)
+
+    assert len(requests) == 1
+    assert requests[0][1] == dater.parse('2021-10-04')
+    assert requests[0][2] == settings.END
+    assert list(prices) == [dater.to_string(this_date) for this_date
+                            in reversed(dater.business_dates_between(settings.START, settings.END))]
+
+
+def test_compact_output_covers_recent_dates(monkeypatch):
+    last_date = dater.parse('2021-11-19')
+    monkeypatch.setattr(services.dater, 'get_last_trading_date',
+                        lambda: last_date)
+    assert services.price_manager.covers_compact(
+        dater.decrement_date_by_business_days(last_date, 10), keys['ASSETS']['EQUITY'])
+    assert not services.price_manager.covers_compact(
+        dater.decrement_date_by_business_days(last_date, 150), keys['ASSETS']['EQUITY'])
+    assert not services.price_manager.covers_compact(
+        last_date, keys['ASSETS']['CRYPTO'])
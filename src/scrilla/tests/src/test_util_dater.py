@@ -1,4 +1,5 @@
 import pytest
+import numpy
 
 from scrilla.util import dater
 
@@ -46,4 +47,46 @@ def test_dates_between(start_date, end_date, length):
 ])
 def test_business_dates_between(start_date, end_date, length):
     date_range = dater.business_dates_between(start_date, end_date)
-    assert len(date_range) == length
\ No newline at end of file
+    assert len(date_range) == length
+@pytest.mark.parametrize('start_date,end_date,gap', [
+    ('2021-11-01', '2022-01-31', 1),
+    ('2020-12-01', '2021-02-28', 2),
+    ('2022-05-20', '2022-07-10', 3)
+])
+def test_consecutive_trading_days_between(start_date, end_date, gap):
+    dates = dater.dates_between(start_date, end_date)
+    start_dates, end_dates = dates[:-gap], dates[gap:]
+    vectorized = dater.consecutive_trading_days_between(
+        numpy.array(start_dates, dtype='datetime64[D]'), numpy.array(end_dates, dtype='datetime64[D]'))
+    assert vectorized.tolist() == [dater.consecutive_trading_days(start, end)
+                                   for start, end in zip(start_dates, end_dates)]
+
+@pytest.mark.parametrize('start_date,end_date,expected', [
+    ('2022-04-14', '2022-04-18', True),  # across good friday
+    ('2021-10-08', '2021-10-12', False),  # columbus day is a trading day
+    ('2021-11-24', '2021-11-26', True),  # across thanksgiving
+    ('2021-11-26', '2021-11-27', False)
+])
+def test_consecutive_trading_days(start_date, end_date, expected):
+    assert dater.consecutive_trading_days(start_date, end_date) == expected
+
+@pytest.mark.parametrize('start_date,end_date,bond', [
+    ('2021-09-01', '2021-12-31', False),
+    ('2021-09-01', '2021-12-31', True)
+])
+def test_trading_calendar_ordinals(start_date, end_date, bond):
+    calendar = dater.trading_calendar(bond)
+    dates = dater.dates_between(start_date, end_date)
+    trading_dates = [this_date for this_date in dates if not dater.is_date_weekend(this_date)
+                     and this_date not in dater._trading_holidays(this_date.year, bond)]
+    assert dater.business_dates_between(start_date, end_date, bond) == trading_dates
+    assert calendar.ordinals_of(numpy.array(trading_dates, dtype='datetime64[D]')).tolist() == \
+        list(range(calendar.ordinal(trading_dates[0]), calendar.ordinal(trading_dates[0]) + len(trading_dates)))
+
+def test_trading_calendar_persistence():
+    calendar = dater.trading_calendar()
+    dater._calendars.clear()
+    persisted = dater.trading_calendar()
+    assert persisted is not calendar
+    assert persisted.start_date == calendar.start_date
+    assert (persisted.trading == calendar.trading).all()
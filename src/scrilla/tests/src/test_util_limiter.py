@@ -0,0 +1,56 @@
+import pytest
+
+from scrilla.util import limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now, waits = [0.0], []
+
+    def sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(limiter.time, 'time', lambda: now[0])
+    monkeypatch.setattr(limiter.time, 'sleep', sleep)
+    return now, waits
+
+
+def test_bucket_allows_burst_then_waits_for_refill(clock):
+    _, waits = clock
+    bucket = limiter.TokenBucket(per_minute=2)
+    for _ in range(4):
+        bucket.acquire()
+    assert waits == [pytest.approx(30), pytest.approx(30)]
+
+
+def test_bucket_refills_while_idle(clock):
+    now, waits = clock
+    bucket = limiter.TokenBucket(per_minute=60, capacity=1)
+    bucket.acquire()
+    assert bucket.try_acquire() == pytest.approx(1)
+    now[0] += 1
+    bucket.acquire()
+    assert waits == []
+
+
+def test_bucket_drain(clock):
+    _, waits = clock
+    bucket = limiter.TokenBucket(per_minute=6)
+    bucket.drain()
+    bucket.acquire()
+    assert waits == [pytest.approx(10)]
+
+
+def test_bucket_shared_through_lock_file(clock, tmp_path):
+    lock_file = str(tmp_path / 'service.limit')
+    bucket_1 = limiter.TokenBucket(per_minute=2, lock_file=lock_file)
+    bucket_2 = limiter.TokenBucket(per_minute=2, lock_file=lock_file)
+    bucket_1.acquire()
+    bucket_1.acquire()
+    assert bucket_2.try_acquire() == pytest.approx(30)
+
+
+def test_bucket_is_shared_within_process():
+    assert limiter.bucket('test_service', 5) is limiter.bucket(
+        'test_service', 5)
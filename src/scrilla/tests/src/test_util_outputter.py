@@ -0,0 +1,39 @@
+import pytest
+
+from scrilla.util.outputter import Logger
+
+
+@pytest.mark.parametrize('log_level,level,expected', [
+    ('none', 'info', False),
+    ('info', 'info', True),
+    ('info', 'debug', False),
+    ('debug', 'info', True),
+    ('debug', 'verbose', False),
+    ('verbose', 'verbose', True),
+    ('verbose', 'debug', True)
+])
+def test_logger_is_enabled(log_level, level, expected):
+    assert Logger('test', log_level).is_enabled(level) == expected
+
+
+def test_logger_skips_formatting_when_disabled(capsys):
+    logger = Logger('test', 'info')
+
+    def message():
+        raise AssertionError('message should not be formatted')
+
+    logger.debug(message, 'test_logger_skips_formatting_when_disabled')
+    logger.verbose(message, 'test_logger_skips_formatting_when_disabled')
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('msg,args,expected', [
+    ('plain message', (), 'plain message'),
+    ('(return, volatility) = (%.2f, %.2f)', (0.1234, 0.5678),
+     '(return, volatility) = (0.12, 0.57)'),
+    (lambda: 'deferred message', (), 'deferred message')
+])
+def test_logger_formats_deferred_messages(capsys, msg, args, expected):
+    Logger('test', 'verbose').verbose(
+        msg, 'test_logger_formats_deferred_messages', *args)
+    assert capsys.readouterr().out.rstrip().endswith(expected)
@@ -0,0 +1,67 @@
+import pytest
+import numpy
+from math import log
+
+from scrilla.static.keys import keys
+from scrilla.static.constants import constants
+from scrilla.util import prices
+from scrilla.analysis.models.geometric import statistics
+
+legacy_prices = {
+    '2021-11-12': {'open': 10.0, 'close': 11.0},
+    '2021-11-11': {'open': 9.0, 'close': 10.0},
+    '2021-11-10': {'open': 8.0, 'close': 9.5},
+    '2021-11-09': {'open': 7.0, 'close': 8.0},
+    '2021-11-08': {'open': 6.5, 'close': 7.0}
+}
+
+
+def test_series_round_trip():
+    series = prices.PriceSeries.from_dict(legacy_prices, 'ALLY')
+    assert series.to_dict() == legacy_prices
+    assert list(series) == list(legacy_prices)
+    assert all(numpy.diff(series.dates) > numpy.timedelta64(0, 'D'))
+
+
+@pytest.mark.parametrize('start,end,expected', [
+    ('2021-11-09', '2021-11-11', ['2021-11-11', '2021-11-10', '2021-11-09']),
+    ('2021-11-01', '2021-11-08', ['2021-11-08']),
+    (None, '2021-11-09', ['2021-11-09', '2021-11-08']),
+    ('2021-11-13', None, [])
+])
+def test_series_between(start, end, expected):
+    series = prices.PriceSeries.from_dict(legacy_prices)
+    sliced = series.between(start, end)
+    assert list(sliced) == expected
+    if expected:
+        assert numpy.shares_memory(sliced.closes, series.closes)
+
+
+def test_series_mapping_protocol():
+    series = prices.PriceSeries.from_dict(legacy_prices)
+    assert series['2021-11-10'] == legacy_prices['2021-11-10']
+    assert '2021-11-10' in series
+    assert '2021-11-13' not in series
+    with pytest.raises(KeyError):
+        series['2021-11-13']
+
+
+def test_frame_intersect():
+    frame = prices.as_frame({
+        'ALLY': legacy_prices,
+        'BX': {date: legacy_prices[date] for date in ['2021-11-12', '2021-11-10', '2021-11-08']}
+    })
+    aligned = frame.intersect()
+    assert list(aligned['ALLY']) == list(aligned['BX']) == [
+        '2021-11-12', '2021-11-10', '2021-11-08']
+    assert frame.closes().shape == (3, 2)
+
+
+def test_series_sample_of_returns():
+    series = prices.as_series(legacy_prices, 'BTC')
+    these_returns = statistics.get_sample_of_returns(
+        ticker='BTC', sample_prices=series, asset_type=keys['ASSETS']['CRYPTO'])
+    closes = [legacy_prices[date]['close'] for date in legacy_prices]
+    expected = [log(closes[i]/closes[i+1])/constants['ONE_TRADING_DAY']['CRYPTO']
+                for i in range(len(closes)-1)]
+    assert these_returns == pytest.approx(expected)
@@ -2,12 +2,16 @@ import datetime
 from datetime import date
 
 import math
+import os
 import holidays
+import numpy
 from typing import Any, List, Tuple, Union
 
 import dateutil.easter as easter
 
+from scrilla import settings
 from scrilla.settings import DATE_FORMAT
+from scrilla.static.constants import constants
 
 
 def bureaucratize_date(this_date: date):
@@ -130,9 +134,11 @@ def is_date_weekend(this_date: Union[date, str]) -> bool:
     return validate_date(this_date).weekday() in [5, 6]
 
 
-def is_date_holiday(this_date: Union[date, str], bond: bool = False) -> bool:
-    this_date = validate_date(this_date)
-    us_holidays = holidays.UnitedStates(years=this_date.year)
+def _trading_holidays(year: int, bond: bool = False) -> List[date]:
+    """
+    Returns the dates in `year` on which the equity market (or the bond market, if `bond=True`) is closed for a holiday.
+    """
+    us_holidays = holidays.UnitedStates(years=year)
     if not bond:
         # generate list without columbus day and veterans day since markets are open on those day
         trading_holidays = [
@@ -143,7 +149,7 @@ def is_date_holiday(this_date: Union[date, str], bond: bool = False) -> bool:
 
     # markets are open
     # see here: https://www.barrons.com/articles/stock-market-open-close-new-years-eve-monday-hours-51640891577
-    if datetime.datetime(year=this_date.year+1, month=1, day=1).weekday() in [5, 6]:
+    if datetime.datetime(year=year+1, month=1, day=1).weekday() in [5, 6]:
         trading_holidays += ["New Year's Day (Observed)"]
 
     custom_holidays = [that_date for that_date in list(
@@ -151,9 +157,212 @@ def is_date_holiday(this_date: Union[date, str], bond: bool = False) -> bool:
 
     # add good friday to list since markets are closed on good friday
     custom_holidays.append(easter.easter(
-        year=this_date.year) - datetime.timedelta(days=2))
+        year=year) - datetime.timedelta(days=2))
+
+    return [that_date for that_date in custom_holidays if that_date.year == year]
+
+
+class TradingCalendar():
+    """
+    Precomputed calendar of trading days. For every calendar date in its range, the calendar stores whether the date is a trading holiday and the cumulative number of trading days up to and including that date, i.e. the date's business day ordinal. Business day counts, offsets, the next and previous trading date and whether two dates are consecutive trading days are then differences and lookups on these arrays, rather than day by day iterations.
+
+    Parameters
+    ----------
+    1. **start_date**: ``datetime.date``
+        First date covered by the calendar.
+    2. **holiday_flags**: ``numpy.ndarray``
+        Boolean array with one entry per calendar date from `start_date` onwards, `True` if the market is closed for a holiday on that date.
+    3. **bond**: ``bool``
+        Whether the calendar describes the bond market, rather than the equity market.
+
+    .. notes::
+        * Calendars are built by `scrilla.util.dater.trading_calendar`, which keeps one calendar per market in memory and persists them to `scrilla.settings.CACHE_CALENDAR_FILE`.
+        * Methods expect dates inside of the calendar's range; `scrilla.util.dater.trading_calendar` extends the range when it is asked for dates outside of it.
+    """
 
-    return (this_date in custom_holidays)
+    def __init__(self, start_date: date, holiday_flags: numpy.ndarray, bond: bool = False):
+        self.bond = bond
+        self.start_date = start_date
+        self.origin = start_date.toordinal()
+        self.holidays = numpy.asarray(holiday_flags, dtype=bool)
+        self.end_date = date.fromordinal(self.origin + len(self.holidays) - 1)
+
+        weekdays = (numpy.arange(len(self.holidays)) + start_date.weekday()) % 7
+        self.trading = (weekdays < 5) & ~self.holidays
+        self.ordinals = numpy.cumsum(self.trading)
+        self.trading_indices = numpy.flatnonzero(self.trading)
+
+    @classmethod
+    def build(cls, start_year: int, end_year: int, bond: bool = False) -> 'TradingCalendar':
+        start_date = date(start_year, 1, 1)
+        length = date(end_year, 12, 31).toordinal() - start_date.toordinal() + 1
+        holiday_flags = numpy.zeros(length, dtype=bool)
+        for year in range(start_year, end_year + 1):
+            for that_date in _trading_holidays(year, bond):
+                holiday_flags[that_date.toordinal() - start_date.toordinal()] = True
+        return cls(start_date, holiday_flags, bond)
+
+    def covers(self, this_date: date) -> bool:
+        return self.start_date <= this_date <= self.end_date
+
+    def _index(self, this_date: date) -> int:
+        return this_date.toordinal() - self.origin
+
+    def _indices(self, dates: numpy.ndarray) -> numpy.ndarray:
+        dates = numpy.asarray(dates, dtype='datetime64[D]')
+        return dates.astype(numpy.int64) - (self.origin - _EPOCH_ORDINAL)
+
+    def _date(self, index: int) -> date:
+        return date.fromordinal(self.origin + int(index))
+
+    def is_holiday(self, this_date: date) -> bool:
+        return bool(self.holidays[self._index(this_date)])
+
+    def is_trading_date(self, this_date: date) -> bool:
+        return bool(self.trading[self._index(this_date)])
+
+    def ordinal(self, this_date: date) -> int:
+        """
+        Returns the number of trading days in the calendar up to and including `this_date`.
+        """
+        return int(self.ordinals[self._index(this_date)])
+
+    def business_days_between(self, start_date: date, end_date: date) -> int:
+        """
+        Returns the number of trading days between `start_date` and `end_date`, inclusive.
+        """
+        start = self._index(start_date)
+        return int(self.ordinals[self._index(end_date)] - self.ordinals[start] + self.trading[start])
+
+    def business_dates_between(self, start_date: date, end_date: date) -> List[date]:
+        start, end = self._index(start_date), self._index(end_date)
+        first = self.ordinals[start] - self.trading[start]
+        return [self._date(index) for index in self.trading_indices[first:self.ordinals[end]]]
+
+    def trading_date_by_ordinal(self, ordinal: int) -> date:
+        """
+        Returns the trading date whose business day ordinal is `ordinal`.
+        """
+        return self._date(self.trading_indices[ordinal - 1])
+
+    def next_trading_date(self, this_date: date) -> date:
+        """
+        Returns `this_date` if it is a trading date, otherwise the first trading date after it.
+        """
+        index = self._index(this_date)
+        return self.trading_date_by_ordinal(int(self.ordinals[index]) + (0 if self.trading[index] else 1))
+
+    def previous_trading_date(self, this_date: date) -> date:
+        """
+        Returns the last trading date strictly before `this_date`.
+        """
+        index = self._index(this_date)
+        return self.trading_date_by_ordinal(int(self.ordinals[index]) - (1 if self.trading[index] else 0))
+
+    def consecutive(self, start_date: date, end_date: date) -> bool:
+        """
+        Returns `True` if both dates are trading dates and no trading date falls between them.
+        """
+        start, end = self._index(start_date), self._index(end_date)
+        return bool(self.trading[start] and self.trading[end]
+                    and abs(int(self.ordinals[end]) - int(self.ordinals[start])) == 1)
+
+    def is_trading_dates(self, dates: numpy.ndarray) -> numpy.ndarray:
+        """
+        Vectorized version of `scrilla.util.dater.TradingCalendar.is_trading_date` over an array of ``datetime64[D]`` dates.
+        """
+        return self.trading[self._indices(dates)]
+
+    def ordinals_of(self, dates: numpy.ndarray) -> numpy.ndarray:
+        """
+        Vectorized version of `scrilla.util.dater.TradingCalendar.ordinal` over an array of ``datetime64[D]`` dates.
+        """
+        return self.ordinals[self._indices(dates)]
+
+    def consecutive_between(self, start_dates: numpy.ndarray, end_dates: numpy.ndarray) -> numpy.ndarray:
+        """
+        Vectorized version of `scrilla.util.dater.TradingCalendar.consecutive` over two arrays of ``datetime64[D]`` dates.
+        """
+        start, end = self._indices(start_dates), self._indices(end_dates)
+        return self.trading[start] & self.trading[end] & \
+            (numpy.abs(self.ordinals[end] - self.ordinals[start]) == 1)
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_calendars = {}
+
+
+def _load_calendars() -> None:
+    try:
+        with numpy.load(settings.CACHE_CALENDAR_FILE, allow_pickle=False) as persisted:
+            if str(persisted['version']) != holidays.__version__:
+                return
+            start_date = date.fromordinal(int(persisted['origin']))
+            for bond in [False, True]:
+                _calendars[bond] = TradingCalendar(
+                    start_date, persisted['bond' if bond else 'equity'], bond)
+    except (OSError, KeyError, ValueError):
+        # NOTE: missing, stale or unreadable files are rebuilt and overwritten.
+        _calendars.clear()
+
+
+def _save_calendars() -> None:
+    if not all(bond in _calendars for bond in [False, True]):
+        return
+    # NOTE: calendars are written to a temporary file and moved into place, so
+    #       concurrent processes never read a partially written file.
+    temp_file = f'{settings.CACHE_CALENDAR_FILE}.{os.getpid()}.tmp'
+    try:
+        with open(temp_file, 'wb') as outfile:
+            numpy.savez(outfile, version=holidays.__version__, origin=_calendars[False].origin,
+                        equity=_calendars[False].holidays, bond=_calendars[True].holidays)
+        os.replace(temp_file, settings.CACHE_CALENDAR_FILE)
+    except OSError:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def trading_calendar(bond: bool = False, *dates: date) -> TradingCalendar:
+    """
+    Returns the process-wide `scrilla.util.dater.TradingCalendar` for the equity market, or the bond market if `bond=True`. The calendars are loaded from `scrilla.settings.CACHE_CALENDAR_FILE` the first time they are needed, or built and saved to that file if it does not exist. If any of `dates` fall outside of the calendar's range, the calendars are rebuilt over a wider range of years.
+
+    Parameters
+    ----------
+    1. **bond**: ``bool``
+        *Optional*. Defaults to `False`. Whether to return the bond market calendar.
+    2. **dates**: ``datetime.date``
+        *Optional*. Dates the calendar must cover.
+    """
+    if not _calendars:
+        _load_calendars()
+
+    calendar = _calendars.get(bond)
+    if calendar is not None and all(calendar.covers(this_date) for this_date in dates):
+        return calendar
+
+    years = [this_date.year for this_date in dates]
+    start_year = min(years + [constants['CALENDAR']['START_YEAR']])
+    end_year = max(years + [today().year + constants['CALENDAR']['YEARS_AHEAD']])
+    if calendar is not None:
+        start_year = min(start_year, calendar.start_date.year)
+        end_year = max(end_year, calendar.end_date.year)
+
+    for market in [False, True]:
+        _calendars[market] = TradingCalendar.build(start_year, end_year, market)
+    _save_calendars()
+    return _calendars[bond]
+
+
+def _as_date(this_date: Union[date, str]) -> date:
+    this_date = validate_date(this_date)
+    if isinstance(this_date, datetime.datetime):
+        return this_date.date()
+    return this_date
+
+
+def is_date_holiday(this_date: Union[date, str], bond: bool = False) -> bool:
+    this_date = _as_date(this_date)
+    return trading_calendar(bond, this_date).is_holiday(this_date)
 
 
 def get_last_trading_date(bond: bool = False) -> date:
@@ -191,8 +400,8 @@ def format_date_range(start_date: date, end_date: date) -> str:
 
 
 def is_trading_date(this_date: Union[date, str], bond: bool = False) -> bool:
-    this_date = validate_date(this_date)
-    return not is_date_weekend(this_date) and not is_date_holiday(this_date, bond)
+    this_date = _as_date(this_date)
+    return trading_calendar(bond, this_date).is_trading_date(this_date)
 
 
 def intersect_with_trading_dates(date_key_dict: dict) -> dict:
@@ -228,35 +437,35 @@ def consecutive_trading_days(start_date: Union[date, str], end_date: Union[date,
         if start_date_string and end_date_string are NOT consecutive trading days.
     """
     start_date, end_date = validate_date_range(start_date, end_date)
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    return trading_calendar(False, start_date, end_date).consecutive(start_date, end_date)
 
-    if is_date_weekend(start_date) or is_date_weekend(end_date):
-        return False
-
-    delta = (end_date - start_date).days
-
-    if delta < 0:
-        start_date, end_date = end_date, start_date
-        delta = end_date - start_date
-
-    holiday_count = get_holidays_between(
-        start_date=start_date, end_date=end_date)
 
-    if (delta - holiday_count) == 0:
-        return False
-
-    if (delta - holiday_count) == 1:
-        return True
+def consecutive_trading_days_between(start_dates: numpy.ndarray, end_dates: numpy.ndarray) -> numpy.ndarray:
+    """
+    Vectorized version of `scrilla.util.dater.consecutive_trading_days`. Looks up every pair of dates in the equity `scrilla.util.dater.TradingCalendar` at once.
 
-    if ((delta - holiday_count) > 1 and (delta - holiday_count) < 4):
-        start_week, end_week = start_date.isocalendar()[
-            1], end_date.isocalendar()[1]
+    Parameters
+    ----------
+    1. **start_dates**: ``numpy.ndarray``
+        Array of ``datetime64[D]`` dates.
+    2. **end_dates**: ``numpy.ndarray``
+        Array of ``datetime64[D]`` dates, the same length as `start_dates`.
 
-        if start_week == end_week:
-            return False
+    Returns
+    -------
+    ``numpy.ndarray``
+        Boolean array, `True` where the corresponding dates are consecutive trading days.
+    """
+    start_dates = numpy.asarray(start_dates, dtype='datetime64[D]')
+    end_dates = numpy.asarray(end_dates, dtype='datetime64[D]')
 
-        return True
+    if len(start_dates) == 0:
+        return numpy.zeros(0, dtype=bool)
 
-    return False
+    calendar = trading_calendar(False, min(start_dates.min(), end_dates.min()).item(),
+                                max(start_dates.max(), end_dates.max()).item())
+    return calendar.consecutive_between(start_dates, end_dates)
 
 
 def dates_between(start_date: Union[date, str], end_date: Union[date, str]) -> List[date]:
@@ -293,18 +502,14 @@ def business_dates_between(start_date: Union[date, str], end_date: Union[date, s
         End date of the date range. 
     """
     start_date, end_date = validate_date_range(start_date, end_date)
-    dates = []
-    for x in range((end_date - start_date).days+1):
-        this_date = start_date + datetime.timedelta(x)
-        if is_trading_date(this_date, bond):
-            dates.append(this_date)
-    return dates
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    return trading_calendar(bond, start_date, end_date).business_dates_between(start_date, end_date)
 
 
 def business_days_between(start_date: Union[date, str], end_date: Union[date, str], bond: bool = False) -> List[int]:
     start_date, end_date = validate_date_range(start_date, end_date)
-    dates = business_dates_between(start_date, end_date, bond)
-    return len(dates)
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    return trading_calendar(bond, start_date, end_date).business_days_between(start_date, end_date)
 
 
 def weekends_between(start_date: Union[date, str], end_date: Union[date, str]) -> List[int]:
@@ -325,41 +530,34 @@ def decrement_date_by_business_days(start_date: Union[date, str], business_days:
     """
     Subtracts `business_days`, ignoring weekends and trading holidays, from `start_date`
     """
-    start_date = validate_date(start_date)
-    added = False
-    while business_days > 0:
-        if is_trading_date(start_date, bond):
-            business_days -= 1
-        start_date -= datetime.timedelta(days=1)
-        if business_days == 0 and not is_trading_date(start_date):
-            business_days += 1
-            added = True
-        if added and is_trading_date(start_date):
-            business_days -= 1
-    return start_date
+    start_date = _as_date(start_date)
+    if business_days <= 0:
+        return start_date
+    # NOTE: a business day never spans more than a few calendar days, so this range always contains the result.
+    calendar = trading_calendar(bond, start_date,
+                                start_date - datetime.timedelta(days=2*business_days + 10))
+    return calendar.trading_date_by_ordinal(calendar.ordinal(start_date) - business_days)
 
 
 def increment_date_by_business_days(start_date: Union[date, str], business_days: int, bond: bool = False) -> date:
-    start_date = validate_date(start_date)
-    while business_days > 0:
-        if is_trading_date(start_date, bond):
-            business_days -= 1
-        start_date += datetime.timedelta(days=1)
-    return start_date
+    start_date = _as_date(start_date)
+    if business_days <= 0:
+        return start_date
+    calendar = trading_calendar(bond, start_date,
+                                start_date + datetime.timedelta(days=2*business_days + 10))
+    first_ordinal = calendar.ordinal(start_date) - \
+        int(calendar.is_trading_date(start_date))
+    return calendar.trading_date_by_ordinal(first_ordinal + business_days) + datetime.timedelta(days=1)
 
 
 def get_next_business_date(this_date: Union[date, str], bond: bool = False) -> date:
-    this_date = validate_date(this_date)
-    while not is_trading_date(this_date, bond):
-        this_date += datetime.timedelta(days=1)
-    return this_date
+    this_date = _as_date(this_date)
+    return trading_calendar(bond, this_date, this_date + datetime.timedelta(days=10)).next_trading_date(this_date)
 
 
 def get_previous_business_date(this_date: Union[date, str], bond: bool = False) -> date:
-    this_date = decrement_date_by_days(start_date=this_date, days=1)
-    while not is_trading_date(this_date, bond):
-        this_date -= datetime.timedelta(days=1)
-    return this_date
+    this_date = _as_date(this_date)
+    return trading_calendar(bond, this_date, this_date - datetime.timedelta(days=10)).previous_trading_date(this_date)
 
 
 def get_time_to_next_month(todays_date: date = today(), trading_days: int = 252) -> float:
@@ -0,0 +1,163 @@
+"""
+Token bucket rate limiters for the external services the program queries.
+
+A `scrilla.util.limiter.TokenBucket` holds up to `capacity` tokens and refills at a constant rate of `per_minute` tokens per minute. Every request to a service consumes a token; if the bucket is empty, the request waits exactly as long as it takes for the next token to arrive, so a batch of requests is spread over the quota instead of being throttled by the service.
+
+Buckets are shared by every manager querying the same service within a process through `scrilla.util.limiter.bucket`. If a `lock_file` is provided, the state of the bucket is kept in that file and updated under an exclusive file lock, so separate processes using the same API key share one quota.
+
+.. notes::
+    * File locks require the `fcntl` module, which is only available on *POSIX* systems. On other platforms, buckets fall back to limiting requests within a single process.
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from scrilla import settings
+from scrilla.util import outputter
+
+logger = outputter.Logger('scrilla.util.limiter', settings.LOG_LEVEL)
+
+
+class TokenBucket():
+    """
+    Thread safe token bucket.
+
+    Parameters
+    ----------
+    1. **per_minute**: ``float``
+        Number of tokens added to the bucket every minute, i.e. the number of requests the service allows per minute.
+    2. **capacity**: ``Union[float, None]``
+        *Optional*. Maximum number of tokens the bucket holds, i.e. the largest burst of requests allowed. Defaults to `per_minute`.
+    3. **lock_file**: ``Union[str, None]``
+        *Optional*. Path of the file used to share the bucket across processes. If `None`, the bucket is only shared within the current process.
+    4. **name**: ``Union[str, None]``
+        *Optional*. Name of the service the bucket limits. Only used for logging.
+    """
+
+    def __init__(self, per_minute: float, capacity: Union[float, None] = None, lock_file: Union[str, None] = None, name: Union[str, None] = None):
+        self.per_minute = per_minute
+        self.capacity = capacity if capacity is not None else per_minute
+        self.lock_file = lock_file if fcntl is not None else None
+        self.name = name
+        self.tokens = self.capacity
+        self.updated = time.time()
+        self.lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """
+        Tokens added to the bucket every second.
+        """
+        return self.per_minute / 60
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        return min(self.capacity, tokens + (now - updated)*self.rate)
+
+    def _take(self, tokens: float) -> float:
+        """
+        Removes `tokens` from the bucket if they are available and returns `0`. Otherwise, leaves the bucket untouched and returns the number of seconds until they will be.
+        """
+        now = time.time()
+        self.tokens, self.updated = self._refill(
+            self.tokens, self.updated, now), now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0
+        return (tokens - self.tokens) / self.rate
+
+    def _load(self, handle):
+        handle.seek(0)
+        try:
+            state = json.loads(handle.read())
+            self.tokens, self.updated = state['tokens'], state['updated']
+        except (ValueError, KeyError):
+            # NOTE: first process to use the file, or the file was corrupted
+            self.tokens, self.updated = self.capacity, time.time()
+
+    def _dump(self, handle):
+        handle.seek(0)
+        handle.truncate()
+        handle.write(json.dumps(
+            {'tokens': self.tokens, 'updated': self.updated}))
+        handle.flush()
+
+    def _locked(self, operation, *args):
+        """
+        Applies `operation` to the bucket while holding the thread lock and, if the bucket is shared across processes, the file lock.
+        """
+        with self.lock:
+            if self.lock_file is None:
+                return operation(*args)
+            with open(self.lock_file, 'a+') as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    self._load(handle)
+                    result = operation(*args)
+                    self._dump(handle)
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+            return result
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Attempts to remove `tokens` from the bucket without blocking.
+
+        Returns
+        -------
+        ``float``
+            `0` if the tokens were acquired, otherwise the number of seconds until they will be available.
+        """
+        return self._locked(self._take, tokens)
+
+    def acquire(self, tokens: float = 1):
+        """
+        Blocks until `tokens` can be removed from the bucket and then removes them.
+        """
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return
+            logger.debug(
+                lambda: f'{self.name} rate limit reached. Waiting {round(wait, 2)} seconds...', 'TokenBucket.acquire')
+            time.sleep(wait)
+
+    def drain(self):
+        """
+        Empties the bucket. Called when the service reports the quota has been exceeded anyway, e.g. because the API key is being used elsewhere, so that subsequent requests wait for the bucket to refill.
+        """
+        def empty():
+            self.tokens, self.updated = 0, time.time()
+        self._locked(empty)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket(name: str, per_minute: float, capacity: Union[float, None] = None) -> TokenBucket:
+    """
+    Returns the process-wide `scrilla.util.limiter.TokenBucket` for the service `name`, creating it the first time it is requested. If `scrilla.settings.RATE_LIMIT_FILE_LOCK` is enabled, the bucket is shared with other processes through a file in `scrilla.settings.CACHE_DIR`.
+
+    Parameters
+    ----------
+    1. **name**: ``str``
+        Name of the service, e.g. `scrilla.static.keys.keys['SERVICES']['PRICES']['ALPHA_VANTAGE']['MANAGER']`.
+    2. **per_minute**: ``float``
+        Number of requests the service allows per minute.
+    3. **capacity**: ``Union[float, None]``
+        *Optional*. Largest burst of requests allowed. Defaults to `per_minute`.
+    """
+    with _buckets_lock:
+        if name not in _buckets:
+            lock_file = os.path.join(settings.CACHE_DIR, f'{name}.limit') \
+                if settings.RATE_LIMIT_FILE_LOCK else None
+            _buckets[name] = TokenBucket(per_minute=per_minute, capacity=capacity,
+                                         lock_file=lock_file, name=name)
+        return _buckets[name]
@@ -188,6 +188,26 @@ def risk_profile(profiles: Dict[str, Dict[str, float]]) -> None:
             scalar_result(f'{subkey}', f'{subvalue}', currency=False)
 
 
+def cache_statistics(stats: Dict[str, Dict[str, Union[int, float, None]]]) -> None:
+    """
+    Prints the results of `scrilla.cache.saved_statistics` to *stdout*.
+
+    Parameters
+    ----------
+    1. **stats**: ``Dict[str, Dict[str, Union[int, float, None]]]``
+        The dictionary returned from a call to `scrilla.cache.saved_statistics`.
+    """
+    for table, tier in stats.items():
+        title_line(f'{table} Memory Tier')
+        for key, value in tier.items():
+            if key == 'hit_rate' and value is not None:
+                percent_result(key, 100*value)
+            elif key in ('max_bytes', 'peak_bytes') and value is not None:
+                string_result(key, f'{value/(1024*1024):.2f} MiB')
+            else:
+                string_result(key, f'{value}')
+
+
 def moving_average_result(ticker: str, averages: Dict[str, Dict[str, float]]) -> None:
     """
     Prints the results of `scrilla.analysis.models.geometric.statistics.calculate_moving_averages` or `scrilla.analysis.models.reversion.statistics.calculate_moving_averages` to *stdout*.
@@ -355,32 +375,76 @@ def correlation_matrix(tickers: List[str], correl_matrix: List[List[float]], dis
 
 
 class Logger():
+    """
+    Prints log messages for a module. Messages are only printed if the `log_level` of the logger is at least as verbose as the level of the message, with the exception of errors, which are always printed.
+
+    Parameters
+    ----------
+    1. **location**: ``str``
+        Name of the module the logger belongs to.
+    2. **log_level**: ``str``
+        *Optional*. One of the values of `scrilla.static.constants.constants['LOG_LEVEL']`. Defaults to `info`.
+
+    .. notes::
+        * Messages may be deferred, so they are only formatted if they will be printed. A message can be passed in as a callable that takes no arguments and returns the message, or as a `%`-style format string followed by its arguments, e.g. `logger.verbose('(return, volatility) = (%.2f, %.2f)', 'method', ret, vol)`.
+        * Loops that log on every iteration should check `scrilla.util.outputter.Logger.is_enabled` once before the loop, so nothing is formatted when the level is disabled.
+    """
+    LEVELS = {
+        constants.constants['LOG_LEVEL']['NONE']: 0,
+        constants.constants['LOG_LEVEL']['ERROR']: 1,
+        constants.constants['LOG_LEVEL']['INFO']: 2,
+        constants.constants['LOG_LEVEL']['DEBUG']: 3,
+        constants.constants['LOG_LEVEL']['VERBOSE']: 4
+    }
+    INFO_RANK = LEVELS[constants.constants['LOG_LEVEL']['INFO']]
+    DEBUG_RANK = LEVELS[constants.constants['LOG_LEVEL']['DEBUG']]
+    VERBOSE_RANK = LEVELS[constants.constants['LOG_LEVEL']['VERBOSE']]
 
     def __init__(self, location, log_level="info"):
         self.location = location
         self.log_level = log_level
 
+    @property
+    def log_level(self):
+        return self._log_level
+
+    @log_level.setter
+    def log_level(self, log_level):
+        self._log_level = log_level
+        self._rank = self.LEVELS.get(log_level, 0)
+
+    def is_enabled(self, level: str) -> bool:
+        """
+        Returns `True` if messages of the given `level` will be printed by this logger.
+        """
+        return self._rank >= self.LEVELS.get(level, len(self.LEVELS))
+
+    @staticmethod
+    def _format(msg, args):
+        if callable(msg):
+            msg = msg()
+        if args:
+            msg = msg % args
+        return msg
+
     # LOGGING FUNCTIONS
-    def comment(self, msg, method, level="INFO"):
+    def comment(self, msg, method, level="INFO", *args):
         now = datetime.datetime.now()
         dt_string = now.strftime("%d/%m/%Y %H:%M:%S")
         print(dt_string, ' : ', level, ':',
-              f'{self.location}.{method}', ' : ', msg)
+              f'{self.location}.{method}', ' : ', self._format(msg, args))
 
-    def error(self, msg, method):
-        self.comment(msg, method, 'ERROR',)
+    def error(self, msg, method, *args):
+        self.comment(msg, method, 'ERROR', *args)
 
-    def info(self, msg, method):
-        if self.log_level in [constants.constants['LOG_LEVEL']['INFO'],
-                              constants.constants['LOG_LEVEL']['DEBUG'],
-                              constants.constants['LOG_LEVEL']['VERBOSE']]:
-            self.comment(msg, method, 'INFO')
+    def info(self, msg, method, *args):
+        if self._rank >= self.INFO_RANK:
+            self.comment(msg, method, 'INFO', *args)
 
-    def debug(self, msg, method):
-        if self.log_level in [constants.constants['LOG_LEVEL']['DEBUG'],
-                              constants.constants['LOG_LEVEL']['VERBOSE']]:
-            self.comment(msg, method, 'DEBUG')
+    def debug(self, msg, method, *args):
+        if self._rank >= self.DEBUG_RANK:
+            self.comment(msg, method, 'DEBUG', *args)
 
-    def verbose(self, msg, method):
-        if self.log_level == constants.constants['LOG_LEVEL']['VERBOSE']:
-            self.comment(msg, method, 'VERBOSE')
+    def verbose(self, msg, method, *args):
+        if self._rank >= self.VERBOSE_RANK:
+            self.comment(msg, method, 'VERBOSE', *args)
@@ -0,0 +1,270 @@
+"""
+Columnar containers for price histories.
+
+The rest of the library exchanges price histories in the legacy format returned by `scrilla.services.get_daily_price_history`, i.e. a dictionary keyed by date strings and ordered from latest to earliest,
+
+```
+{
+    'YYYY-MM-DD': { 'open': float, 'close': float },
+    ...
+}
+```
+
+`scrilla.util.prices.PriceSeries` stores the same information in three contiguous *NumPy* arrays: ``datetime64[D]`` dates, sorted once in ascending order, and ``float64`` opening and closing prices. Date range slices are located with a binary search and return views into the parent arrays, so no prices are copied. `scrilla.util.prices.PriceFrame` groups several series together by ticker symbol.
+
+Both classes implement the read-only mapping protocol of the legacy format (iteration yields date strings from latest to earliest, indexing by a date returns an ``{ 'open': float, 'close': float }`` dictionary), so they can be passed anywhere the legacy dictionary is accepted. `scrilla.util.prices.as_series` and `scrilla.util.prices.as_frame` adapt legacy dictionaries into the columnar format.
+"""
+from collections.abc import Mapping
+from datetime import date
+from typing import Dict, Iterator, List, Union
+
+import numpy
+
+from scrilla.static import keys
+
+
+def _to_datetime64(this_date: Union[date, str, numpy.datetime64]) -> numpy.datetime64:
+    return numpy.datetime64(this_date, 'D')
+
+
+class PriceSeries(Mapping):
+    """
+    Price history of a single asset backed by contiguous arrays.
+
+    Parameters
+    ----------
+    1. **dates**: ``Union[List[str], List[date], numpy.ndarray]``
+        Dates of the observations. Does not need to be sorted.
+    2. **opens**: ``Union[List[float], numpy.ndarray]``
+        Opening prices, in the same order as `dates`.
+    3. **closes**: ``Union[List[float], numpy.ndarray]``
+        Closing prices, in the same order as `dates`.
+    4. **ticker**: ``Union[str, None]``
+        *Optional*. Ticker symbol of the asset.
+
+    Attributes
+    ----------
+    1. **dates**: ``numpy.ndarray``
+        ``datetime64[D]`` array of dates, sorted from earliest to latest.
+    2. **opens**: ``numpy.ndarray``
+        ``float64`` array of opening prices aligned with `dates`.
+    3. **closes**: ``numpy.ndarray``
+        ``float64`` array of closing prices aligned with `dates`.
+
+    .. notes::
+        * The arrays are stored in *ascending* order, whereas the legacy format is ordered from latest to earliest. The mapping protocol and `scrilla.util.prices.PriceSeries.to_dict` preserve the legacy order.
+        * Series returned by `scrilla.util.prices.PriceSeries.between` share memory with the series they are sliced from.
+    """
+    __slots__ = ('ticker', 'dates', 'opens', 'closes')
+
+    def __init__(self, dates, opens, closes, ticker: Union[str, None] = None):
+        self.ticker = ticker
+        dates = numpy.asarray(dates, dtype='datetime64[D]')
+        opens = numpy.asarray(opens, dtype=numpy.float64)
+        closes = numpy.asarray(closes, dtype=numpy.float64)
+
+        if not (len(dates) == len(opens) == len(closes)):
+            raise ValueError('dates, opens and closes must have the same length')
+
+        if len(dates) > 1 and numpy.any(dates[1:] <= dates[:-1]):
+            dates, index = numpy.unique(dates, return_index=True)
+            opens, closes = opens[index], closes[index]
+
+        self.dates, self.opens, self.closes = dates, opens, closes
+
+    @classmethod
+    def _view(cls, dates, opens, closes, ticker):
+        # NOTE: bypasses validation, the arrays are slices of an already sorted series.
+        series = cls.__new__(cls)
+        series.ticker = ticker
+        series.dates, series.opens, series.closes = dates, opens, closes
+        return series
+
+    @classmethod
+    def from_dict(cls, prices: Dict[str, Dict[str, float]], ticker: Union[str, None] = None) -> 'PriceSeries':
+        """
+        Constructs a series from a price history in the legacy format, `{ 'date' : { 'open': value, 'close': value }, ... }`. Dates may be ordered either way.
+        """
+        open_key, close_key = keys.keys['PRICES']['OPEN'], keys.keys['PRICES']['CLOSE']
+        values = prices.values()
+        return cls(dates=list(prices.keys()),
+                   opens=[value.get(open_key, numpy.nan) for value in values],
+                   closes=[value.get(close_key, numpy.nan) for value in values],
+                   ticker=ticker)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the series in the legacy format, ordered from latest to earliest date.
+        """
+        open_key, close_key = keys.keys['PRICES']['OPEN'], keys.keys['PRICES']['CLOSE']
+        return {
+            this_date: {open_key: this_open, close_key: this_close}
+            for this_date, this_open, this_close
+            in zip(self.date_strings(), self.opens[::-1].tolist(), self.closes[::-1].tolist())
+        }
+
+    def date_strings(self) -> List[str]:
+        """
+        Returns the dates of the series as *YYYY-MM-DD* strings, ordered from latest to earliest.
+        """
+        return numpy.datetime_as_string(self.dates[::-1], unit='D').tolist()
+
+    @property
+    def start_date(self) -> Union[date, None]:
+        return self.dates[0].item() if len(self.dates) > 0 else None
+
+    @property
+    def end_date(self) -> Union[date, None]:
+        return self.dates[-1].item() if len(self.dates) > 0 else None
+
+    def between(self, start_date: Union[date, str, None] = None, end_date: Union[date, str, None] = None) -> 'PriceSeries':
+        """
+        Returns the observations dated on or after `start_date` and on or before `end_date`. The endpoints are located with a binary search and the returned series is a view of this series.
+
+        Parameters
+        ----------
+        1. **start_date**: ``Union[date, str, None]``
+            *Optional*. Inclusive start of the range. Defaults to the beginning of the series.
+        2. **end_date**: ``Union[date, str, None]``
+            *Optional*. Inclusive end of the range. Defaults to the end of the series.
+        """
+        start = 0 if start_date is None else int(numpy.searchsorted(
+            self.dates, _to_datetime64(start_date), side='left'))
+        end = len(self.dates) if end_date is None else int(numpy.searchsorted(
+            self.dates, _to_datetime64(end_date), side='right'))
+        return self._view(self.dates[start:end], self.opens[start:end], self.closes[start:end], self.ticker)
+
+    def index_of(self, this_date: Union[date, str]) -> int:
+        """
+        Returns the position of `this_date` in the ascending `dates` array, or raises a ``KeyError`` if the series has no observation on that date.
+        """
+        target = _to_datetime64(this_date)
+        index = int(numpy.searchsorted(self.dates, target))
+        if index == len(self.dates) or self.dates[index] != target:
+            raise KeyError(this_date)
+        return index
+
+    def __getitem__(self, this_date: Union[date, str]) -> Dict[str, float]:
+        index = self.index_of(this_date)
+        return {
+            keys.keys['PRICES']['OPEN']: float(self.opens[index]),
+            keys.keys['PRICES']['CLOSE']: float(self.closes[index])
+        }
+
+    def __contains__(self, this_date) -> bool:
+        try:
+            self.index_of(this_date)
+        except (KeyError, ValueError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.date_strings())
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f'PriceSeries(ticker={self.ticker!r}, start_date={self.start_date}, end_date={self.end_date}, length={len(self)})'
+
+
+class PriceFrame(Mapping):
+    """
+    Collection of `scrilla.util.prices.PriceSeries` keyed by ticker symbol. Indexing a frame by ticker returns the series for that ticker, so a frame can be passed anywhere the legacy `{ 'ticker': { 'date': { 'open': value, 'close': value }, ... }, ... }` format is accepted.
+
+    Parameters
+    ----------
+    1. **series**: ``Dict[str, PriceSeries]``
+        Dictionary of price series keyed by ticker symbol.
+    """
+    __slots__ = ('series',)
+
+    def __init__(self, series: Dict[str, PriceSeries]):
+        self.series = dict(series)
+
+    @classmethod
+    def from_dict(cls, prices: Dict[str, Dict[str, Dict[str, float]]]) -> 'PriceFrame':
+        """
+        Constructs a frame from price histories in the legacy format, keyed by ticker.
+        """
+        return cls({ticker: as_series(history, ticker) for ticker, history in prices.items()})
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        return {ticker: series.to_dict() for ticker, series in self.series.items()}
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.series.keys())
+
+    @property
+    def start_date(self) -> Union[date, None]:
+        dates = [series.start_date for series in self.series.values()
+                 if series.start_date is not None]
+        return min(dates) if dates else None
+
+    @property
+    def end_date(self) -> Union[date, None]:
+        dates = [series.end_date for series in self.series.values()
+                 if series.end_date is not None]
+        return max(dates) if dates else None
+
+    def between(self, start_date: Union[date, str, None] = None, end_date: Union[date, str, None] = None) -> 'PriceFrame':
+        """
+        Applies `scrilla.util.prices.PriceSeries.between` to every series in the frame.
+        """
+        return PriceFrame({ticker: series.between(start_date, end_date) for ticker, series in self.series.items()})
+
+    def intersect(self) -> 'PriceFrame':
+        """
+        Returns a frame whose series are all restricted to the dates on which every series in the frame has an observation.
+        """
+        if not self.series:
+            return PriceFrame({})
+        common = None
+        for series in self.series.values():
+            common = series.dates if common is None \
+                else numpy.intersect1d(common, series.dates, assume_unique=True)
+
+        aligned = {}
+        for ticker, series in self.series.items():
+            mask = numpy.isin(series.dates, common, assume_unique=True)
+            aligned[ticker] = PriceSeries._view(
+                series.dates[mask], series.opens[mask], series.closes[mask], ticker)
+        return PriceFrame(aligned)
+
+    def closes(self) -> numpy.ndarray:
+        """
+        Returns a ``(dates, tickers)`` array of closing prices, with rows ordered from earliest to latest and columns ordered by `scrilla.util.prices.PriceFrame.tickers`. The series in the frame are aligned with `scrilla.util.prices.PriceFrame.intersect` first.
+        """
+        aligned = self.intersect()
+        return numpy.column_stack([series.closes for series in aligned.series.values()])
+
+    def __getitem__(self, ticker: str) -> PriceSeries:
+        return self.series[ticker]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.series)
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def __repr__(self) -> str:
+        return f'PriceFrame(tickers={self.tickers})'
+
+
+def as_series(prices: Union[PriceSeries, Dict[str, Dict[str, float]]], ticker: Union[str, None] = None) -> PriceSeries:
+    """
+    Adapts a price history in the legacy format into a `scrilla.util.prices.PriceSeries`. Series are returned as is.
+    """
+    if isinstance(prices, PriceSeries):
+        return prices
+    return PriceSeries.from_dict(prices, ticker)
+
+
+def as_frame(prices: Union[PriceFrame, Dict[str, Union[PriceSeries, Dict[str, Dict[str, float]]]]]) -> PriceFrame:
+    """
+    Adapts price histories keyed by ticker in the legacy format into a `scrilla.util.prices.PriceFrame`. Frames are returned as is.
+    """
+    if isinstance(prices, PriceFrame):
+        return prices
+    return PriceFrame.from_dict(prices)